@@ -0,0 +1,102 @@
+"""
+목록 응답 직렬화 벤치마크
+
+이벤트 100건 페이지를 두 방식으로 JSON 바이트까지 만드는 시간을 비교합니다.
+- legacy: 필드를 하나씩 옮겨 EventResponse 생성 -> response_model 재검증
+          -> jsonable 변환 -> json.dumps (기존 라우터 + FastAPI 기본 경로)
+- model_response: ORM 객체를 from_attributes로 한 번 검증 후 model_dump_json
+
+사용법:
+    python benchmarks/bench_serialization.py --rows 100 --repeat 2000
+"""
+import argparse
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydantic import TypeAdapter
+
+from app.core.pagination import create_page_response
+from app.core.responses import model_response
+from app.models.event import Event
+from app.schemas.event import EventListResponse, EventResponse
+
+
+def build_events(rows: int) -> list:
+    base = datetime(2025, 1, 1, 9, 0)
+    calendar_id = str(uuid.uuid4())
+    return [
+        Event(
+            id=str(uuid.uuid4()),
+            calendar_id=calendar_id,
+            title=f"Event {i}",
+            description="Weekly sync meeting " * 5,
+            start_at=base + timedelta(hours=i),
+            end_at=base + timedelta(hours=i + 1),
+            location="Conference Room A",
+            is_all_day=False,
+            created_at=base,
+            updated_at=base,
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy(events: list, adapter: TypeAdapter) -> bytes:
+    content = [
+        EventResponse(
+            id=event.id,
+            calendar_id=event.calendar_id,
+            title=event.title,
+            description=event.description,
+            start_at=event.start_at,
+            end_at=event.end_at,
+            location=event.location,
+            is_all_day=event.is_all_day,
+            created_at=event.created_at,
+            updated_at=event.updated_at,
+        )
+        for event in events
+    ]
+    page = EventListResponse(**create_page_response(content, 0, len(events), len(events)))
+    validated = adapter.validate_python(page.model_dump())
+    return json.dumps(adapter.dump_python(validated, mode="json", by_alias=True)).encode("utf-8")
+
+
+def single_pass(events: list) -> bytes:
+    return model_response(EventListResponse, create_page_response(events, 0, len(events), len(events))).body
+
+
+def measure(fn, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=1_000)
+    args = parser.parse_args()
+
+    events = build_events(args.rows)
+    adapter = TypeAdapter(EventListResponse)
+    assert json.loads(legacy(events, adapter)) == json.loads(single_pass(events))
+
+    results = [
+        ("legacy", measure(lambda: legacy(events, adapter), args.repeat)),
+        ("model_response", measure(lambda: single_pass(events), args.repeat)),
+    ]
+    print(f"{'path':<20}{'ms/page':>12}{'pages/s':>12}")
+    for name, seconds in results:
+        print(f"{name:<20}{seconds * 1000:>12.3f}{1 / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,7 @@ from app.db.base import Base
 from app.core.config import settings
 
 # 모든 모델을 import하여 Alembic이 인식할 수 있도록 함
-from app.models import User, Calendar, Event, Task
+from app.models import User, Calendar, Event, Task, TaskArchive
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,87 @@
+"""convert id columns to BINARY(16) (opt-in, ID_SCHEME=uuid7)
+
+Revision ID: binary_uuid_ids
+Revises: add_user_status_fields
+Create Date: 2026-10-19 10:00:00.000000
+
+ID_SCHEME=uuid7 로 설정한 배포에서만 변환을 수행합니다.
+기존 uuid4 문자열은 같은 값의 16바이트 표현으로 변환되며 (API 표현은 동일),
+이후 생성되는 ID부터 시간 순서(UUIDv7)로 clustered index 끝에 추가됩니다.
+"""
+from alembic import op
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision = 'binary_uuid_ids'
+down_revision = 'add_user_status_fields'
+branch_labels = None
+depends_on = None
+
+
+# (테이블, 컬럼) - 부모 테이블부터
+ID_COLUMNS = [
+    ('users', 'id'),
+    ('calendars', 'id'),
+    ('calendars', 'user_id'),
+    ('events', 'id'),
+    ('events', 'calendar_id'),
+    ('tasks', 'id'),
+    ('tasks', 'calendar_id'),
+]
+
+# (FK 이름, 테이블, 컬럼, 참조 테이블) - MySQL 자동 생성 이름
+FOREIGN_KEYS = [
+    ('calendars_ibfk_1', 'calendars', 'user_id', 'users'),
+    ('events_ibfk_1', 'events', 'calendar_id', 'calendars'),
+    ('tasks_ibfk_1', 'tasks', 'calendar_id', 'calendars'),
+]
+
+
+def _enabled() -> bool:
+    return settings.ID_SCHEME == 'uuid7' and op.get_bind().dialect.name == 'mysql'
+
+
+def _drop_foreign_keys():
+    for name, table, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+
+
+def _create_foreign_keys():
+    for name, table, column, referent in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referent, [column], ['id'], ondelete='CASCADE')
+
+
+def upgrade():
+    if not _enabled():
+        return
+
+    op.execute("SET FOREIGN_KEY_CHECKS = 0")
+    _drop_foreign_keys()
+    for table, column in ID_COLUMNS:
+        # CHAR(36) -> VARBINARY(36) (바이트 보존) -> 16바이트로 변환 -> BINARY(16)
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) NOT NULL")
+        op.execute(f"UPDATE {table} SET {column} = UNHEX(REPLACE({column}, '-', ''))")
+        op.execute(f"ALTER TABLE {table} MODIFY {column} BINARY(16) NOT NULL")
+    _create_foreign_keys()
+    op.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+def downgrade():
+    if not _enabled():
+        return
+
+    op.execute("SET FOREIGN_KEY_CHECKS = 0")
+    _drop_foreign_keys()
+    for table, column in ID_COLUMNS:
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARBINARY(36) NOT NULL")
+        op.execute(
+            f"UPDATE {table} SET {column} = LOWER(CONCAT_WS('-', "
+            f"SUBSTR(HEX({column}), 1, 8), SUBSTR(HEX({column}), 9, 4), "
+            f"SUBSTR(HEX({column}), 13, 4), SUBSTR(HEX({column}), 17, 4), "
+            f"SUBSTR(HEX({column}), 21)))"
+        )
+        op.execute(f"ALTER TABLE {table} MODIFY {column} VARCHAR(36) NOT NULL")
+    _create_foreign_keys()
+    op.execute("SET FOREIGN_KEY_CHECKS = 1")
@@ -0,0 +1,40 @@
+"""add event day buckets for overlap lookups
+
+Revision ID: event_day_buckets
+Revises: recurring_events
+Create Date: 2026-10-19 18:00:00.000000
+
+이벤트가 걸친 날짜(UTC)마다 한 행 (app.db.day_buckets)
+- 겹침 확인(check_conflicts)은 (calendar_id, day)로 후보 이벤트만 찾은 뒤 시각을 비교
+- events는 파티션 테이블일 수 있어 event_id FK 없음, 캘린더 삭제 시 calendar_id로 함께 삭제
+
+기존 이벤트 버킷은 배포 후 채웁니다:
+    python -m app.db.day_buckets rebuild
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import id_type
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_day_buckets'
+down_revision = 'recurring_events'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('event_day_buckets',
+    sa.Column('event_id', id_type(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('calendar_id', id_type(), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('event_id', 'day')
+    )
+    op.create_index('idx_event_bucket_calendar_day', 'event_day_buckets', ['calendar_id', 'day', 'event_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_event_bucket_calendar_day', table_name='event_day_buckets')
+    op.drop_table('event_day_buckets')
@@ -0,0 +1,31 @@
+"""extend idx_event_calendar_recurring with end_at
+
+Revision ID: event_recurring_covering
+Revises: sync_changes
+Create Date: 2026-10-19 22:00:00.000000
+
+구간 조회(free/busy, 캘린더 뷰, 반복 마스터 조회)는 calendar_id IN + is_recurring + start_at < :end
++ end_at > :start 형태라 idx_event_calendar_start (calendar_id, start_at, end_at)로는 is_recurring을
+행마다 확인해야 합니다. (calendar_id, is_recurring, start_at, end_at)로 확장해 두 범위 조건과
+is_recurring을 모두 인덱스에서 처리합니다 (free/busy는 인덱스만 읽음).
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'event_recurring_covering'
+down_revision = 'sync_changes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('idx_event_calendar_recurring', table_name='events')
+    op.create_index(
+        'idx_event_calendar_recurring', 'events', ['calendar_id', 'is_recurring', 'start_at', 'end_at'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('idx_event_calendar_recurring', table_name='events')
+    op.create_index('idx_event_calendar_recurring', 'events', ['calendar_id', 'is_recurring', 'start_at'], unique=False)
@@ -0,0 +1,56 @@
+"""partition events by start_at month (opt-in, EVENTS_PARTITIONING=true)
+
+Revision ID: events_month_partitions
+Revises: index_audit_covering
+Create Date: 2026-10-19 12:00:00.000000
+
+MySQL 파티션 테이블은 외래 키를 가질 수 없고, 모든 UNIQUE 키(PK 포함)에
+파티션 컬럼이 포함되어야 합니다. 따라서
+- events.calendar_id FK를 제거 (캘린더 삭제 시 이벤트는 애플리케이션에서 삭제)
+- PK를 (id, start_at)으로 변경 (ORM 매핑은 id 단일 키 유지)
+이후 미래 파티션은 `python -m app.db.partitions ensure`로 주기적으로 생성합니다.
+"""
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.db.partitions import add_months, create_partitioning_sql, month_start
+
+
+# revision identifiers, used by Alembic.
+revision = 'events_month_partitions'
+down_revision = 'index_audit_covering'
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+
+
+def _enabled() -> bool:
+    return settings.EVENTS_PARTITIONING and op.get_bind().dialect.name == 'mysql'
+
+
+def upgrade():
+    if not _enabled():
+        return
+
+    bind = op.get_bind()
+    today = datetime.utcnow().date()
+    oldest = bind.execute(sa.text("SELECT MIN(start_at) FROM events")).scalar()
+    first = month_start(oldest.date()) if oldest else month_start(today)
+
+    op.drop_constraint('events_ibfk_1', 'events', type_='foreignkey')
+    op.execute("ALTER TABLE events DROP PRIMARY KEY, ADD PRIMARY KEY (id, start_at)")
+    op.execute(create_partitioning_sql(first, add_months(month_start(today), MONTHS_AHEAD)))
+
+
+def downgrade():
+    if not _enabled():
+        return
+
+    op.execute("ALTER TABLE events REMOVE PARTITIONING")
+    op.execute("ALTER TABLE events DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+    op.execute("DELETE FROM events WHERE calendar_id NOT IN (SELECT id FROM calendars)")
+    op.create_foreign_key('events_ibfk_1', 'events', 'calendars', ['calendar_id'], ['id'], ondelete='CASCADE')
@@ -0,0 +1,53 @@
+"""add ngram FULLTEXT indexes for keyword search
+
+Revision ID: fulltext_ngram
+Revises: user_status_index
+Create Date: 2026-10-19 15:00:00.000000
+
+keyword 필터를 LIKE '%kw%' 대신 MATCH ... AGAINST 로 처리 (app.db.fulltext)
+- tasks / tasks_archive / calendars / users: FULLTEXT ... WITH PARSER ngram
+- events: 파티션 테이블은 FULLTEXT를 지원하지 않으므로 events_fts 보조 테이블 + 트리거
+
+불용어: ngram 파서는 불용어가 들어간 토큰을 버리고 InnoDB 기본 불용어 목록에 "a", "i" 등 한 글자가 있어
+"data" 같은 키워드의 토큰이 모두 사라집니다. 불용어 목록은 인덱스를 만들 때 고정되므로 이 세션에서
+innodb_ft_enable_stopword=OFF로 만들고, 이후 재생성(ALTER/OPTIMIZE)에 대비해 서버에도 같은 값을 설정합니다
+(docker-compose의 mysql command 참고).
+"""
+from alembic import op
+
+from app.db.fulltext import events_fts, mysql_side_table_ddl
+
+
+# revision identifiers, used by Alembic.
+revision = 'fulltext_ngram'
+down_revision = 'user_status_index'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스, 테이블, 컬럼)
+FULLTEXT_INDEXES = [
+    ('ft_task_text', 'tasks', ['title', 'description']),
+    ('ft_task_archive_text', 'tasks_archive', ['title', 'description']),
+    ('ft_calendar_text', 'calendars', ['title', 'description']),
+    ('ft_user_text', 'users', ['email', 'display_name']),
+]
+
+
+def upgrade():
+    op.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+    for name, table, columns in FULLTEXT_INDEXES:
+        op.execute(f"CREATE FULLTEXT INDEX {name} ON {table} ({', '.join(columns)}) WITH PARSER ngram")
+
+    events_fts.create(op.get_bind())
+    for statement in mysql_side_table_ddl(events_fts, 'events'):
+        op.execute(statement)
+
+
+def downgrade():
+    for trigger in ('events_fts_ai', 'events_fts_au', 'events_fts_ad'):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.drop_table('events_fts')
+
+    for name, table, _ in reversed(FULLTEXT_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,75 @@
+"""drop redundant indexes, add composite indexes for list queries
+
+Revision ID: index_audit_covering
+Revises: binary_uuid_ids
+Create Date: 2026-10-19 11:00:00.000000
+
+- PK와 중복되는 ix_*_id 제거
+- 선택도가 낮은 단일 컬럼 인덱스 제거 (role, is_active, is_banned, status, priority, title)
+- 복합 인덱스의 선두 컬럼과 중복되는 단일 인덱스 제거
+- 목록 엔드포인트 WHERE/ORDER BY 형태에 맞춘 복합 인덱스 추가
+  (python -m app.db.index_audit 로 매핑 확인)
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'index_audit_covering'
+down_revision = 'binary_uuid_ids'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스, 테이블, 컬럼) - 제거 대상
+REDUNDANT_INDEXES = [
+    ('ix_users_id', 'users', ['id']),
+    ('ix_users_role', 'users', ['role']),
+    ('ix_users_is_active', 'users', ['is_active']),
+    ('ix_users_is_banned', 'users', ['is_banned']),
+    ('ix_calendars_id', 'calendars', ['id']),
+    ('ix_calendars_title', 'calendars', ['title']),
+    ('ix_calendars_user_id', 'calendars', ['user_id']),  # idx_calendar_user_title 선두 컬럼
+    ('ix_events_id', 'events', ['id']),
+    ('ix_events_title', 'events', ['title']),
+    ('ix_events_calendar_id', 'events', ['calendar_id']),  # idx_event_calendar_* 선두 컬럼
+    ('ix_events_start_at', 'events', ['start_at']),  # idx_event_start_end 선두 컬럼
+    ('ix_events_end_at', 'events', ['end_at']),
+    ('ix_tasks_id', 'tasks', ['id']),
+    ('ix_tasks_title', 'tasks', ['title']),
+    ('ix_tasks_calendar_id', 'tasks', ['calendar_id']),  # idx_task_calendar_* 선두 컬럼
+    ('ix_tasks_due_at', 'tasks', ['due_at']),  # idx_task_due_status 선두 컬럼
+    ('ix_tasks_status', 'tasks', ['status']),
+    ('ix_tasks_priority', 'tasks', ['priority']),
+]
+
+# (인덱스, 테이블, 기존 컬럼, 새 컬럼) - 같은 이름으로 확장
+EXTENDED_INDEXES = [
+    ('idx_event_calendar_start', 'events', ['calendar_id', 'start_at'], ['calendar_id', 'start_at', 'end_at']),
+    ('idx_task_calendar_status', 'tasks', ['calendar_id', 'status'], ['calendar_id', 'status', 'due_at']),
+]
+
+# (인덱스, 테이블, 컬럼) - 신규
+NEW_INDEXES = [
+    ('idx_calendar_user_created', 'calendars', ['user_id', 'created_at']),
+    ('idx_user_created', 'users', ['created_at']),
+]
+
+
+def upgrade():
+    for name, table, columns in NEW_INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _, columns in EXTENDED_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _ in REDUNDANT_INDEXES:
+        op.drop_index(name, table_name=table)
+
+
+def downgrade():
+    for name, table, columns in reversed(REDUNDANT_INDEXES):
+        op.create_index(name, table, columns, unique=False)
+    for name, table, columns, _ in EXTENDED_INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, columns, unique=False)
+    for name, table, _ in NEW_INDEXES:
+        op.drop_index(name, table_name=table)
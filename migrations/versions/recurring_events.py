@@ -0,0 +1,57 @@
+"""add recurring events (rrule) and occurrence exceptions
+
+Revision ID: recurring_events
+Revises: fulltext_ngram
+Create Date: 2026-10-19 16:00:00.000000
+
+반복 이벤트는 마스터 한 행(events.rrule)으로 저장하고 조회 시 회차를 전개 (app.core.recurrence)
+- events: rrule / is_recurring / recurrence_end + 구간과 겹치는 마스터 조회용 인덱스
+- event_exceptions: 회차 하나의 수정/취소 (events는 파티션 테이블일 수 있어 event_id FK 없음)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import id_type
+
+
+# revision identifiers, used by Alembic.
+revision = 'recurring_events'
+down_revision = 'fulltext_ngram'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('events', sa.Column('rrule', sa.String(length=500), nullable=True))
+    op.add_column('events', sa.Column('is_recurring', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('events', sa.Column('recurrence_end', sa.DateTime(), nullable=True))
+    op.create_index('idx_event_calendar_recurring', 'events', ['calendar_id', 'is_recurring', 'start_at'], unique=False)
+
+    op.create_table('event_exceptions',
+    sa.Column('id', id_type(), nullable=False),
+    sa.Column('event_id', id_type(), nullable=False),
+    sa.Column('calendar_id', id_type(), nullable=False),
+    sa.Column('original_start', sa.DateTime(), nullable=False),
+    sa.Column('is_cancelled', sa.Boolean(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('location', sa.String(length=500), nullable=True),
+    sa.Column('start_at', sa.DateTime(), nullable=True),
+    sa.Column('end_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('uq_event_exception_original', 'event_exceptions', ['event_id', 'original_start'], unique=True)
+    op.create_index('idx_event_exception_calendar', 'event_exceptions', ['calendar_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_event_exception_calendar', table_name='event_exceptions')
+    op.drop_index('uq_event_exception_original', table_name='event_exceptions')
+    op.drop_table('event_exceptions')
+    op.drop_index('idx_event_calendar_recurring', table_name='events')
+    op.drop_column('events', 'recurrence_end')
+    op.drop_column('events', 'is_recurring')
+    op.drop_column('events', 'rrule')
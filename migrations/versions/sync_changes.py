@@ -0,0 +1,71 @@
+"""add change sequence and tombstones for delta sync
+
+Revision ID: sync_changes
+Revises: event_day_buckets
+Create Date: 2026-10-19 20:00:00.000000
+
+증분 동기화 (GET /sync, app.db.sync)
+- calendars/events/tasks/tasks_archive: 소유자 변경 번호 created_seq, change_seq + (범위, change_seq) 인덱스
+- sync_state: 사용자별 마지막 번호와 floor (정리된 삭제 기록의 최대 번호)
+- sync_tombstones: 하드 삭제 기록 (보존 기간 후 python -m app.db.sync compact 로 정리)
+
+기존 행 번호는 배포 후 채웁니다:
+    python -m app.db.sync backfill
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import id_type
+
+
+# revision identifiers, used by Alembic.
+revision = 'sync_changes'
+down_revision = 'event_day_buckets'
+branch_labels = None
+depends_on = None
+
+# (테이블, 인덱스 이름, 범위 컬럼)
+SEQ_TABLES = [
+    ('calendars', 'idx_calendar_user_change', 'user_id'),
+    ('events', 'idx_event_calendar_change', 'calendar_id'),
+    ('tasks', 'idx_task_calendar_change', 'calendar_id'),
+    ('tasks_archive', 'idx_task_archive_calendar_change', 'calendar_id'),
+]
+
+
+def upgrade():
+    for table, index, scope in SEQ_TABLES:
+        op.add_column(table, sa.Column('created_seq', sa.BigInteger(), nullable=True))
+        op.add_column(table, sa.Column('change_seq', sa.BigInteger(), nullable=True))
+        op.create_index(index, table, [scope, 'change_seq'], unique=False)
+
+    op.create_table('sync_state',
+    sa.Column('user_id', id_type(), nullable=False),
+    sa.Column('seq', sa.BigInteger(), nullable=False),
+    sa.Column('floor', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_table('sync_tombstones',
+    sa.Column('id', id_type(), nullable=False),
+    sa.Column('owner_id', id_type(), nullable=False),
+    sa.Column('resource', sa.String(length=20), nullable=False),
+    sa.Column('resource_id', id_type(), nullable=False),
+    sa.Column('change_seq', sa.BigInteger(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_tombstone_owner_seq', 'sync_tombstones', ['owner_id', 'change_seq'], unique=False)
+    op.create_index('idx_tombstone_deleted', 'sync_tombstones', ['deleted_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_tombstone_deleted', table_name='sync_tombstones')
+    op.drop_index('idx_tombstone_owner_seq', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_table('sync_state')
+    for table, index, _ in reversed(SEQ_TABLES):
+        op.drop_index(index, table_name=table)
+        op.drop_column(table, 'change_seq')
+        op.drop_column(table, 'created_seq')
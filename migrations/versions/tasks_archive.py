@@ -0,0 +1,47 @@
+"""add tasks_archive table
+
+Revision ID: tasks_archive
+Revises: events_month_partitions
+Create Date: 2026-10-19 13:00:00.000000
+
+완료/취소 작업 보관 테이블 (python -m app.db.archive 로 이동)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.types import id_type
+
+
+# revision identifiers, used by Alembic.
+revision = 'tasks_archive'
+down_revision = 'events_month_partitions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('tasks_archive',
+    sa.Column('id', id_type(), nullable=False),
+    sa.Column('calendar_id', id_type(), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('due_at', sa.DateTime(), nullable=True),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.Column('status', sa.Enum('PENDING', 'IN_PROGRESS', 'COMPLETED', 'CANCELLED', name='taskstatus'), nullable=False),
+    sa.Column('priority', sa.String(length=20), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['calendar_id'], ['calendars.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_task_archive_calendar_due', 'tasks_archive', ['calendar_id', 'due_at'], unique=False)
+    op.create_index('idx_task_archive_calendar_status', 'tasks_archive', ['calendar_id', 'status', 'due_at'], unique=False)
+    op.create_index('idx_task_archive_status_completed', 'tasks_archive', ['status', 'completed_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('idx_task_archive_status_completed', table_name='tasks_archive')
+    op.drop_index('idx_task_archive_calendar_status', table_name='tasks_archive')
+    op.drop_index('idx_task_archive_calendar_due', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
@@ -0,0 +1,27 @@
+"""add composite index for admin user filters
+
+Revision ID: user_status_index
+Revises: tasks_archive
+Create Date: 2026-10-19 14:00:00.000000
+
+GET /admin/users 의 role/is_active/is_banned 필터 + created_at 정렬용 복합 인덱스
+(단일 컬럼 인덱스는 선택도가 낮아 index_audit_covering 에서 제거됨)
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'user_status_index'
+down_revision = 'tasks_archive'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'idx_user_role_status_created', 'users', ['role', 'is_active', 'is_banned', 'created_at'], unique=False
+    )
+
+
+def downgrade():
+    op.drop_index('idx_user_role_status_created', table_name='users')
@@ -11,7 +11,6 @@ import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import random
-import uuid
 
 # Windows 콘솔 인코딩 설정
 if sys.platform == "win32":
@@ -33,6 +32,7 @@ from app.models.task import Task, TaskStatus
 fake = Faker("ko_KR")  # 한국어 로케일 사용
 
 
+from app.core.ids import new_id
 from app.core.security import hash_password
 
 def generate_users(db: Session, count: int = 20) -> list[User]:
@@ -45,7 +45,7 @@ def generate_users(db: Session, count: int = 20) -> list[User]:
     
     for i in range(count):
         user = User(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             email=fake.unique.email(),
             password=default_password_hash,
             display_name=fake.name(),
@@ -70,7 +70,7 @@ def generate_calendars(db: Session, users: list[User], count: int = 40) -> list[
     for i in range(count):
         user = random.choice(users)
         calendar = Calendar(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             user_id=user.id,
             title=fake.sentence(nb_words=3).rstrip('.'),
             description=fake.text(max_nb_chars=200) if random.random() > 0.3 else None,
@@ -107,7 +107,7 @@ def generate_events(db: Session, calendars: list[Calendar], count: int = 100) ->
             is_all_day = True
         
         event = Event(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             calendar_id=calendar.id,
             title=fake.sentence(nb_words=4).rstrip('.'),
             description=fake.text(max_nb_chars=500) if random.random() > 0.4 else None,
@@ -146,7 +146,7 @@ def generate_tasks(db: Session, calendars: list[Calendar], count: int = 100) ->
             completed_at = fake.date_time_between(start_date=due_at - timedelta(days=7), end_date=due_at)
         
         task = Task(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             calendar_id=calendar.id,
             title=fake.sentence(nb_words=4).rstrip('.'),
             description=fake.text(max_nb_chars=300) if random.random() > 0.3 else None,
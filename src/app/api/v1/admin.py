@@ -1,38 +1,124 @@
 """
 관리자 전용 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
+from datetime import datetime
 
 from app.db.session import get_db
+from app.db.cascade import purge_user
+from app.db.redis import get_redis
+from app.db.search_index import invalidate_user_index
+from app.db.suggest import invalidate_suggestions
+from app.db.queries import list_cache_key, user_list_query
+from app.core.counts import bump_counter, invalidate_counters
 from app.core.dependencies import require_admin
+from app.core.export import export_response
+from app.core.fieldsets import apply_fields, parse_fields, sort_field_name, sparse_page_response
+from app.core.responses import model_response
+from app.core.pagination import apply_sort, create_page_response, fetch_page, next_cursor
 from app.models.user import User, UserRole
-from app.schemas.user import UserResponse, UserBanRequest, UserDeactivateRequest
+from app.schemas.common import CountMode, ExportFormat
+from app.schemas.user import UserResponse, UserListRequest, UserListResponse, UserBanRequest, UserDeactivateRequest
 from app.schemas.admin import UpdateRoleRequest
 
 router = APIRouter()
 
+DEFAULT_SORT = "created_at,DESC"
 
-@router.get("/users", response_model=List[UserResponse])
+
+@router.get("/users", response_model=UserListResponse)
 def get_all_users(
+    page: int = Query(0, ge=0),
+    size: int = Query(20, ge=1, le=100),
+    sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
+    fields: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    role: Optional[UserRole] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    is_banned: Optional[bool] = Query(None),
+    created_from: Optional[str] = Query(None),
+    created_to: Optional[str] = Query(None),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """
-    모든 사용자 목록 조회 (관리자 전용)
+    사용자 목록 조회 (관리자 전용)
+
+    role/is_active/is_banned 필터는 idx_user_role_status_created로 처리됩니다.
     """
-    users = db.query(User).all()
-    return [UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    ) for user in users]
+    page_request = UserListRequest(
+        page=page,
+        size=size,
+        sort=sort,
+        cursor=cursor,
+        count=count,
+        keyword=keyword,
+        role=role,
+        is_active=is_active,
+        is_banned=is_banned,
+        created_from=datetime.fromisoformat(created_from) if created_from else None,
+        created_to=datetime.fromisoformat(created_to) if created_to else None,
+    )
+    
+    field_list = parse_fields(fields, UserResponse)
+    query = user_list_query(db, page_request)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
+    
+    cache_key = list_cache_key("users", None, page_request)
+    users, total_count, count_mode = fetch_page(
+        query, page_request, DEFAULT_SORT, cache_key, redis_client
+    )
+    page_data = create_page_response(
+        content=users,
+        page=page_request.page,
+        size=page_request.size,
+        total_elements=total_count,
+        sort=page_request.sort,
+        next_cursor=next_cursor(users, page_request, total_count, DEFAULT_SORT, count_mode),
+        count_mode=count_mode,
+    )
+    if field_list:
+        return sparse_page_response(UserResponse, field_list, page_data)
+    
+    return model_response(UserListResponse, page_data)
+
+
+@router.get("/users/export")
+def export_users(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    sort: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    role: Optional[UserRole] = Query(None),
+    is_active: Optional[bool] = Query(None),
+    is_banned: Optional[bool] = Query(None),
+    created_from: Optional[str] = Query(None),
+    created_to: Optional[str] = Query(None),
+    current_user: User = Depends(require_admin),
+    db: Session = Depends(get_db),
+):
+    """사용자 전체 내보내기 (관리자 전용, GET /admin/users와 같은 필터, NDJSON/CSV 스트리밍)"""
+    page_request = UserListRequest(
+        sort=sort,
+        keyword=keyword,
+        role=role,
+        is_active=is_active,
+        is_banned=is_banned,
+        created_from=datetime.fromisoformat(created_from) if created_from else None,
+        created_to=datetime.fromisoformat(created_to) if created_to else None,
+    )
+    
+    field_list = parse_fields(fields, UserResponse)
+    query = user_list_query(db, page_request)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
+    query = apply_sort(query, page_request, DEFAULT_SORT)
+    
+    return export_response(query, UserResponse, format, "users", field_list)
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
@@ -51,16 +137,7 @@ def get_user(
             detail="User not found",
         )
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 @router.patch("/users/{user_id}/role", response_model=UserResponse)
@@ -84,16 +161,7 @@ def update_user_role(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -101,6 +169,7 @@ def delete_user(
     user_id: str,
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """
     사용자 삭제 (관리자 전용)
@@ -119,8 +188,11 @@ def delete_user(
             detail="Cannot delete yourself",
         )
     
-    db.delete(user)
-    db.commit()
+    purge_user(db, user_id)
+    bump_counter(redis_client, "users", None, -1)
+    invalidate_counters(redis_client, ["calendars", "events", "tasks"], user_id)
+    invalidate_user_index(redis_client, user_id, purge=True)
+    invalidate_suggestions(redis_client, user_id, purge=True)
     
     return None
 
@@ -150,16 +222,7 @@ def ban_user(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 @router.post("/users/{user_id}/unban", response_model=UserResponse)
@@ -180,16 +243,7 @@ def unban_user(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 @router.post("/users/{user_id}/deactivate", response_model=UserResponse)
@@ -217,16 +271,7 @@ def deactivate_user(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 @router.post("/users/{user_id}/activate", response_model=UserResponse)
@@ -247,14 +292,5 @@ def activate_user(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
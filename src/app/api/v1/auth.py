@@ -5,7 +5,6 @@ from fastapi import APIRouter, Depends, HTTPException, status, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from datetime import timedelta
-import uuid
 import time
 
 from app.db.session import get_db
@@ -18,6 +17,8 @@ from app.core.security import (
     decode_token,
     get_token_expiry,
 )
+from app.core.ids import new_id
+from app.core.counts import bump_counter
 from app.core.dependencies import get_current_user
 from app.core.firebase import verify_firebase_token, init_firebase
 from app.core.google_oauth import get_google_oauth
@@ -62,7 +63,7 @@ def signup(
     
     # 사용자 생성
     user = User(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         email=request.email,
         password=hashed_password,
         display_name=request.display_name,
@@ -70,6 +71,7 @@ def signup(
     db.add(user)
     db.commit()
     db.refresh(user)
+    bump_counter(redis_client, "users", None, 1)
     
     # 토큰 생성
     access_token = create_access_token(data={"sub": user.id, "email": user.email, "role": user.role.value})
@@ -309,7 +311,7 @@ def firebase_login(
     else:
         # 새 사용자 생성
         user = User(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             email=email,
             password="",  # 소셜 로그인은 비밀번호 없음
             display_name=name,
@@ -318,6 +320,7 @@ def firebase_login(
         db.add(user)
         db.commit()
         db.refresh(user)
+        bump_counter(redis_client, "users", None, 1)
     
     # 서버 JWT 토큰 생성
     access_token = create_access_token(data={"sub": user.id, "email": user.email, "role": user.role.value})
@@ -419,7 +422,7 @@ async def google_callback(
         else:
             # 새 사용자 생성
             user = User(
-                id=str(uuid.uuid4()),
+                id=new_id(),
                 email=email,
                 password="",  # 소셜 로그인은 비밀번호 없음
                 display_name=name,
@@ -428,6 +431,7 @@ async def google_callback(
             db.add(user)
             db.commit()
             db.refresh(user)
+            bump_counter(redis_client, "users", None, 1)
         
         # 서버 JWT 토큰 생성
         access_token = create_access_token(data={"sub": user.id, "email": user.email, "role": user.role.value})
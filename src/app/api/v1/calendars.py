@@ -1,135 +1,268 @@
 """
 캘린더 CRUD 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
-from datetime import datetime
-import uuid
+from datetime import date, datetime, timedelta
 
 from app.db.session import get_db
+from app.core.ids import new_id
 from app.core.dependencies import get_current_user
-from app.core.pagination import apply_pagination, create_page_response
+from app.core.etag import (
+    detail_etag,
+    etag_matches,
+    list_etag,
+    not_modified,
+    set_etag,
+    touch_calendar,
+    user_version_key,
+)
+from app.core.aggregates import calendar_aggregates, include_model, parse_include
+from app.core.counts import bump_counter, invalidate_counters
+from app.core.ics import ICSImporter, ICSReader, ics_chunks
+from app.core.fieldsets import apply_fields, parse_fields, sort_field_name, sparse_model, sparse_page_response, sparse_response
+from app.core.responses import ModelResponse, model_response
+from app.core.views import next_month, parse_timezone, today, view_days
+from app.core.pagination import create_page_response, fetch_page, next_cursor
+from app.db.cascade import purge_calendars
+from app.db.queries import calendar_list_query, list_cache_key
+from app.db.redis import get_redis
+from app.db.search_index import index_document, invalidate_user_index, remove_document
+from app.db.suggest import add_suggestion, invalidate_suggestions
+from app.db.sync import mark_changed, record_deletions
 from app.models.calendar import Calendar
 from app.models.user import User
+from app.schemas.common import CountMode, PageResponse
 from app.schemas.calendar import (
     CalendarCreate,
     CalendarUpdate,
     CalendarResponse,
     CalendarListRequest,
     CalendarListResponse,
+    ICSImportResponse,
 )
+from app.schemas.view import CalendarViewResponse
 
 router = APIRouter()
 
+DEFAULT_SORT = "created_at,DESC"
+
+WEEK_STARTS = {"monday": 0, "sunday": 6}
+
 
 @router.post("", response_model=CalendarResponse, status_code=status.HTTP_201_CREATED)
 def create_calendar(
     request: CalendarCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """캘린더 생성"""
     calendar = Calendar(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         user_id=current_user.id,
         title=request.title,
         description=request.description,
         color=request.color,
     )
     db.add(calendar)
+    mark_changed(db, calendar.user_id, calendar)
     db.commit()
     db.refresh(calendar)
+    bump_counter(redis_client, "calendars", calendar.user_id, 1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "calendars", calendar.user_id, calendar)
+    add_suggestion(redis_client, "calendars", calendar.user_id, calendar)
     
-    return CalendarResponse(
-        id=calendar.id,
-        user_id=calendar.user_id,
-        title=calendar.title,
-        description=calendar.description,
-        color=calendar.color,
-        created_at=calendar.created_at,
-        updated_at=calendar.updated_at,
-    )
+    return model_response(CalendarResponse, calendar, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("", response_model=CalendarListResponse)
 def get_calendars(
+    request: Request,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
+    fields: Optional[str] = Query(None),
+    include: Optional[str] = Query(None, description="포함 집계 (counts,next_event,open_tasks)"),
     keyword: Optional[str] = Query(None),
     user_id: Optional[str] = Query(None),
     created_from: Optional[str] = Query(None),
     created_to: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
-    """캘린더 목록 조회"""
+    """
+    캘린더 목록 조회
+
+    include를 지정하면 페이지의 캘린더별 집계를 집계마다 GROUP BY 한 번으로 붙입니다 (app.core.aggregates).
+    """
     page_request = CalendarListRequest(
         page=page,
         size=size,
         sort=sort,
+        cursor=cursor,
+        count=count,
         keyword=keyword,
         user_id=user_id or current_user.id,  # 기본값: 현재 사용자
         created_from=datetime.fromisoformat(created_from) if created_from else None,
         created_to=datetime.fromisoformat(created_to) if created_to else None,
     )
     
-    query = db.query(Calendar)
+    includes = parse_include(include)
     
-    # 권한 확인: 자신의 캘린더만 조회 가능 (관리자는 모든 캘린더 조회 가능)
-    if current_user.role.value != "ADMIN":
-        query = query.filter(Calendar.user_id == current_user.id)
-    elif page_request.user_id:
-        query = query.filter(Calendar.user_id == page_request.user_id)
+    # 변경이 없으면 페이지 쿼리 없이 304 (next_event는 시간에 따라 달라지므로 제외)
+    version_key = user_version_key(current_user.id if current_user.role.value != "ADMIN" else page_request.user_id)
+    if "next_event" in includes:
+        version_key = None
+    etag = list_etag(redis_client, request, current_user.id, version_key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    # 필터 적용
-    if page_request.keyword:
-        query = query.filter(
-            or_(
-                Calendar.title.contains(page_request.keyword),
-                Calendar.description.contains(page_request.keyword),
-            )
-        )
-    if page_request.created_from:
-        query = query.filter(Calendar.created_at >= page_request.created_from)
-    if page_request.created_to:
-        query = query.filter(Calendar.created_at <= page_request.created_to)
-    
-    paginated_query, total_count = apply_pagination(query, page_request, "created_at,DESC")
-    calendars = paginated_query.all()
-    
-    content = [
-        CalendarResponse(
-            id=cal.id,
-            user_id=cal.user_id,
-            title=cal.title,
-            description=cal.description,
-            color=cal.color,
-            created_at=cal.created_at,
-            updated_at=cal.updated_at,
-        )
-        for cal in calendars
-    ]
+    field_list = parse_fields(fields, CalendarResponse)
+    query = calendar_list_query(db, current_user, page_request, redis_client)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
+    
+    owner_id = current_user.id if current_user.role.value != "ADMIN" else page_request.user_id
+    cache_key = list_cache_key("calendars", owner_id, page_request, scope_fields=("user_id",))
+    calendars, total_count, count_mode = fetch_page(
+        query, page_request, DEFAULT_SORT, cache_key, redis_client
+    )
     
-    return CalendarListResponse(**create_page_response(
-        content=content,
+    page_data = create_page_response(
+        content=calendars,
         page=page_request.page,
         size=page_request.size,
         total_elements=total_count,
         sort=page_request.sort,
-    ))
+        next_cursor=next_cursor(calendars, page_request, total_count, DEFAULT_SORT, count_mode),
+        count_mode=count_mode,
+    )
+    if includes:
+        base_model = sparse_model(CalendarResponse, field_list) if field_list else CalendarResponse
+        aggregates = calendar_aggregates(db, redis_client, [calendar.id for calendar in calendars], includes)
+        page_data["content"] = [
+            {**{name: getattr(calendar, name) for name in base_model.model_fields}, **aggregates[calendar.id]}
+            for calendar in calendars
+        ]
+        model = PageResponse[include_model(base_model, includes)]
+        return set_etag(ModelResponse(model.model_validate(page_data, from_attributes=True)), etag)
+    if field_list:
+        return set_etag(sparse_page_response(CalendarResponse, field_list, page_data), etag)
+    
+    return set_etag(model_response(CalendarListResponse, page_data), etag)
+
+
+def _view_response(
+    view: str,
+    first: date,
+    end: date,
+    tz,
+    explicit: bool,
+    request: Request,
+    current_user: User,
+    db: Session,
+    redis_client,
+):
+    """사용자 모든 캘린더의 [first, end) 날짜별 이벤트 (날짜를 생략하면 오늘 기준이라 ETag 없음)"""
+    etag = list_etag(redis_client, request, current_user.id, user_version_key(current_user.id) if explicit else None)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    days = view_days(db, redis_client, current_user.id, first, end, tz)
+    return set_etag(model_response(CalendarViewResponse, {
+        "view": view,
+        "timezone": tz.key,
+        "start": first,
+        "end": end - timedelta(days=1),
+        "days": days,
+    }), etag)
+
+
+def _timezone(name: str):
+    try:
+        return parse_timezone(name)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/views/month", response_model=CalendarViewResponse)
+def get_month_view(
+    request: Request,
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="YYYY-MM (기본: 이번 달)"),
+    tz: str = Query("UTC", description="IANA 시간대 (예: Asia/Seoul)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """
+    월 뷰
+
+    본인 모든 캘린더의 이벤트를 날짜별로 나눠 반환합니다 (여러 날/종일 이벤트는 걸친 날마다 포함).
+    """
+    zone = _timezone(tz)
+    try:
+        first = date.fromisoformat(f"{month}-01") if month else today(zone).replace(day=1)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid month",
+        )
+    return _view_response("month", first, next_month(first), zone, month is not None, request, current_user, db, redis_client)
+
+
+@router.get("/views/week", response_model=CalendarViewResponse)
+def get_week_view(
+    request: Request,
+    day: Optional[date] = Query(None, alias="date", description="주에 포함된 날짜 (기본: 오늘)"),
+    week_start: str = Query("monday", pattern="^(monday|sunday)$"),
+    tz: str = Query("UTC", description="IANA 시간대 (예: Asia/Seoul)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """주 뷰 (7일)"""
+    zone = _timezone(tz)
+    target = day or today(zone)
+    first = target - timedelta(days=(target.weekday() - WEEK_STARTS[week_start]) % 7)
+    return _view_response("week", first, first + timedelta(days=7), zone, day is not None, request, current_user, db, redis_client)
+
+
+@router.get("/views/day", response_model=CalendarViewResponse)
+def get_day_view(
+    request: Request,
+    day: Optional[date] = Query(None, alias="date", description="날짜 (기본: 오늘)"),
+    tz: str = Query("UTC", description="IANA 시간대 (예: Asia/Seoul)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """일 뷰"""
+    zone = _timezone(tz)
+    first = day or today(zone)
+    return _view_response("day", first, first + timedelta(days=1), zone, day is not None, request, current_user, db, redis_client)
 
 
 @router.get("/{calendar_id}", response_model=CalendarResponse)
 def get_calendar(
     calendar_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """캘린더 상세 조회"""
-    calendar = db.query(Calendar).filter(Calendar.id == calendar_id).first()
+    field_list = parse_fields(fields, CalendarResponse)
+    calendar = apply_fields(db.query(Calendar), field_list, "user_id", "updated_at", "change_seq").filter(Calendar.id == calendar_id).first()
     if not calendar:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -143,15 +276,14 @@ def get_calendar(
             detail="Access denied",
         )
     
-    return CalendarResponse(
-        id=calendar.id,
-        user_id=calendar.user_id,
-        title=calendar.title,
-        description=calendar.description,
-        color=calendar.color,
-        created_at=calendar.created_at,
-        updated_at=calendar.updated_at,
-    )
+    etag = detail_etag(calendar, fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if field_list:
+        return set_etag(sparse_response(CalendarResponse, field_list, calendar), etag)
+    
+    return set_etag(model_response(CalendarResponse, calendar), etag)
 
 
 @router.put("/{calendar_id}", response_model=CalendarResponse)
@@ -160,6 +292,7 @@ def update_calendar(
     request: CalendarUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """캘린더 수정"""
     calendar = db.query(Calendar).filter(Calendar.id == calendar_id).first()
@@ -182,19 +315,15 @@ def update_calendar(
         calendar.description = request.description
     if request.color is not None:
         calendar.color = request.color
+    mark_changed(db, calendar.user_id, calendar)
     
     db.commit()
     db.refresh(calendar)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "calendars", calendar.user_id, calendar)
+    add_suggestion(redis_client, "calendars", calendar.user_id, calendar)
     
-    return CalendarResponse(
-        id=calendar.id,
-        user_id=calendar.user_id,
-        title=calendar.title,
-        description=calendar.description,
-        color=calendar.color,
-        created_at=calendar.created_at,
-        updated_at=calendar.updated_at,
-    )
+    return model_response(CalendarResponse, calendar)
 
 
 @router.delete("/{calendar_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -202,6 +331,7 @@ def delete_calendar(
     calendar_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """캘린더 삭제"""
     calendar = db.query(Calendar).filter(Calendar.id == calendar_id).first()
@@ -218,12 +348,98 @@ def delete_calendar(
             detail="Access denied",
         )
     
-    db.delete(calendar)
-    db.commit()
+    owner_id = calendar.user_id
+    # 삭제 기록은 첫 청크 삭제와 함께 커밋 (하위 이벤트/작업은 캘린더 삭제로 함께 처리)
+    record_deletions(db, owner_id, "calendars", [calendar.id])
+    purge_calendars(db, [calendar.id])
+    bump_counter(redis_client, "calendars", owner_id, -1)
+    touch_calendar(redis_client, calendar_id, owner_id)
+    # 하위 이벤트/작업 수는 알 수 없으므로 카운터 삭제, 검색 색인은 다음 조회 시 재생성
+    invalidate_counters(redis_client, ["events", "tasks"], owner_id)
+    remove_document(redis_client, "calendars", owner_id, calendar_id)
+    invalidate_user_index(redis_client, owner_id)
+    invalidate_suggestions(redis_client, owner_id)
     return None
 
 
+def _owned_calendar(db: Session, calendar_id: str, current_user: User) -> Calendar:
+    """캘린더 조회 + 소유권 확인 (404 / 403)"""
+    calendar = db.query(Calendar).filter(Calendar.id == calendar_id).first()
+    if not calendar:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Calendar not found",
+        )
+    
+    if calendar.user_id != current_user.id and current_user.role.value != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+    return calendar
 
 
+@router.get("/{calendar_id}/ics")
+def export_calendar_ics(
+    calendar_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """캘린더 iCalendar 내보내기 (이벤트/회차 수정/작업, 서버 측 커서로 스트리밍)"""
+    calendar = _owned_calendar(db, calendar_id, current_user)
+    return StreamingResponse(
+        ics_chunks(db.get_bind(), calendar.id, calendar.title),
+        media_type="text/calendar; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="{calendar.id}.ics"'},
+    )
+
 
+def _finish_import(redis_client, calendar: Calendar, importer: ICSImporter) -> None:
+    owner_id = calendar.user_id
+    bump_counter(redis_client, "events", owner_id, importer.counts["events"])
+    bump_counter(redis_client, "tasks", owner_id, importer.counts["tasks"])
+    touch_calendar(redis_client, calendar.id, owner_id)
+    # 개별 색인 대신 다음 조회 시 재생성
+    invalidate_user_index(redis_client, owner_id)
+    invalidate_suggestions(redis_client, owner_id)
 
+
+@router.post("/{calendar_id}/import", response_model=ICSImportResponse)
+async def import_calendar_ics(
+    calendar_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """
+    iCalendar 가져오기 (요청 본문이 ICS, Content-Type: text/calendar)
+
+    본문을 받는 대로 파싱해 VEVENT/VTODO를 청크 단위 다중 행 INSERT로 저장합니다 (청크마다 커밋).
+    변환할 수 없는 항목은 건너뛰고 rejected에 줄 번호와 사유를 담습니다.
+    """
+    calendar = await run_in_threadpool(_owned_calendar, db, calendar_id, current_user)
+    reader = ICSReader()
+    importer = ICSImporter(db, calendar.id, calendar.user_id)
+    try:
+        async for data in request.stream():
+            if importer.add(reader.feed(data)):
+                await run_in_threadpool(importer.flush)
+        importer.add(reader.close())
+        if not reader.saw_calendar:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid ICS: missing VCALENDAR",
+            )
+        await run_in_threadpool(importer.flush)
+    finally:
+        # 이미 커밋한 청크는 오류(400, 연결 끊김)로 끝나도 카운터/버전/색인에 반영
+        if importer.chunks:
+            await run_in_threadpool(_finish_import, redis_client, calendar, importer)
+    
+    return model_response(ICSImportResponse, {
+        **importer.counts,
+        "chunks": importer.chunks,
+        "rejected_count": importer.rejected_count,
+        "rejected": [vars(entry) for entry in importer.rejected],
+    })
@@ -1,22 +1,52 @@
 """
 이벤트 CRUD 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import Optional
-from datetime import datetime
-import uuid
+from typing import List, Optional, Tuple
+from bisect import bisect_left
+from datetime import datetime, timedelta
 
 from app.db.session import get_db
+from app.core.ids import new_id
 from app.core.dependencies import get_current_user
-from app.core.pagination import apply_pagination, create_page_response
-from app.models.event import Event
+from app.core.etag import (
+    calendar_version_key,
+    detail_etag,
+    etag_matches,
+    list_etag,
+    not_modified,
+    set_etag,
+    touch_calendar,
+    user_version_key,
+)
+from app.core.counts import bump_counter
+from app.core.export import export_response
+from app.core.fieldsets import apply_fields, parse_fields, sort_field_name, sparse_page_response, sparse_response
+from app.core.responses import model_response
+from app.core.pagination import apply_sort, create_page_response, fetch_page, next_cursor
+from app.core.recurrence import (
+    MAX_WINDOW_DAYS,
+    expand_occurrences,
+    expanded_page,
+    is_occurrence,
+    parse_rrule,
+    recurrence_end,
+)
+from app.db.day_buckets import delete_buckets, find_conflicts, sync_buckets
+from app.db.queries import event_list_query, list_cache_key
+from app.db.redis import get_redis
+from app.db.search_index import index_document, remove_document
+from app.db.sync import mark_changed, record_deletions
+from app.db.suggest import add_suggestion, remove_suggestion
+from app.models.event import Event, EventException
 from app.models.calendar import Calendar
 from app.models.user import User
+from app.schemas.common import CountMode, ExportFormat, UtcDatetime
 from app.schemas.event import (
     EventCreate,
     EventUpdate,
+    EventOccurrenceUpdate,
     EventResponse,
     EventListRequest,
     EventListResponse,
@@ -24,12 +54,100 @@ from app.schemas.event import (
 
 router = APIRouter()
 
+DEFAULT_SORT = "start_at,ASC"
+
+
+def _apply_recurrence(event: Event, rrule: Optional[str]) -> None:
+    """반복 규칙 검증 후 rrule / is_recurring / recurrence_end 설정 (빈 값이면 반복 해제)"""
+    if not rrule:
+        event.rrule, event.is_recurring, event.recurrence_end = None, False, None
+        return
+    try:
+        rule = parse_rrule(rrule)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid rrule: {e}",
+        )
+    event.rrule = rule.to_string()
+    event.is_recurring = True
+    event.recurrence_end = recurrence_end(rule, event.start_at, event.end_at - event.start_at)
+
+
+def _series_intervals(db: Session, event: Event) -> List[Tuple[datetime, datetime]]:
+    """
+    겹침 확인 대상 구간 (단일 이벤트는 자신, 반복 이벤트는 회차)
+
+    반복 이벤트는 마지막 회차 또는 시작 후 MAX_WINDOW_DAYS까지 전개하고 (flush된) 회차 예외를 적용합니다.
+    """
+    if not event.is_recurring:
+        return [(event.start_at, event.end_at)]
+    horizon = event.start_at + timedelta(days=MAX_WINDOW_DAYS)
+    window_end = min(event.recurrence_end, horizon) if event.recurrence_end else horizon
+    return [(item["start_at"], item["end_at"]) for item in expand_occurrences(db, None, [event], event.start_at, window_end)]
+
+
+def _overlapping(items: list, intervals: List[Tuple[datetime, datetime]]) -> list:
+    """구간 중 하나라도 겹치는 항목 (구간 시작 정렬 + 누적 최대 종료 시각으로 이분 탐색)"""
+    intervals = sorted((start, end if end > start else start + timedelta(microseconds=1)) for start, end in intervals)
+    starts = [start for start, _ in intervals]
+    max_ends = []
+    for _, end in intervals:
+        max_ends.append(max(end, max_ends[-1]) if max_ends else end)
+
+    def overlaps(item) -> bool:
+        start_at, end_at = (item["start_at"], item["end_at"]) if isinstance(item, dict) else (item.start_at, item.end_at)
+        index = bisect_left(starts, end_at if end_at > start_at else start_at + timedelta(microseconds=1))
+        return index > 0 and max_ends[index - 1] > start_at
+
+    return [item for item in items if overlaps(item)]
+
+
+def _check_conflicts(
+    db: Session,
+    redis_client,
+    calendar: Calendar,
+    scope: str,
+    intervals: List[Tuple[datetime, datetime]],
+    exclude_event_id: Optional[str] = None,
+) -> None:
+    """
+    구간(반복 이벤트는 회차들)과 겹치는 이벤트가 있으면 409 (detail.conflicts에 겹치는 이벤트/회차)
+
+    전체 구간의 후보를 한 번 조회한 뒤 각 구간과 겹치는 것만 남깁니다.
+    """
+    if not intervals:
+        return
+    if scope == "user":
+        calendar_ids = [row[0] for row in db.query(Calendar.id).filter(Calendar.user_id == calendar.user_id)]
+    else:
+        calendar_ids = [calendar.id]
+    window_start = min(start for start, _ in intervals)
+    window_end = max(end for _, end in intervals)
+    conflicts = find_conflicts(db, calendar_ids, window_start, window_end, exclude_event_id, redis_client)
+    if len(intervals) > 1:
+        conflicts = _overlapping(conflicts, intervals)
+    if conflicts:
+        detail = {
+            "message": "Conflicting events",
+            "conflicts": [EventResponse.model_validate(item).model_dump(mode="json") for item in conflicts],
+        }
+        # 확인 전에 flush한 생성/수정 취소
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail,
+        )
+
 
 @router.post("", response_model=EventResponse, status_code=status.HTTP_201_CREATED)
 def create_event(
     request: EventCreate,
+    check_conflicts: bool = Query(False, description="겹치는 이벤트가 있으면 저장하지 않고 409로 반환"),
+    conflict_scope: str = Query("calendar", pattern="^(calendar|user)$", description="겹침 확인 범위"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """이벤트 생성"""
     # 캘린더 소유권 확인
@@ -54,7 +172,7 @@ def create_event(
         )
     
     event = Event(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         calendar_id=request.calendar_id,
         title=request.title,
         description=request.description,
@@ -63,29 +181,33 @@ def create_event(
         location=request.location,
         is_all_day=request.is_all_day,
     )
+    _apply_recurrence(event, request.rrule)
     db.add(event)
+    sync_buckets(db, event)
+    if check_conflicts:
+        # 409이면 커밋하지 않으므로 flush한 이벤트는 롤백됨
+        db.flush()
+        _check_conflicts(db, redis_client, calendar, conflict_scope, _series_intervals(db, event), event.id)
+    mark_changed(db, calendar.user_id, event)
     db.commit()
     db.refresh(event)
+    bump_counter(redis_client, "events", calendar.user_id, 1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "events", calendar.user_id, event)
+    add_suggestion(redis_client, "events", calendar.user_id, event)
     
-    return EventResponse(
-        id=event.id,
-        calendar_id=event.calendar_id,
-        title=event.title,
-        description=event.description,
-        start_at=event.start_at,
-        end_at=event.end_at,
-        location=event.location,
-        is_all_day=event.is_all_day,
-        created_at=event.created_at,
-        updated_at=event.updated_at,
-    )
+    return model_response(EventResponse, event, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("", response_model=EventListResponse)
 def get_events(
+    request: Request,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
+    fields: Optional[str] = Query(None),
     keyword: Optional[str] = Query(None),
     calendar_id: Optional[str] = Query(None),
     start_from: Optional[str] = Query(None),
@@ -93,14 +215,18 @@ def get_events(
     end_from: Optional[str] = Query(None),
     end_to: Optional[str] = Query(None),
     is_all_day: Optional[bool] = Query(None),
+    expand: bool = Query(False, description="반복 이벤트를 start_from ~ start_to 구간의 회차로 전개"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """이벤트 목록 조회"""
     page_request = EventListRequest(
         page=page,
         size=size,
         sort=sort,
+        cursor=cursor,
+        count=count,
         keyword=keyword,
         calendar_id=calendar_id,
         start_from=datetime.fromisoformat(start_from) if start_from else None,
@@ -110,70 +236,99 @@ def get_events(
         is_all_day=is_all_day,
     )
     
-    query = db.query(Event).join(Calendar)
-    
-    # 권한 확인: 자신의 캘린더 이벤트만 조회 가능
-    if current_user.role.value != "ADMIN":
-        query = query.filter(Calendar.user_id == current_user.id)
+    # 변경이 없으면 페이지 쿼리 없이 304
+    version_key = calendar_version_key(calendar_id) if calendar_id else (
+        None if current_user.role.value == "ADMIN" else user_version_key(current_user.id)
+    )
+    etag = list_etag(redis_client, request, current_user.id, version_key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    # 필터 적용
-    if page_request.calendar_id:
-        query = query.filter(Event.calendar_id == page_request.calendar_id)
-    if page_request.keyword:
-        query = query.filter(
-            or_(
-                Event.title.contains(page_request.keyword),
-                Event.description.contains(page_request.keyword),
-                Event.location.contains(page_request.keyword),
-            )
+    field_list = parse_fields(fields, EventResponse)
+    if expand:
+        # 반복 회차는 마스터 전체 필드가 필요하므로 fields는 응답에만 적용
+        events, total_count = expanded_page(db, redis_client, current_user, page_request)
+        page_data = create_page_response(
+            content=events,
+            page=page_request.page,
+            size=page_request.size,
+            total_elements=total_count,
+            sort=page_request.sort,
         )
-    if page_request.start_from:
-        query = query.filter(Event.start_at >= page_request.start_from)
-    if page_request.start_to:
-        query = query.filter(Event.start_at <= page_request.start_to)
-    if page_request.end_from:
-        query = query.filter(Event.end_at >= page_request.end_from)
-    if page_request.end_to:
-        query = query.filter(Event.end_at <= page_request.end_to)
-    if page_request.is_all_day is not None:
-        query = query.filter(Event.is_all_day == page_request.is_all_day)
+        if field_list:
+            return set_etag(sparse_page_response(EventResponse, field_list, page_data), etag)
+        return set_etag(model_response(EventListResponse, page_data), etag)
     
-    paginated_query, total_count = apply_pagination(query, page_request, "start_at,ASC")
-    events = paginated_query.all()
+    query = event_list_query(db, current_user, page_request, redis_client)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
     
-    content = [
-        EventResponse(
-            id=event.id,
-            calendar_id=event.calendar_id,
-            title=event.title,
-            description=event.description,
-            start_at=event.start_at,
-            end_at=event.end_at,
-            location=event.location,
-            is_all_day=event.is_all_day,
-            created_at=event.created_at,
-            updated_at=event.updated_at,
-        )
-        for event in events
-    ]
+    cache_key = list_cache_key("events", None if current_user.role.value == "ADMIN" else current_user.id, page_request)
+    events, total_count, count_mode = fetch_page(
+        query, page_request, DEFAULT_SORT, cache_key, redis_client
+    )
     
-    return EventListResponse(**create_page_response(
-        content=content,
+    page_data = create_page_response(
+        content=events,
         page=page_request.page,
         size=page_request.size,
         total_elements=total_count,
         sort=page_request.sort,
-    ))
+        next_cursor=next_cursor(events, page_request, total_count, DEFAULT_SORT, count_mode),
+        count_mode=count_mode,
+    )
+    if field_list:
+        return set_etag(sparse_page_response(EventResponse, field_list, page_data), etag)
+    
+    return set_etag(model_response(EventListResponse, page_data), etag)
+
+
+@router.get("/export")
+def export_events(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    sort: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    calendar_id: Optional[str] = Query(None),
+    start_from: Optional[str] = Query(None),
+    start_to: Optional[str] = Query(None),
+    end_from: Optional[str] = Query(None),
+    end_to: Optional[str] = Query(None),
+    is_all_day: Optional[bool] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """이벤트 전체 내보내기 (GET /events와 같은 필터, NDJSON/CSV 스트리밍)"""
+    page_request = EventListRequest(
+        sort=sort,
+        keyword=keyword,
+        calendar_id=calendar_id,
+        start_from=datetime.fromisoformat(start_from) if start_from else None,
+        start_to=datetime.fromisoformat(start_to) if start_to else None,
+        end_from=datetime.fromisoformat(end_from) if end_from else None,
+        end_to=datetime.fromisoformat(end_to) if end_to else None,
+        is_all_day=is_all_day,
+    )
+    
+    field_list = parse_fields(fields, EventResponse)
+    query = event_list_query(db, current_user, page_request, redis_client)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
+    query = apply_sort(query, page_request, DEFAULT_SORT)
+    
+    return export_response(query, EventResponse, format, "events", field_list)
 
 
 @router.get("/{event_id}", response_model=EventResponse)
 def get_event(
     event_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """이벤트 상세 조회"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    field_list = parse_fields(fields, EventResponse)
+    event = apply_fields(db.query(Event), field_list, "calendar_id", "updated_at", "change_seq").filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -188,26 +343,25 @@ def get_event(
             detail="Access denied",
         )
     
-    return EventResponse(
-        id=event.id,
-        calendar_id=event.calendar_id,
-        title=event.title,
-        description=event.description,
-        start_at=event.start_at,
-        end_at=event.end_at,
-        location=event.location,
-        is_all_day=event.is_all_day,
-        created_at=event.created_at,
-        updated_at=event.updated_at,
-    )
+    etag = detail_etag(event, fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if field_list:
+        return set_etag(sparse_response(EventResponse, field_list, event), etag)
+    
+    return set_etag(model_response(EventResponse, event), etag)
 
 
 @router.put("/{event_id}", response_model=EventResponse)
 def update_event(
     event_id: str,
     request: EventUpdate,
+    check_conflicts: bool = Query(False, description="겹치는 이벤트가 있으면 저장하지 않고 409로 반환"),
+    conflict_scope: str = Query("calendar", pattern="^(calendar|user)$", description="겹침 확인 범위"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """이벤트 수정"""
     event = db.query(Event).filter(Event.id == event_id).first()
@@ -233,7 +387,7 @@ def update_event(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="End date must be after start date",
         )
-    
+    rrule_before, start_before = event.rrule, event.start_at
     if request.title is not None:
         event.title = request.title
     if request.description is not None:
@@ -246,22 +400,26 @@ def update_event(
         event.location = request.location
     if request.is_all_day is not None:
         event.is_all_day = request.is_all_day
+    if request.rrule is not None or (event.is_recurring and (request.start_at or request.end_at)):
+        _apply_recurrence(event, event.rrule if request.rrule is None else request.rrule)
+        # 규칙이나 시작 시각이 바뀌면 기존 회차 예외는 더 이상 회차와 맞지 않으므로 삭제
+        if event.rrule != rrule_before or event.start_at != start_before:
+            db.query(EventException).filter(EventException.event_id == event.id).delete(synchronize_session=False)
+    if request.start_at is not None or request.end_at is not None or request.rrule is not None:
+        sync_buckets(db, event)
+    if check_conflicts:
+        # 수정 후 상태(새 규칙, 남은 회차 예외)로 확인, 409이면 커밋하지 않음
+        db.flush()
+        _check_conflicts(db, redis_client, calendar, conflict_scope, _series_intervals(db, event), event.id)
+    mark_changed(db, calendar.user_id, event)
     
     db.commit()
     db.refresh(event)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "events", calendar.user_id, event)
+    add_suggestion(redis_client, "events", calendar.user_id, event)
     
-    return EventResponse(
-        id=event.id,
-        calendar_id=event.calendar_id,
-        title=event.title,
-        description=event.description,
-        start_at=event.start_at,
-        end_at=event.end_at,
-        location=event.location,
-        is_all_day=event.is_all_day,
-        created_at=event.created_at,
-        updated_at=event.updated_at,
-    )
+    return model_response(EventResponse, event)
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -269,6 +427,7 @@ def delete_event(
     event_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """이벤트 삭제"""
     event = db.query(Event).filter(Event.id == event_id).first()
@@ -286,12 +445,117 @@ def delete_event(
             detail="Access denied",
         )
     
+    db.query(EventException).filter(EventException.event_id == event.id).delete(synchronize_session=False)
+    delete_buckets(db, event.id)
+    record_deletions(db, calendar.user_id, "events", [event.id])
     db.delete(event)
     db.commit()
+    bump_counter(redis_client, "events", calendar.user_id, -1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    remove_document(redis_client, "events", calendar.user_id, event_id)
+    remove_suggestion(redis_client, "events", calendar.user_id, event_id)
     return None
 
 
+def _recurring_event(db: Session, event_id: str, recurrence_id: datetime, current_user: User):
+    """회차 예외 대상 마스터와 캘린더 (권한, 회차 여부 확인)"""
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found",
+        )
+    
+    # 권한 확인
+    calendar = db.query(Calendar).filter(Calendar.id == event.calendar_id).first()
+    if calendar.user_id != current_user.id and current_user.role.value != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+    
+    if not event.is_recurring or not is_occurrence(event, recurrence_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Occurrence not found",
+        )
+    return event, calendar
+
+
+def _occurrence_exception(db: Session, event: Event, recurrence_id: datetime) -> EventException:
+    exception = db.query(EventException).filter(
+        EventException.event_id == event.id,
+        EventException.original_start == recurrence_id,
+    ).first()
+    if exception is None:
+        exception = EventException(
+            id=new_id(),
+            event_id=event.id,
+            calendar_id=event.calendar_id,
+            original_start=recurrence_id,
+        )
+        db.add(exception)
+    return exception
 
 
+@router.put("/{event_id}/occurrences/{recurrence_id}", status_code=status.HTTP_204_NO_CONTENT)
+def update_occurrence(
+    event_id: str,
+    recurrence_id: UtcDatetime,
+    request: EventOccurrenceUpdate,
+    check_conflicts: bool = Query(False, description="겹치는 이벤트가 있으면 저장하지 않고 409로 반환"),
+    conflict_scope: str = Query("calendar", pattern="^(calendar|user)$", description="겹침 확인 범위"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """반복 이벤트 회차 하나 수정 (recurrence_id: 회차의 원래 시작 시각)"""
+    event, calendar = _recurring_event(db, event_id, recurrence_id, current_user)
+    
+    # 날짜 검증
+    duration = event.end_at - event.start_at
+    start_at = request.start_at or recurrence_id
+    end_at = request.end_at or start_at + duration
+    if end_at < start_at:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End date must be after start date",
+        )
+    if check_conflicts:
+        # 같은 반복 이벤트의 다른 회차는 제외
+        _check_conflicts(db, redis_client, calendar, conflict_scope, [(start_at, end_at)], event.id)
+    
+    exception = _occurrence_exception(db, event, recurrence_id)
+    exception.is_cancelled = False
+    for name in ("title", "description", "location"):
+        value = getattr(request, name)
+        if value is not None:
+            setattr(exception, name, value)
+    if request.start_at is not None or request.end_at is not None:
+        exception.start_at, exception.end_at = start_at, end_at
+    # 동기화에서는 마스터가 바뀐 것으로 보고 클라이언트가 회차를 다시 전개
+    mark_changed(db, calendar.user_id, event)
+    
+    db.commit()
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    return None
 
 
+@router.delete("/{event_id}/occurrences/{recurrence_id}", status_code=status.HTTP_204_NO_CONTENT)
+def cancel_occurrence(
+    event_id: str,
+    recurrence_id: UtcDatetime,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """반복 이벤트 회차 하나 취소"""
+    event, calendar = _recurring_event(db, event_id, recurrence_id, current_user)
+    
+    exception = _occurrence_exception(db, event, recurrence_id)
+    exception.is_cancelled = True
+    mark_changed(db, calendar.user_id, event)
+    
+    db.commit()
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    return None
@@ -0,0 +1,84 @@
+"""
+Free/busy 엔드포인트
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from datetime import timedelta
+
+from app.db.session import get_db
+from app.core.dependencies import get_current_user
+from app.core.freebusy import busy_intervals
+from app.core.responses import model_response
+from app.db.redis import get_redis
+from app.models.calendar import Calendar
+from app.models.user import User
+from app.schemas.freebusy import FreeBusyRequest, FreeBusyResponse
+
+router = APIRouter()
+
+# 조회 구간 상한
+MAX_WINDOW_DAYS = 366
+
+
+@router.post("", response_model=FreeBusyResponse)
+def get_freebusy(
+    request: FreeBusyRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """
+    Free/busy 조회
+
+    지정한 캘린더(및 사용자의 모든 캘린더)의 바쁜 구간을 병합해 반환합니다.
+    일반 사용자는 본인 캘린더/본인만 지정할 수 있습니다.
+    """
+    if request.time_max <= request.time_min or request.time_max - request.time_min > timedelta(days=MAX_WINDOW_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"time_max must be after time_min and within {MAX_WINDOW_DAYS} days",
+        )
+    if not request.calendar_ids and not request.user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="calendar_ids or user_ids is required",
+        )
+    
+    is_admin = current_user.role.value == "ADMIN"
+    
+    # 권한 확인
+    if not is_admin and any(user_id != current_user.id for user_id in request.user_ids):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+    
+    calendar_ids = set()
+    if request.calendar_ids:
+        owners = dict(db.execute(
+            select(Calendar.id, Calendar.user_id).where(Calendar.id.in_(set(request.calendar_ids)))
+        ).all())
+        if len(owners) != len(set(request.calendar_ids)):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Calendar not found",
+            )
+        if not is_admin and any(owner_id != current_user.id for owner_id in owners.values()):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Access denied",
+            )
+        calendar_ids.update(owners)
+    if request.user_ids:
+        calendar_ids.update(db.execute(
+            select(Calendar.id).where(Calendar.user_id.in_(set(request.user_ids)))
+        ).scalars())
+    
+    busy = busy_intervals(db, sorted(calendar_ids), request.time_min, request.time_max, redis_client)
+    return model_response(FreeBusyResponse, {
+        "time_min": request.time_min,
+        "time_max": request.time_max,
+        "calendars": len(calendar_ids),
+        "busy": [{"start": start, "end": end} for start, end in busy],
+    })
@@ -3,7 +3,7 @@ API v1 router
 """
 from fastapi import APIRouter
 
-from app.api.v1 import auth, admin, users, calendars, events, tasks, stats
+from app.api.v1 import auth, admin, users, calendars, events, tasks, stats, search, freebusy, sync
 
 api_router = APIRouter()
 
@@ -27,3 +27,12 @@ api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 # Stats
 api_router.include_router(stats.router, prefix="/stats", tags=["stats"])
+
+# Search
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+
+# Free/busy
+api_router.include_router(freebusy.router, prefix="/freebusy", tags=["freebusy"])
+
+# Sync
+api_router.include_router(sync.router, prefix="/sync", tags=["sync"])
@@ -0,0 +1,76 @@
+"""
+검색 엔드포인트
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.db.session import get_db
+from app.core.dependencies import get_current_user
+from app.core.responses import model_response
+from app.db.redis import get_redis
+from app.core.search import SEARCH_TYPES, search_all
+from app.db.suggest import SUGGEST_TYPES, suggest
+from app.models.user import User
+from app.schemas.search import SearchResponse, SuggestResponse
+
+router = APIRouter()
+
+
+def parse_types(types: Optional[str], allowed=tuple(SUGGEST_TYPES)) -> tuple:
+    """types 파라미터 파싱 (기본 전체, 알 수 없는 항목은 400)"""
+    if not types:
+        return tuple(allowed)
+    requested = {name.strip() for name in types.split(",") if name.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown type: {', '.join(sorted(unknown))}",
+        )
+    return tuple(name for name in allowed if name in requested)
+
+
+@router.get("", response_model=SearchResponse)
+def search(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어"),
+    limit: int = Query(5, ge=1, le=20, description="리소스별 최대 항목 수"),
+    types: Optional[str] = Query(None, description="대상 (calendars,events,tasks)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """
+    통합 검색
+
+    본인 캘린더/이벤트/작업을 동시에 검색해 하나의 순위 목록으로 반환합니다.
+    시간 예산 안에 끝나지 않은 리소스는 incomplete에 표시하고 나머지 결과만 반환합니다.
+    """
+    items, incomplete = search_all(db, current_user, q, parse_types(types, SEARCH_TYPES), limit, redis_client=redis_client)
+    return model_response(SearchResponse, {
+        "query": q,
+        "items": items,
+        "partial": bool(incomplete),
+        "incomplete": incomplete,
+    })
+
+
+@router.get("/suggest", response_model=SuggestResponse)
+def get_suggestions(
+    q: str = Query(..., min_length=1, max_length=100, description="제목 접두사"),
+    limit: int = Query(10, ge=1, le=20, description="최대 항목 수"),
+    types: Optional[str] = Query(None, description="대상 (calendars,events,tasks)"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """
+    제목 자동완성
+
+    사용자 본인의 캘린더/이벤트/작업 제목 중 q로 시작하는(단어 시작 포함) 항목을 반환합니다.
+    """
+    items = suggest(db, redis_client, current_user.id, q, limit, parse_types(types))
+    return model_response(SuggestResponse, {
+        "query": q,
+        "items": [{"type": resource, "id": doc_id, "title": title} for resource, doc_id, title in items],
+    })
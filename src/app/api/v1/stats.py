@@ -12,7 +12,7 @@ from app.core.dependencies import require_admin
 from app.models.user import User
 from app.models.calendar import Calendar
 from app.models.event import Event
-from app.models.task import Task, TaskStatus
+from app.models.task import Task, TaskArchive, TaskStatus
 from app.schemas.stats import (
     DailyStatsResponse,
     TopCalendarStatsResponse,
@@ -168,10 +168,15 @@ def get_stats_summary(
     
     total_calendars = db.query(func.count(Calendar.id)).scalar() or 0
     total_events = db.query(func.count(Event.id)).scalar() or 0
-    total_tasks = db.query(func.count(Task.id)).scalar() or 0
-    completed_tasks_count = db.query(func.count(Task.id)).filter(
+    total_tasks = (db.query(func.count(Task.id)).scalar() or 0) + (
+        db.query(func.count(TaskArchive.id)).scalar() or 0
+    )
+    # 완료 작업은 대부분 tasks_archive로 이동하므로 두 테이블 합산
+    completed_tasks_count = (db.query(func.count(Task.id)).filter(
         Task.status == TaskStatus.COMPLETED
-    ).scalar() or 0
+    ).scalar() or 0) + (db.query(func.count(TaskArchive.id)).filter(
+        TaskArchive.status == TaskStatus.COMPLETED
+    ).scalar() or 0)
     
     # 다가오는 이벤트 (7일 이내)
     upcoming_events_count = db.query(func.count(Event.id)).filter(
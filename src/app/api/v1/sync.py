@@ -0,0 +1,67 @@
+"""
+증분 동기화 엔드포인트
+"""
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.db.session import get_db
+from app.core.dependencies import get_current_user
+from app.core.pagination import decode_signed, encode_signed
+from app.core.responses import model_response
+from app.db.sync import SYNC_RESOURCES, changes_since, state
+from app.models.user import User
+from app.schemas.sync import SyncResponse
+
+router = APIRouter()
+
+
+@router.get("", response_model=SyncResponse)
+def sync_changes(
+    token: Optional[str] = Query(None, description="이전 응답의 token (없으면 전체 동기화)"),
+    limit: int = Query(500, ge=1, le=1000, description="한 번에 반환할 최대 변경 수"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    증분 동기화
+
+    token 이후 바뀐 캘린더/이벤트/작업(created/updated)과 삭제된 id(deleted)를 변경 순서대로 반환합니다.
+    has_more가 true이면 응답의 token으로 이어서 요청합니다.
+    토큰이 삭제 기록 보존 기간보다 오래되면 410을 반환하며, 토큰 없이 전체 동기화해야 합니다.
+    """
+    since = 0
+    if token is not None:
+        payload = decode_signed(token)
+        if (
+            payload is None
+            or payload.get("u") != current_user.id
+            or not isinstance(payload.get("s"), int)
+            or payload["s"] < 0
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid sync token",
+            )
+        since = payload["s"]
+        seq, floor = state(db, current_user.id)
+        if since < floor or since > seq:
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail="Sync token expired",
+            )
+    
+    changed, deleted, last_seq, has_more = changes_since(db, current_user.id, since, limit)
+    body = {
+        resource: {
+            "created": [obj for obj in changed[resource] if obj.created_seq is not None and obj.created_seq > since],
+            "updated": [obj for obj in changed[resource] if obj.created_seq is None or obj.created_seq <= since],
+            "deleted": deleted[resource],
+        }
+        for resource in SYNC_RESOURCES
+    }
+    return model_response(SyncResponse, {
+        "token": encode_signed({"u": current_user.id, "s": last_seq}),
+        "has_more": has_more,
+        **body,
+    })
@@ -1,19 +1,39 @@
 """
 작업 CRUD 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from typing import Optional
 from datetime import datetime
-import uuid
 
 from app.db.session import get_db
+from app.core.ids import new_id
 from app.core.dependencies import get_current_user
-from app.core.pagination import apply_pagination, create_page_response
-from app.models.task import Task, TaskStatus
+from app.core.etag import (
+    calendar_version_key,
+    detail_etag,
+    etag_matches,
+    list_etag,
+    not_modified,
+    set_etag,
+    touch_calendar,
+    user_version_key,
+)
+from app.core.counts import bump_counter
+from app.core.export import export_response
+from app.core.fieldsets import apply_fields, parse_fields, sort_field_name, sparse_page_response, sparse_response
+from app.core.responses import model_response
+from app.core.pagination import apply_sort, create_page_response, fetch_page, next_cursor
+from app.db.archive import restore_task
+from app.db.queries import list_cache_key, task_list_query
+from app.db.redis import get_redis
+from app.db.search_index import index_document, remove_document
+from app.db.suggest import add_suggestion, remove_suggestion
+from app.db.sync import mark_changed, record_deletions
+from app.models.task import Task, TaskArchive, TaskStatus
 from app.models.calendar import Calendar
 from app.models.user import User
+from app.schemas.common import CountMode, ExportFormat
 from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
@@ -24,12 +44,15 @@ from app.schemas.task import (
 
 router = APIRouter()
 
+DEFAULT_SORT = "due_at,ASC"
+
 
 @router.post("", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 def create_task(
     request: TaskCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """작업 생성"""
     # 캘린더 소유권 확인
@@ -47,7 +70,7 @@ def create_task(
         )
     
     task = Task(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         calendar_id=request.calendar_id,
         title=request.title,
         description=request.description,
@@ -56,111 +79,136 @@ def create_task(
         priority=request.priority,
     )
     db.add(task)
+    mark_changed(db, calendar.user_id, task)
     db.commit()
     db.refresh(task)
+    bump_counter(redis_client, "tasks", calendar.user_id, 1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "tasks", calendar.user_id, task)
+    add_suggestion(redis_client, "tasks", calendar.user_id, task)
     
-    return TaskResponse(
-        id=task.id,
-        calendar_id=task.calendar_id,
-        title=task.title,
-        description=task.description,
-        due_at=task.due_at,
-        status=task.status,
-        priority=task.priority,
-        completed_at=task.completed_at,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return model_response(TaskResponse, task, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("", response_model=TaskListResponse)
 def get_tasks(
+    request: Request,
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
+    fields: Optional[str] = Query(None),
     keyword: Optional[str] = Query(None),
     calendar_id: Optional[str] = Query(None),
     status: Optional[TaskStatus] = Query(None),
     priority: Optional[str] = Query(None),
     due_from: Optional[str] = Query(None),
     due_to: Optional[str] = Query(None),
+    include_archived: bool = Query(False),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
-    """작업 목록 조회"""
+    """작업 목록 조회 (status=COMPLETED 또는 include_archived=true이면 보관 작업 포함)"""
     page_request = TaskListRequest(
         page=page,
         size=size,
         sort=sort,
+        cursor=cursor,
+        count=count,
         keyword=keyword,
         calendar_id=calendar_id,
         status=status,
         priority=priority,
         due_from=datetime.fromisoformat(due_from) if due_from else None,
         due_to=datetime.fromisoformat(due_to) if due_to else None,
+        include_archived=include_archived,
     )
     
-    query = db.query(Task).join(Calendar)
-    
-    # 권한 확인
-    if current_user.role.value != "ADMIN":
-        query = query.filter(Calendar.user_id == current_user.id)
-    
-    # 필터 적용
-    if page_request.calendar_id:
-        query = query.filter(Task.calendar_id == page_request.calendar_id)
-    if page_request.status:
-        query = query.filter(Task.status == page_request.status)
-    if page_request.priority:
-        query = query.filter(Task.priority == page_request.priority)
-    if page_request.keyword:
-        query = query.filter(
-            or_(
-                Task.title.contains(page_request.keyword),
-                Task.description.contains(page_request.keyword),
-            )
-        )
-    if page_request.due_from:
-        query = query.filter(Task.due_at >= page_request.due_from)
-    if page_request.due_to:
-        query = query.filter(Task.due_at <= page_request.due_to)
+    # 변경이 없으면 페이지 쿼리 없이 304
+    version_key = calendar_version_key(calendar_id) if calendar_id else (
+        None if current_user.role.value == "ADMIN" else user_version_key(current_user.id)
+    )
+    etag = list_etag(redis_client, request, current_user.id, version_key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
-    paginated_query, total_count = apply_pagination(query, page_request, "due_at,ASC")
-    tasks = paginated_query.all()
+    field_list = parse_fields(fields, TaskResponse)
+    query = task_list_query(db, current_user, page_request, redis_client)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
     
-    content = [
-        TaskResponse(
-            id=task.id,
-            calendar_id=task.calendar_id,
-            title=task.title,
-            description=task.description,
-            due_at=task.due_at,
-            status=task.status,
-            priority=task.priority,
-            completed_at=task.completed_at,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-        )
-        for task in tasks
-    ]
+    cache_key = list_cache_key("tasks", None if current_user.role.value == "ADMIN" else current_user.id, page_request)
+    tasks, total_count, count_mode = fetch_page(
+        query, page_request, DEFAULT_SORT, cache_key, redis_client
+    )
     
-    return TaskListResponse(**create_page_response(
-        content=content,
+    page_data = create_page_response(
+        content=tasks,
         page=page_request.page,
         size=page_request.size,
         total_elements=total_count,
         sort=page_request.sort,
-    ))
+        next_cursor=next_cursor(tasks, page_request, total_count, DEFAULT_SORT, count_mode),
+        count_mode=count_mode,
+    )
+    if field_list:
+        return set_etag(sparse_page_response(TaskResponse, field_list, page_data), etag)
+    
+    return set_etag(model_response(TaskListResponse, page_data), etag)
+
+
+@router.get("/export")
+def export_tasks(
+    format: ExportFormat = Query(ExportFormat.NDJSON),
+    sort: Optional[str] = Query(None),
+    fields: Optional[str] = Query(None),
+    keyword: Optional[str] = Query(None),
+    calendar_id: Optional[str] = Query(None),
+    status: Optional[TaskStatus] = Query(None),
+    priority: Optional[str] = Query(None),
+    due_from: Optional[str] = Query(None),
+    due_to: Optional[str] = Query(None),
+    include_archived: bool = Query(False),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
+):
+    """작업 전체 내보내기 (GET /tasks와 같은 필터, NDJSON/CSV 스트리밍)"""
+    page_request = TaskListRequest(
+        sort=sort,
+        keyword=keyword,
+        calendar_id=calendar_id,
+        status=status,
+        priority=priority,
+        due_from=datetime.fromisoformat(due_from) if due_from else None,
+        due_to=datetime.fromisoformat(due_to) if due_to else None,
+        include_archived=include_archived,
+    )
+    
+    field_list = parse_fields(fields, TaskResponse)
+    query = task_list_query(db, current_user, page_request, redis_client)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
+    query = apply_sort(query, page_request, DEFAULT_SORT)
+    
+    return export_response(query, TaskResponse, format, "tasks", field_list)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 def get_task(
     task_id: str,
+    request: Request,
+    fields: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """작업 상세 조회"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """작업 상세 조회 (보관된 작업 포함)"""
+    field_list = parse_fields(fields, TaskResponse)
+    task = apply_fields(db.query(Task), field_list, "calendar_id", "updated_at", "change_seq").filter(Task.id == task_id).first()
+    if not task:
+        task = apply_fields(db.query(TaskArchive), field_list, "calendar_id", "updated_at", "change_seq").filter(
+            TaskArchive.id == task_id
+        ).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -175,18 +223,14 @@ def get_task(
             detail="Access denied",
         )
     
-    return TaskResponse(
-        id=task.id,
-        calendar_id=task.calendar_id,
-        title=task.title,
-        description=task.description,
-        due_at=task.due_at,
-        status=task.status,
-        priority=task.priority,
-        completed_at=task.completed_at,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    etag = detail_etag(task, fields)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if field_list:
+        return set_etag(sparse_response(TaskResponse, field_list, task), etag)
+    
+    return set_etag(model_response(TaskResponse, task), etag)
 
 
 @router.put("/{task_id}", response_model=TaskResponse)
@@ -195,9 +239,14 @@ def update_task(
     request: TaskUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
-    """작업 수정"""
+    """작업 수정 (보관된 작업은 tasks로 되돌린 뒤 수정)"""
     task = db.query(Task).filter(Task.id == task_id).first()
+    restored = False
+    if not task:
+        task = restore_task(db, task_id)
+        restored = task is not None
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -227,22 +276,17 @@ def update_task(
             task.completed_at = None
     if request.priority is not None:
         task.priority = request.priority
+    mark_changed(db, calendar.user_id, task)
     
     db.commit()
     db.refresh(task)
+    if restored:
+        bump_counter(redis_client, "tasks", calendar.user_id, 1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    index_document(redis_client, "tasks", calendar.user_id, task)
+    add_suggestion(redis_client, "tasks", calendar.user_id, task)
     
-    return TaskResponse(
-        id=task.id,
-        calendar_id=task.calendar_id,
-        title=task.title,
-        description=task.description,
-        due_at=task.due_at,
-        status=task.status,
-        priority=task.priority,
-        completed_at=task.completed_at,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-    )
+    return model_response(TaskResponse, task)
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -250,9 +294,12 @@ def delete_task(
     task_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
-    """작업 삭제"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """작업 삭제 (보관된 작업 포함)"""
+    task = db.query(Task).filter(Task.id == task_id).first() or db.query(TaskArchive).filter(
+        TaskArchive.id == task_id
+    ).first()
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -267,8 +314,14 @@ def delete_task(
             detail="Access denied",
         )
     
+    record_deletions(db, calendar.user_id, "tasks", [task.id])
     db.delete(task)
     db.commit()
+    if isinstance(task, Task):
+        bump_counter(redis_client, "tasks", calendar.user_id, -1)
+    touch_calendar(redis_client, calendar.id, calendar.user_id)
+    remove_document(redis_client, "tasks", calendar.user_id, task_id)
+    remove_suggestion(redis_client, "tasks", calendar.user_id, task_id)
     return None
 
 
@@ -3,15 +3,19 @@
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
 from typing import Optional
 import uuid
 
 from app.db.session import get_db
 from app.core.dependencies import get_current_user, require_admin
-from app.core.pagination import apply_pagination, create_page_response
+from app.core.fieldsets import apply_fields, parse_fields, sort_field_name, sparse_page_response, sparse_response
+from app.core.responses import model_response
+from app.core.pagination import create_page_response, fetch_page, next_cursor
+from app.db.queries import list_cache_key, user_list_query
+from app.db.redis import get_redis
 from app.core.security import hash_password
 from app.models.user import User, UserRole
+from app.schemas.common import CountMode
 from app.schemas.user import (
     UserCreate,
     UserUpdate,
@@ -22,22 +26,15 @@ from app.schemas.user import (
 
 router = APIRouter()
 
+DEFAULT_SORT = "created_at,DESC"
+
 
 @router.get("/me", response_model=UserResponse)
 def get_me(
     current_user: User = Depends(get_current_user),
 ):
     """현재 사용자 정보 조회"""
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        display_name=current_user.display_name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-        is_banned=current_user.is_banned,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-    )
+    return model_response(UserResponse, current_user)
 
 
 @router.put("/me", response_model=UserResponse)
@@ -62,16 +59,7 @@ def update_me(
     db.commit()
     db.refresh(current_user)
     
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        display_name=current_user.display_name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-        is_banned=current_user.is_banned,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-    )
+    return model_response(UserResponse, current_user)
 
 
 @router.get("", response_model=UserListResponse)
@@ -79,6 +67,9 @@ def get_users(
     page: int = Query(0, ge=0),
     size: int = Query(20, ge=1, le=100),
     sort: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
+    fields: Optional[str] = Query(None),
     keyword: Optional[str] = Query(None),
     role: Optional[UserRole] = Query(None),
     is_active: Optional[bool] = Query(None),
@@ -87,6 +78,7 @@ def get_users(
     created_to: Optional[str] = Query(None),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
+    redis_client = Depends(get_redis),
 ):
     """사용자 목록 조회 (관리자 전용)"""
     from datetime import datetime
@@ -95,6 +87,8 @@ def get_users(
         page=page,
         size=size,
         sort=sort,
+        cursor=cursor,
+        count=count,
         keyword=keyword,
         role=role,
         is_active=is_active,
@@ -103,78 +97,50 @@ def get_users(
         created_to=datetime.fromisoformat(created_to) if created_to else None,
     )
     
-    query = db.query(User)
-    
-    # 필터 적용
-    if page_request.role:
-        query = query.filter(User.role == page_request.role)
-    if page_request.is_active is not None:
-        query = query.filter(User.is_active == page_request.is_active)
-    if page_request.is_banned is not None:
-        query = query.filter(User.is_banned == page_request.is_banned)
-    if page_request.keyword:
-        query = query.filter(
-            or_(
-                User.email.contains(page_request.keyword),
-                User.display_name.contains(page_request.keyword),
-            )
-        )
-    if page_request.created_from:
-        query = query.filter(User.created_at >= page_request.created_from)
-    if page_request.created_to:
-        query = query.filter(User.created_at <= page_request.created_to)
+    field_list = parse_fields(fields, UserResponse)
+    query = user_list_query(db, page_request)
+    query = apply_fields(query, field_list, sort_field_name(page_request.sort or DEFAULT_SORT))
     
     # 페이징 적용
-    paginated_query, total_count = apply_pagination(query, page_request, "created_at,DESC")
-    
-    users = paginated_query.all()
-    content = [
-        UserResponse(
-            id=user.id,
-            email=user.email,
-            display_name=user.display_name,
-            role=user.role,
-            is_active=user.is_active,
-            is_banned=user.is_banned,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-        )
-        for user in users
-    ]
-    
-    return UserListResponse(**create_page_response(
-        content=content,
+    cache_key = list_cache_key("users", None, page_request)
+    users, total_count, count_mode = fetch_page(
+        query, page_request, DEFAULT_SORT, cache_key, redis_client
+    )
+    page_data = create_page_response(
+        content=users,
         page=page_request.page,
         size=page_request.size,
         total_elements=total_count,
         sort=page_request.sort,
-    ))
+        next_cursor=next_cursor(users, page_request, total_count, DEFAULT_SORT, count_mode),
+        count_mode=count_mode,
+    )
+    if field_list:
+        return sparse_page_response(UserResponse, field_list, page_data)
+    
+    return model_response(UserListResponse, page_data)
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(
     user_id: str,
+    fields: Optional[str] = Query(None),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
     """사용자 상세 조회 (관리자 전용)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    field_list = parse_fields(fields, UserResponse)
+    user = apply_fields(db.query(User), field_list).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    if field_list:
+        return sparse_response(UserResponse, field_list, user)
+    
+    return model_response(UserResponse, user)
 
 
 @router.put("/{user_id}", response_model=UserResponse)
@@ -206,16 +172,7 @@ def update_user(
     db.commit()
     db.refresh(user)
     
-    return UserResponse(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        role=user.role,
-        is_active=user.is_active,
-        is_banned=user.is_banned,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
-    )
+    return model_response(UserResponse, user)
 
 
 
@@ -0,0 +1,173 @@
+"""
+캘린더 목록 집계 포함 (include= 파라미터)
+
+`GET /calendars?include=counts,next_event,open_tasks` 는 조회한 페이지의 캘린더 id에 대해
+집계별로 GROUP BY 쿼리를 한 번씩 실행해 붙입니다 (캘린더마다 쿼리하지 않음).
+
+- counts: 캘린더별 이벤트/작업 수 (idx_event_calendar_start, idx_task_calendar_due)
+- next_event: 캘린더별 now 이후 가장 먼저 시작하는 이벤트 (idx_event_calendar_start)
+- open_tasks: 캘린더별 PENDING/IN_PROGRESS 작업 수 (idx_task_calendar_status)
+
+개수 집계는 캘린더 변경 버전(app.core.etag)을 포함한 키로 Redis에 캐시합니다.
+이벤트/작업 쓰기 시 touch_calendar로 버전이 바뀌므로 별도 무효화가 필요 없습니다.
+next_event는 시간에 따라 달라지므로 캐시하지 않습니다.
+"""
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, create_model
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.core.counts import COUNTER_TTL_SECONDS
+from app.core.etag import calendar_version_key, current_version
+from app.models.event import Event
+from app.models.task import Task, TaskStatus
+from app.schemas.calendar import CalendarCounts, NextEvent
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_INCLUDES = ("counts", "next_event", "open_tasks")
+
+OPEN_TASK_STATUSES = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
+
+# 포함 항목 -> 응답 필드 타입
+_INCLUDE_TYPES = {
+    "counts": Optional[CalendarCounts],
+    "next_event": Optional[NextEvent],
+    "open_tasks": Optional[int],
+}
+
+
+def parse_include(include: Optional[str]) -> Tuple[str, ...]:
+    """include 파라미터 파싱 (CALENDAR_INCLUDES 순서 유지, 알 수 없는 항목은 400)"""
+    if not include:
+        return ()
+    requested = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = requested - set(CALENDAR_INCLUDES)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}",
+        )
+    return tuple(name for name in CALENDAR_INCLUDES if name in requested)
+
+
+@lru_cache(maxsize=64)
+def include_model(base_model: Type[BaseModel], includes: Tuple[str, ...]) -> Type[BaseModel]:
+    """응답 모델에 포함 항목 필드를 추가한 모델"""
+    return create_model(
+        f"{base_model.__name__}With{''.join(name.title().replace('_', '') for name in includes)}",
+        __base__=base_model,
+        **{name: (_INCLUDE_TYPES[name], None) for name in includes},
+    )
+
+
+def _grouped_count(db: Session, column, calendar_ids: List[str], *criteria) -> Dict[str, int]:
+    rows = db.execute(
+        select(column, func.count())
+        .where(column.in_(calendar_ids), *criteria)
+        .group_by(column)
+    ).all()
+    return {calendar_id: total for calendar_id, total in rows}
+
+
+# 캐시 가능한 개수 집계: 이름 -> (db, calendar_ids) -> {calendar_id: count}
+_COUNTERS = {
+    "events": lambda db, ids: _grouped_count(db, Event.calendar_id, ids),
+    "tasks": lambda db, ids: _grouped_count(db, Task.calendar_id, ids),
+    "open_tasks": lambda db, ids: _grouped_count(db, Task.calendar_id, ids, Task.status.in_(OPEN_TASK_STATUSES)),
+}
+
+
+def _aggregate_key(name: str, calendar_id: str, version: str) -> str:
+    return f"agg:{name}:{calendar_id}:{version}"
+
+
+def _cached_counts(db: Session, redis_client, name: str, calendar_ids: List[str]) -> Dict[str, int]:
+    """캘린더별 개수 (버전 키 캐시 -> 미스만 GROUP BY 한 번)"""
+    keys: Dict[str, str] = {}
+    counts: Dict[str, int] = {}
+    if redis_client is not None:
+        for calendar_id in calendar_ids:
+            version = current_version(redis_client, calendar_version_key(calendar_id))
+            if version is not None:
+                keys[calendar_id] = _aggregate_key(name, calendar_id, version)
+        try:
+            for calendar_id, key in keys.items():
+                cached = redis_client.get(key)
+                if cached is not None:
+                    counts[calendar_id] = int(cached)
+        except Exception as e:
+            logger.warning(f"Aggregate cache read failed: {e}")
+            keys = {}
+
+    missing = [calendar_id for calendar_id in calendar_ids if calendar_id not in counts]
+    if not missing:
+        return counts
+
+    computed = _COUNTERS[name](db, missing)
+    for calendar_id in missing:
+        counts[calendar_id] = computed.get(calendar_id, 0)
+        if calendar_id in keys:
+            try:
+                redis_client.setex(keys[calendar_id], COUNTER_TTL_SECONDS, counts[calendar_id])
+            except Exception as e:
+                logger.warning(f"Aggregate cache write failed: {e}")
+                keys = {}
+    return counts
+
+
+def _next_events(db: Session, calendar_ids: List[str], now: datetime) -> Dict[str, Event]:
+    """캘린더별 다음 이벤트 (MIN(start_at) 그룹 서브쿼리와 조인)"""
+    upcoming = (
+        select(Event.calendar_id, func.min(Event.start_at).label("next_start"))
+        .where(Event.calendar_id.in_(calendar_ids), Event.start_at >= now)
+        .group_by(Event.calendar_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(Event)
+        .join(upcoming, and_(Event.calendar_id == upcoming.c.calendar_id, Event.start_at == upcoming.c.next_start))
+        .order_by(Event.calendar_id, Event.id)
+    ).scalars()
+    next_events: Dict[str, Event] = {}
+    for event in rows:
+        next_events.setdefault(event.calendar_id, event)
+    return next_events
+
+
+def calendar_aggregates(
+    db: Session,
+    redis_client,
+    calendar_ids: List[str],
+    includes: Tuple[str, ...],
+    now: Optional[datetime] = None,
+) -> Dict[str, dict]:
+    """
+    페이지의 캘린더별 포함 항목
+
+    Returns:
+        {calendar_id: {"counts": ..., "next_event": ..., "open_tasks": ...}} (요청한 항목만)
+    """
+    result: Dict[str, dict] = {calendar_id: {} for calendar_id in calendar_ids}
+    if not calendar_ids or not includes:
+        return result
+
+    if "counts" in includes:
+        events = _cached_counts(db, redis_client, "events", calendar_ids)
+        tasks = _cached_counts(db, redis_client, "tasks", calendar_ids)
+        for calendar_id in calendar_ids:
+            result[calendar_id]["counts"] = {"events": events[calendar_id], "tasks": tasks[calendar_id]}
+    if "open_tasks" in includes:
+        open_tasks = _cached_counts(db, redis_client, "open_tasks", calendar_ids)
+        for calendar_id in calendar_ids:
+            result[calendar_id]["open_tasks"] = open_tasks[calendar_id]
+    if "next_event" in includes:
+        next_events = _next_events(db, calendar_ids, now or datetime.utcnow())
+        for calendar_id in calendar_ids:
+            result[calendar_id]["next_event"] = next_events.get(calendar_id)
+    return result
@@ -61,6 +61,26 @@ class Settings(BaseModel):
     MYSQL_PORT: int = int(os.getenv("MYSQL_PORT", "3306"))
     MYSQL_DB: str = os.getenv("MYSQL_DB", "calendar_suite")
 
+    # 기본 키 방식: uuid4 (String(36)) / uuid7 (시간 순서, BINARY(16))
+    ID_SCHEME: str = os.getenv("ID_SCHEME", "uuid4").lower()
+
+    # events 월별 RANGE 파티셔닝 사용 여부 (MySQL 전용, FK 대신 애플리케이션에서 삭제 처리)
+    EVENTS_PARTITIONING: bool = os.getenv("EVENTS_PARTITIONING", "false").lower() == "true"
+
+    # 완료/취소 후 N일이 지난 작업을 tasks_archive로 이동
+    TASK_ARCHIVE_AFTER_DAYS: int = int(os.getenv("TASK_ARCHIVE_AFTER_DAYS", "90"))
+
+    # 사용자/캘린더 삭제 시 하위 행 청크 크기
+    DELETE_CHUNK_SIZE: int = int(os.getenv("DELETE_CHUNK_SIZE", "1000"))
+
+    # 동기화 삭제 기록 보존 기간 (이보다 오래된 sync 토큰은 전체 동기화 필요)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "30"))
+
+    # keyword 검색 방식: fulltext (DB 전문 검색 인덱스) / index (사용자별 역색인, app.db.search_index)
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "fulltext").lower()
+    # 역색인 저장소: redis / local (프로세스 내, 단일 워커용)
+    SEARCH_INDEX_STORE: str = os.getenv("SEARCH_INDEX_STORE", "redis").lower()
+
     # Redis
     REDIS_HOST: str = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT: int = int(os.getenv("REDIS_PORT", "6379"))
@@ -0,0 +1,141 @@
+"""
+목록 전체 개수(total_elements) 조회 전략
+
+- exact: COUNT(*) OVER()로 페이지와 함께 조회 (pagination.fetch_page), 불가하면 COUNT(*) 서브쿼리 (기본)
+- none: 개수 조회 생략
+- estimate: MySQL EXPLAIN의 예상 행 수 (통계 기반, 지원하지 않는 DB는 exact)
+- cached: 필터 없는 목록의 소유자별 개수를 Redis에 보관하고 생성/삭제 시 증감
+          (캐시 미스 시 exact로 계산해 저장)
+"""
+import logging
+from typing import Iterable, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Query
+
+from app.schemas.common import CountMode
+
+logger = logging.getLogger(__name__)
+
+# 캐시 카운터 TTL (증감 누락 시 자연 복구)
+COUNTER_TTL_SECONDS = 600
+
+# 소유자 구분 없는 전체 카운터 (관리자 목록)
+ALL_OWNERS = "all"
+
+
+def counter_key(resource: str, owner_id: Optional[str]) -> str:
+    """카운터 Redis 키 (예: count:events:<user_id>)"""
+    return f"count:{resource}:{owner_id or ALL_OWNERS}"
+
+
+def bump_counter(redis_client, resource: str, owner_id: Optional[str], delta: int) -> None:
+    """
+    생성/삭제 시 소유자 카운터와 전체 카운터 증감
+
+    캐시된 카운터만 갱신합니다 (없는 키를 만들면 0부터 세어 틀린 값이 됨).
+    """
+    if redis_client is None:
+        return
+    keys = {counter_key(resource, owner_id), counter_key(resource, None)}
+    try:
+        for key in keys:
+            if redis_client.exists(key):
+                redis_client.incr(key, delta)
+    except Exception as e:
+        logger.warning(f"Counter bump failed: {e}")
+
+
+def invalidate_counters(redis_client, resources: Iterable[str], owner_id: Optional[str]) -> None:
+    """벌크 삭제 등 개수를 알 수 없는 변경 후 카운터 삭제"""
+    if redis_client is None:
+        return
+    try:
+        for resource in resources:
+            redis_client.delete(counter_key(resource, owner_id))
+            redis_client.delete(counter_key(resource, None))
+    except Exception as e:
+        logger.warning(f"Counter invalidation failed: {e}")
+
+
+def supports_window_functions(bind) -> bool:
+    """COUNT(*) OVER() 사용 가능 여부 (MySQL 8.0+/MariaDB 10.2+, SQLite 3.25+)"""
+    dialect = bind.dialect
+    if dialect.name == "sqlite":
+        return dialect.dbapi.sqlite_version_info >= (3, 25)
+    if dialect.name in ("mysql", "mariadb"):
+        version = dialect.server_version_info or ()
+        return version >= ((10, 2) if getattr(dialect, "is_mariadb", False) else (8, 0))
+    return dialect.name == "postgresql"
+
+
+def estimate_from_plan(plan_rows: Iterable[dict]) -> int:
+    """
+    MySQL EXPLAIN 결과로 결과 행 수 추정
+
+    조인은 중첩 루프이므로 테이블별 rows * filtered% 의 곱을 사용합니다.
+    """
+    estimate = 1.0
+    for row in plan_rows:
+        rows = row.get("rows")
+        if rows is None:
+            continue
+        filtered = row.get("filtered")
+        estimate *= float(rows) * (float(filtered) if filtered is not None else 100.0) / 100.0
+    return int(round(estimate))
+
+
+def estimate_count(query: Query) -> Optional[int]:
+    """EXPLAIN 예상 행 수 (MySQL 외 또는 실패 시 None)"""
+    bind = query.session.get_bind()
+    if bind.dialect.name != "mysql":
+        return None
+    try:
+        compiled = query.order_by(None).statement.compile(
+            dialect=bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        plan = query.session.execute(text("EXPLAIN " + str(compiled))).mappings().all()
+    except Exception as e:
+        logger.warning(f"Count estimate failed: {e}")
+        return None
+    return estimate_from_plan(plan)
+
+
+def count_total(
+    query: Query,
+    mode: CountMode,
+    cache_key: Optional[str] = None,
+    redis_client=None,
+) -> Tuple[Optional[int], CountMode]:
+    """
+    요청한 방식으로 전체 개수 조회
+
+    Returns:
+        (total_count, 실제로 사용한 방식)
+    """
+    if mode == CountMode.NONE:
+        return None, CountMode.NONE
+
+    if mode == CountMode.ESTIMATE:
+        estimate = estimate_count(query)
+        if estimate is not None:
+            return estimate, CountMode.ESTIMATE
+
+    if mode == CountMode.CACHED and cache_key and redis_client is not None:
+        try:
+            cached = redis_client.get(cache_key)
+            if cached is not None:
+                return int(cached), CountMode.CACHED
+        except Exception as e:
+            logger.warning(f"Counter read failed: {e}")
+            redis_client = None
+
+        total_count = query.count()
+        if redis_client is not None:
+            try:
+                redis_client.setex(cache_key, COUNTER_TTL_SECONDS, total_count)
+            except Exception as e:
+                logger.warning(f"Counter write failed: {e}")
+        return total_count, CountMode.EXACT
+
+    return query.count(), CountMode.EXACT
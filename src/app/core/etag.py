@@ -0,0 +1,129 @@
+"""
+ETag / 조건부 GET
+
+- 상세 조회: id + 행 버전(change_seq + updated_at) (+ fields)로 만든 강한 ETag
+- 목록 조회: 캘린더/사용자 단위 변경 버전(Redis) + 요청 쿼리로 만든 ETag
+  If-None-Match가 일치하면 페이지 쿼리를 실행하기 전에 304를 반환합니다.
+이벤트/작업/캘린더 쓰기 시 touch_calendar로 해당 캘린더와 소유자 버전을 갱신합니다.
+버전 키가 없으면(만료/유실) 새 임의 버전을 만들어 이전 ETag와 일치하지 않게 합니다.
+"""
+import hashlib
+import logging
+import uuid
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+
+logger = logging.getLogger(__name__)
+
+# 변경 버전 TTL (쓰기 경로 밖의 일괄 변경도 최대 이 시간 후에는 반영)
+VERSION_TTL_SECONDS = 86400
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def calendar_version_key(calendar_id: str) -> str:
+    return f"ver:calendar:{calendar_id}"
+
+
+def user_version_key(user_id: str) -> str:
+    return f"ver:user:{user_id}"
+
+
+def _new_version() -> str:
+    return uuid.uuid4().hex
+
+
+def current_version(redis_client, key: str) -> Optional[str]:
+    """현재 변경 버전 (없으면 새로 생성, Redis 오류 시 None)"""
+    if redis_client is None:
+        return None
+    try:
+        version = redis_client.get(key)
+        if version is None:
+            redis_client.set(key, _new_version(), ex=VERSION_TTL_SECONDS, nx=True)
+            version = redis_client.get(key)
+        return version
+    except Exception as e:
+        logger.warning(f"Version read failed: {e}")
+        return None
+
+
+def bump_versions(redis_client, keys: Iterable[str]) -> None:
+    """변경 버전 갱신"""
+    if redis_client is None:
+        return
+    try:
+        for key in keys:
+            redis_client.set(key, _new_version(), ex=VERSION_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Version bump failed: {e}")
+
+
+def touch_calendar(redis_client, calendar_id: str, owner_id: str) -> None:
+    """캘린더(및 하위 이벤트/작업) 변경 후 캘린더/소유자 목록 버전 갱신"""
+    bump_versions(redis_client, [calendar_version_key(calendar_id), user_version_key(owner_id)])
+
+
+def make_etag(*parts) -> str:
+    """강한 ETag 생성"""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def row_version(obj) -> str:
+    """
+    행 버전 (변경 번호 + updated_at)
+
+    MySQL DATETIME은 초 단위라 같은 초 안의 두 수정은 updated_at이 같으므로,
+    수정마다 새로 할당되는 change_seq를 함께 씁니다 (change_seq가 없는 이전 행은 updated_at만).
+    """
+    return f"{obj.change_seq}.{obj.updated_at:%Y%m%dT%H%M%S%f}"
+
+
+def detail_etag(obj, fields: Optional[str] = None) -> str:
+    """상세 응답 ETag (id + 행 버전, fields에 따라 표현이 달라지므로 포함)"""
+    return make_etag(obj.__tablename__, obj.id, row_version(obj), fields or "")
+
+
+def list_etag(redis_client, request: Request, user_id: str, version_key: Optional[str]) -> Optional[str]:
+    """
+    목록 응답 ETag
+
+    같은 사용자 + 같은 쿼리 + 같은 변경 버전이면 같은 응답입니다.
+    버전 범위가 없거나(관리자 전체 목록) Redis를 사용할 수 없으면 None.
+    """
+    if version_key is None:
+        return None
+    version = current_version(redis_client, version_key)
+    if version is None:
+        return None
+    query = sorted(request.query_params.multi_items())
+    return make_etag(request.url.path, query, user_id, version)
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 비교 (목록/와일드카드/약한 비교 지원)"""
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def not_modified(etag: str) -> Response:
+    """304 응답"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: Optional[str]) -> Response:
+    """응답에 ETag 헤더 설정"""
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
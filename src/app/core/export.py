@@ -0,0 +1,82 @@
+"""
+전체 내보내기 (NDJSON / CSV 스트리밍)
+
+목록 엔드포인트를 100건씩 페이지로 넘기면 페이지마다 개수/OFFSET 스캔이 반복되므로,
+같은 필터 쿼리를 서버 측 커서(yield_per -> stream_results)로 한 번 실행해
+EXPORT_BATCH_SIZE 행씩 읽고 직렬화한 즉시 응답으로 흘려보냅니다.
+
+- 메모리: 배치 하나 분량만 유지 (세션 identity map은 약한 참조라 직렬화한 배치는 해제됨)
+- 역압: 동기 제너레이터는 스레드풀에서 한 청크씩 소비되고 다음 청크는 이전 청크의
+  전송이 끝난 뒤 요청되므로, 클라이언트가 느리면 DB 읽기도 그만큼 늦춰집니다.
+- 세션: 요청 세션은 응답 전송 전에 닫히므로 같은 엔진에 별도 세션을 열어 스트리밍합니다.
+"""
+import csv
+import io
+from typing import Iterator, Optional, Tuple, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query, Session
+
+from app.core.fieldsets import sparse_model
+from app.schemas.common import ExportFormat
+
+# 서버 측 커서에서 한 번에 가져와 직렬화하는 행 수
+EXPORT_BATCH_SIZE = 500
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _iter_batches(query: Query, batch_size: int) -> Iterator[list]:
+    """별도 세션에서 서버 측 커서로 배치 단위 조회"""
+    session = Session(bind=query.session.get_bind())
+    try:
+        result = session.execute(query.statement, execution_options={"yield_per": batch_size})
+        for batch in result.scalars().partitions():
+            yield batch
+    finally:
+        session.close()
+
+
+def _ndjson_chunks(query: Query, model: Type[BaseModel], batch_size: int) -> Iterator[bytes]:
+    for batch in _iter_batches(query, batch_size):
+        yield b"".join(model.model_validate(obj).model_dump_json().encode("utf-8") + b"\n" for obj in batch)
+
+
+def _csv_chunks(query: Query, model: Type[BaseModel], batch_size: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(model.model_fields))
+    writer.writeheader()
+    for batch in _iter_batches(query, batch_size):
+        for obj in batch:
+            writer.writerow(model.model_validate(obj).model_dump(mode="json"))
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(
+    query: Query,
+    response_model: Type[BaseModel],
+    export_format: ExportFormat,
+    filename: str,
+    fields: Optional[Tuple[str, ...]] = None,
+    batch_size: Optional[int] = None,
+) -> StreamingResponse:
+    """
+    필터/정렬이 적용된 쿼리의 전체 결과를 스트리밍 응답으로 반환
+
+    fields가 있으면 선택한 필드만 내보냅니다 (CSV 헤더도 같은 순서).
+    """
+    model = sparse_model(response_model, fields) if fields else response_model
+    chunks = _csv_chunks if export_format == ExportFormat.CSV else _ndjson_chunks
+    return StreamingResponse(
+        chunks(query, model, batch_size or EXPORT_BATCH_SIZE),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
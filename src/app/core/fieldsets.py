@@ -0,0 +1,88 @@
+"""
+Sparse fieldset (fields= 파라미터)
+
+`fields=id,title,start_at` 처럼 필요한 필드만 요청하면
+- 조회: load_only로 선택한 컬럼만 SELECT (description 같은 TEXT 컬럼을 읽지 않음)
+- 응답: 선택한 필드만 가진 축소 응답 모델로 직렬화
+id는 항상 포함됩니다.
+"""
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ConfigDict, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import Query, load_only
+
+from app.core.responses import ModelResponse
+from app.schemas.common import PageResponse
+
+
+def parse_fields(fields: Optional[str], response_model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    fields 파라미터 파싱 (응답 모델 필드 순서 유지)
+
+    Returns:
+        선택한 필드 튜플, fields가 없으면 None (전체 필드)
+    """
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(response_model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    requested.add("id")
+    return tuple(name for name in response_model.model_fields if name in requested)
+
+
+def apply_fields(query: Query, fields: Optional[Tuple[str, ...]], *extra: str) -> Query:
+    """
+    선택한 필드의 컬럼만 로드하도록 load_only 적용
+
+    extra는 응답에는 없지만 처리에 필요한 컬럼(정렬 필드, 권한 확인용 FK 등)입니다.
+    """
+    if not fields:
+        return query
+    description = query.column_descriptions[0]
+    entity = description["entity"]
+    columns = set(inspect(description["type"]).column_attrs.keys())
+    names = [name for name in dict.fromkeys((*fields, *extra)) if name in columns]
+    return query.options(load_only(*[getattr(entity, name) for name in names]))
+
+
+def sort_field_name(sort: Optional[str]) -> str:
+    """정렬 문자열의 필드명 ('start_at,ASC' -> 'start_at')"""
+    return (sort or "id").split(",")[0].strip()
+
+
+@lru_cache(maxsize=256)
+def sparse_model(response_model: Type[BaseModel], fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """선택한 필드만 가진 응답 모델 (ORM 객체에서 선택한 속성만 읽음)"""
+    definitions = {
+        name: (response_model.model_fields[name].annotation, response_model.model_fields[name])
+        for name in fields
+    }
+    return create_model(
+        f"{response_model.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+def sparse_response(response_model: Type[BaseModel], fields: Tuple[str, ...], obj) -> ModelResponse:
+    """상세 조회 축소 응답"""
+    return ModelResponse(sparse_model(response_model, fields).model_validate(obj))
+
+
+def sparse_page_response(response_model: Type[BaseModel], fields: Tuple[str, ...], page: dict) -> ModelResponse:
+    """
+    목록 조회 축소 응답
+
+    page는 content에 ORM 객체가 담긴 create_page_response 결과입니다.
+    """
+    model = sparse_model(response_model, fields)
+    return ModelResponse(PageResponse[model].model_validate(page, from_attributes=True))
+
@@ -0,0 +1,76 @@
+"""
+Free/busy 계산 (POST /freebusy)
+
+바쁜 구간만 필요하므로 이벤트 전체 행 대신 (start_at, end_at)만 읽습니다.
+
+- 조회: calendar_id IN (청크) AND is_recurring = false AND start_at < time_max AND end_at > time_min
+  idx_event_calendar_recurring (calendar_id, is_recurring, start_at, end_at)가 모든 컬럼을 포함해 인덱스만 읽습니다.
+- 반복 이벤트: 구간과 겹치는 마스터만 읽어 회차를 전개합니다 (app.core.recurrence).
+- 병합: 구간을 시작 시각으로 정렬한 뒤 한 번 훑으며 겹치거나 맞닿은 구간을 합칩니다 (O(n log n)).
+- 캘린더 수천 개도 FREEBUSY_CHUNK_SIZE씩 나눠 조회하고 결과 튜플만 유지합니다.
+"""
+from datetime import datetime
+from typing import Iterable, List, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.recurrence import overlapping_occurrences
+from app.models.event import Event
+
+# IN 목록 하나에 넣는 최대 캘린더 수
+FREEBUSY_CHUNK_SIZE = 500
+
+Interval = Tuple[datetime, datetime]
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    """겹치거나 맞닿은 구간 병합 (시작 시각 정렬 후 스윕)"""
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def _busy_rows(db: Session, calendar_ids: Sequence[str], time_min: datetime, time_max: datetime) -> List[Interval]:
+    rows = db.execute(
+        select(Event.start_at, Event.end_at).where(
+            Event.calendar_id.in_(calendar_ids),
+            Event.start_at < time_max,
+            Event.end_at > time_min,
+            Event.is_recurring.is_(False),
+        )
+    )
+    return [(start, end) for start, end in rows]
+
+
+def _recurring_rows(
+    db: Session,
+    redis_client,
+    calendar_ids: Sequence[str],
+    time_min: datetime,
+    time_max: datetime,
+) -> List[Interval]:
+    occurrences = overlapping_occurrences(db, redis_client, calendar_ids, time_min, time_max)
+    return [(item["start_at"], item["end_at"]) for item in occurrences]
+
+
+def busy_intervals(
+    db: Session,
+    calendar_ids: Sequence[str],
+    time_min: datetime,
+    time_max: datetime,
+    redis_client=None,
+) -> List[Interval]:
+    """캘린더들의 바쁜 구간 (time_min ~ time_max로 잘라 병합)"""
+    calendar_ids = list(dict.fromkeys(calendar_ids))
+    intervals: List[Interval] = []
+    for offset in range(0, len(calendar_ids), FREEBUSY_CHUNK_SIZE):
+        chunk = calendar_ids[offset:offset + FREEBUSY_CHUNK_SIZE]
+        intervals.extend(_busy_rows(db, chunk, time_min, time_max))
+        intervals.extend(_recurring_rows(db, redis_client, chunk, time_min, time_max))
+    return merge_intervals((max(start, time_min), min(end, time_max)) for start, end in intervals)
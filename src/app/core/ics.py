@@ -0,0 +1,585 @@
+"""
+iCalendar (RFC 5545) 내보내기 / 가져오기
+
+내보내기 (GET /calendars/{id}/ics)
+- 캘린더의 이벤트, 반복 회차 수정/취소(RECURRENCE-ID), 작업(VTODO)을 차례로 서버 측 커서로
+  ICS_BATCH_SIZE 행씩 읽어 바로 전송합니다 (app.core.export와 같은 방식, 별도 세션).
+- 시각은 모두 UTC(...Z), 종일 이벤트는 VALUE=DATE (DTEND는 다음 날, 배타적)
+
+가져오기 (POST /calendars/{id}/import, 본문이 ICS)
+- ICSReader: 요청 본문 바이트 청크를 받아 줄 접기(folding)를 풀고 완성된 VEVENT/VTODO만 돌려주는 증분 파서
+  (파일 전체를 메모리에 올리지 않음)
+- ICSImporter: 구성 요소를 IMPORT_CHUNK_SIZE개씩 행으로 바꿔 테이블별 다중 행 INSERT 후 청크마다 커밋
+  (소유권 확인/커밋이 이벤트마다 반복되는 POST /events 대비)
+- 변환할 수 없는 항목(필수 속성 누락, 지원하지 않는 RRULE, 알 수 없는 TZID 등)은 건너뛰고 rejected에 사유를 남깁니다.
+- 반복 이벤트의 EXDATE는 취소 회차, RECURRENCE-ID 항목은 같은 파일에서 먼저 나온 마스터(UID 기준)의 회차 수정으로 저장합니다.
+"""
+import codecs
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.ids import new_id
+from app.core.recurrence import parse_rrule, recurrence_end
+from app.db.day_buckets import bucket_rows
+from app.db.sync import mark_rows
+from app.models.event import Event, EventDayBucket, EventException
+from app.models.task import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# 내보내기 시 서버 측 커서에서 한 번에 가져오는 행 수
+ICS_BATCH_SIZE = 500
+
+# 가져오기 시 한 트랜잭션에 넣는 구성 요소 수
+IMPORT_CHUNK_SIZE = 500
+
+# 응답에 담는 거부 항목 최대 수 (개수는 모두 셈)
+MAX_REJECTED_REPORTED = 100
+
+TASK_STATUSES = {
+    TaskStatus.PENDING: "NEEDS-ACTION",
+    TaskStatus.IN_PROGRESS: "IN-PROCESS",
+    TaskStatus.COMPLETED: "COMPLETED",
+    TaskStatus.CANCELLED: "CANCELLED",
+}
+TASK_PRIORITIES = {"HIGH": 1, "MEDIUM": 5, "LOW": 9}
+
+_DURATION = re.compile(r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+_FLOATING_UNTIL = re.compile(r"(UNTIL=\d{8}T\d{6})(?=;|$)")
+
+
+def _escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """75옥텟 단위 줄 접기 (UTF-8 문자 중간에서 자르지 않음)"""
+    if len(line.encode("utf-8")) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _utc(value: datetime) -> str:
+    return f"{value:%Y%m%dT%H%M%S}Z"
+
+
+def _text(name: str, value: Optional[str]) -> List[str]:
+    return [f"{name}:{_escape(value)}"] if value else []
+
+
+def _event_lines(event: Event) -> List[str]:
+    lines = ["BEGIN:VEVENT", f"UID:{event.id}", f"DTSTAMP:{_utc(event.updated_at)}"]
+    if event.is_all_day:
+        end_day = event.end_at.date() if event.end_at.time() == datetime.min.time() else event.end_at.date() + timedelta(days=1)
+        lines.append(f"DTSTART;VALUE=DATE:{event.start_at:%Y%m%d}")
+        lines.append(f"DTEND;VALUE=DATE:{max(end_day, event.start_at.date() + timedelta(days=1)):%Y%m%d}")
+    else:
+        lines.append(f"DTSTART:{_utc(event.start_at)}")
+        lines.append(f"DTEND:{_utc(event.end_at)}")
+    if event.rrule:
+        lines.append("RRULE:" + _FLOATING_UNTIL.sub(r"\1Z", event.rrule))
+    lines += _text("SUMMARY", event.title) + _text("DESCRIPTION", event.description) + _text("LOCATION", event.location)
+    lines += [f"CREATED:{_utc(event.created_at)}", f"LAST-MODIFIED:{_utc(event.updated_at)}", "END:VEVENT"]
+    return lines
+
+
+def _exception_lines(exception: EventException, master_start: datetime, master_end: datetime, title: str) -> List[str]:
+    start_at = exception.start_at or exception.original_start
+    end_at = exception.end_at or start_at + (master_end - master_start)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{exception.event_id}",
+        f"RECURRENCE-ID:{_utc(exception.original_start)}",
+        f"DTSTAMP:{_utc(exception.updated_at)}",
+        f"DTSTART:{_utc(start_at)}",
+        f"DTEND:{_utc(end_at)}",
+    ]
+    if exception.is_cancelled:
+        lines.append("STATUS:CANCELLED")
+    lines += _text("SUMMARY", exception.title or title)
+    lines += _text("DESCRIPTION", exception.description) + _text("LOCATION", exception.location)
+    lines.append("END:VEVENT")
+    return lines
+
+
+def _task_lines(task: Task) -> List[str]:
+    lines = ["BEGIN:VTODO", f"UID:{task.id}", f"DTSTAMP:{_utc(task.updated_at)}"]
+    if task.due_at:
+        lines.append(f"DUE:{_utc(task.due_at)}")
+    lines.append(f"STATUS:{TASK_STATUSES[task.status]}")
+    if task.priority in TASK_PRIORITIES:
+        lines.append(f"PRIORITY:{TASK_PRIORITIES[task.priority]}")
+    if task.completed_at:
+        lines.append(f"COMPLETED:{_utc(task.completed_at)}")
+    lines += _text("SUMMARY", task.title) + _text("DESCRIPTION", task.description)
+    lines += [f"CREATED:{_utc(task.created_at)}", f"LAST-MODIFIED:{_utc(task.updated_at)}", "END:VTODO"]
+    return lines
+
+
+def _encode(lines: List[str]) -> bytes:
+    return "".join(_fold(line) for line in lines).encode("utf-8")
+
+
+def ics_chunks(bind, calendar_id: str, calendar_title: str, batch_size: int = ICS_BATCH_SIZE) -> Iterator[bytes]:
+    """캘린더 ICS 스트림 (별도 세션, 구성 요소 종류별로 서버 측 커서를 하나씩 차례로 사용)"""
+    session = Session(bind=bind)
+    options = {"yield_per": batch_size}
+    try:
+        yield _encode([
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:-//{settings.PROJECT_NAME}//EN",
+            "CALSCALE:GREGORIAN",
+            *_text("X-WR-CALNAME", calendar_title),
+        ])
+
+        events = select(Event).where(Event.calendar_id == calendar_id).order_by(Event.start_at, Event.id)
+        for batch in session.execute(events, execution_options=options).scalars().partitions():
+            yield _encode([line for event in batch for line in _event_lines(event)])
+
+        exceptions = (
+            select(EventException, Event.start_at, Event.end_at, Event.title)
+            .join(Event, Event.id == EventException.event_id)
+            .where(EventException.calendar_id == calendar_id)
+            .order_by(EventException.event_id, EventException.original_start)
+        )
+        for batch in session.execute(exceptions, execution_options=options).partitions():
+            yield _encode([line for row in batch for line in _exception_lines(*row)])
+
+        tasks = select(Task).where(Task.calendar_id == calendar_id).order_by(Task.id)
+        for batch in session.execute(tasks, execution_options=options).scalars().partitions():
+            yield _encode([line for task in batch for line in _task_lines(task)])
+
+        yield _encode(["END:VCALENDAR"])
+    finally:
+        session.close()
+
+
+@dataclass
+class Property:
+    name: str
+    params: Dict[str, str]
+    value: str
+
+
+@dataclass
+class Component:
+    """VEVENT / VTODO 하나 (line: 시작 줄 번호, error: 파싱 중 발견한 문제)"""
+    name: str
+    line: int
+    properties: List[Property] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def get(self, name: str) -> Optional[Property]:
+        return next((prop for prop in self.properties if prop.name == name), None)
+
+    def all(self, name: str) -> List[Property]:
+        return [prop for prop in self.properties if prop.name == name]
+
+
+def _split_content_line(line: str) -> Optional[Property]:
+    """NAME;PARAM=VALUE;...:VALUE (따옴표 안의 ; : 는 구분자가 아님)"""
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        return None
+    name, *raw_params = re.split(r';(?=(?:[^"]*"[^"]*")*[^"]*$)', head)
+    params = {}
+    for raw in raw_params:
+        key, _, param_value = raw.partition("=")
+        params[key.upper()] = param_value.strip('"')
+    return Property(name.upper(), params, value)
+
+
+class ICSReader:
+    """
+    ICS 증분 파서
+
+    feed()로 받은 바이트를 줄 단위로 처리하며, 완성된 VEVENT/VTODO를 반환합니다.
+    VALARM처럼 안쪽에 중첩된 구성 요소의 속성은 무시합니다.
+    """
+
+    COMPONENTS = ("VEVENT", "VTODO")
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._partial = ""
+        self._logical: Optional[str] = None
+        self._logical_line = 0
+        self._line_no = 0
+        self._stack: List[str] = []
+        self._current: Optional[Component] = None
+        self.saw_calendar = False
+
+    def feed(self, data: bytes) -> List[Component]:
+        text = self._partial + self._decoder.decode(data)
+        lines = text.split("\n")
+        self._partial = lines.pop()
+        return self._physical_lines(lines)
+
+    def close(self) -> List[Component]:
+        text = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        done = self._physical_lines([text] if text else [])
+        if self._logical is not None:
+            done += self._logical_complete(self._logical)
+            self._logical = None
+        return done
+
+    def _physical_lines(self, lines: List[str]) -> List[Component]:
+        done: List[Component] = []
+        for line in lines:
+            self._line_no += 1
+            line = line.rstrip("\r")
+            if line[:1] in (" ", "\t") and self._logical is not None:
+                self._logical += line[1:]
+                continue
+            if self._logical is not None:
+                done += self._logical_complete(self._logical)
+            self._logical, self._logical_line = (line, self._line_no) if line else (None, 0)
+        return done
+
+    def _logical_complete(self, line: str) -> List[Component]:
+        prop = _split_content_line(line)
+        if prop is None:
+            if self._current is not None and self._current.error is None:
+                self._current.error = f"Malformed line {self._logical_line}"
+            return []
+        value = prop.value.strip().upper()
+        if prop.name == "BEGIN":
+            if value == "VCALENDAR":
+                self.saw_calendar = True
+            if value in self.COMPONENTS and self._current is None and self._stack == ["VCALENDAR"]:
+                self._current = Component(value, self._logical_line)
+            self._stack.append(value)
+            return []
+        if prop.name == "END":
+            if self._stack and self._stack[-1] == value:
+                self._stack.pop()
+            if self._current is not None and value == self._current.name and len(self._stack) <= 1:
+                done, self._current = self._current, None
+                return [done]
+            return []
+        if self._current is not None and self._stack and self._stack[-1] == self._current.name:
+            self._current.properties.append(prop)
+        return []
+
+
+def _unescape(value: str) -> str:
+    return re.sub(r"\\([\\;,nN])", lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+def _parse_datetime(prop: Property) -> Tuple[datetime, bool]:
+    """(UTC naive datetime, 날짜만 지정 여부)"""
+    value = prop.value.strip()
+    if prop.params.get("VALUE") == "DATE" or re.fullmatch(r"\d{8}", value):
+        return datetime.strptime(value, "%Y%m%d"), True
+    try:
+        parsed = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise ValueError(f"Invalid {prop.name}: {value}")
+    if value.endswith("Z"):
+        return parsed, False
+    if "TZID" in prop.params:
+        try:
+            zone = ZoneInfo(prop.params["TZID"])
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown TZID: {prop.params['TZID']}")
+        return parsed.replace(tzinfo=zone).astimezone(timezone.utc).replace(tzinfo=None), False
+    # 시간대 없는 시각(floating)은 UTC로 저장
+    return parsed, False
+
+
+def _parse_duration(value: str) -> timedelta:
+    match = _DURATION.match(value.strip())
+    if not match or not any(match.groups()[1:]):
+        raise ValueError(f"Invalid DURATION: {value}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+        minutes=int(minutes or 0), seconds=int(seconds or 0),
+    )
+    return -duration if sign == "-" else duration
+
+
+def _title(component: Component) -> str:
+    summary = component.get("SUMMARY")
+    title = _unescape(summary.value).strip() if summary else ""
+    if not title:
+        raise ValueError("Missing SUMMARY")
+    if len(title) > 255:
+        raise ValueError("SUMMARY longer than 255 characters")
+    return title
+
+
+def _optional_text(component: Component, name: str, max_length: Optional[int] = None) -> Optional[str]:
+    prop = component.get(name)
+    if prop is None:
+        return None
+    value = _unescape(prop.value)
+    if max_length is not None and len(value) > max_length:
+        raise ValueError(f"{name} longer than {max_length} characters")
+    return value or None
+
+
+def _event_times(component: Component) -> Tuple[datetime, datetime, bool]:
+    dtstart = component.get("DTSTART")
+    if dtstart is None:
+        raise ValueError("Missing DTSTART")
+    start_at, all_day = _parse_datetime(dtstart)
+    if component.get("DTEND") is not None:
+        end_at, _ = _parse_datetime(component.get("DTEND"))
+    elif component.get("DURATION") is not None:
+        end_at = start_at + _parse_duration(component.get("DURATION").value)
+    else:
+        end_at = start_at + timedelta(days=1) if all_day else start_at
+    if end_at < start_at:
+        raise ValueError("DTEND before DTSTART")
+    return start_at, end_at, all_day
+
+
+@dataclass
+class RejectedEntry:
+    line: int
+    component: str
+    uid: Optional[str]
+    reason: str
+
+
+class ICSImporter:
+    """
+    구성 요소를 청크 단위로 다중 행 INSERT (청크마다 커밋)
+
+    recurring: 이 가져오기에서 만든 반복 마스터 (UID -> (id, start_at))
+    """
+
+    def __init__(self, db: Session, calendar_id: str, owner_id: str, chunk_size: Optional[int] = None):
+        self.db = db
+        self.calendar_id = calendar_id
+        self.owner_id = owner_id
+        self.chunk_size = chunk_size or IMPORT_CHUNK_SIZE
+        self.pending: List[Component] = []
+        self.recurring: Dict[str, Tuple[str, datetime]] = {}
+        self._exception_keys: Set[Tuple[str, datetime]] = set()
+        # 현재 청크에서 추가한 마스터 UID / 회차 키 (청크 실패 시 되돌림)
+        self._chunk_uids: List[str] = []
+        self._chunk_keys: List[Tuple[str, datetime]] = []
+        self.counts = {"events": 0, "tasks": 0, "exceptions": 0}
+        self.rejected: List[RejectedEntry] = []
+        self.rejected_count = 0
+        self.chunks = 0
+
+    def add(self, components: List[Component]) -> bool:
+        """대기열에 추가, 청크가 찼으면 True"""
+        self.pending.extend(components)
+        return len(self.pending) >= self.chunk_size
+
+    def _reject(self, component: Component, reason: str) -> None:
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REJECTED_REPORTED:
+            uid = component.get("UID")
+            self.rejected.append(RejectedEntry(component.line, component.name, uid.value if uid else None, reason))
+
+    def _event_rows(self, component: Component, now: datetime, rows: Dict[str, list]) -> None:
+        start_at, end_at, all_day = _event_times(component)
+        uid = component.get("UID").value if component.get("UID") else None
+        recurrence_id = component.get("RECURRENCE-ID")
+        if recurrence_id is not None:
+            self._exception_row(component, uid, recurrence_id, start_at, end_at, now, rows)
+            return
+        event = {
+            "id": new_id(),
+            "calendar_id": self.calendar_id,
+            "title": _title(component),
+            "description": _optional_text(component, "DESCRIPTION"),
+            "location": _optional_text(component, "LOCATION", 500),
+            "start_at": start_at,
+            "end_at": end_at,
+            "is_all_day": all_day,
+            "rrule": None,
+            "is_recurring": False,
+            "recurrence_end": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        rrule = component.get("RRULE")
+        if rrule is None:
+            rows["events"].append(event)
+            rows["buckets"].extend(bucket_rows(event["id"], self.calendar_id, start_at, end_at))
+            return
+        try:
+            rule = parse_rrule(rrule.value)
+        except ValueError as e:
+            raise ValueError(f"Unsupported RRULE: {e}")
+        event.update(
+            rrule=rule.to_string(),
+            is_recurring=True,
+            recurrence_end=recurrence_end(rule, start_at, end_at - start_at),
+        )
+        exdates = [
+            _parse_datetime(Property("EXDATE", prop.params, value))[0]
+            for prop in component.all("EXDATE") for value in prop.value.split(",")
+        ]
+        rows["events"].append(event)
+        if uid:
+            self.recurring[uid] = (event["id"], start_at)
+            self._chunk_uids.append(uid)
+        for original_start in exdates:
+            if (event["id"], original_start) in self._exception_keys:
+                continue
+            self._remember((event["id"], original_start))
+            rows["exceptions"].append(self._exception(event["id"], original_start, now, is_cancelled=True))
+
+    def _exception(self, event_id: str, original_start: datetime, now: datetime, **values) -> dict:
+        row = {
+            "id": new_id(),
+            "event_id": event_id,
+            "calendar_id": self.calendar_id,
+            "original_start": original_start,
+            "is_cancelled": False,
+            "title": None,
+            "description": None,
+            "location": None,
+            "start_at": None,
+            "end_at": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        row.update(values)
+        return row
+
+    def _remember(self, key: Tuple[str, datetime]) -> None:
+        self._exception_keys.add(key)
+        self._chunk_keys.append(key)
+
+    def _exception_row(
+        self,
+        component: Component,
+        uid: Optional[str],
+        recurrence_id: Property,
+        start_at: datetime,
+        end_at: datetime,
+        now: datetime,
+        rows: Dict[str, list],
+    ) -> None:
+        if uid not in self.recurring:
+            raise ValueError("RECURRENCE-ID without a recurring event earlier in the file")
+        event_id, _ = self.recurring[uid]
+        original_start, _ = _parse_datetime(recurrence_id)
+        if (event_id, original_start) in self._exception_keys:
+            raise ValueError("Duplicate RECURRENCE-ID")
+        status_prop = component.get("STATUS")
+        cancelled = status_prop is not None and status_prop.value.strip().upper() == "CANCELLED"
+        if cancelled:
+            row = self._exception(event_id, original_start, now, is_cancelled=True)
+        else:
+            row = self._exception(
+                event_id, original_start, now,
+                title=_title(component) if component.get("SUMMARY") else None,
+                description=_optional_text(component, "DESCRIPTION"),
+                location=_optional_text(component, "LOCATION", 500),
+                start_at=start_at,
+                end_at=end_at,
+            )
+        # 행을 다 만든 뒤 기록 (변환 오류로 거부된 항목이 같은 회차의 다음 항목을 막지 않도록)
+        self._remember((event_id, original_start))
+        rows["exceptions"].append(row)
+
+    def _task_row(self, component: Component, now: datetime, rows: Dict[str, list]) -> None:
+        due = component.get("DUE")
+        completed = component.get("COMPLETED")
+        status_prop = component.get("STATUS")
+        statuses = {value: key for key, value in TASK_STATUSES.items()}
+        priority = component.get("PRIORITY")
+        priority_value = None
+        if priority is not None and priority.value.strip().isdigit() and int(priority.value) > 0:
+            level = int(priority.value)
+            priority_value = "HIGH" if level <= 4 else "MEDIUM" if level == 5 else "LOW"
+        rows["tasks"].append({
+            "id": new_id(),
+            "calendar_id": self.calendar_id,
+            "title": _title(component),
+            "description": _optional_text(component, "DESCRIPTION"),
+            "due_at": _parse_datetime(due)[0] if due else None,
+            "completed_at": _parse_datetime(completed)[0] if completed else None,
+            "status": statuses.get(status_prop.value.strip().upper(), TaskStatus.PENDING) if status_prop else TaskStatus.PENDING,
+            "priority": priority_value,
+            "created_at": now,
+            "updated_at": now,
+        })
+
+    def flush(self) -> None:
+        """대기 중인 구성 요소를 chunk_size개씩 저장"""
+        pending, self.pending = self.pending, []
+        for offset in range(0, len(pending), self.chunk_size):
+            self._flush_chunk(pending[offset:offset + self.chunk_size])
+
+    def _flush_chunk(self, components: List[Component]) -> None:
+        """구성 요소를 변환해 테이블별 다중 행 INSERT 후 커밋"""
+        self._chunk_uids, self._chunk_keys = [], []
+        now = datetime.utcnow()
+        rows: Dict[str, list] = {"events": [], "buckets": [], "exceptions": [], "tasks": []}
+        accepted: List[Component] = []
+        for component in components:
+            if component.error:
+                self._reject(component, component.error)
+                continue
+            try:
+                if component.name == "VEVENT":
+                    self._event_rows(component, now, rows)
+                else:
+                    self._task_row(component, now, rows)
+                accepted.append(component)
+            except ValueError as e:
+                self._reject(component, str(e))
+
+        try:
+            mark_rows(self.db, self.owner_id, rows["events"] + rows["tasks"])
+            for model, key in ((Event, "events"), (EventDayBucket, "buckets"), (EventException, "exceptions"), (Task, "tasks")):
+                if rows[key]:
+                    self.db.execute(insert(model), rows[key])
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.exception("ICS import chunk failed")
+            for uid in self._chunk_uids:
+                self.recurring.pop(uid, None)
+            self._exception_keys.difference_update(self._chunk_keys)
+            for component in accepted:
+                self._reject(component, f"Insert failed: {e.__class__.__name__}")
+            return
+
+        self.chunks += 1
+        self.counts["events"] += len(rows["events"])
+        self.counts["tasks"] += len(rows["tasks"])
+        self.counts["exceptions"] += len(rows["exceptions"])
+        logger.info(
+            f"ICS import {self.calendar_id}: chunk {self.chunks}, "
+            f"{self.counts['events']} events, {self.counts['tasks']} tasks, {self.rejected_count} rejected"
+        )
@@ -0,0 +1,58 @@
+"""
+기본 키(ID) 생성 유틸리티
+
+- uuid4: 기존 방식 (완전 랜덤, String(36) 저장)
+- uuid7: 시간 순서 UUID (RFC 9562), BINARY(16) 저장
+
+ID_SCHEME 환경변수로 선택하며 기본값은 uuid4입니다.
+"""
+import os
+import threading
+import time
+import uuid
+
+from app.core.config import settings
+
+_lock = threading.Lock()
+_last_ms = 0
+_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    UUIDv7 생성
+
+    상위 48비트는 밀리초 단위 Unix 타임스탬프, rand_a 12비트는 같은 밀리초 안의
+    단조 증가 카운터로 사용하여 한 프로세스 안에서는 항상 증가 순서를 보장합니다.
+    """
+    global _last_ms, _seq
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _seq = int.from_bytes(os.urandom(2), "big") & 0x3FF  # 상위 여유 비트 확보
+        else:
+            _seq += 1
+            if _seq > 0xFFF:
+                # 카운터 소진 시 타임스탬프를 1ms 앞당김
+                _last_ms += 1
+                _seq = 0
+        ms = _last_ms
+        seq = _seq
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+
+    value = (ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76
+    value |= seq << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """설정된 ID_SCHEME에 따라 새 ID 문자열 반환"""
+    if settings.ID_SCHEME == "uuid7":
+        return str(uuid7())
+    return str(uuid.uuid4())
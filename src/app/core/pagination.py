@@ -1,84 +1,331 @@
 """
 페이징 및 필터링 유틸리티
+
+두 가지 방식을 지원합니다.
+- OFFSET 페이징: page/size (기본)
+- 키셋(커서) 페이징: 이전 응답의 next_cursor를 cursor로 전달하면
+  OFFSET 대신 (정렬 컬럼, id) 기준 WHERE 조건으로 다음 행부터 조회하므로
+  페이지 깊이와 무관하게 일정한 비용으로 조회되고, 동시 삽입에도 결과가 밀리지 않습니다.
+
+라우터는 fetch_page로 페이지와 전체 개수를 함께 조회합니다.
+keyword가 있으면 sort=relevance로 전문 검색 관련도 순 정렬을 사용할 수 있습니다 (OFFSET 페이징만).
 """
-from typing import TypeVar, Type, Optional, Tuple
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from enum import Enum
+from typing import TypeVar, Type, Optional, Tuple, Any, Dict
+from fastapi import HTTPException, status
 from sqlalchemy.orm import Query
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, and_, func, or_
 from math import ceil
 
-from app.schemas.common import PageRequest, PageResponse
+from app.core.config import settings
+from app.core.counts import count_total, supports_window_functions
+from app.db.fulltext import relevance
+from app.schemas.common import CountMode, PageRequest, PageResponse
 
 ModelType = TypeVar("ModelType")
 
+# 커서 서명 길이 (HMAC-SHA256 앞 16바이트)
+CURSOR_SIGNATURE_BYTES = 16
+
+# 전문 검색 관련도 정렬 (keyword 필요, 커서 미지원)
+RELEVANCE_SORT = "relevance"
+
+
+def sortable_fields(model: Any) -> Dict[str, str]:
+    """
+    모델이 선언한 정렬 가능 필드 -> 인덱스 (SORTABLE_FIELDS)
+
+    id(PK)는 항상 정렬 가능하며 다른 필드 정렬 시 보조 정렬로 추가됩니다.
+    """
+    return {**getattr(model, "SORTABLE_FIELDS", {}), "id": "PRIMARY"}
+
+
+def _resolve_sort(model: Any, sort: Optional[str], default_sort: Optional[str]) -> Tuple[str, str]:
+    """
+    정렬 문자열('field' 또는 'field,ASC|DESC')을 (필드, 방향)으로 해석
+
+    인덱스로 정렬할 수 없는 필드(예: description)는 전체 filesort를 유발하므로 400으로 거부합니다.
+    """
+    spec = sort or default_sort
+    if not spec:
+        return "id", "ASC"
+
+    parts = [part.strip() for part in spec.split(",")]
+    sort_field = parts[0]
+    sort_direction = parts[1].upper() if len(parts) > 1 else "ASC"
+    if len(parts) > 2 or sort_direction not in ("ASC", "DESC") or sort_field not in sortable_fields(model):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported sort: {spec} (sortable: {', '.join(sorted(sortable_fields(model)))})",
+        )
+    return sort_field, sort_direction
+
+
+def is_relevance_sort(sort: Optional[str]) -> bool:
+    return (sort or "").split(",")[0].strip() == RELEVANCE_SORT
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(body: str) -> str:
+    digest = hmac.new(settings.JWT_SECRET.encode("utf-8"), body.encode("ascii"), hashlib.sha256).digest()
+    return _b64encode(digest[:CURSOR_SIGNATURE_BYTES])
+
+
+def _invalid_cursor(detail: str = "Invalid cursor") -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def encode_signed(payload: dict) -> str:
+    """dict를 서명된 불투명 문자열로 인코딩 (커서, sync 토큰)"""
+    body = _b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+    return f"{body}.{_sign(body)}"
+
+
+def decode_signed(token: str) -> Optional[dict]:
+    """서명 검증 후 dict 반환 (위변조/형식 오류 시 None)"""
+    try:
+        body, signature = token.split(".")
+    except ValueError:
+        return None
+    # 비ASCII 입력은 str 비교/ASCII 서명에서 TypeError/UnicodeEncodeError가 나므로 바이트로 비교
+    try:
+        expected = _sign(body)
+    except UnicodeEncodeError:
+        return None
+    if not hmac.compare_digest(signature.encode("utf-8"), expected.encode("ascii")):
+        return None
+    try:
+        payload = json.loads(_b64decode(body))
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def encode_cursor(sort: str, value: Any, last_id: str) -> str:
+    """마지막 행의 정렬 값과 id를 서명된 커서 문자열로 인코딩"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Enum):
+        value = value.value
+    return encode_signed({"s": sort, "v": value, "id": last_id})
+
+
+def decode_cursor(cursor: str) -> dict:
+    """커서 서명 검증 후 payload 반환 (위변조/형식 오류 시 400)"""
+    payload = decode_signed(cursor)
+    if payload is None or not {"s", "v", "id"} <= payload.keys():
+        raise _invalid_cursor()
+    return payload
+
+
+def _load_value(field: Any, raw: Any) -> Any:
+    """커서에 저장된 JSON 값을 컬럼 타입으로 복원"""
+    if raw is None:
+        return None
+    try:
+        python_type = field.type.python_type
+    except NotImplementedError:
+        return raw
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(raw)
+        if issubclass(python_type, Enum):
+            return python_type(raw)
+    except (TypeError, ValueError):
+        raise _invalid_cursor()
+    return raw
+
+
+def _seek_criteria(field: Any, id_field: Any, direction: str, value: Any, last_id: str):
+    """
+    (정렬 컬럼, id) 기준 다음 행 조건
+
+    MySQL/SQLite는 NULL을 ASC에서 가장 앞, DESC에서 가장 뒤에 정렬하므로
+    NULL 정렬 값(예: due_at)도 같은 순서로 이어지도록 조건을 나눕니다.
+    """
+    if field is id_field:
+        return id_field > last_id if direction == "ASC" else id_field < last_id
+    if direction == "ASC":
+        if value is None:
+            return or_(and_(field.is_(None), id_field > last_id), field.isnot(None))
+        return or_(field > value, and_(field == value, id_field > last_id))
+    if value is None:
+        return and_(field.is_(None), id_field < last_id)
+    return or_(field < value, and_(field == value, id_field < last_id), field.is_(None))
+
+
+def _apply_sort(query: Query, page_request: PageRequest, default_sort: Optional[str]) -> Tuple[Query, Any, Any, str, str]:
+    """(정렬 컬럼, id) 정렬 적용"""
+    description = query.column_descriptions[0]
+    entity = description["entity"]
+    if is_relevance_sort(page_request.sort):
+        if not page_request.keyword:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="sort=relevance requires keyword",
+            )
+        score = relevance(entity, page_request.keyword, query.session.get_bind().dialect.name)
+        id_field = getattr(entity, "id")
+        if score is not None:
+            return query.order_by(desc(score), asc(id_field)), score, id_field, RELEVANCE_SORT, "DESC"
+        # 전문 검색을 쓰지 않는 짧은 키워드는 기본 정렬
+        page_request = page_request.model_copy(update={"sort": None})
+    sort_field, sort_direction = _resolve_sort(description["type"], page_request.sort, default_sort)
+    id_field = getattr(entity, "id")
+    field = id_field if sort_field == "id" else getattr(entity, sort_field)
+    order = desc if sort_direction == "DESC" else asc
+    if field is id_field:
+        return query.order_by(order(id_field)), field, id_field, sort_field, sort_direction
+    return query.order_by(order(field), order(id_field)), field, id_field, sort_field, sort_direction
+
+
+def apply_sort(query: Query, page_request: PageRequest, default_sort: Optional[str] = None) -> Query:
+    """페이징 없이 (정렬 컬럼, id) 정렬만 적용 (전체 내보내기용)"""
+    return _apply_sort(query, page_request, default_sort)[0]
+
 
 def apply_pagination(
     query: Query,
     page_request: PageRequest,
     default_sort: Optional[str] = None,
-) -> Tuple[Query, int]:
+    cache_key: Optional[str] = None,
+    redis_client=None,
+) -> Tuple[Query, Optional[int], CountMode]:
     """
     쿼리에 페이징 및 정렬 적용
-    
+
+    정렬 컬럼이 같은 행의 순서를 고정하기 위해 항상 id를 보조 정렬로 추가합니다.
+    page_request.cursor가 있으면 OFFSET 대신 키셋 조건으로 다음 페이지를 조회합니다.
+    전체 개수는 page_request.count 방식으로 조회합니다 (cached는 cache_key가 있을 때만, app.core.counts).
+
     Returns:
-        (paginated_query, total_count)
+        (paginated_query, total_count, count_mode)
     """
-    # 정렬 처리
-    if page_request.sort:
-        try:
-            sort_field, sort_direction = page_request.sort.split(",")
-            sort_direction = sort_direction.strip().upper()
-            sort_field = sort_field.strip()
-            
-            # 모델에서 필드 가져오기
-            if hasattr(query.column_descriptions[0]["entity"], sort_field):
-                field = getattr(query.column_descriptions[0]["entity"], sort_field)
-                if sort_direction == "DESC":
-                    query = query.order_by(desc(field))
-                else:
-                    query = query.order_by(asc(field))
-        except (ValueError, AttributeError, IndexError):
-            # 정렬 파싱 실패 시 기본 정렬 사용
-            if default_sort:
-                try:
-                    sort_field, sort_direction = default_sort.split(",")
-                    field = getattr(query.column_descriptions[0]["entity"], sort_field.strip())
-                    if sort_direction.strip().upper() == "DESC":
-                        query = query.order_by(desc(field))
-                    else:
-                        query = query.order_by(asc(field))
-                except:
-                    pass
-    elif default_sort:
-        try:
-            sort_field, sort_direction = default_sort.split(",")
-            field = getattr(query.column_descriptions[0]["entity"], sort_field.strip())
-            if sort_direction.strip().upper() == "DESC":
-                query = query.order_by(desc(field))
-            else:
-                query = query.order_by(asc(field))
-        except:
-            pass
-    
+    query, field, id_field, sort_field, sort_direction = _apply_sort(query, page_request, default_sort)
+
     # 전체 개수 조회
-    total_count = query.count()
-    
+    total_count, count_mode = count_total(query, page_request.count, cache_key, redis_client)
+
+    # 키셋 페이징
+    if page_request.cursor:
+        if is_relevance_sort(page_request.sort):
+            raise _invalid_cursor("Cursor is not supported with sort=relevance")
+        payload = decode_cursor(page_request.cursor)
+        if payload["s"] != f"{sort_field},{sort_direction}":
+            raise _invalid_cursor("Cursor does not match sort")
+        value = _load_value(field, payload["v"])
+        query = query.filter(_seek_criteria(field, id_field, sort_direction, value, payload["id"]))
+        return query.limit(page_request.size), total_count, count_mode
+
     # 페이징 적용
     offset = page_request.page * page_request.size
     paginated_query = query.offset(offset).limit(page_request.size)
-    
-    return paginated_query, total_count
+
+    return paginated_query, total_count, count_mode
+
+
+def fetch_page(
+    query: Query,
+    page_request: PageRequest,
+    default_sort: Optional[str] = None,
+    cache_key: Optional[str] = None,
+    redis_client=None,
+) -> Tuple[list, Optional[int], CountMode]:
+    """
+    페이지 조회 실행
+
+    OFFSET 페이지의 exact 개수는 윈도 함수를 지원하는 DB(MySQL 8, SQLite 3.25+)에서
+    COUNT(*) OVER()로 페이지와 함께 한 번에 조회합니다. 조인/키워드 LIKE 필터를
+    COUNT 서브쿼리에서 한 번 더 평가하지 않습니다.
+    커서 페이지, 다른 개수 방식, 윈도 함수 미지원 DB는 apply_pagination (2회 조회)을 사용합니다.
+
+    Returns:
+        (items, total_count, count_mode)
+    """
+    if (
+        page_request.count != CountMode.EXACT
+        or page_request.cursor
+        or not supports_window_functions(query.session.get_bind())
+    ):
+        paginated_query, total_count, count_mode = apply_pagination(
+            query, page_request, default_sort, cache_key, redis_client
+        )
+        return paginated_query.all(), total_count, count_mode
+
+    query = _apply_sort(query, page_request, default_sort)[0]
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset(page_request.page * page_request.size)
+        .limit(page_request.size)
+        .all()
+    )
+    if rows:
+        return [row[0] for row in rows], rows[0][-1], CountMode.EXACT
+    if page_request.page == 0:
+        return [], 0, CountMode.EXACT
+    # 범위를 벗어난 페이지는 윈도 결과가 없으므로 개수만 따로 조회
+    return [], query.count(), CountMode.EXACT
+
+
+def next_cursor(
+    items: list,
+    page_request: PageRequest,
+    total_count: Optional[int],
+    default_sort: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
+) -> Optional[str]:
+    """
+    조회한 페이지의 마지막 행으로 다음 페이지 커서 생성
+
+    OFFSET 페이지에서도 생성하므로 어느 페이지에서든 커서 방식으로 이어서 조회할 수 있습니다.
+    커서 방식이거나 정확한 전체 개수가 없으면 위치를 알 수 없으므로 페이지가 가득 찬 경우 항상 생성합니다.
+    """
+    if not items or len(items) < page_request.size or is_relevance_sort(page_request.sort):
+        return None
+    if (
+        not page_request.cursor
+        and count_mode == CountMode.EXACT
+        and page_request.page * page_request.size + len(items) >= total_count
+    ):
+        return None
+
+    last = items[-1]
+    sort_field, sort_direction = _resolve_sort(type(last), page_request.sort, default_sort)
+    return encode_cursor(f"{sort_field},{sort_direction}", getattr(last, sort_field), last.id)
 
 
 def create_page_response(
     content: list,
     page: int,
     size: int,
-    total_elements: int,
+    total_elements: Optional[int],
     sort: Optional[str] = None,
+    next_cursor: Optional[str] = None,
+    count_mode: CountMode = CountMode.EXACT,
 ) -> dict:
-    """페이징 응답 생성"""
-    total_pages = ceil(total_elements / size) if total_elements > 0 else 0
-    
+    """
+    페이징 응답 생성
+
+    count_mode=none이면 total_elements/total_pages는 None,
+    estimate/cached이면 근사값일 수 있습니다.
+    """
+    if total_elements is None:
+        total_pages = None
+    else:
+        total_pages = ceil(total_elements / size) if total_elements > 0 else 0
+
     return {
         "content": content,
         "page": page,
@@ -86,10 +333,6 @@ def create_page_response(
         "total_elements": total_elements,
         "total_pages": total_pages,
         "sort": sort,
+        "next_cursor": next_cursor,
+        "count_mode": count_mode,
     }
-
-
-
-
-
-
@@ -0,0 +1,381 @@
+"""
+반복 이벤트 (RRULE) 전개
+
+반복 이벤트는 마스터 행 하나(events.rrule)로 저장하고, 목록 조회(GET /events?expand=true)에서
+요청한 start_from ~ start_to 구간의 회차만 그때그때 생성합니다.
+
+- 지원 규칙 (RFC 5545 부분 집합): FREQ=DAILY|WEEKLY|MONTHLY, INTERVAL, COUNT, UNTIL, BYDAY(WEEKLY)
+  MONTHLY는 시작일의 날짜를 사용하며 해당 날짜가 없는 달(예: 31일)은 건너뜁니다.
+- 전개: COUNT가 없으면 구간 시작 직전 주기로 바로 건너뛰어 구간 안의 회차만 계산합니다.
+  (COUNT는 MAX_COUNT 이하라 처음부터 셉니다)
+- 캐시: 마스터 id + 행 버전(change_seq + updated_at) + 구간을 키로 회차 시작 시각 목록을 Redis에 저장합니다.
+  마스터가 수정되면 change_seq가 바뀌어 (같은 초 안의 수정도) 자연히 새 키를 사용합니다.
+- 예외: 회차 하나의 수정/취소는 event_exceptions 행(original_start 기준)으로 저장하고 전개 후 적용합니다.
+"""
+import calendar as calendar_module
+import heapq
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.core.etag import row_version
+from app.db.queries import event_list_query
+from app.models.event import Event, EventException
+from app.models.user import User
+from app.schemas.event import EventListRequest
+
+logger = logging.getLogger(__name__)
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+
+# COUNT 상한 (마스터 하나가 만들 수 있는 최대 회차)
+MAX_COUNT = 1000
+
+# expand=true 조회 구간 상한
+MAX_WINDOW_DAYS = 366
+
+OCCURRENCE_CACHE_TTL_SECONDS = 3600
+
+EXPAND_SORT = "start_at,ASC"
+
+
+@dataclass(frozen=True)
+class Rule:
+    """파싱한 반복 규칙"""
+    freq: str
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    byday: Tuple[int, ...] = ()
+
+    def to_string(self) -> str:
+        parts = [f"FREQ={self.freq}"]
+        if self.interval != 1:
+            parts.append(f"INTERVAL={self.interval}")
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%S}")
+        return ";".join(parts)
+
+
+def _parse_until(value: str) -> datetime:
+    value = value.rstrip("Z")
+    for fmt in ("%Y%m%dT%H%M%S", "%Y%m%d"):
+        try:
+            until = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        # 날짜만 지정하면 그날 전체 포함
+        return until if "T" in value else until + timedelta(days=1, microseconds=-1)
+    raise ValueError(f"Invalid UNTIL: {value}")
+
+
+def parse_rrule(text: str) -> Rule:
+    """RRULE 문자열 파싱 (지원하지 않는 규칙은 ValueError)"""
+    parts: Dict[str, str] = {}
+    for part in text.strip().removeprefix("RRULE:").split(";"):
+        if not part:
+            continue
+        name, sep, value = part.partition("=")
+        if not sep or not value:
+            raise ValueError(f"Invalid rule part: {part}")
+        parts[name.strip().upper()] = value.strip().upper()
+
+    freq = parts.pop("FREQ", None)
+    if freq not in FREQUENCIES:
+        raise ValueError(f"FREQ must be one of {', '.join(FREQUENCIES)}")
+    try:
+        interval = int(parts.pop("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        raise ValueError("INTERVAL and COUNT must be integers")
+    parts.pop("COUNT", None)
+    if interval < 1:
+        raise ValueError("INTERVAL must be positive")
+    if count is not None and not 1 <= count <= MAX_COUNT:
+        raise ValueError(f"COUNT must be between 1 and {MAX_COUNT}")
+    until = _parse_until(parts.pop("UNTIL")) if "UNTIL" in parts else None
+    if count is not None and until is not None:
+        raise ValueError("COUNT and UNTIL cannot be combined")
+
+    byday: Tuple[int, ...] = ()
+    if "BYDAY" in parts:
+        if freq != "WEEKLY":
+            raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+        names = parts.pop("BYDAY").split(",")
+        if any(name not in WEEKDAYS for name in names):
+            raise ValueError("BYDAY must be a list of MO,TU,WE,TH,FR,SA,SU")
+        byday = tuple(sorted({WEEKDAYS.index(name) for name in names}))
+    if parts:
+        raise ValueError(f"Unsupported rule parts: {', '.join(sorted(parts))}")
+    return Rule(freq=freq, interval=interval, count=count, until=until, byday=byday)
+
+
+def _add_months(value: datetime, months: int) -> Optional[datetime]:
+    """months개월 뒤 같은 날짜 (그 달에 해당 날짜가 없으면 None)"""
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    if value.day > calendar_module.monthrange(year, month)[1]:
+        return None
+    return value.replace(year=year, month=month)
+
+
+def _period_starts(rule: Rule, dtstart: datetime, period: int) -> List[datetime]:
+    """period번째 주기의 회차 시작 시각 (오름차순)"""
+    if rule.freq == "DAILY":
+        return [dtstart + timedelta(days=period * rule.interval)]
+    if rule.freq == "WEEKLY":
+        week = dtstart - timedelta(days=dtstart.weekday()) + timedelta(weeks=period * rule.interval)
+        return [week + timedelta(days=day) for day in (rule.byday or (dtstart.weekday(),))]
+    start = _add_months(dtstart, period * rule.interval)
+    return [start] if start is not None else []
+
+
+def _first_period(rule: Rule, dtstart: datetime, window_start: datetime) -> int:
+    """window_start 이전에 끝나는 주기를 건너뛴 첫 주기 번호"""
+    if rule.count is not None or window_start <= dtstart:
+        return 0
+    if rule.freq == "DAILY":
+        return (window_start - dtstart).days // rule.interval
+    if rule.freq == "WEEKLY":
+        week0 = dtstart - timedelta(days=dtstart.weekday())
+        return (window_start - week0).days // (7 * rule.interval)
+    months = (window_start.year - dtstart.year) * 12 + window_start.month - dtstart.month
+    return max(0, months // rule.interval - 1)
+
+
+def iter_starts(rule: Rule, dtstart: datetime, window_start: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    회차 시작 시각 (오름차순, COUNT/UNTIL이 없으면 무한)
+
+    window_start를 주면 그 이전 주기를 건너뛰고 시작합니다 (COUNT 규칙은 처음부터).
+    """
+    period = _first_period(rule, dtstart, window_start) if window_start else 0
+    emitted = 0
+    while True:
+        for start in _period_starts(rule, dtstart, period):
+            if start < dtstart:
+                continue
+            if rule.until is not None and start > rule.until:
+                return
+            yield start
+            emitted += 1
+            if rule.count is not None and emitted >= rule.count:
+                return
+        period += 1
+
+
+def recurrence_end(rule: Rule, dtstart: datetime, duration: timedelta) -> Optional[datetime]:
+    """마지막 회차 종료 시각 (끝이 없으면 None) - 구간 조회 시 마스터 필터용"""
+    if rule.until is not None:
+        return rule.until + duration
+    if rule.count is not None:
+        last = dtstart
+        for last in iter_starts(rule, dtstart):
+            pass
+        return last + duration
+    return None
+
+
+def expand(rule: Rule, dtstart: datetime, window_start: datetime, window_end: datetime) -> List[datetime]:
+    """window_start <= 시작 <= window_end 인 회차 시작 시각"""
+    starts = []
+    for start in iter_starts(rule, dtstart, window_start):
+        if start > window_end:
+            break
+        if start >= window_start:
+            starts.append(start)
+    return starts
+
+
+def is_occurrence(event: Event, original_start: datetime) -> bool:
+    """original_start가 반복 이벤트의 회차인지"""
+    return original_start in expand(parse_rrule(event.rrule), event.start_at, original_start, original_start)
+
+
+def _cache_key(event: Event, window_start: datetime, window_end: datetime) -> str:
+    return f"occ:{event.id}:{row_version(event)}:{window_start:%Y%m%dT%H%M%S}:{window_end:%Y%m%dT%H%M%S}"
+
+
+def cached_expand(redis_client, event: Event, window_start: datetime, window_end: datetime) -> List[datetime]:
+    """마스터 하나의 구간 회차 (Redis 캐시)"""
+    key = _cache_key(event, window_start, window_end)
+    if redis_client is not None:
+        try:
+            cached = redis_client.get(key)
+            if cached is not None:
+                return [datetime.fromisoformat(value) for value in json.loads(cached)]
+        except Exception as e:
+            logger.warning(f"Occurrence cache read failed: {e}")
+
+    starts = expand(parse_rrule(event.rrule), event.start_at, window_start, window_end)
+    if redis_client is not None:
+        try:
+            redis_client.setex(key, OCCURRENCE_CACHE_TTL_SECONDS, json.dumps([start.isoformat() for start in starts]))
+        except Exception as e:
+            logger.warning(f"Occurrence cache write failed: {e}")
+    return starts
+
+
+def _occurrence(event: Event, original_start: datetime, exception: Optional[EventException]) -> dict:
+    """회차 응답 dict (EventResponse 필드 + recurrence_id)"""
+    duration = event.end_at - event.start_at
+    item = {
+        "id": event.id,
+        "calendar_id": event.calendar_id,
+        "title": event.title,
+        "description": event.description,
+        "start_at": original_start,
+        "end_at": original_start + duration,
+        "location": event.location,
+        "is_all_day": event.is_all_day,
+        "rrule": event.rrule,
+        "recurrence_id": original_start,
+        "created_at": event.created_at,
+        "updated_at": event.updated_at,
+    }
+    if exception is not None:
+        for name in ("title", "description", "location", "start_at", "end_at"):
+            value = getattr(exception, name)
+            if value is not None:
+                item[name] = value
+        item["updated_at"] = max(event.updated_at, exception.updated_at)
+    return item
+
+
+def expand_occurrences(
+    db: Session,
+    redis_client,
+    masters: List[Event],
+    window_start: datetime,
+    window_end: datetime,
+) -> List[dict]:
+    """
+    마스터들의 구간 회차 (예외 적용, 시작 시각 순)
+
+    예외는 마스터 id로 한 번에 조회합니다. 다른 시각으로 옮긴 회차는 옮긴 시각 기준으로 구간에 포함됩니다.
+    """
+    if not masters:
+        return []
+    by_id = {event.id: event for event in masters}
+    exceptions = db.query(EventException).filter(
+        EventException.event_id.in_(list(by_id)),
+        or_(
+            EventException.original_start.between(window_start, window_end),
+            EventException.start_at.between(window_start, window_end),
+        ),
+    ).all()
+    overrides = {(exception.event_id, exception.original_start): exception for exception in exceptions}
+
+    items = []
+    for event in masters:
+        starts = set(cached_expand(redis_client, event, window_start, window_end))
+        # 구간 밖에서 구간 안으로 옮긴 회차
+        starts.update(
+            original for (event_id, original), exception in overrides.items()
+            if event_id == event.id and not exception.is_cancelled and is_occurrence(event, original)
+        )
+        for original_start in starts:
+            exception = overrides.get((event.id, original_start))
+            if exception is not None and exception.is_cancelled:
+                continue
+            item = _occurrence(event, original_start, exception)
+            if window_start <= item["start_at"] <= window_end:
+                items.append(item)
+    items.sort(key=lambda item: (item["start_at"], item["id"]))
+    return items
+
+
+def overlapping_occurrences(
+    db: Session,
+    redis_client,
+    calendar_ids,
+    window_start: datetime,
+    window_end: datetime,
+    exclude_event_id: Optional[str] = None,
+) -> List[dict]:
+    """
+    구간과 겹치는 반복 회차 (start_at < window_end AND end_at > window_start)
+
+    calendar_ids는 id 목록 또는 id를 고르는 서브쿼리입니다.
+    """
+    query = db.query(Event).filter(
+        Event.calendar_id.in_(calendar_ids),
+        Event.is_recurring.is_(True),
+        Event.start_at < window_end,
+        or_(Event.recurrence_end.is_(None), Event.recurrence_end > window_start),
+    )
+    if exclude_event_id:
+        query = query.filter(Event.id != exclude_event_id)
+    masters = query.all()
+    if not masters:
+        return []
+    # 구간 시작 전에 시작해 구간까지 이어지는 회차도 포함하도록 가장 긴 회차 길이만큼 앞당겨 전개
+    longest = max(event.end_at - event.start_at for event in masters)
+    return [
+        item for item in expand_occurrences(db, redis_client, masters, window_start - longest, window_end)
+        if item["start_at"] < window_end and item["end_at"] > window_start
+    ]
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def expanded_page(
+    db: Session,
+    redis_client,
+    current_user: User,
+    page_request: EventListRequest,
+) -> Tuple[list, int]:
+    """
+    GET /events?expand=true 페이지 (단일 이벤트 + 반복 회차, start_at 오름차순)
+
+    단일 이벤트는 (page+1)*size 행까지만 DB에서 읽고, 반복 마스터는 구간과 겹치는 것만 읽어 전개한 뒤
+    병합해 페이지를 자릅니다. 전체 개수는 단일 이벤트 COUNT + 회차 수입니다.
+    """
+    window_start, window_end = page_request.start_from, page_request.start_to
+    if window_start is None or window_end is None:
+        raise _bad_request("expand requires start_from and start_to")
+    if window_end < window_start or window_end - window_start > timedelta(days=MAX_WINDOW_DAYS):
+        raise _bad_request(f"expand window must be between 0 and {MAX_WINDOW_DAYS} days")
+    if page_request.cursor:
+        raise _bad_request("Cursor is not supported with expand")
+    if page_request.sort and page_request.sort.replace(" ", "") != EXPAND_SORT:
+        raise _bad_request(f"expand only supports sort={EXPAND_SORT}")
+
+    single = event_list_query(db, current_user, page_request, redis_client).filter(Event.is_recurring.is_(False))
+    total = single.order_by(None).count()
+    limit = (page_request.page + 1) * page_request.size
+    singles = single.order_by(Event.start_at, Event.id).limit(limit).all()
+
+    master_request = page_request.model_copy(update={"start_from": None, "start_to": None, "end_from": None, "end_to": None})
+    masters = event_list_query(db, current_user, master_request, redis_client).filter(
+        Event.is_recurring.is_(True),
+        Event.start_at <= window_end,
+        or_(Event.recurrence_end.is_(None), Event.recurrence_end >= window_start),
+    ).all()
+    occurrences = [
+        item for item in expand_occurrences(db, redis_client, masters, window_start, window_end)
+        if (page_request.end_from is None or item["end_at"] >= page_request.end_from)
+        and (page_request.end_to is None or item["end_at"] <= page_request.end_to)
+    ]
+    total += len(occurrences)
+
+    def start_key(item):
+        return (item["start_at"], item["id"]) if isinstance(item, dict) else (item.start_at, item.id)
+
+    merged = heapq.merge(singles, occurrences, key=start_key)
+    content = list(itertools.islice(merged, page_request.page * page_request.size, limit))
+    return content, total
@@ -0,0 +1,41 @@
+"""
+응답 직렬화
+
+response_model로 반환하면 FastAPI가 응답 모델을 한 번 더 검증하고 dict로 변환한 뒤
+json.dumps로 인코딩합니다. 여기서는 ORM 객체를 from_attributes로 한 번만 검증하고
+pydantic-core의 model_dump_json으로 바로 바이트를 만들어 반환합니다.
+라우트의 response_model은 OpenAPI 문서용으로 그대로 둡니다.
+"""
+from typing import Any, Mapping, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class ModelResponse(Response):
+    """pydantic 모델을 model_dump_json(by_alias)으로 직렬화하는 JSON 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode("utf-8")
+        return super().render(content)
+
+
+def model_response(
+    model: Type[BaseModel],
+    data: Any,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> ModelResponse:
+    """
+    ORM 객체(또는 ORM 객체를 담은 dict)를 응답 모델로 한 번 검증 후 직렬화
+
+    목록 응답은 create_page_response 결과를 그대로 넘기면 content의 ORM 객체도
+    같은 패스에서 from_attributes로 검증됩니다.
+    """
+    return ModelResponse(
+        model.model_validate(data, from_attributes=True),
+        status_code=status_code,
+        headers=headers,
+    )
@@ -0,0 +1,210 @@
+"""
+통합 검색 (GET /search?q=)
+
+캘린더/이벤트/작업을 각각 페이지 + COUNT로 조회하는 대신 한 요청에서:
+
+- 권한 범위: 사용자 캘린더 id를 한 번만 조회해 모든 하위 쿼리에 IN 조건으로 사용
+- 병렬 실행: 리소스별 쿼리를 스레드풀에서 별도 세션으로 동시에 실행 (COUNT 없음, 리소스별 limit)
+- 시간 예산: SEARCH_TIME_BUDGET_SECONDS 안에 끝나지 않은 리소스는 건너뛰고 부분 결과를 반환
+  실행 중인 future는 cancel로 멈출 수 없으므로, 늦은 쿼리는 DB별 문장 시간 제한으로 남은 예산이 지나면
+  중단해 공유 스레드를 돌려받습니다 (MySQL: MAX_EXECUTION_TIME 힌트, PostgreSQL: statement_timeout,
+  SQLite: 기한에 그 문장이 연결에서 마지막으로 시작한 문장이면 interrupt). 대기열에서 예산을 넘긴 하위 쿼리는 실행하지 않습니다.
+- 병합: 제목 접두사 일치 > 제목 포함 > 본문 일치 순, 같은 등급은 리소스별 순위(관련도/최근 수정)로 교차 배치
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.db.queries import SEARCH_MODELS, search_query
+from app.models.calendar import Calendar
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TYPES = tuple(SEARCH_MODELS)
+
+# 전체 하위 쿼리 대기 시간
+SEARCH_TIME_BUDGET_SECONDS = 0.5
+
+# 요청 간 공유하는 하위 쿼리 스레드풀
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search")
+
+
+def _item(resource: str, obj) -> dict:
+    return {
+        "type": resource,
+        "id": obj.id,
+        "title": obj.title,
+        "calendar_id": getattr(obj, "calendar_id", None),
+        "start_at": getattr(obj, "start_at", None),
+        "end_at": getattr(obj, "end_at", None),
+        "due_at": getattr(obj, "due_at", None),
+    }
+
+
+@contextmanager
+def _statement_timeout(session: Session, timeout_ms: int):
+    """
+    세션의 문장 실행 시간 제한 (MySQL은 쿼리 힌트로 처리)
+
+    PostgreSQL은 트랜잭션 범위 statement_timeout, SQLite는 기한에 이 세션의 문장을 interrupt (_sqlite_interrupt).
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        session.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+    if dialect != "sqlite":
+        yield
+        return
+    with _sqlite_interrupt(session, timeout_ms):
+        yield
+
+
+# SQLite 연결별 문장 시작 기록 (연결 info의 statement_thread / interrupting)
+_sqlite_statements = threading.Condition()
+
+
+def _track_sqlite_statement(conn, cursor, statement, parameters, context, executemany):
+    """연결에서 마지막으로 시작한 문장의 스레드 기록 (다른 스레드의 interrupt가 끝날 때까지 대기)"""
+    info = conn.connection.info
+    current = threading.get_ident()
+    with _sqlite_statements:
+        while info.get("interrupting") not in (None, current):
+            _sqlite_statements.wait()
+        info["statement_thread"] = current
+
+
+@contextmanager
+def _sqlite_interrupt(session: Session, timeout_ms: int):
+    """
+    기한에 연결의 실행 중인 문장을 interrupt
+
+    sqlite3_interrupt는 연결에서 실행 중인 모든 문장을 중단하므로 (StaticPool 등 공유 연결)
+    기한에 마지막으로 시작한 문장이 이 스레드의 문장일 때만 중단하고, 중단한 문장이 끝날 때까지
+    다른 스레드의 새 문장은 시작하지 않습니다. 타이머를 쓰는 이유: Python progress handler는
+    연결을 여러 스레드가 함께 쓸 때 GIL과 연결 잠금을 서로 기다려 교착될 수 있음.
+    """
+    engine = session.get_bind()
+    if not event.contains(engine, "before_cursor_execute", _track_sqlite_statement):
+        event.listen(engine, "before_cursor_execute", _track_sqlite_statement)
+    connection = session.connection().connection
+    current = threading.get_ident()
+    state = {"done": False}
+
+    def interrupt():
+        with _sqlite_statements:
+            if state["done"] or connection.info.get("statement_thread") != current:
+                return
+            connection.info["interrupting"] = current
+            connection.dbapi_connection.interrupt()
+
+    timer = threading.Timer(timeout_ms / 1000, interrupt)
+    timer.daemon = True
+    timer.start()
+    try:
+        yield
+    finally:
+        with _sqlite_statements:
+            state["done"] = True
+            if connection.info.get("interrupting") == current:
+                connection.info["interrupting"] = None
+                _sqlite_statements.notify_all()
+        timer.cancel()
+
+
+def _run_type(
+    bind,
+    resource: str,
+    current_user: User,
+    calendar_ids: List[str],
+    keyword: str,
+    limit: int,
+    deadline: float,
+    redis_client=None,
+) -> List[dict]:
+    """
+    리소스 하나 검색 (별도 세션, 세션을 닫기 전에 응답 dict로 변환)
+
+    deadline(time.monotonic 기준)까지 남은 시간을 문장 시간 제한으로 걸어 예산이 지나면 DB에서 중단합니다.
+    """
+    remaining_ms = int((deadline - time.monotonic()) * 1000)
+    if remaining_ms <= 0:
+        raise TimeoutError("search budget exhausted before start")
+    session = Session(bind=bind)
+    try:
+        query = search_query(session, resource, current_user, calendar_ids, keyword, limit, redis_client)
+        query = query.prefix_with(f"/*+ MAX_EXECUTION_TIME({remaining_ms}) */", dialect="mysql")
+        with _statement_timeout(session, remaining_ms):
+            return [_item(resource, obj) for obj in query.all()]
+    finally:
+        session.close()
+
+
+def _tier(title: str, keyword: str) -> int:
+    lowered, needle = (title or "").lower(), keyword.lower()
+    if lowered.startswith(needle):
+        return 0
+    if needle in lowered:
+        return 1
+    return 2
+
+
+def merge_results(results: Dict[str, List[dict]], keyword: str) -> List[dict]:
+    """리소스별 결과를 하나의 순위 목록으로 병합"""
+    ranked = []
+    for type_index, resource in enumerate(SEARCH_TYPES):
+        for position, item in enumerate(results.get(resource, [])):
+            ranked.append(((_tier(item["title"], keyword), position, type_index), item))
+    ranked.sort(key=lambda pair: pair[0])
+    return [item for _, item in ranked]
+
+
+def search_all(
+    db: Session,
+    current_user: User,
+    keyword: str,
+    types: Tuple[str, ...] = SEARCH_TYPES,
+    limit: int = 5,
+    budget: Optional[float] = None,
+    redis_client=None,
+) -> Tuple[List[dict], List[str]]:
+    """
+    사용자 범위 통합 검색
+
+    Returns:
+        (병합된 항목 목록, 시간 예산 안에 끝나지 않았거나 실패한 리소스)
+    """
+    budget = SEARCH_TIME_BUDGET_SECONDS if budget is None else budget
+    calendar_ids = [row[0] for row in db.query(Calendar.id).filter(Calendar.user_id == current_user.id)]
+    if not calendar_ids:
+        return [], []
+
+    bind = db.get_bind()
+    deadline = time.monotonic() + budget
+    futures = {
+        resource: _executor.submit(
+            _run_type, bind, resource, current_user, calendar_ids, keyword, limit, deadline, redis_client,
+        )
+        for resource in types
+    }
+    wait(futures.values(), timeout=budget)
+
+    results: Dict[str, List[dict]] = {}
+    incomplete: List[str] = []
+    for resource, future in futures.items():
+        if not future.done():
+            # 대기 중이면 취소, 실행 중이면 문장 시간 제한으로 곧 끝나므로 기다리지 않음
+            future.cancel()
+            incomplete.append(resource)
+            continue
+        try:
+            results[resource] = future.result()
+        except Exception as e:
+            logger.warning(f"Search sub-query failed ({resource}): {e}")
+            incomplete.append(resource)
+    return merge_results(results, keyword), incomplete
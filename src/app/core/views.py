@@ -0,0 +1,168 @@
+"""
+캘린더 뷰 (GET /calendars/views/month|week|day)
+
+클라이언트가 GET /events를 페이지마다 넘기며 날짜별로 나누는 대신 서버에서 날짜별 목록을 만듭니다.
+
+- 조회: 사용자 캘린더 id 서브쿼리 + 구간 조건 한 번 (idx_event_calendar_recurring), 필요한 컬럼만 읽음
+  반복 이벤트는 구간과 겹치는 회차를 전개합니다 (app.core.recurrence).
+- 시간대: 시각 이벤트는 UTC로 저장된 시각을 요청 시간대로 바꿔 날짜를 정하고,
+  종일 이벤트(is_all_day)는 저장된 날짜 그대로 사용합니다 (시간대와 무관).
+- 분할: 이벤트마다 첫 날짜/마지막 날짜를 한 번 계산하고 구간 안의 날짜에만 조각을 넣습니다.
+  (여러 날 이벤트는 걸친 날마다 is_start/is_end로 이어짐을 표시)
+- 캐시: (사용자, 월, 시간대)마다 월 뷰를 저장하고 주/일 뷰는 월 뷰에서 잘라 씁니다.
+  키에 사용자 변경 버전(app.core.etag.user_version_key)을 넣어 이벤트/캘린더 쓰기 시 자동으로 무효화됩니다.
+"""
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.etag import current_version, user_version_key
+from app.core.recurrence import overlapping_occurrences
+from app.models.calendar import Calendar
+from app.models.event import Event
+
+logger = logging.getLogger(__name__)
+
+# 월 뷰 캐시 TTL (버전이 바뀌면 이전 키는 더 이상 읽지 않음)
+VIEW_CACHE_TTL_SECONDS = 3600
+
+_VIEW_COLUMNS = (
+    Event.id, Event.calendar_id, Event.title, Event.location, Event.start_at, Event.end_at, Event.is_all_day,
+)
+
+
+def parse_timezone(name: str) -> ZoneInfo:
+    """IANA 시간대 이름 (잘못된 이름은 ValueError)"""
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Unknown timezone: {name}")
+
+
+def today(tz: ZoneInfo) -> date:
+    return datetime.now(timezone.utc).astimezone(tz).date()
+
+
+def _to_local(value: datetime, tz: ZoneInfo) -> datetime:
+    return value.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
+
+
+def _to_utc(value: datetime, tz: ZoneInfo) -> datetime:
+    return value.replace(tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def next_month(day: date) -> date:
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def _window_items(db: Session, redis_client, user_id: str, first: date, end: date, tz: ZoneInfo) -> List[dict]:
+    """[first, end) 날짜 구간과 겹칠 수 있는 이벤트/회차 (시각 이벤트와 종일 이벤트 기준을 모두 포함하는 UTC 구간)"""
+    local_start = datetime.combine(first, datetime.min.time())
+    local_end = datetime.combine(end, datetime.min.time())
+    window_start = min(local_start, _to_utc(local_start, tz))
+    window_end = max(local_end, _to_utc(local_end, tz))
+
+    calendar_ids = select(Calendar.id).where(Calendar.user_id == user_id)
+    rows = db.execute(
+        select(*_VIEW_COLUMNS).where(
+            Event.calendar_id.in_(calendar_ids),
+            Event.start_at < window_end,
+            Event.end_at > window_start,
+            Event.is_recurring.is_(False),
+        )
+    ).mappings()
+    items = [{**row, "recurrence_id": None} for row in rows]
+    items.extend(overlapping_occurrences(db, redis_client, calendar_ids, window_start, window_end))
+    return items
+
+
+def bucket_by_day(items: List[dict], first: date, end: date, tz: ZoneInfo) -> Dict[str, List[dict]]:
+    """
+    이벤트를 [first, end) 날짜별로 분할
+
+    end_at이 자정이면 그날은 제외하고, 길이 0인 이벤트는 시작일에만 넣습니다.
+    날짜 안의 순서: 종일 이벤트, 시작 시각, id
+    """
+    days: Dict[str, List[dict]] = {(first + timedelta(days=offset)).isoformat(): [] for offset in range((end - first).days)}
+    last_day = end - timedelta(days=1)
+    for item in items:
+        if item["is_all_day"]:
+            start_at, end_at = item["start_at"], item["end_at"]
+        else:
+            start_at, end_at = _to_local(item["start_at"], tz), _to_local(item["end_at"], tz)
+        span_first = start_at.date()
+        span_last = (end_at - timedelta(microseconds=1)).date() if end_at > start_at else span_first
+        if span_last < first or span_first > last_day:
+            continue
+        segment = {
+            "id": item["id"],
+            "calendar_id": item["calendar_id"],
+            "title": item["title"],
+            "location": item["location"],
+            "start_at": start_at.isoformat(),
+            "end_at": end_at.isoformat(),
+            "is_all_day": item["is_all_day"],
+            "recurrence_id": item["recurrence_id"].isoformat() if item["recurrence_id"] else None,
+        }
+        day = max(span_first, first)
+        while day <= min(span_last, last_day):
+            days[day.isoformat()].append({**segment, "is_start": day == span_first, "is_end": day == span_last})
+            day += timedelta(days=1)
+    for segments in days.values():
+        segments.sort(key=lambda segment: (not segment["is_all_day"], segment["start_at"], segment["id"]))
+    return days
+
+
+def _cache_key(user_id: str, month: date, tz: ZoneInfo, version: str) -> str:
+    return f"view:month:{user_id}:{month:%Y-%m}:{tz.key}:{version}"
+
+
+def month_days(db: Session, redis_client, user_id: str, month: date, tz: ZoneInfo) -> Dict[str, List[dict]]:
+    """월 뷰 날짜별 목록 (캐시 우선)"""
+    version = current_version(redis_client, user_version_key(user_id))
+    key = _cache_key(user_id, month, tz, version) if version is not None else None
+    if key is not None:
+        try:
+            cached = redis_client.get(key)
+            if cached is not None:
+                return json.loads(cached)
+        except Exception as e:
+            logger.warning(f"View cache read failed: {e}")
+
+    end = next_month(month)
+    days = bucket_by_day(_window_items(db, redis_client, user_id, month, end, tz), month, end, tz)
+    if key is not None:
+        try:
+            redis_client.setex(key, VIEW_CACHE_TTL_SECONDS, json.dumps(days))
+        except Exception as e:
+            logger.warning(f"View cache write failed: {e}")
+    return days
+
+
+def view_days(
+    db: Session,
+    redis_client,
+    user_id: str,
+    first: date,
+    end: date,
+    tz: ZoneInfo,
+) -> Dict[str, List[dict]]:
+    """[first, end) 날짜별 목록 (걸친 월 뷰를 합쳐 자름)"""
+    days: Dict[str, List[dict]] = {}
+    month = _month_start(first)
+    while month < end:
+        days.update(month_days(db, redis_client, user_id, month, tz))
+        month = next_month(month)
+    return {
+        day: segments for day, segments in days.items()
+        if first.isoformat() <= day < end.isoformat()
+    }
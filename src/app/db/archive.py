@@ -0,0 +1,152 @@
+"""
+완료/취소 작업 아카이빙 작업
+
+완료(completed_at 기준) 또는 취소(updated_at 기준) 후 N일이 지난 작업을
+배치 단위로 tasks -> tasks_archive 로 이동합니다. 배치마다 INSERT ... SELECT 와
+DELETE 를 한 트랜잭션으로 커밋하므로, 중단 후 다시 실행하면 남은 작업부터 이어서 처리합니다.
+보관된 작업을 수정하면 restore_task로 tasks에 되돌립니다.
+
+사용법:
+    python -m app.db.archive --days 90 --batch-size 1000
+"""
+import argparse
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, delete, insert, literal, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.counts import invalidate_counters
+from app.core.etag import touch_calendar
+from app.models.calendar import Calendar
+from app.models.task import Task, TaskArchive, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# tasks 와 tasks_archive 공통 컬럼
+ARCHIVE_COLUMNS = [column.name for column in Task.__table__.columns]
+
+
+def archivable_criteria(cutoff: datetime):
+    """아카이빙 대상 조건"""
+    return or_(
+        and_(Task.status == TaskStatus.COMPLETED, Task.completed_at < cutoff),
+        and_(Task.status == TaskStatus.CANCELLED, Task.updated_at < cutoff),
+    )
+
+
+def archive_batch(db: Session, cutoff: datetime, batch_size: int, redis_client=None) -> int:
+    """
+    한 배치 이동 후 커밋, 이동한 행 수 반환
+
+    redis_client가 있으면 작업 목록 ETag가 갱신되도록 영향받은 캘린더 버전을 올리고
+    (보관 작업이 빠지는) 소유자 작업 카운터를 삭제합니다.
+    """
+    ids: List[str] = [
+        row[0]
+        for row in db.execute(
+            select(Task.id).where(archivable_criteria(cutoff)).order_by(Task.id).limit(batch_size)
+        )
+    ]
+    if not ids:
+        return 0
+    calendars = db.execute(
+        select(Calendar.id, Calendar.user_id)
+        .where(Calendar.id.in_(select(Task.calendar_id).where(Task.id.in_(ids))))
+    ).all()
+
+    tasks = Task.__table__
+    archive = TaskArchive.__table__
+    now = datetime.utcnow()
+    try:
+        db.execute(
+            insert(archive).from_select(
+                ARCHIVE_COLUMNS + ["archived_at"],
+                select(*[tasks.c[name] for name in ARCHIVE_COLUMNS], literal(now, archive.c.archived_at.type))
+                .where(tasks.c.id.in_(ids)),
+            )
+        )
+        db.execute(delete(tasks).where(tasks.c.id.in_(ids)))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    for calendar_id, owner_id in calendars:
+        touch_calendar(redis_client, calendar_id, owner_id)
+    for owner_id in {owner_id for _, owner_id in calendars}:
+        invalidate_counters(redis_client, ["tasks"], owner_id)
+    return len(ids)
+
+
+def restore_task(db: Session, task_id: str) -> Optional[Task]:
+    """
+    보관 작업을 tasks로 되돌림 (커밋은 호출자), 되돌린 Task 반환 (보관 작업이 없으면 None)
+    """
+    tasks = Task.__table__
+    archive = TaskArchive.__table__
+    if db.execute(select(archive.c.id).where(archive.c.id == task_id)).first() is None:
+        return None
+    db.execute(
+        insert(tasks).from_select(
+            ARCHIVE_COLUMNS,
+            select(*[archive.c[name] for name in ARCHIVE_COLUMNS]).where(archive.c.id == task_id),
+        )
+    )
+    db.execute(delete(archive).where(archive.c.id == task_id))
+    return db.get(Task, task_id)
+
+
+def archive_tasks(
+    db: Session,
+    older_than_days: Optional[int] = None,
+    batch_size: int = 1000,
+    max_batches: Optional[int] = None,
+    now: Optional[datetime] = None,
+    redis_client=None,
+) -> int:
+    """
+    아카이빙 실행
+
+    Returns:
+        이동한 작업 수
+    """
+    days = settings.TASK_ARCHIVE_AFTER_DAYS if older_than_days is None else older_than_days
+    cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = archive_batch(db, cutoff, batch_size, redis_client)
+        if not moved:
+            break
+        total += moved
+        batches += 1
+        logger.info(f"Archived {moved} tasks (total {total})")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="완료/취소 작업 아카이빙")
+    parser.add_argument("--days", type=int, default=None, help="완료/취소 후 경과 일수 (기본: TASK_ARCHIVE_AFTER_DAYS)")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db.redis import get_redis
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        total = archive_tasks(db, args.days, args.batch_size, args.max_batches, redis_client=get_redis())
+        print(f"archived: {total}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
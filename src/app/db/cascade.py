@@ -0,0 +1,87 @@
+"""
+사용자/캘린더 삭제 (청크 단위 벌크 DELETE)
+
+ORM cascade는 하위 캘린더/이벤트/작업을 모두 세션에 로드한 뒤 행 단위로 삭제하므로
+관계는 passive_deletes=True로 두고, 여기서 하위 행을 id 청크 단위로 직접 삭제합니다.
+- 메모리: 한 번에 최대 chunk_size 개의 id만 유지
+- 잠금: 청크마다 커밋하여 긴 트랜잭션 방지
+- events 파티셔닝 시 FK가 없으므로 이 경로에서 반드시 삭제
+남은 행은 DB의 ON DELETE CASCADE가 처리합니다.
+"""
+from typing import List, Optional, Sequence
+
+from sqlalchemy import Table, delete, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.sync import purge_user_state
+from app.models.calendar import Calendar
+from app.models.event import Event, EventDayBucket, EventException
+from app.models.task import Task, TaskArchive
+from app.models.user import User
+
+# calendars 하위 테이블
+CALENDAR_CHILD_TABLES: List[Table] = [
+    Event.__table__, EventException.__table__, EventDayBucket.__table__, Task.__table__, TaskArchive.__table__,
+]
+
+
+def _delete_in_chunks(db: Session, table: Table, calendar_ids: Sequence[str], chunk_size: int) -> int:
+    # 복합 PK 테이블(event_day_buckets)은 첫 PK 컬럼(event_id) 단위로 삭제
+    key = list(table.primary_key.columns)[0]
+    deleted = 0
+    while True:
+        ids = db.execute(
+            select(key).where(table.c.calendar_id.in_(calendar_ids)).distinct().limit(chunk_size)
+        ).scalars().all()
+        if not ids:
+            return deleted
+        db.execute(delete(table).where(key.in_(ids)))
+        db.commit()
+        deleted += len(ids)
+
+
+def purge_calendars(db: Session, calendar_ids: Sequence[str], chunk_size: Optional[int] = None) -> int:
+    """
+    캘린더와 하위 이벤트/작업 삭제
+
+    Returns:
+        삭제한 하위 행 수
+    """
+    chunk_size = chunk_size or settings.DELETE_CHUNK_SIZE
+    calendar_ids = list(calendar_ids)
+    if not calendar_ids:
+        return 0
+
+    deleted = 0
+    for table in CALENDAR_CHILD_TABLES:
+        deleted += _delete_in_chunks(db, table, calendar_ids, chunk_size)
+
+    db.execute(
+        delete(Calendar).where(Calendar.id.in_(calendar_ids)).execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return deleted
+
+
+def purge_user(db: Session, user_id: str, chunk_size: Optional[int] = None) -> int:
+    """
+    사용자와 소유 캘린더(및 하위 행) 삭제
+
+    Returns:
+        삭제한 하위 행 수
+    """
+    chunk_size = chunk_size or settings.DELETE_CHUNK_SIZE
+    deleted = 0
+    while True:
+        calendar_ids = db.execute(
+            select(Calendar.id).where(Calendar.user_id == user_id).limit(chunk_size)
+        ).scalars().all()
+        if not calendar_ids:
+            break
+        deleted += purge_calendars(db, calendar_ids, chunk_size)
+
+    purge_user_state(db, user_id)
+    db.execute(delete(User).where(User.id == user_id).execution_options(synchronize_session=False))
+    db.commit()
+    return deleted
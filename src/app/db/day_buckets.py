@@ -0,0 +1,148 @@
+"""
+이벤트 날짜 버킷 (겹침 조회 인덱스)
+
+겹침 조건 start_at < :end AND end_at > :start 는 두 컬럼의 범위 조건이라
+idx_event_calendar_start로는 start_at < :end 쪽만 좁혀지고 과거 이벤트를 모두 훑게 됩니다.
+event_day_buckets에 이벤트가 걸친 날짜(UTC)마다 한 행을 두고
+(calendar_id, day) 인덱스로 구간 날짜의 이벤트만 찾은 뒤 시각을 비교하므로,
+비용은 구간에 있는 이벤트 수에 비례합니다.
+
+- 쓰기: 이벤트 생성/수정/삭제와 같은 트랜잭션에서 sync_buckets / delete_buckets 호출
+- 반복 이벤트는 버킷을 두지 않고 구간과 겹치는 마스터의 회차를 전개해 확인합니다.
+
+사용법 (기존 데이터 채우기):
+    python -m app.db.day_buckets rebuild --batch-size 1000
+"""
+import argparse
+import logging
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Sequence
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.recurrence import overlapping_occurrences
+from app.models.event import Event, EventDayBucket
+
+logger = logging.getLogger(__name__)
+
+REBUILD_BATCH_SIZE = 1000
+
+
+def bucket_days(start_at: datetime, end_at: datetime) -> List[date]:
+    """이벤트가 걸친 날짜 (end_at이 자정이면 그날은 제외, 길이 0이면 시작일)"""
+    first = start_at.date()
+    last = (end_at - timedelta(microseconds=1)).date() if end_at > start_at else first
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def bucket_rows(event_id: str, calendar_id: str, start_at: datetime, end_at: datetime) -> List[dict]:
+    return [
+        {"event_id": event_id, "day": day, "calendar_id": calendar_id}
+        for day in bucket_days(start_at, end_at)
+    ]
+
+
+def delete_buckets(db: Session, event_id: str) -> None:
+    db.execute(delete(EventDayBucket).where(EventDayBucket.event_id == event_id))
+
+
+def sync_buckets(db: Session, event: Event) -> None:
+    """이벤트 버킷 다시 쓰기 (커밋은 호출 측 트랜잭션에서)"""
+    delete_buckets(db, event.id)
+    if event.is_recurring:
+        return
+    db.execute(insert(EventDayBucket), bucket_rows(event.id, event.calendar_id, event.start_at, event.end_at))
+
+
+def find_conflicts(
+    db: Session,
+    calendar_ids: Sequence[str],
+    start_at: datetime,
+    end_at: datetime,
+    exclude_event_id: Optional[str] = None,
+    redis_client=None,
+) -> list:
+    """
+    구간과 겹치는 이벤트 (단일 이벤트 ORM 객체 + 반복 회차 dict, 시작 시각 순)
+
+    길이 0인 구간은 같은 시각을 포함하는 이벤트와 겹치는 것으로 봅니다.
+    """
+    if not calendar_ids:
+        return []
+    days = bucket_days(start_at, end_at)
+    overlap_end = end_at if end_at > start_at else start_at + timedelta(microseconds=1)
+
+    candidates = (
+        select(EventDayBucket.event_id)
+        .where(
+            EventDayBucket.calendar_id.in_(calendar_ids),
+            EventDayBucket.day.between(days[0], days[-1]),
+        )
+        .distinct()
+    )
+    query = db.query(Event).filter(
+        Event.id.in_(candidates),
+        Event.start_at < overlap_end,
+        Event.end_at > start_at,
+    )
+    if exclude_event_id:
+        query = query.filter(Event.id != exclude_event_id)
+    conflicts: list = query.all()
+    conflicts.extend(
+        overlapping_occurrences(db, redis_client, calendar_ids, start_at, overlap_end, exclude_event_id)
+    )
+
+    def start_key(item):
+        return (item["start_at"], item["id"]) if isinstance(item, dict) else (item.start_at, item.id)
+
+    return sorted(conflicts, key=start_key)
+
+
+def rebuild(db: Session, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """모든 단일 이벤트의 버킷 다시 생성 (id 순 배치 커밋), 처리한 이벤트 수 반환"""
+    db.execute(delete(EventDayBucket))
+    db.commit()
+    total = 0
+    last_id = None
+    while True:
+        stmt = (
+            select(Event.id, Event.calendar_id, Event.start_at, Event.end_at)
+            .where(Event.is_recurring.is_(False))
+            .order_by(Event.id)
+            .limit(batch_size)
+        )
+        if last_id is not None:
+            stmt = stmt.where(Event.id > last_id)
+        rows = db.execute(stmt).all()
+        if not rows:
+            return total
+        buckets = [bucket for row in rows for bucket in bucket_rows(*row)]
+        db.execute(insert(EventDayBucket), buckets)
+        db.commit()
+        total += len(rows)
+        last_id = rows[-1][0]
+        logger.info(f"Bucketed {total} events")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이벤트 날짜 버킷 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rebuild_parser = subparsers.add_parser("rebuild", help="이벤트에서 버킷 다시 생성")
+    rebuild_parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        total = rebuild(db, args.batch_size)
+        print(f"bucketed: {total}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
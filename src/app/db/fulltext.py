@@ -0,0 +1,172 @@
+"""
+키워드 전문 검색 (keyword= 필터)
+
+LIKE '%kw%'는 인덱스를 쓰지 못해 사용자의 모든 행(관리자는 전체 행)을 스캔하므로
+DB별 전문 검색 인덱스를 사용합니다. 데이터 대부분이 한국어라 형태소 대신 n-gram 토큰을 씁니다.
+
+- MySQL: FULLTEXT ... WITH PARSER ngram (ngram_token_size=2) + MATCH ... AGAINST (BOOLEAN MODE 구문)
+  ngram 파서는 불용어가 들어간 토큰을 모두 버리고 기본 불용어 목록에 "a", "i" 같은 한 글자가 있어
+  라틴 문자 키워드("data" 등)의 토큰이 사라지므로, 인덱스는 innodb_ft_enable_stopword=OFF로 만듭니다
+  (마이그레이션 fulltext_ngram, docker-compose의 mysql 옵션).
+  events는 파티션 테이블이라 FULLTEXT를 만들 수 없으므로 events_fts 보조 테이블을
+  트리거로 유지합니다 (마이그레이션 fulltext_ngram).
+- SQLite: FTS5 trigram 외부 콘텐츠 테이블 ({table}_fts) + 트리거 (create_all 시 생성)
+  테스트도 같은 검색 경로를 사용합니다.
+
+토큰보다 짧은 키워드(MySQL 1자, SQLite 2자 이하)와 그 외 DB는 LIKE로 처리합니다.
+n-gram 구문 일치는 부분 문자열 일치와 같지 않으므로 (토큰 경계, 구두점) 인덱스로 찾은 행만 LIKE로 다시 확인합니다.
+sort=relevance는 MATCH 점수(SQLite는 bm25) 순으로 정렬합니다.
+"""
+from typing import Iterable, Optional
+
+from sqlalchemy import (
+    Column, DDL, MetaData, String, Table, Text, and_, bindparam, event, func, literal_column, or_, select, table,
+)
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.inspection import inspect
+
+from app.db.types import id_type
+
+# 키워드 최소 길이 (이보다 짧으면 n-gram 토큰이 없어 LIKE 사용)
+MIN_KEYWORD_LENGTH = {
+    "mysql": 2,  # ngram_token_size
+    "sqlite": 3,  # trigram
+}
+
+# MySQL에서 FULLTEXT 대신 보조 테이블로 검색하는 테이블 (파티션 테이블)
+_search_metadata = MetaData()
+events_fts = Table(
+    "events_fts",
+    _search_metadata,
+    Column("id", id_type(), primary_key=True),
+    Column("title", String(255), nullable=False),
+    Column("description", Text),
+    Column("location", String(500)),
+    mysql_engine="InnoDB",
+)
+MYSQL_SIDE_TABLES = {"events": events_fts}
+
+
+def fts_name(table_name: str) -> str:
+    return f"{table_name}_fts"
+
+
+def register_sqlite_fts(target: Table, columns: Iterable[str]) -> None:
+    """
+    SQLite FTS5 외부 콘텐츠 테이블과 동기화 트리거를 create_all/drop_all에 연결
+
+    rowid로 원본 행과 연결합니다 (정수 PK가 없는 테이블은 VACUUM 시 rowid가 바뀔 수 있어
+    SQLite는 개발/테스트 용도로만 사용).
+    """
+    name = target.name
+    fts = fts_name(name)
+    cols = list(columns)
+    col_list = ", ".join(cols)
+    new_values = ", ".join(f"new.{col}" for col in cols)
+    old_values = ", ".join(f"old.{col}" for col in cols)
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({col_list}, "
+        f"content='{name}', content_rowid='rowid', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {name} BEGIN "
+        f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.rowid, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.rowid, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {name} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.rowid, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.rowid, {new_values}); END",
+    ]
+    for statement in statements:
+        event.listen(target, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(target, "before_drop", DDL(f"DROP TABLE IF EXISTS {fts}").execute_if(dialect="sqlite"))
+
+
+def mysql_side_table_ddl(side: Table, source: str) -> list:
+    """MySQL 보조 검색 테이블 FULLTEXT 인덱스 / 동기화 트리거 / 초기 적재 DDL"""
+    name = side.name
+    cols = [column.name for column in side.columns]
+    text_cols = [col for col in cols if col != "id"]
+    col_list = ", ".join(cols)
+    new_values = ", ".join(f"NEW.{col}" for col in cols)
+    updates = ", ".join(f"{col} = NEW.{col}" for col in text_cols)
+    return [
+        f"CREATE FULLTEXT INDEX ft_{name} ON {name} ({', '.join(text_cols)}) WITH PARSER ngram",
+        f"CREATE TRIGGER {name}_ai AFTER INSERT ON {source} FOR EACH ROW "
+        f"INSERT INTO {name} ({col_list}) VALUES ({new_values})",
+        f"CREATE TRIGGER {name}_au AFTER UPDATE ON {source} FOR EACH ROW "
+        f"UPDATE {name} SET {updates} WHERE id = NEW.id",
+        f"CREATE TRIGGER {name}_ad AFTER DELETE ON {source} FOR EACH ROW "
+        f"DELETE FROM {name} WHERE id = OLD.id",
+        f"INSERT INTO {name} ({col_list}) SELECT {col_list} FROM {source}",
+    ]
+
+
+def _uses_fulltext(dialect_name: str, keyword: str) -> bool:
+    minimum = MIN_KEYWORD_LENGTH.get(dialect_name)
+    return minimum is not None and len(keyword) >= minimum
+
+
+def _phrase(keyword: str) -> str:
+    """키워드를 구문 검색어로 (n-gram이 연속으로 일치 = 부분 문자열 일치)"""
+    return '"' + keyword.replace('"', " ") + '"'
+
+
+def _sqlite_match(fts: str, keyword: str):
+    return literal_column(fts).op("MATCH")(bindparam(None, '"' + keyword.replace('"', '""') + '"', unique=True))
+
+
+def keyword_criterion(entity, keyword: str, dialect_name: str):
+    """
+    entity.SEARCH_FIELDS에 키워드가 포함된 행 조건
+
+    entity는 매핑된 모델 클래스(Event, Task, TaskArchive, Calendar, User)입니다.
+    """
+    columns = [getattr(entity, name) for name in entity.SEARCH_FIELDS]
+    substring = or_(*[column.contains(keyword) for column in columns])
+    if not _uses_fulltext(dialect_name, keyword):
+        return substring
+
+    name = entity.__table__.name
+    if dialect_name == "sqlite":
+        fts = fts_name(name)
+        rowids = select(literal_column("rowid")).select_from(table(fts)).where(_sqlite_match(fts, keyword))
+        return and_(literal_column(f"{name}.rowid").in_(rowids), substring)
+
+    side = MYSQL_SIDE_TABLES.get(name)
+    if side is not None:
+        text_columns = [side.c[field] for field in entity.SEARCH_FIELDS]
+        matched = select(side.c.id).where(match(*text_columns, against=_phrase(keyword)).in_boolean_mode())
+        return and_(entity.id.in_(matched), substring)
+    return and_(match(*columns, against=_phrase(keyword)).in_boolean_mode(), substring)
+
+
+def relevance(entity, keyword: Optional[str], dialect_name: str):
+    """
+    키워드 관련도 식 (클수록 관련도 높음)
+
+    전문 검색을 쓰지 않는 경우(짧은 키워드, 그 외 DB, UNION 별칭 엔티티)는 None.
+    """
+    if not keyword or not _uses_fulltext(dialect_name, keyword):
+        return None
+    if inspect(entity).is_aliased_class:
+        return None
+
+    name = entity.__table__.name
+    if dialect_name == "sqlite":
+        fts = fts_name(name)
+        return (
+            select(-func.bm25(literal_column(fts)))
+            .select_from(table(fts))
+            .where(_sqlite_match(fts, keyword), literal_column(f"{fts}.rowid") == literal_column(f"{name}.rowid"))
+            .scalar_subquery()
+        )
+
+    side = MYSQL_SIDE_TABLES.get(name)
+    if side is not None:
+        text_columns = [side.c[field] for field in entity.SEARCH_FIELDS]
+        return (
+            select(match(*text_columns, against=_phrase(keyword)).in_boolean_mode())
+            .where(side.c.id == entity.id)
+            .scalar_subquery()
+        )
+    columns = [getattr(entity, field) for field in entity.SEARCH_FIELDS]
+    return match(*columns, against=_phrase(keyword)).in_boolean_mode()
@@ -0,0 +1,174 @@
+"""
+사용자별 파생 저장소 세대 관리 (검색 역색인, 자동완성)
+
+DB에서 다시 만들 수 있는 사용자별 Redis 구조를 요청 안에서 지우고 다시 채우면
+첫 조회가 사용자 문서 수만큼 느려지고, 동시에 두 번 만들거나 증분 쓰기와 겹칠 때
+한쪽의 삭제가 다른 쪽이 방금 쓴 키를 지워 문서가 영구히 빠질 수 있습니다.
+
+- 키: {ns}:{user}:gen       -> 조회에 쓰는 세대 id (없으면 준비 안 됨)
+      {ns}:{user}:building  -> 만드는 중인 세대 id
+      {ns}:{user}:lock      -> 생성 잠금 (SET NX EX)
+      {ns}:{user}:{세대}:... -> 세대별 데이터
+- 생성: 잠금을 얻은 요청 하나만 새 세대를 백그라운드로 채운 뒤 gen을 바꾸고 이전 세대 키를 지웁니다.
+  조회 쪽은 gen이 없으면 생성을 예약하고 바로 DB 검색으로 대체합니다.
+- 증분 쓰기는 gen과 building 세대 모두에 씁니다. 쓰기는 DB 커밋 뒤에 building을 읽으므로
+  building이 보이지 않았다면 생성은 그 커밋 이후에 DB를 읽어 같은 내용을 담습니다.
+- 생성은 이미 문서 키가 있는 문서(생성 중 증분 쓰기가 먼저 반영한 문서)는 건너뜁니다.
+
+저장소는 Redis 클라이언트 또는 app.db.search_index.LocalIndexStore (같은 명령/파이프라인 인터페이스).
+"""
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 생성 잠금/building 표시 TTL (작업이 죽어도 이 시간 뒤 다시 생성)
+BUILD_LOCK_SECONDS = 300
+
+# 백그라운드 생성 스레드풀 (요청 간 공유)
+_builder = ThreadPoolExecutor(max_workers=2, thread_name_prefix="index-build")
+
+
+def _gen_key(ns: str, owner_id: str) -> str:
+    return f"{ns}:{owner_id}:gen"
+
+
+def _building_key(ns: str, owner_id: str) -> str:
+    return f"{ns}:{owner_id}:building"
+
+
+def _lock_key(ns: str, owner_id: str) -> str:
+    return f"{ns}:{owner_id}:lock"
+
+
+def data_prefix(ns: str, owner_id: str, generation: str) -> str:
+    """세대 데이터 키 접두사"""
+    return f"{ns}:{owner_id}:{generation}"
+
+
+def current_generation(store, ns: str, owner_id: str) -> Optional[str]:
+    """조회에 쓸 세대 (준비 안 됐으면 None)"""
+    return store.get(_gen_key(ns, owner_id))
+
+
+def write_generations(store, ns: str, owner_id: str) -> List[Tuple[str, bool]]:
+    """
+    증분 쓰기 대상 세대 [(세대 id, 만드는 중 여부)] (현재 세대 + 만드는 중인 세대)
+
+    만드는 중인 세대에는 삭제도 표시를 남겨야 생성이 이전 내용을 다시 넣지 않습니다.
+    """
+    pipe = store.pipeline(transaction=False)
+    pipe.get(_gen_key(ns, owner_id))
+    pipe.get(_building_key(ns, owner_id))
+    current, building = pipe.execute()
+    targets = [(current, False)] if current else []
+    if building and building != current:
+        targets.append((building, True))
+    return targets
+
+
+def _delete_keys(store, match: str, keep: Callable[[str], bool] = lambda key: False) -> None:
+    stale = [key for key in store.scan_iter(match=match) if not keep(key)]
+    if stale:
+        store.delete(*stale)
+
+
+def _release(store, ns: str, owner_id: str, token: str) -> None:
+    if store.get(_lock_key(ns, owner_id)) == token:
+        store.delete(_lock_key(ns, owner_id))
+
+
+def begin_build(store, ns: str, owner_id: str) -> Optional[tuple]:
+    """
+    생성 잠금을 얻고 새 세대를 building으로 표시
+
+    Returns:
+        (잠금 토큰, 새 세대 id), 다른 생성이 진행 중이면 None
+    """
+    token = uuid.uuid4().hex
+    if not store.set(_lock_key(ns, owner_id), token, nx=True, ex=BUILD_LOCK_SECONDS):
+        return None
+    generation = uuid.uuid4().hex[:12]
+    store.set(_building_key(ns, owner_id), generation, ex=BUILD_LOCK_SECONDS)
+    return token, generation
+
+
+def finish_build(
+    store,
+    ns: str,
+    owner_id: str,
+    lock: tuple,
+    fill: Callable[[str], int],
+) -> int:
+    """새 세대를 채운 뒤 gen 교체, 이전 세대 키 삭제 (실패 시 새 세대 키 삭제), 채운 문서 수 반환"""
+    token, generation = lock
+    prefix = data_prefix(ns, owner_id, generation)
+    meta_keys = {_gen_key(ns, owner_id), _building_key(ns, owner_id), _lock_key(ns, owner_id)}
+    try:
+        total = fill(generation)
+        pipe = store.pipeline(transaction=False)
+        pipe.set(_gen_key(ns, owner_id), generation)
+        pipe.delete(_building_key(ns, owner_id))
+        pipe.execute()
+        _delete_keys(
+            store, f"{ns}:{owner_id}:*",
+            keep=lambda key: key in meta_keys or key.startswith(prefix + ":"),
+        )
+        return total
+    except Exception:
+        store.delete(_building_key(ns, owner_id))
+        _delete_keys(store, f"{prefix}:*")
+        raise
+    finally:
+        _release(store, ns, owner_id, token)
+
+
+def build(store, ns: str, owner_id: str, fill: Callable[[str], int]) -> Optional[int]:
+    """현재 스레드에서 새 세대 생성 (CLI rebuild), 다른 생성이 진행 중이면 None"""
+    lock = begin_build(store, ns, owner_id)
+    if lock is None:
+        return None
+    return finish_build(store, ns, owner_id, lock, fill)
+
+
+def run_in_background(job: Callable[[], None]) -> None:
+    _builder.submit(job)
+
+
+def schedule_build(bind, store, ns: str, owner_id: str, fill: Callable[[Session, str], int]) -> bool:
+    """
+    잠금을 얻으면 별도 세션으로 새 세대를 백그라운드에서 생성
+
+    Returns:
+        생성을 예약했는지 여부 (이미 진행 중이면 False)
+    """
+    lock = begin_build(store, ns, owner_id)
+    if lock is None:
+        return False
+
+    def job():
+        session = Session(bind=bind)
+        try:
+            total = finish_build(store, ns, owner_id, lock, lambda generation: fill(session, generation))
+            logger.info(f"Built {ns} for user {owner_id} ({total} documents)")
+        except Exception as e:
+            logger.warning(f"Background {ns} build failed for user {owner_id}: {e}")
+        finally:
+            session.close()
+
+    run_in_background(job)
+    return True
+
+
+def invalidate(store, ns: str, owner_id: str) -> None:
+    """현재 세대를 조회에서 제외 (다음 조회가 다시 생성, 이전 키는 다음 생성이 정리)"""
+    store.delete(_gen_key(ns, owner_id))
+
+
+def purge(store, ns: str, owner_id: str) -> None:
+    """사용자 키 전체 삭제 (사용자 삭제)"""
+    _delete_keys(store, f"{ns}:{owner_id}:*")
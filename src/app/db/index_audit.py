@@ -0,0 +1,236 @@
+"""
+목록 엔드포인트 인덱스 점검 도구
+
+각 목록 엔드포인트의 대표 쿼리(app.db.queries 빌더로 생성)에서 테이블별
+WHERE(등호/범위)·JOIN·ORDER BY 컬럼을 추출하고, 모델에 선언된 인덱스 중
+어떤 인덱스가 사용될 수 있는지(leftmost prefix 기준) 매핑합니다.
+
+사용법:
+    python -m app.db.index_audit            # 모델 기준 정적 분석
+    python -m app.db.index_audit --explain  # 설정된 DB에 EXPLAIN 실행
+"""
+import argparse
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from sqlalchemy import Column, Table, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, UnaryExpression
+
+from app.db.queries import calendar_list_query, event_list_query, task_list_query, user_list_query
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.task import Task, TaskStatus
+from app.models.user import User, UserRole
+from app.schemas.calendar import CalendarListRequest
+from app.schemas.event import EventListRequest
+from app.schemas.task import TaskListRequest
+from app.schemas.user import UserListRequest
+
+_SAMPLE_ID = "00000000-0000-0000-0000-000000000000"
+_EQUALITY_OPS = {operators.eq, operators.is_}
+_RANGE_OPS = {operators.gt, operators.ge, operators.lt, operators.le}
+
+
+@dataclass
+class TableAccess:
+    """쿼리 내 한 테이블의 접근 형태"""
+    table: Table
+    equality: List[str] = field(default_factory=list)
+    joins: List[str] = field(default_factory=list)
+    ranges: List[str] = field(default_factory=list)
+    order: List[str] = field(default_factory=list)
+    unindexable: List[str] = field(default_factory=list)  # LIKE '%kw%' 등
+
+
+@dataclass
+class IndexChoice:
+    """테이블 접근에 사용 가능한 인덱스"""
+    table: str
+    index: Optional[str]
+    used_columns: List[str]
+    sorted_by_index: bool
+    access: TableAccess
+
+
+def _sample_user(role: UserRole = UserRole.USER):
+    return SimpleNamespace(id=_SAMPLE_ID, role=role)
+
+
+def list_query_shapes(db: Session) -> Dict[str, Query]:
+    """목록 엔드포인트별 대표 쿼리 (기본 정렬 포함)"""
+    now = datetime.utcnow()
+    user = _sample_user()
+    admin = _sample_user(UserRole.ADMIN)
+    return {
+        "GET /events": event_list_query(db, user, EventListRequest()).order_by(Event.start_at),
+        "GET /events?calendar_id&start_from&start_to": event_list_query(
+            db, user, EventListRequest(calendar_id=_SAMPLE_ID, start_from=now, start_to=now + timedelta(days=30)),
+        ).order_by(Event.start_at),
+        "GET /events?keyword": event_list_query(db, user, EventListRequest(keyword="회의")).order_by(Event.start_at),
+        "GET /tasks": task_list_query(db, user, TaskListRequest()).order_by(Task.due_at),
+        "GET /tasks?calendar_id&status": task_list_query(
+            db, user, TaskListRequest(calendar_id=_SAMPLE_ID, status=TaskStatus.PENDING),
+        ).order_by(Task.due_at),
+        "GET /calendars": calendar_list_query(db, user, CalendarListRequest()).order_by(Calendar.created_at.desc()),
+        "GET /users": user_list_query(db, UserListRequest()).order_by(User.created_at.desc()),
+        "GET /users?role&is_active": user_list_query(
+            db, UserListRequest(role=UserRole.USER, is_active=True),
+        ).order_by(User.created_at.desc()),
+        "GET /admin/users?role&is_active&is_banned": user_list_query(
+            db, UserListRequest(role=UserRole.USER, is_active=True, is_banned=False),
+        ).order_by(User.created_at.desc()),
+        "GET /calendars (admin)": calendar_list_query(db, admin, CalendarListRequest(user_id=_SAMPLE_ID)).order_by(
+            Calendar.created_at.desc()
+        ),
+    }
+
+
+def _column(expr) -> Optional[Column]:
+    if isinstance(expr, Column) and isinstance(expr.table, Table):
+        return expr
+    return None
+
+
+def extract_access(query: Query) -> Dict[str, TableAccess]:
+    """쿼리에서 테이블별 WHERE/JOIN/ORDER BY 컬럼 추출"""
+    stmt = query.statement
+    accesses: Dict[str, TableAccess] = {}
+
+    def access_for(column: Column) -> TableAccess:
+        return accesses.setdefault(column.table.name, TableAccess(table=column.table))
+
+    for from_clause in stmt.get_final_froms():
+        for table in visitors.iterate(from_clause):
+            if isinstance(table, Table):
+                accesses.setdefault(table.name, TableAccess(table=table))
+
+    clauses = [stmt.whereclause] if stmt.whereclause is not None else []
+    for from_clause in stmt.get_final_froms():
+        onclause = getattr(from_clause, "onclause", None)
+        if onclause is not None:
+            clauses.append(onclause)
+
+    for clause in clauses:
+        for node in visitors.iterate(clause):
+            if not isinstance(node, BinaryExpression):
+                continue
+            left, right = _column(node.left), _column(node.right)
+            if left is not None and right is not None and node.operator in _EQUALITY_OPS:
+                # JOIN 조건: 양쪽 모두 등호 탐색 컬럼
+                access_for(left).joins.append(left.name)
+                access_for(right).joins.append(right.name)
+            elif left is not None and right is None:
+                if node.operator in _EQUALITY_OPS:
+                    access_for(left).equality.append(left.name)
+                elif node.operator in _RANGE_OPS:
+                    access_for(left).ranges.append(left.name)
+                else:
+                    access_for(left).unindexable.append(left.name)
+
+    for clause in stmt._order_by_clauses:
+        element = clause.element if isinstance(clause, UnaryExpression) else clause
+        column = _column(element)
+        if column is not None:
+            access_for(column).order.append(column.name)
+
+    return accesses
+
+
+def _candidate_indexes(table: Table) -> Dict[str, List[str]]:
+    candidates = {"PRIMARY": [c.name for c in table.primary_key.columns]}
+    for index in table.indexes:
+        candidates[index.name] = [c.name for c in index.columns]
+    return candidates
+
+
+def choose_index(access: TableAccess) -> IndexChoice:
+    """leftmost prefix 규칙으로 가장 많은 컬럼을 활용하는 인덱스 선택"""
+    best = IndexChoice(access.table.name, None, [], False, access)
+    best_score = (0, 0, False)
+
+    constants = set(access.equality)
+    equality = constants | set(access.joins)
+    for name, columns in _candidate_indexes(access.table).items():
+        used: List[str] = []
+        for column in columns:
+            if column in equality:
+                used.append(column)
+            else:
+                break
+        next_column = columns[len(used)] if len(used) < len(columns) else None
+        sorted_by_index = bool(access.order) and next_column == access.order[0]
+        if next_column is not None and (next_column in access.ranges or sorted_by_index):
+            used.append(next_column)
+        if not used:
+            continue
+        # 동점이면 상수 조건(드라이빙 테이블 탐색)에 쓰이는 인덱스 우선
+        score = (len(used), len(constants.intersection(used)), sorted_by_index)
+        if score > best_score:
+            best_score = score
+            best = IndexChoice(access.table.name, name, used, sorted_by_index, access)
+    return best
+
+
+def audit(db: Session) -> Dict[str, List[IndexChoice]]:
+    """엔드포인트별 테이블 인덱스 매핑"""
+    return {
+        endpoint: [choose_index(access) for access in extract_access(query).values()]
+        for endpoint, query in list_query_shapes(db).items()
+    }
+
+
+def explain(engine: Engine, query: Query) -> List[tuple]:
+    """실제 DB 실행 계획 조회 (MySQL: EXPLAIN, SQLite: EXPLAIN QUERY PLAN)"""
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    compiled = query.statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return [tuple(row) for row in conn.execute(text(prefix + str(compiled)))]
+
+
+def _format_choice(choice: IndexChoice) -> str:
+    access = choice.access
+    predicates = ", ".join(
+        [f"{c}=" for c in dict.fromkeys(access.equality)]
+        + [f"{c}=JOIN" for c in dict.fromkeys(access.joins)]
+        + [f"{c}<>" for c in dict.fromkeys(access.ranges)]
+        + [f"ORDER {c}" for c in access.order]
+    )
+    if choice.index is None:
+        target = "FULL SCAN"
+    else:
+        target = f"{choice.index}({', '.join(choice.used_columns)})"
+        if access.order and not choice.sorted_by_index:
+            target += " + filesort"
+    notes = f"  [non-sargable: {', '.join(access.unindexable)}]" if access.unindexable else ""
+    return f"    {choice.table:<10} {predicates:<45} -> {target}{notes}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 엔드포인트 인덱스 점검")
+    parser.add_argument("--explain", action="store_true", help="설정된 DB에 EXPLAIN 실행")
+    args = parser.parse_args()
+
+    engine = None
+    if args.explain:
+        from app.db.session import engine
+    db = Session(bind=engine)
+    try:
+        queries = list_query_shapes(db)
+        for endpoint, choices in audit(db).items():
+            print(endpoint)
+            for choice in choices:
+                print(_format_choice(choice))
+            if engine is not None:
+                for row in explain(engine, queries[endpoint]):
+                    print(f"      EXPLAIN {row}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+events 테이블 월별 RANGE 파티션 관리 (MySQL)
+
+파티션 이름은 pYYYYMM, 경계는 다음 달 1일 00:00 (RANGE COLUMNS(start_at))이며
+마지막에 항상 pmax (MAXVALUE) 파티션을 둡니다.
+
+DROP/EXCHANGE PARTITION은 트리거와 FK CASCADE가 동작하지 않으므로 같은 작업에서
+해당 기간 이벤트의 하위 행(CHILD_TABLES)을 먼저 삭제합니다.
+
+사용법:
+    python -m app.db.partitions ensure --months-ahead 3
+    python -m app.db.partitions drop --before 2024-01
+    python -m app.db.partitions exchange --partition p202401 --table events_2024_01
+"""
+import argparse
+import re
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+TABLE = "events"
+MAX_PARTITION = "pmax"
+_NAME_RE = re.compile(r"^p(\d{4})(\d{2})$")
+# events를 참조하는 하위 테이블 (테이블, 이벤트 ID 컬럼)
+CHILD_TABLES = (("event_day_buckets", "event_id"), ("event_exceptions", "event_id"), ("events_fts", "id"))
+
+
+def month_start(value: date) -> date:
+    """해당 월의 1일"""
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """월 단위 덧셈 (항상 1일 반환)"""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """월 -> 파티션 이름 (p202601)"""
+    return f"p{month.year:04d}{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """파티션 이름 -> 월 (pmax 등은 None)"""
+    match = _NAME_RE.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def partition_definition(month: date) -> str:
+    """월 파티션 정의 (다음 달 1일 미만)"""
+    return f"PARTITION {partition_name(month)} VALUES LESS THAN ('{add_months(month, 1).isoformat()} 00:00:00')"
+
+
+def months_between(first: date, last: date) -> List[date]:
+    """first ~ last (포함) 월 목록"""
+    months = []
+    current = month_start(first)
+    while current <= month_start(last):
+        months.append(current)
+        current = add_months(current, 1)
+    return months
+
+
+def create_partitioning_sql(first: date, last: date) -> str:
+    """기존 테이블에 파티셔닝을 적용하는 DDL"""
+    definitions = [partition_definition(m) for m in months_between(first, last)]
+    definitions.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return f"ALTER TABLE {TABLE} PARTITION BY RANGE COLUMNS(start_at) (\n    " + ",\n    ".join(definitions) + "\n)"
+
+
+def plan_future_partitions(existing: List[str], today: date, months_ahead: int) -> List[date]:
+    """today 기준 months_ahead 개월 뒤까지 아직 없는 월 목록"""
+    months = [m for m in (partition_month(name) for name in existing) if m]
+    last = max(months) if months else add_months(month_start(today), -1)
+    target = add_months(month_start(today), months_ahead)
+    return months_between(add_months(last, 1), target) if last < target else []
+
+
+def add_partitions_sql(months: List[date]) -> Optional[str]:
+    """pmax를 분할하여 월 파티션 추가"""
+    if not months:
+        return None
+    definitions = [partition_definition(m) for m in months]
+    definitions.append(f"PARTITION {MAX_PARTITION} VALUES LESS THAN (MAXVALUE)")
+    return (
+        f"ALTER TABLE {TABLE} REORGANIZE PARTITION {MAX_PARTITION} INTO (\n    "
+        + ",\n    ".join(definitions)
+        + "\n)"
+    )
+
+
+def plan_expired_partitions(existing: List[str], before: date) -> List[str]:
+    """before 월 이전(미포함) 파티션 목록"""
+    cutoff = month_start(before)
+    expired = []
+    for name in existing:
+        month = partition_month(name)
+        if month is not None and month < cutoff:
+            expired.append(name)
+    return expired
+
+
+def partition_range(existing: List[str], partition: str) -> Tuple[Optional[date], date]:
+    """파티션의 start_at 범위 [시작, 끝) (첫 파티션은 하한 없음)"""
+    months = [m for m in (partition_month(name) for name in existing[: existing.index(partition)]) if m]
+    start = add_months(max(months), 1) if months else None
+    return start, add_months(partition_month(partition), 1)
+
+
+def purge_children_sql(start: Optional[date], end: date) -> List[str]:
+    """start_at이 [start, end)인 이벤트의 하위 행 삭제 SQL"""
+    condition = f"start_at < '{end.isoformat()} 00:00:00'"
+    if start is not None:
+        condition = f"start_at >= '{start.isoformat()} 00:00:00' AND {condition}"
+    return [
+        f"DELETE FROM {table} WHERE {column} IN (SELECT id FROM {TABLE} WHERE {condition})"
+        for table, column in CHILD_TABLES
+    ]
+
+
+def list_partitions(conn: Connection) -> List[str]:
+    """현재 events 파티션 이름 (경계 순)"""
+    rows = conn.execute(
+        text(
+            "SELECT partition_name FROM information_schema.PARTITIONS "
+            "WHERE table_schema = DATABASE() AND table_name = :table AND partition_name IS NOT NULL "
+            "ORDER BY partition_ordinal_position"
+        ),
+        {"table": TABLE},
+    )
+    return [row[0] for row in rows]
+
+
+def ensure_future_partitions(engine: Engine, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+    """미래 월 파티션 사전 생성, 생성한 파티션 이름 반환"""
+    with engine.begin() as conn:
+        existing = list_partitions(conn)
+        if not existing:
+            # 파티셔닝이 적용되지 않은 테이블
+            return []
+        months = plan_future_partitions(existing, today or datetime.utcnow().date(), months_ahead)
+        sql = add_partitions_sql(months)
+        if sql:
+            conn.execute(text(sql))
+    return [partition_name(m) for m in months]
+
+
+def drop_partitions_before(engine: Engine, before: date) -> List[str]:
+    """
+    before 월 이전 파티션 삭제 (해당 이벤트 데이터도 즉시 삭제됨)
+
+    하위 행은 DROP 전에 삭제합니다 (DDL은 암묵적으로 커밋되므로 DROP이 실패하면
+    하위 행만 지워진 상태가 되며, 같은 명령을 다시 실행하면 됩니다).
+    """
+    with engine.begin() as conn:
+        existing = list_partitions(conn)
+        expired = plan_expired_partitions(existing, before)
+        if expired:
+            # 만료 파티션은 앞에서부터 연속이므로 마지막 만료 파티션의 상한 미만 전체
+            for sql in purge_children_sql(None, partition_range(existing, expired[-1])[1]):
+                conn.execute(text(sql))
+            conn.execute(text(f"ALTER TABLE {TABLE} DROP PARTITION {', '.join(expired)}"))
+    return expired
+
+
+def exchange_partition(engine: Engine, partition: str, archive_table: str) -> None:
+    """
+    파티션 데이터를 일반 테이블로 교환 (메타데이터 작업, 데이터 복사 없음)
+
+    archive_table이 없으면 events와 같은 구조의 비파티션 테이블을 만든 뒤 교환합니다.
+    교환 후 파티션은 비어 있으므로 drop_partitions_before로 정리합니다.
+    아카이브에는 events 행만 옮겨지며 하위 행(CHILD_TABLES)은 교환 전에 삭제합니다.
+    """
+    if not _NAME_RE.match(partition) or not re.match(r"^\w+$", archive_table):
+        raise ValueError("Invalid partition or table name")
+    with engine.begin() as conn:
+        existing = list_partitions(conn)
+        if partition not in existing:
+            raise ValueError(f"Unknown partition: {partition}")
+        exists = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.TABLES "
+                "WHERE table_schema = DATABASE() AND table_name = :table"
+            ),
+            {"table": archive_table},
+        ).scalar()
+        if not exists:
+            conn.execute(text(f"CREATE TABLE {archive_table} LIKE {TABLE}"))
+            conn.execute(text(f"ALTER TABLE {archive_table} REMOVE PARTITIONING"))
+        for sql in purge_children_sql(*partition_range(existing, partition)):
+            conn.execute(text(sql))
+        conn.execute(text(f"ALTER TABLE {TABLE} EXCHANGE PARTITION {partition} WITH TABLE {archive_table}"))
+
+
+def _parse_month(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m").date()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="events 파티션 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ensure = sub.add_parser("ensure", help="미래 파티션 사전 생성")
+    ensure.add_argument("--months-ahead", type=int, default=3)
+
+    drop = sub.add_parser("drop", help="오래된 파티션 삭제")
+    drop.add_argument("--before", type=_parse_month, required=True, help="YYYY-MM (미포함)")
+
+    exchange = sub.add_parser("exchange", help="파티션을 아카이브 테이블로 교환")
+    exchange.add_argument("--partition", required=True)
+    exchange.add_argument("--table", required=True)
+
+    args = parser.parse_args()
+
+    from app.db.session import engine
+
+    if args.command == "ensure":
+        created = ensure_future_partitions(engine, args.months_ahead)
+        print(f"created: {', '.join(created) or '-'}")
+    elif args.command == "drop":
+        dropped = drop_partitions_before(engine, args.before)
+        print(f"dropped: {', '.join(dropped) or '-'}")
+    elif args.command == "exchange":
+        exchange_partition(engine, args.partition, args.table)
+        print(f"exchanged: {args.partition} -> {args.table}")
+
+
+if __name__ == "__main__":
+    main()
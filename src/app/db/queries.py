@@ -0,0 +1,220 @@
+"""
+목록 조회 쿼리 빌더
+
+라우터와 인덱스 점검 도구(app.db.index_audit)가 같은 WHERE/ORDER BY 형태를
+사용하도록 목록 엔드포인트의 필터 조합을 한 곳에서 생성합니다.
+"""
+from typing import Iterable, List, Optional
+
+from sqlalchemy import and_, or_, select, union_all
+from sqlalchemy.orm import Query, Session, aliased
+
+from app.core.counts import counter_key
+from app.db.fulltext import keyword_criterion, relevance
+from app.db.search_index import candidate_ids
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.task import Task, TaskArchive, TaskStatus
+from app.models.user import User
+from app.schemas.calendar import CalendarListRequest
+from app.schemas.event import EventListRequest
+from app.schemas.task import TaskListRequest
+from app.schemas.user import UserListRequest
+from app.schemas.common import PageRequest
+
+# 필터가 아닌 페이징 파라미터
+PAGING_FIELDS = {"page", "size", "sort", "cursor", "count"}
+
+
+def list_cache_key(
+    resource: str,
+    owner_id: Optional[str],
+    page_request: PageRequest,
+    scope_fields: Iterable[str] = (),
+) -> Optional[str]:
+    """
+    count=cached용 카운터 키
+
+    소유자 단위 카운터는 필터 없는 목록의 개수이므로, 필터가 있으면 None(=exact)을 반환합니다.
+    scope_fields는 소유자 범위를 나타내는 필드(예: calendars의 user_id)로 필터에서 제외합니다.
+    """
+    excluded = PAGING_FIELDS | set(scope_fields)
+    for name, value in page_request:
+        if name not in excluded and value not in (None, False):
+            return None
+    return counter_key(resource, owner_id)
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def _keyword_filter(db: Session, entity, resource: str, current_user: User, keyword: str, redis_client=None):
+    """
+    keyword 조건
+
+    역색인(SEARCH_BACKEND=index)으로 사용자 범위 후보 id를 구할 수 있으면 해당 id만 LIKE로 확인하고,
+    그렇지 않으면 DB 전문 검색을 사용합니다. redis_client는 색인 쓰기와 같은 (주입된) 클라이언트입니다.
+    """
+    if current_user.role.value != "ADMIN":
+        ids = candidate_ids(db, redis_client, resource, current_user.id, keyword)
+        if ids is not None:
+            return and_(
+                entity.id.in_(ids),
+                or_(*[getattr(entity, name).contains(keyword) for name in entity.SEARCH_FIELDS]),
+            )
+    return keyword_criterion(entity, keyword, _dialect(db))
+
+
+def event_list_query(db: Session, current_user: User, page_request: EventListRequest, redis_client=None) -> Query:
+    """GET /events 필터 쿼리"""
+    query = db.query(Event).join(Calendar)
+
+    # 권한 확인: 자신의 캘린더 이벤트만 조회 가능
+    if current_user.role.value != "ADMIN":
+        query = query.filter(Calendar.user_id == current_user.id)
+
+    # 필터 적용
+    if page_request.calendar_id:
+        query = query.filter(Event.calendar_id == page_request.calendar_id)
+    if page_request.keyword:
+        query = query.filter(_keyword_filter(db, Event, "events", current_user, page_request.keyword, redis_client))
+    if page_request.start_from:
+        query = query.filter(Event.start_at >= page_request.start_from)
+    if page_request.start_to:
+        query = query.filter(Event.start_at <= page_request.start_to)
+    if page_request.end_from:
+        query = query.filter(Event.end_at >= page_request.end_from)
+    if page_request.end_to:
+        query = query.filter(Event.end_at <= page_request.end_to)
+        # start_at <= end_at 이므로 end_to는 start_at 상한이기도 함 (파티션 프루닝용)
+        if not page_request.start_to or page_request.end_to < page_request.start_to:
+            query = query.filter(Event.start_at <= page_request.end_to)
+    if page_request.is_all_day is not None:
+        query = query.filter(Event.is_all_day == page_request.is_all_day)
+    return query
+
+
+def _task_criteria(db: Session, entity, current_user: User, page_request: TaskListRequest, redis_client=None) -> list:
+    """tasks / tasks_archive 공통 필터 조건"""
+    criteria = []
+
+    # 권한 확인
+    if current_user.role.value != "ADMIN":
+        criteria.append(Calendar.user_id == current_user.id)
+
+    # 필터 적용
+    if page_request.calendar_id:
+        criteria.append(entity.calendar_id == page_request.calendar_id)
+    if page_request.status:
+        criteria.append(entity.status == page_request.status)
+    if page_request.priority:
+        criteria.append(entity.priority == page_request.priority)
+    if page_request.keyword:
+        criteria.append(_keyword_filter(db, entity, "tasks", current_user, page_request.keyword, redis_client))
+    if page_request.due_from:
+        criteria.append(entity.due_at >= page_request.due_from)
+    if page_request.due_to:
+        criteria.append(entity.due_at <= page_request.due_to)
+    return criteria
+
+
+def task_list_query(db: Session, current_user: User, page_request: TaskListRequest, redis_client=None) -> Query:
+    """
+    GET /tasks 필터 쿼리
+
+    status=COMPLETED 또는 include_archived=true이면 tasks_archive를 UNION ALL로 합친
+    결과를 Task 엔티티로 매핑합니다.
+    """
+    include_archived = page_request.include_archived or page_request.status == TaskStatus.COMPLETED
+    if not include_archived:
+        return db.query(Task).join(Calendar).filter(*_task_criteria(db, Task, current_user, page_request, redis_client))
+
+    columns = [column.name for column in Task.__table__.columns]
+    live = (
+        select(*[Task.__table__.c[name] for name in columns])
+        .join(Calendar, Task.calendar_id == Calendar.id)
+        .where(*_task_criteria(db, Task, current_user, page_request, redis_client))
+    )
+    archived = (
+        select(*[TaskArchive.__table__.c[name] for name in columns])
+        .join(Calendar, TaskArchive.calendar_id == Calendar.id)
+        .where(*_task_criteria(db, TaskArchive, current_user, page_request, redis_client))
+    )
+    combined = union_all(live, archived).subquery("tasks_all")
+    return db.query(aliased(Task, combined))
+
+
+def calendar_list_query(db: Session, current_user: User, page_request: CalendarListRequest, redis_client=None) -> Query:
+    """GET /calendars 필터 쿼리"""
+    query = db.query(Calendar)
+
+    # 권한 확인: 자신의 캘린더만 조회 가능 (관리자는 모든 캘린더 조회 가능)
+    if current_user.role.value != "ADMIN":
+        query = query.filter(Calendar.user_id == current_user.id)
+    elif page_request.user_id:
+        query = query.filter(Calendar.user_id == page_request.user_id)
+
+    # 필터 적용
+    if page_request.keyword:
+        query = query.filter(_keyword_filter(db, Calendar, "calendars", current_user, page_request.keyword, redis_client))
+    if page_request.created_from:
+        query = query.filter(Calendar.created_at >= page_request.created_from)
+    if page_request.created_to:
+        query = query.filter(Calendar.created_at <= page_request.created_to)
+    return query
+
+
+# GET /search 대상 리소스 -> 모델
+SEARCH_MODELS = {
+    "calendars": Calendar,
+    "events": Event,
+    "tasks": Task,
+}
+
+
+def search_query(
+    db: Session,
+    resource: str,
+    current_user: User,
+    calendar_ids: List[str],
+    keyword: str,
+    limit: int,
+    redis_client=None,
+) -> Query:
+    """
+    GET /search 리소스별 쿼리
+
+    권한 범위는 호출 측에서 한 번 구한 사용자 캘린더 id로 제한합니다 (캘린더 조인 없음).
+    관련도(전문 검색 점수)가 있으면 관련도 순, 없으면 최근 수정 순으로 limit개.
+    """
+    entity = SEARCH_MODELS[resource]
+    scope = entity.id if entity is Calendar else entity.calendar_id
+    query = db.query(entity).filter(
+        scope.in_(calendar_ids),
+        _keyword_filter(db, entity, resource, current_user, keyword, redis_client),
+    )
+    score = relevance(entity, keyword, _dialect(db))
+    if score is not None:
+        query = query.order_by(score.desc())
+    return query.order_by(entity.updated_at.desc(), entity.id).limit(limit)
+
+
+def user_list_query(db: Session, page_request: UserListRequest) -> Query:
+    """GET /users 필터 쿼리 (관리자 전용)"""
+    query = db.query(User)
+
+    # 필터 적용
+    if page_request.role:
+        query = query.filter(User.role == page_request.role)
+    if page_request.is_active is not None:
+        query = query.filter(User.is_active == page_request.is_active)
+    if page_request.is_banned is not None:
+        query = query.filter(User.is_banned == page_request.is_banned)
+    if page_request.keyword:
+        query = query.filter(keyword_criterion(User, page_request.keyword, _dialect(db)))
+    if page_request.created_from:
+        query = query.filter(User.created_at >= page_request.created_from)
+    if page_request.created_to:
+        query = query.filter(User.created_at <= page_request.created_to)
+    return query
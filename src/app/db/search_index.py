@@ -0,0 +1,393 @@
+"""
+사용자별 역색인 검색 (SEARCH_BACKEND=index)
+
+MySQL FULLTEXT를 쓸 수 없는 배포에서 keyword 필터를 처리합니다.
+이벤트/작업/캘린더의 SEARCH_FIELDS를 단어 안의 bigram으로 토큰화해 (한 글자 단어는 색인하지 않음)
+사용자별 역색인을 Redis(또는 프로세스 내 저장소)에 유지합니다.
+
+- 키: sidx:{user}:{세대}:{resource}:t:{token} -> 문서 id 집합
+      sidx:{user}:{세대}:{resource}:d:{id}    -> 문서 토큰 집합 (수정/삭제 시 이전 토큰 제거용)
+      세대/잠금 키는 app.db.generations 참고
+- 쓰기: 생성/수정/삭제 핸들러에서 index_document / remove_document로 증분 갱신 (파이프라인)
+- 조회: 키워드 토큰 집합의 교집합으로 후보 id를 구한 뒤 id IN (...) + LIKE로 해당 행만 확인
+        (bigram 교집합은 부분 문자열 일치의 상위 집합이므로 남은 후보가 있어도 결과는 정확)
+- 색인이 없으면(첫 조회, 캘린더 삭제/가져오기 후 무효화) 잠금을 얻은 요청 하나가 백그라운드 생성을 예약하고,
+  생성이 끝날 때까지는 DB 검색(app.db.fulltext)을 사용합니다.
+- 관리자 전체 조회, 2자 이상 단어가 없는 키워드, 후보가 너무 많으면 None을 반환해 DB 검색(app.db.fulltext)을 사용합니다.
+  키워드의 한 글자 단어는 문서에서 더 긴 단어의 일부일 수 있어 ("팀 회의" -> "우리팀 회의") 교집합에서 뺍니다.
+
+사용법:
+    python -m app.db.search_index rebuild --batch-size 1000
+    python -m app.db.search_index rebuild --user <user_id>
+"""
+import argparse
+import bisect
+import fnmatch
+import logging
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import generations
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.task import Task, TaskArchive
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# 후보가 이보다 많으면 id IN (...) 대신 DB 검색
+MAX_CANDIDATES = 10_000
+
+REBUILD_BATCH_SIZE = 1000
+
+# 리소스 -> 색인 대상 모델 (작업은 보관 작업도 같은 리소스로 색인, id 유지)
+RESOURCES: Dict[str, tuple] = {
+    "events": (Event,),
+    "tasks": (Task, TaskArchive),
+    "calendars": (Calendar,),
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(*texts: Optional[str]) -> Set[str]:
+    """
+    소문자화 후 단어 안의 bigram (한 글자 단어는 토큰 없음)
+
+    키워드 단어의 bigram은 그 단어를 포함하는 문서 단어에도 모두 있으므로 교집합이 LIKE 일치의 상위 집합입니다.
+    """
+    tokens: Set[str] = set()
+    for value in texts:
+        for word in _WORD_RE.findall((value or "").lower()):
+            tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class LocalIndexStore:
+    """프로세스 내 색인 저장소 (단일 워커/개발용, Redis 집합/정렬 집합 명령과 같은 인터페이스)"""
+
+    def __init__(self):
+        self._sets: Dict[str, Set[str]] = {}
+        self._values: Dict[str, str] = {}
+        # 점수가 모두 같은 정렬 집합 (사전순 범위 조회용, 정렬된 리스트)
+        self._zsets: Dict[str, List[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> "LocalPipeline":
+        return LocalPipeline(self)
+
+    def sadd(self, key: str, *members: str) -> int:
+        self._sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    def srem(self, key: str, *members: str) -> int:
+        current = self._sets.get(key, set())
+        current.difference_update(members)
+        if not current:
+            self._sets.pop(key, None)
+        return len(members)
+
+    def smembers(self, key: str) -> Set[str]:
+        return set(self._sets.get(key, set()))
+
+    def sinter(self, keys: List[str]) -> Set[str]:
+        sets = [self._sets.get(key, set()) for key in keys]
+        return set.intersection(*sets) if sets else set()
+
+    def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        members = self._zsets.setdefault(key, [])
+        added = 0
+        for member in mapping:
+            index = bisect.bisect_left(members, member)
+            if index == len(members) or members[index] != member:
+                members.insert(index, member)
+                added += 1
+        return added
+
+    def zrem(self, key: str, *members: str) -> int:
+        current = self._zsets.get(key, [])
+        removed = 0
+        for member in members:
+            index = bisect.bisect_left(current, member)
+            if index < len(current) and current[index] == member:
+                del current[index]
+                removed += 1
+        if not current:
+            self._zsets.pop(key, None)
+        return removed
+
+    def zrangebylex(self, key: str, min: str, max: str, start: Optional[int] = None, num: Optional[int] = None) -> List[str]:
+        """min/max는 '[' (포함) 접두사만 지원"""
+        members = self._zsets.get(key, [])
+        low = bisect.bisect_left(members, min[1:])
+        high = bisect.bisect_right(members, max[1:])
+        selected = members[low:high]
+        if start is not None and num is not None:
+            selected = selected[start:start + num]
+        return list(selected)
+
+    def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if key in self._sets or key in self._values or key in self._zsets)
+
+    def get(self, key: str) -> Optional[str]:
+        return self._values.get(key)
+
+    def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        """ex(만료)는 무시 (프로세스 내 저장소)"""
+        if nx and key in self._values:
+            return None
+        self._values[key] = value
+        return True
+
+    def delete(self, *keys: str) -> int:
+        for key in keys:
+            self._sets.pop(key, None)
+            self._values.pop(key, None)
+            self._zsets.pop(key, None)
+        return len(keys)
+
+    def scan_iter(self, match: str) -> Iterator[str]:
+        for key in list(self._sets) + list(self._values) + list(self._zsets):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def clear(self) -> None:
+        self._sets.clear()
+        self._values.clear()
+        self._zsets.clear()
+
+
+class LocalPipeline:
+    """명령을 모아 execute() 때 순서대로 실행 (Redis 파이프라인과 같은 사용법)"""
+
+    def __init__(self, store: LocalIndexStore):
+        self._store = store
+        self._calls: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> list:
+        calls, self._calls = self._calls, []
+        return [getattr(self._store, name)(*args, **kwargs) for name, args, kwargs in calls]
+
+
+local_store = LocalIndexStore()
+
+# 세대 키 네임스페이스 (app.db.generations)
+NAMESPACE = "sidx"
+
+
+def enabled() -> bool:
+    return settings.SEARCH_BACKEND == "index"
+
+
+def get_store(redis_client=None):
+    """설정된 색인 저장소 (SEARCH_INDEX_STORE=redis|local)"""
+    if settings.SEARCH_INDEX_STORE == "local":
+        return local_store
+    if redis_client is None:
+        from app.db import redis as redis_module
+        redis_client = redis_module.get_redis()
+    return redis_client
+
+
+def _token_key(prefix: str, resource: str, token: str) -> str:
+    return f"{prefix}:{resource}:t:{token}"
+
+
+def _doc_key(prefix: str, resource: str, doc_id: str) -> str:
+    return f"{prefix}:{resource}:d:{doc_id}"
+
+
+# 생성 중 삭제된 문서 표시 (문서 키를 남겨 생성이 이전 내용으로 다시 넣지 않도록)
+_DELETED = ""
+
+
+def _write_document(store, prefix: str, resource: str, doc_id: str, tokens: Set[str], building: bool = False) -> None:
+    """이전 토큰과의 차이만 갱신 (읽기 1번 + 파이프라인 1번), building이면 삭제 표시를 남김"""
+    doc_key = _doc_key(prefix, resource, doc_id)
+    previous = set(store.smembers(doc_key)) - {_DELETED}
+    pipe = store.pipeline(transaction=False)
+    for token in previous - tokens:
+        pipe.srem(_token_key(prefix, resource, token), doc_id)
+    for token in tokens - previous:
+        pipe.sadd(_token_key(prefix, resource, token), doc_id)
+    if previous - tokens:
+        pipe.srem(doc_key, *(previous - tokens))
+    if tokens - previous:
+        pipe.sadd(doc_key, *(tokens - previous))
+    if building and not tokens:
+        pipe.sadd(doc_key, _DELETED)
+    pipe.execute()
+
+
+def _document_tokens(obj) -> Set[str]:
+    return tokenize(*(getattr(obj, name) for name in obj.SEARCH_FIELDS))
+
+
+def index_document(redis_client, resource: str, owner_id: str, obj) -> None:
+    """생성/수정된 문서 색인 (이전 토큰과의 차이만 갱신)"""
+    if not enabled():
+        return
+    try:
+        store = get_store(redis_client)
+        tokens = _document_tokens(obj)
+        for generation, building in generations.write_generations(store, NAMESPACE, owner_id):
+            prefix = generations.data_prefix(NAMESPACE, owner_id, generation)
+            _write_document(store, prefix, resource, obj.id, tokens, building)
+    except Exception as e:
+        logger.warning(f"Search index update failed: {e}")
+
+
+def remove_document(redis_client, resource: str, owner_id: str, doc_id: str) -> None:
+    """삭제된 문서 색인 제거"""
+    if not enabled():
+        return
+    try:
+        store = get_store(redis_client)
+        for generation, building in generations.write_generations(store, NAMESPACE, owner_id):
+            prefix = generations.data_prefix(NAMESPACE, owner_id, generation)
+            _write_document(store, prefix, resource, doc_id, set(), building)
+    except Exception as e:
+        logger.warning(f"Search index removal failed: {e}")
+
+
+def invalidate_user_index(redis_client, owner_id: str, purge: bool = False) -> None:
+    """
+    사용자 색인 무효화 (다음 조회 시 다시 생성)
+
+    캘린더 삭제처럼 하위 문서가 일괄 삭제되어 개별 제거가 어려운 경우 사용합니다.
+    purge=True이면 색인 키도 바로 삭제합니다 (사용자 삭제).
+    """
+    if not enabled():
+        return
+    try:
+        store = get_store(redis_client)
+        if purge:
+            generations.purge(store, NAMESPACE, owner_id)
+        else:
+            generations.invalidate(store, NAMESPACE, owner_id)
+    except Exception as e:
+        logger.warning(f"Search index invalidation failed: {e}")
+
+
+def _owner_rows(db: Session, model, owner_id: str, batch_size: int) -> Iterator[list]:
+    columns = [model.id] + [getattr(model, name) for name in model.SEARCH_FIELDS]
+    stmt = select(*columns).order_by(model.id)
+    if model is Calendar:
+        stmt = stmt.where(Calendar.user_id == owner_id)
+    else:
+        stmt = stmt.join(Calendar, model.calendar_id == Calendar.id).where(Calendar.user_id == owner_id)
+    result = db.execute(stmt, execution_options={"yield_per": batch_size})
+    yield from result.partitions()
+
+
+def fill_user_index(db: Session, store, owner_id: str, generation: str, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """
+    새 세대에 사용자 문서 색인 (배치마다 파이프라인 2번), 색인한 문서 수 반환
+
+    생성 중 증분 쓰기가 먼저 반영한 문서(문서 키 있음)는 건너뜁니다.
+    """
+    prefix = generations.data_prefix(NAMESPACE, owner_id, generation)
+    total = 0
+    for resource, models in RESOURCES.items():
+        for model in models:
+            for rows in _owner_rows(db, model, owner_id, batch_size):
+                check = store.pipeline(transaction=False)
+                for doc_id, *_ in rows:
+                    check.exists(_doc_key(prefix, resource, doc_id))
+                pipe = store.pipeline(transaction=False)
+                for (doc_id, *texts), written in zip(rows, check.execute()):
+                    tokens = tokenize(*texts)
+                    if written or not tokens:
+                        continue
+                    for token in tokens:
+                        pipe.sadd(_token_key(prefix, resource, token), doc_id)
+                    pipe.sadd(_doc_key(prefix, resource, doc_id), *tokens)
+                pipe.execute()
+                total += len(rows)
+    return total
+
+
+def build_user_index(db: Session, store, owner_id: str, batch_size: int = REBUILD_BATCH_SIZE) -> Optional[int]:
+    """현재 스레드에서 사용자 색인 새 세대 생성 (다른 생성이 진행 중이면 None)"""
+    return generations.build(
+        store, NAMESPACE, owner_id, lambda generation: fill_user_index(db, store, owner_id, generation, batch_size),
+    )
+
+
+def candidate_ids(db: Session, redis_client, resource: str, owner_id: str, keyword: str) -> Optional[List[str]]:
+    """
+    키워드 후보 문서 id (사용자 범위)
+
+    색인을 사용할 수 없거나 아직 만드는 중이면 None (호출 측은 DB 검색 사용).
+    """
+    if not enabled() or len(keyword.strip()) < 2:
+        return None
+    tokens = tokenize(keyword)
+    if not tokens:
+        # 한 글자 단어뿐인 키워드 ("a b")
+        return None
+    try:
+        store = get_store(redis_client)
+        generation = generations.current_generation(store, NAMESPACE, owner_id)
+        if generation is None:
+            generations.schedule_build(
+                db.get_bind(), store, NAMESPACE, owner_id,
+                lambda session, new_generation: fill_user_index(session, store, owner_id, new_generation),
+            )
+            return None
+        prefix = generations.data_prefix(NAMESPACE, owner_id, generation)
+        ids = store.sinter([_token_key(prefix, resource, token) for token in sorted(tokens)])
+    except Exception as e:
+        logger.warning(f"Search index lookup failed: {e}")
+        return None
+    if len(ids) > MAX_CANDIDATES:
+        return None
+    return sorted(ids)
+
+
+def rebuild(db: Session, store, batch_size: int = REBUILD_BATCH_SIZE, user_ids: Optional[Iterable[str]] = None) -> int:
+    """전체(또는 지정 사용자) 색인 재생성"""
+    if user_ids is None:
+        user_ids = [row[0] for row in db.execute(select(User.id).order_by(User.id))]
+    total = 0
+    for owner_id in user_ids:
+        indexed = build_user_index(db, store, owner_id, batch_size)
+        if indexed is None:
+            logger.info(f"Skipped user {owner_id} (build in progress)")
+            continue
+        total += indexed
+        logger.info(f"Reindexed user {owner_id} ({total} documents)")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 역색인 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    rebuild_parser = subparsers.add_parser("rebuild", help="DB에서 색인 재생성")
+    rebuild_parser.add_argument("--batch-size", type=int, default=REBUILD_BATCH_SIZE)
+    rebuild_parser.add_argument("--user", action="append", dest="users", default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        total = rebuild(db, get_store(), args.batch_size, args.users)
+        print(f"indexed: {total}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
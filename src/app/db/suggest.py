@@ -0,0 +1,233 @@
+"""
+제목 접두사 자동완성 (GET /search/suggest)
+
+키 입력마다 GET /events?keyword= 를 호출하면 LIKE 스캔 + COUNT가 반복되므로,
+사용자별 정렬 집합(점수 0)에 정규화한 제목을 넣고 ZRANGEBYLEX 한 번으로 접두사 후보를 찾습니다.
+
+- 키: sug:{user}:{세대}:z                -> 정렬 집합, 멤버 "{정규화 제목 또는 단어 시작 부분}\\0{type}\\0{id}\\0{원래 제목}"
+      sug:{user}:{세대}:d:{type}:{id}      -> 문서가 넣은 멤버 집합 (수정/삭제 시 이전 멤버 제거용)
+      세대/잠금 키는 app.db.generations 참고 (검색 색인과 같은 생성 방식)
+- 제목의 각 단어 시작 위치부터의 부분 문자열도 넣어 "회의록"으로 "주간 회의록"을 찾습니다.
+- 쓰기: 생성/수정/삭제 핸들러에서 add_suggestion / remove_suggestion으로 갱신 (파이프라인)
+- 조회 시 세대가 없으면(첫 조회, 캘린더 삭제/가져오기 후) 잠금을 얻은 요청 하나가 백그라운드 생성을 예약하고
+  생성이 끝날 때까지는 DB에서 제목 접두사만 찾습니다 (단어 시작 위치 일치 없음).
+
+저장소는 검색 색인과 같습니다 (SEARCH_INDEX_STORE=redis|local, app.db.search_index.get_store).
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db import generations
+from app.db.search_index import REBUILD_BATCH_SIZE, get_store
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.task import Task
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_TYPES: Dict[str, type] = {
+    "calendars": Calendar,
+    "events": Event,
+    "tasks": Task,
+}
+
+# 세대 키 네임스페이스 (app.db.generations)
+NAMESPACE = "sug"
+
+# 제목 하나에서 만드는 최대 멤버 수 (단어 시작 위치)
+MAX_WORD_STARTS = 8
+
+_SEP = "\0"
+# 사전순 범위 상한 (모든 문자보다 큰 코드 포인트, UTF-8 바이트 순서도 동일)
+_MAX_CHAR = "\U0010ffff"
+
+
+def normalize(text: Optional[str]) -> str:
+    """소문자화 + 공백 정리"""
+    return " ".join((text or "").lower().split())
+
+
+def _members(resource: str, doc_id: str, title: Optional[str]) -> List[str]:
+    normalized = normalize(title)
+    if not normalized:
+        return []
+    members = []
+    position = 0
+    for word in normalized.split(" ")[:MAX_WORD_STARTS]:
+        members.append(_SEP.join((normalized[position:], resource, doc_id, title)))
+        position += len(word) + 1
+    return members
+
+
+def _key(prefix: str) -> str:
+    return f"{prefix}:z"
+
+
+def _doc_key(prefix: str, resource: str, doc_id: str) -> str:
+    return f"{prefix}:d:{resource}:{doc_id}"
+
+
+# 생성 중 삭제된 문서 표시 (문서 키를 남겨 생성이 이전 제목을 다시 넣지 않도록)
+_DELETED = ""
+
+
+def _write(store, prefix: str, resource: str, doc_id: str, members: List[str], building: bool = False) -> None:
+    """이전 멤버와의 차이만 갱신 (읽기 1번 + 파이프라인 1번), building이면 삭제 표시를 남김"""
+    doc_key = _doc_key(prefix, resource, doc_id)
+    previous = set(store.smembers(doc_key)) - {_DELETED}
+    stale = previous - set(members)
+    added = set(members) - previous
+    pipe = store.pipeline(transaction=False)
+    if stale:
+        pipe.zrem(_key(prefix), *stale)
+        pipe.srem(doc_key, *stale)
+    if added:
+        pipe.zadd(_key(prefix), {member: 0 for member in added})
+        pipe.sadd(doc_key, *added)
+    if building and not members:
+        pipe.sadd(doc_key, _DELETED)
+    pipe.execute()
+
+
+def _write_all(redis_client, owner_id: str, resource: str, doc_id: str, members: List[str]) -> None:
+    store = get_store(redis_client)
+    for generation, building in generations.write_generations(store, NAMESPACE, owner_id):
+        _write(store, generations.data_prefix(NAMESPACE, owner_id, generation), resource, doc_id, members, building)
+
+
+def add_suggestion(redis_client, resource: str, owner_id: str, obj) -> None:
+    """생성/수정된 문서 제목 반영"""
+    try:
+        _write_all(redis_client, owner_id, resource, obj.id, _members(resource, obj.id, obj.title))
+    except Exception as e:
+        logger.warning(f"Suggestion update failed: {e}")
+
+
+def remove_suggestion(redis_client, resource: str, owner_id: str, doc_id: str) -> None:
+    """삭제된 문서 제목 제거"""
+    try:
+        _write_all(redis_client, owner_id, resource, doc_id, [])
+    except Exception as e:
+        logger.warning(f"Suggestion removal failed: {e}")
+
+
+def invalidate_suggestions(redis_client, owner_id: str, purge: bool = False) -> None:
+    """
+    사용자 자동완성 무효화 (다음 조회 시 다시 생성)
+
+    purge=True이면 키도 바로 삭제합니다 (사용자 삭제).
+    """
+    try:
+        store = get_store(redis_client)
+        if purge:
+            generations.purge(store, NAMESPACE, owner_id)
+        else:
+            generations.invalidate(store, NAMESPACE, owner_id)
+    except Exception as e:
+        logger.warning(f"Suggestion invalidation failed: {e}")
+
+
+def fill_suggestions(db: Session, store, owner_id: str, generation: str, batch_size: int = REBUILD_BATCH_SIZE) -> int:
+    """
+    새 세대에 DB 제목 넣기 (배치마다 파이프라인 2번), 넣은 문서 수 반환
+
+    생성 중 증분 쓰기가 먼저 반영한 문서(문서 키 있음)는 건너뜁니다.
+    """
+    prefix = generations.data_prefix(NAMESPACE, owner_id, generation)
+    total = 0
+    for resource, model in SUGGEST_TYPES.items():
+        stmt = select(model.id, model.title).order_by(model.id)
+        if model is Calendar:
+            stmt = stmt.where(Calendar.user_id == owner_id)
+        else:
+            stmt = stmt.join(Calendar, model.calendar_id == Calendar.id).where(Calendar.user_id == owner_id)
+        for rows in db.execute(stmt, execution_options={"yield_per": batch_size}).partitions():
+            check = store.pipeline(transaction=False)
+            for doc_id, _ in rows:
+                check.exists(_doc_key(prefix, resource, doc_id))
+            pipe = store.pipeline(transaction=False)
+            mapping = {}
+            for (doc_id, title), written in zip(rows, check.execute()):
+                members = _members(resource, doc_id, title)
+                if members and not written:
+                    pipe.sadd(_doc_key(prefix, resource, doc_id), *members)
+                    mapping.update((member, 0) for member in members)
+            if mapping:
+                pipe.zadd(_key(prefix), mapping)
+            pipe.execute()
+            total += len(rows)
+    return total
+
+
+def build_suggestions(db: Session, store, owner_id: str, batch_size: int = REBUILD_BATCH_SIZE) -> Optional[int]:
+    """현재 스레드에서 사용자 자동완성 새 세대 생성 (다른 생성이 진행 중이면 None)"""
+    return generations.build(
+        store, NAMESPACE, owner_id, lambda generation: fill_suggestions(db, store, owner_id, generation, batch_size),
+    )
+
+
+def _db_suggest(db: Session, owner_id: str, normalized: str, limit: int, wanted: set) -> List[Tuple[str, str, str]]:
+    """저장소가 준비되지 않았을 때 DB 제목 접두사 일치 (타입별 limit개, 사전순)"""
+    results = []
+    for resource, model in SUGGEST_TYPES.items():
+        if resource not in wanted:
+            continue
+        stmt = select(model.id, model.title).where(func.lower(model.title).startswith(normalized, autoescape=True))
+        if model is Calendar:
+            stmt = stmt.where(Calendar.user_id == owner_id)
+        else:
+            stmt = stmt.join(Calendar, model.calendar_id == Calendar.id).where(Calendar.user_id == owner_id)
+        results.extend((resource, doc_id, title) for doc_id, title in db.execute(stmt.order_by(model.title).limit(limit)))
+    results.sort(key=lambda item: (normalize(item[2]), item[0], item[1]))
+    return results[:limit]
+
+
+def suggest(
+    db: Session,
+    redis_client,
+    owner_id: str,
+    prefix: str,
+    limit: int,
+    types: Iterable[str] = tuple(SUGGEST_TYPES),
+) -> List[Tuple[str, str, str]]:
+    """
+    접두사가 일치하는 제목 (type, id, title), 사전순 상위 limit개
+
+    한 문서가 여러 단어 시작 위치로 일치하면 한 번만 반환합니다.
+    저장소를 사용할 수 없으면 빈 목록, 아직 만드는 중이면 DB 제목 접두사 일치.
+    """
+    normalized = normalize(prefix)
+    if not normalized:
+        return []
+    wanted = set(types)
+    try:
+        store = get_store(redis_client)
+        generation = generations.current_generation(store, NAMESPACE, owner_id)
+        if generation is None:
+            generations.schedule_build(
+                db.get_bind(), store, NAMESPACE, owner_id,
+                lambda session, new_generation: fill_suggestions(session, store, owner_id, new_generation),
+            )
+            return _db_suggest(db, owner_id, normalized, limit, wanted)
+        # 중복/다른 타입을 건너뛰어도 limit개를 채우도록 넉넉히 읽음
+        members = store.zrangebylex(
+            _key(generations.data_prefix(NAMESPACE, owner_id, generation)), f"[{normalized}", f"[{normalized}{_MAX_CHAR}", start=0, num=limit * MAX_WORD_STARTS,
+        )
+    except Exception as e:
+        logger.warning(f"Suggestion lookup failed: {e}")
+        return []
+
+    results: List[Tuple[str, str, str]] = []
+    seen = set()
+    for member in members:
+        _, resource, doc_id, title = member.split(_SEP, 3)
+        if resource not in wanted or (resource, doc_id) in seen:
+            continue
+        seen.add((resource, doc_id))
+        results.append((resource, doc_id, title))
+        if len(results) == limit:
+            break
+    return results
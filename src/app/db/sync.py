@@ -0,0 +1,252 @@
+"""
+증분 동기화 (GET /sync?token=)
+
+클라이언트가 매번 전체를 다시 받지 않도록, 마지막 동기화 이후 바뀐 캘린더/이벤트/작업과 삭제된 id만 반환합니다.
+
+- 변경 번호: 사용자마다 sync_state.seq를 쓰기 트랜잭션 안에서 증가시켜 변경된 행의 change_seq에 기록
+  (처음 만들 때는 created_seq도 같은 번호). sync_state 행 잠금이 커밋까지 유지되므로
+  같은 사용자의 쓰기는 번호 순서대로 커밋되어, 이미 받은 번호보다 작은 번호가 나중에 나타나지 않습니다.
+- 삭제: 하드 삭제 시 sync_tombstones에 (resource, id, change_seq)를 남깁니다.
+  캘린더 삭제는 캘린더 하나만 기록합니다 (하위 이벤트/작업도 삭제된 것으로 처리).
+- 조회: 리소스별로 (소유 범위, change_seq) 인덱스에서 토큰 번호 이후만 읽어 번호 순으로 병합하므로
+  비용은 전체 데이터가 아니라 변경 수에 비례합니다. 한 번에 limit개까지, 남으면 has_more.
+- 정리: 보존 기간이 지난 삭제 기록은 compact로 지우고 sync_state.floor를 올립니다.
+  floor보다 오래된 토큰은 놓친 삭제가 있을 수 있으므로 410으로 전체 동기화를 요구합니다.
+
+사용법:
+    python -m app.db.sync backfill   # 기능 도입 전 행에 번호 부여
+    python -m app.db.sync compact --days 30
+"""
+import argparse
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, delete, insert, select, union_all, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.core.ids import new_id
+from app.models.calendar import Calendar
+from app.models.event import Event
+from app.models.sync import SyncState, SyncTombstone
+from app.models.task import Task, TaskArchive
+
+logger = logging.getLogger(__name__)
+
+SYNC_RESOURCES = ("calendars", "events", "tasks")
+
+BATCH_SIZE = 1000
+
+
+def allocate(db: Session, owner_id: str, count: int = 1) -> int:
+    """
+    소유자 변경 번호 count개 예약, 첫 번호 반환
+
+    sync_state 행은 호출 측 트랜잭션이 커밋될 때까지 잠깁니다.
+    """
+    updated = db.execute(
+        update(SyncState).where(SyncState.user_id == owner_id).values(seq=SyncState.seq + count)
+    ).rowcount
+    if not updated:
+        try:
+            with db.begin_nested():
+                db.execute(insert(SyncState).values(user_id=owner_id, seq=count, floor=0))
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 만든 경우
+            db.execute(update(SyncState).where(SyncState.user_id == owner_id).values(seq=SyncState.seq + count))
+    last = db.execute(select(SyncState.seq).where(SyncState.user_id == owner_id)).scalar_one()
+    return last - count + 1
+
+
+def mark_changed(db: Session, owner_id: str, *objs) -> None:
+    """생성/수정한 캘린더/이벤트/작업에 변경 번호 기록 (커밋은 호출 측)"""
+    first = allocate(db, owner_id, len(objs))
+    for offset, obj in enumerate(objs):
+        obj.change_seq = first + offset
+        if obj.created_seq is None:
+            obj.created_seq = obj.change_seq
+
+
+def mark_rows(db: Session, owner_id: str, rows: List[dict]) -> None:
+    """다중 행 INSERT용 dict에 변경 번호 기록"""
+    if not rows:
+        return
+    first = allocate(db, owner_id, len(rows))
+    for offset, row in enumerate(rows):
+        row["change_seq"] = row["created_seq"] = first + offset
+
+
+def record_deletions(db: Session, owner_id: str, resource: str, ids: Sequence[str]) -> None:
+    """삭제 기록 추가 (커밋은 삭제와 같은 트랜잭션에서)"""
+    if not ids:
+        return
+    first = allocate(db, owner_id, len(ids))
+    now = datetime.utcnow()
+    db.execute(insert(SyncTombstone), [
+        {
+            "id": new_id(),
+            "owner_id": owner_id,
+            "resource": resource,
+            "resource_id": resource_id,
+            "change_seq": first + offset,
+            "deleted_at": now,
+        }
+        for offset, resource_id in enumerate(ids)
+    ])
+
+
+def state(db: Session, owner_id: str) -> Tuple[int, int]:
+    """(현재 번호, floor)"""
+    row = db.execute(select(SyncState.seq, SyncState.floor).where(SyncState.user_id == owner_id)).first()
+    return (row.seq, row.floor) if row else (0, 0)
+
+
+def _task_source(owner_calendars, since: int, limit: int):
+    """작업은 보관된 작업도 포함 (보관 시 번호를 유지하므로 변경으로 보지 않음)"""
+    columns = [column.name for column in Task.__table__.columns]
+    live = select(*[Task.__table__.c[name] for name in columns]).where(
+        Task.calendar_id.in_(owner_calendars), Task.change_seq > since,
+    )
+    archived = select(*[TaskArchive.__table__.c[name] for name in columns]).where(
+        TaskArchive.calendar_id.in_(owner_calendars), TaskArchive.change_seq > since,
+    )
+    combined = aliased(Task, union_all(live, archived).subquery("tasks_all"))
+    return select(combined).order_by(combined.change_seq).limit(limit)
+
+
+def changes_since(db: Session, owner_id: str, since: int, limit: int) -> Tuple[Dict[str, list], Dict[str, list], int, bool]:
+    """
+    since 이후 변경 (번호 순 최대 limit개)
+
+    Returns:
+        (리소스별 변경된 객체, 리소스별 삭제된 id, 마지막으로 포함한 번호, 남은 변경 여부)
+    """
+    owner_calendars = select(Calendar.id).where(Calendar.user_id == owner_id)
+    sources = {
+        "calendars": select(Calendar).where(Calendar.user_id == owner_id, Calendar.change_seq > since)
+        .order_by(Calendar.change_seq).limit(limit + 1),
+        "events": select(Event).where(Event.calendar_id.in_(owner_calendars), Event.change_seq > since)
+        .order_by(Event.change_seq).limit(limit + 1),
+        "tasks": _task_source(owner_calendars, since, limit + 1),
+    }
+    streams: List[Iterable[Tuple[int, str, object]]] = [
+        [(obj.change_seq, resource, obj) for obj in db.execute(stmt).scalars()]
+        for resource, stmt in sources.items()
+    ]
+    if since > 0:
+        # 처음 동기화(토큰 없음)에는 삭제 기록이 필요 없음
+        tombstones = db.execute(
+            select(SyncTombstone).where(SyncTombstone.owner_id == owner_id, SyncTombstone.change_seq > since)
+            .order_by(SyncTombstone.change_seq).limit(limit + 1)
+        ).scalars()
+        streams.append([(tombstone.change_seq, "deleted", tombstone) for tombstone in tombstones])
+
+    changed: Dict[str, list] = {resource: [] for resource in SYNC_RESOURCES}
+    deleted: Dict[str, list] = {resource: [] for resource in SYNC_RESOURCES}
+    last_seq = since
+    has_more = False
+    for count, (seq, kind, obj) in enumerate(heapq.merge(*streams, key=lambda item: item[0])):
+        if count == limit:
+            has_more = True
+            break
+        if kind == "deleted":
+            deleted[obj.resource].append(obj.resource_id)
+        else:
+            changed[kind].append(obj)
+        last_seq = seq
+    return changed, deleted, last_seq, has_more
+
+
+def purge_user_state(db: Session, user_id: str) -> None:
+    """사용자 삭제 시 동기화 상태/삭제 기록 삭제 (커밋은 호출 측)"""
+    db.execute(delete(SyncTombstone).where(SyncTombstone.owner_id == user_id))
+    db.execute(delete(SyncState).where(SyncState.user_id == user_id))
+
+
+def compact(db: Session, retention_days: Optional[int] = None, batch_size: int = BATCH_SIZE, now: Optional[datetime] = None) -> int:
+    """보존 기간이 지난 삭제 기록 정리 (배치마다 floor 갱신 후 커밋), 삭제한 기록 수 반환"""
+    days = settings.SYNC_TOMBSTONE_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = (now or datetime.utcnow()) - timedelta(days=days)
+    total = 0
+    while True:
+        rows = db.execute(
+            select(SyncTombstone.id, SyncTombstone.owner_id, SyncTombstone.change_seq)
+            .where(SyncTombstone.deleted_at < cutoff)
+            .order_by(SyncTombstone.deleted_at)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return total
+        floors: Dict[str, int] = {}
+        for _, owner_id, seq in rows:
+            floors[owner_id] = max(floors.get(owner_id, 0), seq)
+        for owner_id, seq in floors.items():
+            db.execute(
+                update(SyncState).where(SyncState.user_id == owner_id, SyncState.floor < seq).values(floor=seq)
+            )
+        db.execute(delete(SyncTombstone).where(SyncTombstone.id.in_([row.id for row in rows])))
+        db.commit()
+        total += len(rows)
+        logger.info(f"Compacted {total} tombstones")
+
+
+def backfill(db: Session, batch_size: int = BATCH_SIZE) -> int:
+    """번호가 없는 기존 캘린더/이벤트/작업에 소유자별 번호 부여 (배치 커밋), 처리한 행 수 반환"""
+    total = 0
+    for model in (Calendar, Event, Task, TaskArchive):
+        owner = Calendar.user_id
+        stmt = select(model.id, owner).where(model.change_seq.is_(None)).limit(batch_size)
+        if model is not Calendar:
+            stmt = stmt.join(Calendar, model.calendar_id == Calendar.id)
+        assign = (
+            update(model.__table__)
+            .where(model.__table__.c.id == bindparam("row_id"))
+            .values(change_seq=bindparam("seq"), created_seq=bindparam("seq"))
+        )
+        while True:
+            rows = db.execute(stmt).all()
+            if not rows:
+                break
+            by_owner: Dict[str, List[str]] = {}
+            for row_id, owner_id in rows:
+                by_owner.setdefault(owner_id, []).append(row_id)
+            params = []
+            for owner_id, ids in by_owner.items():
+                first = allocate(db, owner_id, len(ids))
+                params.extend({"row_id": row_id, "seq": first + offset} for offset, row_id in enumerate(ids))
+            db.execute(assign, params)
+            db.commit()
+            total += len(rows)
+            logger.info(f"Backfilled {total} rows")
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기화 변경 번호 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    backfill_parser = subparsers.add_parser("backfill", help="기존 행에 변경 번호 부여")
+    backfill_parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    compact_parser = subparsers.add_parser("compact", help="보존 기간이 지난 삭제 기록 정리")
+    compact_parser.add_argument("--days", type=int, default=None, help="보존 일수 (기본: SYNC_TOMBSTONE_RETENTION_DAYS)")
+    compact_parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.command == "backfill":
+            print(f"backfilled: {backfill(db, args.batch_size)}")
+        else:
+            print(f"compacted: {compact(db, args.days, args.batch_size)}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -137,6 +137,11 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
 async def http_exception_handler(request: Request, exc: HTTPException):
     status_code = exc.status_code
     detail = exc.detail or "An error occurred"
+    details = {}
+    # dict detail: message는 메시지로, 나머지 키는 details로 (예: 409 겹침 목록)
+    if isinstance(detail, dict):
+        details = {key: value for key, value in detail.items() if key != "message"}
+        detail = detail.get("message") or "An error occurred"
     
     # 기본 코드 매핑
     code_map = {
@@ -199,7 +204,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         status_code=status_code,
         code=code,
         message=detail,
-        details={},
+        details=details,
         request=request,
     )
 
@@ -3,10 +3,13 @@
 """
 from app.models.user import User
 from app.models.calendar import Calendar
-from app.models.event import Event
-from app.models.task import Task
+from app.models.event import Event, EventDayBucket, EventException
+from app.models.task import Task, TaskArchive
+from app.models.sync import SyncState, SyncTombstone
 
-__all__ = ["User", "Calendar", "Event", "Task"]
+__all__ = [
+    "User", "Calendar", "Event", "EventDayBucket", "EventException", "Task", "TaskArchive", "SyncState", "SyncTombstone",
+]
 
 
 
@@ -1,35 +1,58 @@
 """
 Calendar 모델
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy import BigInteger, Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from app.db.base import Base
+from app.db.fulltext import register_sqlite_fts
+from app.db.types import id_type
 
 
 class Calendar(Base):
     """캘린더 모델"""
     __tablename__ = "calendars"
 
-    id = Column(String(36), primary_key=True, index=True)
-    user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(255), nullable=False, index=True)
+    id = Column(id_type(), primary_key=True)
+    user_id = Column(id_type(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
     description = Column(String(1000), nullable=True)
     color = Column(String(7), nullable=True)  # HEX 색상 코드
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # 소유자 변경 번호 (생성 시 / 마지막 변경 시, app.db.sync)
+    created_seq = Column(BigInteger, nullable=True)
+    change_seq = Column(BigInteger, nullable=True)
 
     # 관계
     user = relationship("User", back_populates="calendars")
-    events = relationship("Event", back_populates="calendar", cascade="all, delete-orphan")
-    tasks = relationship("Task", back_populates="calendar", cascade="all, delete-orphan")
+    # 삭제는 DB ON DELETE CASCADE / app.db.cascade에 위임 (하위 행을 세션에 로드하지 않음)
+    events = relationship("Event", back_populates="calendar", cascade="all, delete-orphan", passive_deletes=True)
+    tasks = relationship("Task", back_populates="calendar", cascade="all, delete-orphan", passive_deletes=True)
 
     # 복합 인덱스
     __table_args__ = (
         Index("idx_calendar_user_title", "user_id", "title"),
+        Index("idx_calendar_user_created", "user_id", "created_at"),
+        Index("idx_calendar_user_change", "user_id", "change_seq"),
+        Index("ft_calendar_text", "title", "description", mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(
+            dialect="mysql"
+        ),
     )
 
+    # 정렬 가능 필드 -> 정렬을 받쳐주는 인덱스 (id는 항상 보조 정렬, app.core.pagination)
+    SORTABLE_FIELDS = {
+        "created_at": "idx_calendar_user_created",
+        "title": "idx_calendar_user_title",
+    }
+
+    # keyword 전문 검색 대상 (app.db.fulltext)
+    SEARCH_FIELDS = ("title", "description")
+
+
+register_sqlite_fts(Calendar.__table__, Calendar.SEARCH_FIELDS)
+
 
 
 
@@ -1,38 +1,111 @@
 """
 Event 모델
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Index
+from sqlalchemy import BigInteger, Column, Date, String, DateTime, ForeignKey, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
 from app.db.base import Base
+from app.db.fulltext import register_sqlite_fts
+from app.db.types import id_type
 
 
 class Event(Base):
     """이벤트 모델"""
     __tablename__ = "events"
 
-    id = Column(String(36), primary_key=True, index=True)
-    calendar_id = Column(String(36), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(255), nullable=False, index=True)
+    id = Column(id_type(), primary_key=True)
+    calendar_id = Column(id_type(), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    start_at = Column(DateTime, nullable=False, index=True)
-    end_at = Column(DateTime, nullable=False, index=True)
+    start_at = Column(DateTime, nullable=False)
+    end_at = Column(DateTime, nullable=False)
     location = Column(String(500), nullable=True)
     is_all_day = Column(Boolean, default=False, nullable=False)
+    # 반복 규칙 (app.core.recurrence), 마스터 한 행으로 저장하고 조회 시 회차 전개
+    rrule = Column(String(500), nullable=True)
+    is_recurring = Column(Boolean, default=False, nullable=False)
+    # 마지막 회차 종료 시각 (끝이 없으면 NULL) - 구간과 겹치는 마스터 조회용
+    recurrence_end = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # 소유자 변경 번호 (생성 시 / 마지막 변경 시, app.db.sync)
+    created_seq = Column(BigInteger, nullable=True)
+    change_seq = Column(BigInteger, nullable=True)
 
     # 관계
     calendar = relationship("Calendar", back_populates="events")
 
     # 복합 인덱스 (검색/정렬 최적화)
     __table_args__ = (
-        Index("idx_event_calendar_start", "calendar_id", "start_at"),
+        Index("idx_event_calendar_start", "calendar_id", "start_at", "end_at"),
         Index("idx_event_calendar_end", "calendar_id", "end_at"),
         Index("idx_event_start_end", "start_at", "end_at"),
+        Index("idx_event_calendar_recurring", "calendar_id", "is_recurring", "start_at", "end_at"),
+        Index("idx_event_calendar_change", "calendar_id", "change_seq"),
     )
 
+    # 정렬 가능 필드 -> 정렬을 받쳐주는 인덱스 (id는 항상 보조 정렬, app.core.pagination)
+    SORTABLE_FIELDS = {
+        "start_at": "idx_event_calendar_start",
+        "end_at": "idx_event_calendar_end",
+    }
+
+    # keyword 전문 검색 대상 (app.db.fulltext, MySQL은 파티션 제약으로 events_fts 보조 테이블)
+    SEARCH_FIELDS = ("title", "description", "location")
+
+
+class EventException(Base):
+    """
+    반복 이벤트 회차 예외 (회차 하나의 수정/취소)
+
+    events는 파티션 테이블이 될 수 있어 event_id에 FK를 두지 않습니다.
+    캘린더 삭제 시 calendar_id로 함께 삭제합니다 (app.db.cascade).
+    """
+    __tablename__ = "event_exceptions"
+
+    id = Column(id_type(), primary_key=True)
+    event_id = Column(id_type(), nullable=False)
+    calendar_id = Column(id_type(), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
+    # 규칙상 원래 회차 시작 시각
+    original_start = Column(DateTime, nullable=False)
+    is_cancelled = Column(Boolean, default=False, nullable=False)
+    # 변경한 값 (NULL이면 마스터 값 사용)
+    title = Column(String(255), nullable=True)
+    description = Column(Text, nullable=True)
+    location = Column(String(500), nullable=True)
+    start_at = Column(DateTime, nullable=True)
+    end_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("uq_event_exception_original", "event_id", "original_start", unique=True),
+        Index("idx_event_exception_calendar", "calendar_id"),
+    )
+
+
+class EventDayBucket(Base):
+    """
+    이벤트가 걸친 날짜별 행 (겹침 조회용, app.db.day_buckets)
+
+    start_at < :end AND end_at > :start 는 두 범위 조건이라 한 인덱스로 좁힐 수 없으므로
+    (calendar_id, day) 동등/범위 조건으로 해당 날짜의 이벤트만 찾은 뒤 시각을 비교합니다.
+    단일 이벤트만 저장합니다 (반복 이벤트는 회차 전개로 확인).
+    """
+    __tablename__ = "event_day_buckets"
+
+    event_id = Column(id_type(), primary_key=True)
+    day = Column(Date, primary_key=True)
+    calendar_id = Column(id_type(), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
+
+    __table_args__ = (
+        Index("idx_event_bucket_calendar_day", "calendar_id", "day", "event_id"),
+    )
+
+
+register_sqlite_fts(Event.__table__, Event.SEARCH_FIELDS)
+
 
 
 
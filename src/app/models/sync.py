@@ -0,0 +1,43 @@
+"""
+동기화 (GET /sync) 모델
+"""
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String
+from datetime import datetime
+
+from app.db.base import Base
+from app.db.types import id_type
+
+
+class SyncState(Base):
+    """
+    사용자별 변경 번호
+
+    seq: 마지막으로 발급한 번호 (캘린더/이벤트/작업 쓰기마다 증가)
+    floor: 보존 기간이 지나 정리한 삭제 기록의 최대 번호 (이보다 오래된 토큰은 전체 동기화 필요)
+    """
+    __tablename__ = "sync_state"
+
+    user_id = Column(id_type(), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(BigInteger, default=0, nullable=False)
+    floor = Column(BigInteger, default=0, nullable=False)
+
+
+class SyncTombstone(Base):
+    """
+    삭제 기록 (하드 삭제된 캘린더/이벤트/작업)
+
+    캘린더 삭제는 캘린더 하나만 기록합니다 (하위 이벤트/작업은 함께 삭제된 것으로 간주).
+    """
+    __tablename__ = "sync_tombstones"
+
+    id = Column(id_type(), primary_key=True)
+    owner_id = Column(id_type(), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    resource = Column(String(20), nullable=False)  # calendars, events, tasks
+    resource_id = Column(id_type(), nullable=False)
+    change_seq = Column(BigInteger, nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_tombstone_owner_seq", "owner_id", "change_seq"),
+        Index("idx_tombstone_deleted", "deleted_at"),
+    )
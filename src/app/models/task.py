@@ -1,12 +1,14 @@
 """
 Task 모델
 """
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Boolean, Enum, Index
+from sqlalchemy import BigInteger, Column, String, DateTime, ForeignKey, Text, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
 from app.db.base import Base
+from app.db.fulltext import register_sqlite_fts
+from app.db.types import id_type
 
 
 class TaskStatus(str, enum.Enum):
@@ -21,16 +23,19 @@ class Task(Base):
     """작업 모델"""
     __tablename__ = "tasks"
 
-    id = Column(String(36), primary_key=True, index=True)
-    calendar_id = Column(String(36), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False, index=True)
-    title = Column(String(255), nullable=False, index=True)
+    id = Column(id_type(), primary_key=True)
+    calendar_id = Column(id_type(), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    due_at = Column(DateTime, nullable=True, index=True)
+    due_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
-    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False, index=True)
-    priority = Column(String(20), nullable=True, index=True)  # LOW, MEDIUM, HIGH
+    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING, nullable=False)
+    priority = Column(String(20), nullable=True)  # LOW, MEDIUM, HIGH
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # 소유자 변경 번호 (생성 시 / 마지막 변경 시, app.db.sync)
+    created_seq = Column(BigInteger, nullable=True)
+    change_seq = Column(BigInteger, nullable=True)
 
     # 관계
     calendar = relationship("Calendar", back_populates="tasks")
@@ -38,12 +43,60 @@ class Task(Base):
     # 복합 인덱스 (검색/정렬 최적화)
     __table_args__ = (
         Index("idx_task_calendar_due", "calendar_id", "due_at"),
-        Index("idx_task_calendar_status", "calendar_id", "status"),
+        Index("idx_task_calendar_status", "calendar_id", "status", "due_at"),
         Index("idx_task_due_status", "due_at", "status"),
+        Index("idx_task_calendar_change", "calendar_id", "change_seq"),
+        Index("ft_task_text", "title", "description", mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(
+            dialect="mysql"
+        ),
     )
 
+    # 정렬 가능 필드 -> 정렬을 받쳐주는 인덱스 (id는 항상 보조 정렬, app.core.pagination)
+    SORTABLE_FIELDS = {
+        "due_at": "idx_task_calendar_due",
+    }
 
+    # keyword 전문 검색 대상 (app.db.fulltext)
+    SEARCH_FIELDS = ("title", "description")
 
 
 
 
+
+
+
+
+class TaskArchive(Base):
+    """완료/취소된 작업 보관 모델 (tasks와 동일 컬럼 + archived_at)"""
+    __tablename__ = "tasks_archive"
+
+    id = Column(id_type(), primary_key=True)
+    calendar_id = Column(id_type(), ForeignKey("calendars.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    due_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    status = Column(Enum(TaskStatus), nullable=False)
+    priority = Column(String(20), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    created_seq = Column(BigInteger, nullable=True)
+    change_seq = Column(BigInteger, nullable=True)
+    archived_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # 복합 인덱스 (GET /tasks 합집합 조회용)
+    __table_args__ = (
+        Index("idx_task_archive_calendar_due", "calendar_id", "due_at"),
+        Index("idx_task_archive_calendar_status", "calendar_id", "status", "due_at"),
+        Index("idx_task_archive_status_completed", "status", "completed_at"),
+        Index("idx_task_archive_calendar_change", "calendar_id", "change_seq"),
+        Index(
+            "ft_task_archive_text", "title", "description", mysql_prefix="FULLTEXT", mysql_with_parser="ngram"
+        ).ddl_if(dialect="mysql"),
+    )
+
+    SEARCH_FIELDS = Task.SEARCH_FIELDS
+
+
+register_sqlite_fts(Task.__table__, Task.SEARCH_FIELDS)
+register_sqlite_fts(TaskArchive.__table__, TaskArchive.SEARCH_FIELDS)
@@ -1,12 +1,14 @@
 """
 User 모델
 """
-from sqlalchemy import Column, String, DateTime, Enum, Boolean
+from sqlalchemy import Column, String, DateTime, Enum, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
 
 from app.db.base import Base
+from app.db.fulltext import register_sqlite_fts
+from app.db.types import id_type
 
 
 class UserRole(str, enum.Enum):
@@ -19,16 +21,38 @@ class User(Base):
     """사용자 모델"""
     __tablename__ = "users"
 
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(id_type(), primary_key=True)
     email = Column(String(255), unique=True, index=True, nullable=False)
     password = Column(String(255), nullable=False)  # bcrypt 해시된 비밀번호
     display_name = Column(String(255), nullable=True)
-    role = Column(Enum(UserRole), default=UserRole.USER, nullable=False, index=True)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)  # 활성화 여부
-    is_banned = Column(Boolean, default=False, nullable=False, index=True)  # 차단 여부
+    role = Column(Enum(UserRole), default=UserRole.USER, nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)  # 활성화 여부
+    is_banned = Column(Boolean, default=False, nullable=False)  # 차단 여부
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # 관계
-    calendars = relationship("Calendar", back_populates="user", cascade="all, delete-orphan")
+    # 삭제는 DB ON DELETE CASCADE / app.db.cascade에 위임 (하위 행을 세션에 로드하지 않음)
+    calendars = relationship("Calendar", back_populates="user", cascade="all, delete-orphan", passive_deletes=True)
+
+    # 인덱스 (목록 기본 정렬, 관리자 목록 상태 필터 + 정렬)
+    __table_args__ = (
+        Index("idx_user_created", "created_at"),
+        Index("idx_user_role_status_created", "role", "is_active", "is_banned", "created_at"),
+        Index("ft_user_text", "email", "display_name", mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(
+            dialect="mysql"
+        ),
+    )
+
+    # 정렬 가능 필드 -> 정렬을 받쳐주는 인덱스 (id는 항상 보조 정렬, app.core.pagination)
+    SORTABLE_FIELDS = {
+        "created_at": "idx_user_created",
+        "email": "ix_users_email",
+    }
+
+    # keyword 전문 검색 대상 (app.db.fulltext)
+    SEARCH_FIELDS = ("email", "display_name")
+
+
+register_sqlite_fts(User.__table__, User.SEARCH_FIELDS)
 
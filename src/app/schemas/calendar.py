@@ -2,7 +2,7 @@
 캘린더 관련 Pydantic 스키마
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from app.schemas.common import PageRequest, PageResponse
 
@@ -53,6 +53,23 @@ class CalendarResponse(CalendarBase):
         from_attributes = True
 
 
+class CalendarCounts(BaseModel):
+    """캘린더 하위 항목 수 (include=counts)"""
+    events: int
+    tasks: int
+
+
+class NextEvent(BaseModel):
+    """캘린더의 다음 이벤트 (include=next_event)"""
+    id: str
+    title: str
+    start_at: datetime
+    end_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class CalendarListRequest(PageRequest):
     """캘린더 목록 조회 요청"""
     user_id: Optional[str] = None
@@ -65,7 +82,19 @@ class CalendarListResponse(PageResponse[CalendarResponse]):
     pass
 
 
+class ICSRejectedEntry(BaseModel):
+    """가져오지 못한 ICS 항목"""
+    line: int = Field(..., description="구성 요소 시작 줄 번호")
+    component: str = Field(..., description="VEVENT / VTODO")
+    uid: Optional[str] = None
+    reason: str
 
 
-
-
+class ICSImportResponse(BaseModel):
+    """ICS 가져오기 결과 (청크마다 커밋되므로 실패한 청크가 있어도 앞선 청크는 저장됨)"""
+    events: int = Field(..., description="생성한 이벤트 수")
+    tasks: int = Field(..., description="생성한 작업 수")
+    exceptions: int = Field(..., description="생성한 반복 회차 수정/취소 수")
+    chunks: int = Field(..., description="커밋한 청크 수")
+    rejected_count: int
+    rejected: List[ICSRejectedEntry] = Field(..., description="거부 항목 (최대 100개)")
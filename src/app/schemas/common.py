@@ -1,25 +1,53 @@
 """
 공통 스키마 (페이징, 필터링, 정렬)
 """
-from typing import Optional, List, Generic, TypeVar, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+from typing import Annotated, Optional, List, Generic, TypeVar, Any
+from pydantic import AfterValidator, BaseModel, Field
+from datetime import datetime, timezone
+import enum
 
 T = TypeVar('T')
 
 
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """시간대가 있는 시각(예: ...Z, +09:00)을 naive UTC로 변환 (DB 컬럼은 naive UTC)"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# 요청 시각 타입 (naive UTC로 정규화해 저장된 시각과 비교 가능)
+UtcDatetime = Annotated[datetime, AfterValidator(naive_utc)]
+
+
 class SortParam(BaseModel):
     """정렬 파라미터"""
     field: str = Field(..., description="정렬 필드")
     direction: str = Field(..., pattern="^(ASC|DESC)$", description="정렬 방향 (ASC/DESC)")
 
 
+class CountMode(str, enum.Enum):
+    """전체 개수 조회 방식"""
+    EXACT = "exact"
+    NONE = "none"
+    ESTIMATE = "estimate"
+    CACHED = "cached"
+
+
+class ExportFormat(str, enum.Enum):
+    """전체 내보내기 형식"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class PageRequest(BaseModel):
     """페이징 요청"""
     page: int = Field(0, ge=0, description="페이지 번호 (0부터 시작)")
     size: int = Field(20, ge=1, le=100, description="페이지 크기 (1-100)")
     sort: Optional[str] = Field(None, description="정렬 (예: 'field,ASC' 또는 'field,DESC')")
     keyword: Optional[str] = Field(None, max_length=100, description="검색 키워드")
+    cursor: Optional[str] = Field(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 지정 시 page 무시)")
+    count: CountMode = Field(CountMode.EXACT, description="전체 개수 조회 방식 (exact/none/estimate/cached)")
 
 
 class DateRangeFilter(BaseModel):
@@ -33,9 +61,11 @@ class PageResponse(BaseModel, Generic[T]):
     content: List[T]
     page: int
     size: int
-    total_elements: int = Field(..., serialization_alias="totalElements")
-    total_pages: int = Field(..., serialization_alias="totalPages")
+    total_elements: Optional[int] = Field(None, serialization_alias="totalElements")
+    total_pages: Optional[int] = Field(None, serialization_alias="totalPages")
     sort: Optional[str] = None
+    next_cursor: Optional[str] = Field(None, serialization_alias="nextCursor")
+    count_mode: CountMode = Field(CountMode.EXACT, serialization_alias="countMode")
 
     class Config:
         from_attributes = True
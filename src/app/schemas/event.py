@@ -4,17 +4,20 @@
 from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
-from app.schemas.common import PageRequest, PageResponse
+from app.schemas.common import PageRequest, PageResponse, UtcDatetime
 
 
 class EventBase(BaseModel):
     """이벤트 기본 스키마"""
     title: str = Field(..., max_length=255, description="이벤트 제목")
     description: Optional[str] = Field(None, description="설명")
-    start_at: datetime = Field(..., description="시작 시간")
-    end_at: datetime = Field(..., description="종료 시간")
+    start_at: UtcDatetime = Field(..., description="시작 시간 (시간대가 있으면 UTC로 변환)")
+    end_at: UtcDatetime = Field(..., description="종료 시간 (시간대가 있으면 UTC로 변환)")
     location: Optional[str] = Field(None, max_length=500, description="장소")
     is_all_day: bool = Field(False, description="종일 이벤트 여부")
+    rrule: Optional[str] = Field(
+        None, max_length=500, description="반복 규칙 (RRULE, 예: FREQ=WEEKLY;BYDAY=MO,WE;COUNT=10)"
+    )
 
 
 class EventCreate(EventBase):
@@ -39,10 +42,11 @@ class EventUpdate(BaseModel):
     """이벤트 수정 요청"""
     title: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    start_at: Optional[datetime] = None
-    end_at: Optional[datetime] = None
+    start_at: Optional[UtcDatetime] = None
+    end_at: Optional[UtcDatetime] = None
     location: Optional[str] = Field(None, max_length=500)
     is_all_day: Optional[bool] = None
+    rrule: Optional[str] = Field(None, max_length=500, description="반복 규칙 (빈 문자열이면 반복 해제)")
 
     class Config:
         json_schema_extra = {
@@ -54,10 +58,20 @@ class EventUpdate(BaseModel):
         }
 
 
+class EventOccurrenceUpdate(BaseModel):
+    """반복 이벤트 회차 하나 수정 요청"""
+    title: Optional[str] = Field(None, max_length=255)
+    description: Optional[str] = None
+    start_at: Optional[UtcDatetime] = None
+    end_at: Optional[UtcDatetime] = None
+    location: Optional[str] = Field(None, max_length=500)
+
+
 class EventResponse(EventBase):
     """이벤트 응답"""
     id: str
     calendar_id: str
+    recurrence_id: Optional[datetime] = Field(None, description="반복 회차의 원래 시작 시각 (expand=true)")
     created_at: datetime
     updated_at: datetime
 
@@ -68,10 +82,10 @@ class EventResponse(EventBase):
 class EventListRequest(PageRequest):
     """이벤트 목록 조회 요청"""
     calendar_id: Optional[str] = None
-    start_from: Optional[datetime] = None
-    start_to: Optional[datetime] = None
-    end_from: Optional[datetime] = None
-    end_to: Optional[datetime] = None
+    start_from: Optional[UtcDatetime] = None
+    start_to: Optional[UtcDatetime] = None
+    end_from: Optional[UtcDatetime] = None
+    end_to: Optional[UtcDatetime] = None
     is_all_day: Optional[bool] = None
 
 
@@ -0,0 +1,38 @@
+"""
+Free/busy 관련 Pydantic 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import datetime
+from app.schemas.common import UtcDatetime
+
+
+class FreeBusyRequest(BaseModel):
+    """Free/busy 조회 요청 (calendar_ids와 user_ids의 캘린더를 합쳐 계산)"""
+    time_min: UtcDatetime = Field(..., description="구간 시작 (시간대가 있으면 UTC로 변환)")
+    time_max: UtcDatetime = Field(..., description="구간 끝 (시간대가 있으면 UTC로 변환)")
+    calendar_ids: List[str] = Field(default_factory=list, max_length=5000, description="캘린더 ID 목록")
+    user_ids: List[str] = Field(default_factory=list, max_length=1000, description="사용자 ID 목록 (소유 캘린더 전체)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "time_min": "2025-12-22T00:00:00Z",
+                "time_max": "2025-12-27T00:00:00Z",
+                "calendar_ids": ["uuid-of-calendar"],
+            }
+        }
+
+
+class BusyInterval(BaseModel):
+    """바쁜 구간"""
+    start: datetime
+    end: datetime
+
+
+class FreeBusyResponse(BaseModel):
+    """Free/busy 응답"""
+    time_min: datetime
+    time_max: datetime
+    calendars: int
+    busy: List[BusyInterval]
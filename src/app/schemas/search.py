@@ -0,0 +1,38 @@
+"""
+검색 관련 Pydantic 스키마
+"""
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class SuggestionItem(BaseModel):
+    """자동완성 항목"""
+    type: str
+    id: str
+    title: str
+
+
+class SuggestResponse(BaseModel):
+    """자동완성 응답"""
+    query: str
+    items: List[SuggestionItem]
+
+
+class SearchItem(BaseModel):
+    """통합 검색 항목 (type에 따라 해당 필드만 값이 있음)"""
+    type: str
+    id: str
+    title: str
+    calendar_id: Optional[str] = None
+    start_at: Optional[datetime] = None
+    end_at: Optional[datetime] = None
+    due_at: Optional[datetime] = None
+
+
+class SearchResponse(BaseModel):
+    """통합 검색 응답"""
+    query: str
+    items: List[SearchItem]
+    partial: bool = False
+    incomplete: List[str] = []
@@ -0,0 +1,32 @@
+"""
+동기화 관련 Pydantic 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import Generic, List, TypeVar
+
+from app.schemas.calendar import CalendarResponse
+from app.schemas.event import EventResponse
+from app.schemas.task import TaskResponse
+
+T = TypeVar('T')
+
+
+class SyncChanges(BaseModel, Generic[T]):
+    """리소스 하나의 변경 (created/updated: 현재 상태, deleted: 삭제된 id)"""
+    created: List[T] = Field(default_factory=list)
+    updated: List[T] = Field(default_factory=list)
+    deleted: List[str] = Field(default_factory=list)
+
+
+class SyncResponse(BaseModel):
+    """
+    증분 동기화 응답
+
+    token: 다음 요청에 넘길 토큰 (has_more이면 바로 이어서 요청)
+    반복 이벤트의 회차 수정/취소는 마스터 이벤트의 updated로 전달됩니다.
+    """
+    token: str
+    has_more: bool
+    calendars: SyncChanges[CalendarResponse]
+    events: SyncChanges[EventResponse]
+    tasks: SyncChanges[TaskResponse]
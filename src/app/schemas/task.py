@@ -71,6 +71,7 @@ class TaskListRequest(PageRequest):
     priority: Optional[str] = Field(None, pattern="^(LOW|MEDIUM|HIGH)$")
     due_from: Optional[datetime] = None
     due_to: Optional[datetime] = None
+    include_archived: bool = Field(False, description="보관된(아카이브) 작업 포함 여부")
 
 
 class TaskListResponse(PageResponse[TaskResponse]):
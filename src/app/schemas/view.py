@@ -0,0 +1,29 @@
+"""
+캘린더 뷰 관련 Pydantic 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from datetime import date, datetime
+
+
+class ViewEvent(BaseModel):
+    """날짜 하나에 놓인 이벤트 조각 (시각은 요청 시간대 기준)"""
+    id: str
+    calendar_id: str
+    title: str
+    location: Optional[str] = None
+    start_at: datetime
+    end_at: datetime
+    is_all_day: bool
+    recurrence_id: Optional[datetime] = Field(None, description="반복 회차의 원래 시작 시각 (UTC)")
+    is_start: bool = Field(..., description="이벤트가 이 날짜에 시작")
+    is_end: bool = Field(..., description="이벤트가 이 날짜에 끝남")
+
+
+class CalendarViewResponse(BaseModel):
+    """월/주/일 뷰 응답 (days: 구간의 모든 날짜, 이벤트 없는 날은 빈 목록)"""
+    view: str
+    timezone: str
+    start: date
+    end: date
+    days: Dict[date, List[ViewEvent]]
@@ -3,12 +3,14 @@ pytest 설정 및 공통 픽스처
 """
 import os
 import pytest
+from contextlib import contextmanager
+from fastapi import status
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event as sa_event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # 테스트 환경 변수 설정
 os.environ["TESTING"] = "1"
@@ -54,7 +56,9 @@ def mock_redis():
         def get(self, key):
             return self._data.get(key)
         
-        def set(self, key, value):
+        def set(self, key, value, ex=None, nx=False):
+            if nx and key in self._data:
+                return None
             self._data[key] = value
             return True
         
@@ -70,10 +74,10 @@ def mock_redis():
         def exists(self, key):
             return 1 if key in self._data else 0
         
-        def incr(self, key):
+        def incr(self, key, amount=1):
             if key not in self._data:
                 self._data[key] = 0
-            self._data[key] = int(self._data[key]) + 1
+            self._data[key] = int(self._data[key]) + amount
             return self._data[key]
         
         def expire(self, key, ttl):
@@ -212,3 +216,76 @@ def admin_headers(client, test_admin):
     token = response.json()["access_token"]
     return {"Authorization": f"Bearer {token}"}
 
+
+@pytest.fixture
+def count_statements(db):
+    """
+    실행된 SQL 수집 (쿼리 수 확인용)
+    
+    Usage:
+        with count_statements("FROM events") as statements:
+            client.get("/api/v1/events", headers=auth_headers)
+        assert len(statements) == 1
+    
+    contains를 주면 해당 문자열이 들어간 문장만 모읍니다.
+    """
+    engine = db.get_bind()
+    
+    @contextmanager
+    def collect(contains=None):
+        statements = []
+        
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if contains is None or contains in statement:
+                statements.append(statement)
+        
+        sa_event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    
+    return collect
+
+
+@pytest.fixture
+def create_event(client, auth_headers):
+    """
+    이벤트 생성 헬퍼 (기본: 2026-01-01 09:00부터 hours시간, 일반 사용자)
+    
+    Usage:
+        event_id = create_event(calendar_id, "회의", start_at=datetime(2026, 5, 1, 9, 0))["id"]
+        body = create_event(calendar_id, "면접", start, end, params="?check_conflicts=true", expect=409)
+    
+    응답 상태가 expect와 같은지 확인하고 응답 본문을 반환합니다.
+    """
+    def create(
+        calendar_id,
+        title="Event",
+        start_at=datetime(2026, 1, 1, 9, 0),
+        end_at=None,
+        hours=1,
+        description=None,
+        rrule=None,
+        is_all_day=False,
+        headers=None,
+        params="",
+        expect=status.HTTP_201_CREATED,
+    ):
+        response = client.post(
+            f"/api/v1/events{params}",
+            headers=headers or auth_headers,
+            json={
+                "calendar_id": calendar_id,
+                "title": title,
+                "description": description,
+                "start_at": start_at.isoformat(),
+                "end_at": (end_at or start_at + timedelta(hours=hours)).isoformat(),
+                "rrule": rrule,
+                "is_all_day": is_all_day,
+            },
+        )
+        assert response.status_code == expect, response.text
+        return response.json()
+    
+    return create
@@ -14,7 +14,31 @@ class TestAdminGetUsers:
         response = client.get("/api/v1/admin/users", headers=admin_headers)
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
-        assert isinstance(data, list)
+        assert data["totalElements"] == 1
+        assert data["content"][0]["email"] == "admin@example.com"
+    
+    def test_admin_get_users_filters_and_cursor(self, client, admin_headers, test_user, db):
+        """role/is_banned 필터와 커서 페이징"""
+        test_user.is_banned = True
+        db.commit()
+        
+        banned = client.get("/api/v1/admin/users?role=USER&is_banned=true", headers=admin_headers).json()
+        assert [user["id"] for user in banned["content"]] == [test_user.id]
+        
+        first = client.get("/api/v1/admin/users?size=1", headers=admin_headers).json()
+        assert first["totalElements"] == 2
+        second = client.get(f"/api/v1/admin/users?size=1&cursor={first['nextCursor']}", headers=admin_headers).json()
+        emails = {first["content"][0]["email"], second["content"][0]["email"]}
+        assert emails == {"admin@example.com", "testuser@example.com"}
+    
+    def test_admin_export_users(self, client, admin_headers, test_user):
+        """사용자 전체 NDJSON 내보내기"""
+        import json
+        
+        response = client.get("/api/v1/admin/users/export?is_active=true", headers=admin_headers)
+        assert response.status_code == status.HTTP_200_OK
+        emails = {json.loads(line)["email"] for line in response.text.splitlines()}
+        assert emails == {"admin@example.com", "testuser@example.com"}
     
     def test_admin_get_users_forbidden(self, client, auth_headers):
         """일반 사용자 접근 실패 (403)"""
@@ -153,3 +177,50 @@ class TestAdminDeleteUser:
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    
+    def test_admin_delete_user_removes_owned_rows(self, client, admin_headers, auth_headers, test_user, db):
+        """사용자 삭제 시 소유 캘린더/이벤트/작업도 청크 단위로 삭제"""
+        from datetime import datetime, timedelta
+        from app.core.config import settings
+        from app.models.calendar import Calendar
+        from app.models.event import Event
+        from app.models.task import Task
+        
+        calendar_id = client.post(
+            "/api/v1/calendars",
+            headers=auth_headers,
+            json={"title": "Owned Calendar"},
+        ).json()["id"]
+        start_at = datetime.utcnow() + timedelta(days=1)
+        for i in range(3):
+            client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "calendar_id": calendar_id,
+                    "title": f"Event {i}",
+                    "start_at": start_at.isoformat(),
+                    "end_at": (start_at + timedelta(hours=1)).isoformat(),
+                },
+            )
+            client.post(
+                "/api/v1/tasks",
+                headers=auth_headers,
+                json={"calendar_id": calendar_id, "title": f"Task {i}"},
+            )
+        
+        original_chunk_size = settings.DELETE_CHUNK_SIZE
+        settings.DELETE_CHUNK_SIZE = 2
+        try:
+            response = client.delete(
+                f"/api/v1/admin/users/{test_user.id}",
+                headers=admin_headers,
+            )
+        finally:
+            settings.DELETE_CHUNK_SIZE = original_chunk_size
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        
+        db.expire_all()
+        assert db.query(Calendar).filter(Calendar.id == calendar_id).count() == 0
+        assert db.query(Event).filter(Event.calendar_id == calendar_id).count() == 0
+        assert db.query(Task).filter(Task.calendar_id == calendar_id).count() == 0
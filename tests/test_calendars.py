@@ -189,3 +189,431 @@ class TestDeleteCalendar:
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+
+
+class TestCalendarETag:
+    """캘린더 조건부 GET 테스트"""
+    
+    def test_detail_not_modified_until_update(self, client, auth_headers):
+        """상세 ETag: 변경 전 304, 수정 후 200"""
+        calendar_id = client.post(
+            "/api/v1/calendars", headers=auth_headers, json={"title": "ETag"}
+        ).json()["id"]
+        
+        first = client.get(f"/api/v1/calendars/{calendar_id}", headers=auth_headers)
+        etag = first.headers["etag"]
+        
+        cached = client.get(
+            f"/api/v1/calendars/{calendar_id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert cached.content == b""
+        
+        client.put(f"/api/v1/calendars/{calendar_id}", headers=auth_headers, json={"title": "Changed"})
+        
+        changed = client.get(
+            f"/api/v1/calendars/{calendar_id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.json()["title"] == "Changed"
+        assert changed.headers["etag"] != etag
+    
+    def test_detail_changes_within_same_second(self, client, auth_headers, db):
+        """초 단위 updated_at이 같아도 수정하면 ETag가 바뀜 (MySQL DATETIME)"""
+        from datetime import datetime
+        from app.models.calendar import Calendar
+        
+        calendar_id = client.post(
+            "/api/v1/calendars", headers=auth_headers, json={"title": "ETag"}
+        ).json()["id"]
+        same_second = datetime(2026, 5, 1, 9, 0, 0)
+        
+        def pin_updated_at():
+            db.query(Calendar).filter(Calendar.id == calendar_id).update({"updated_at": same_second})
+            db.commit()
+        
+        pin_updated_at()
+        etag = client.get(f"/api/v1/calendars/{calendar_id}", headers=auth_headers).headers["etag"]
+        
+        client.put(f"/api/v1/calendars/{calendar_id}", headers=auth_headers, json={"title": "Changed"})
+        pin_updated_at()
+        
+        changed = client.get(
+            f"/api/v1/calendars/{calendar_id}",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert changed.status_code == status.HTTP_200_OK
+        assert changed.json()["title"] == "Changed"
+    
+    def test_list_not_modified_until_write(self, client, auth_headers):
+        """목록 ETag: 사용자 버전이 바뀌기 전까지 304"""
+        client.post("/api/v1/calendars", headers=auth_headers, json={"title": "A"})
+        
+        etag = client.get("/api/v1/calendars", headers=auth_headers).headers["etag"]
+        cached = client.get("/api/v1/calendars", headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        # 쿼리가 다르면 다른 ETag
+        other = client.get("/api/v1/calendars?size=5", headers={**auth_headers, "If-None-Match": etag})
+        assert other.status_code == status.HTTP_200_OK
+        
+        client.post("/api/v1/calendars", headers=auth_headers, json={"title": "B"})
+        changed = client.get("/api/v1/calendars", headers={**auth_headers, "If-None-Match": etag})
+        assert changed.status_code == status.HTTP_200_OK
+        assert len(changed.json()["content"]) == 2
+
+
+class TestCalendarInclude:
+    """캘린더 목록 include= 집계 테스트"""
+
+    def _seed(self, client, auth_headers):
+        from datetime import datetime, timedelta
+
+        now = datetime.utcnow()
+        busy = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "Busy"}).json()["id"]
+        client.post("/api/v1/calendars", headers=auth_headers, json={"title": "Empty"})
+        for days in (-1, 2, 5):
+            client.post(
+                "/api/v1/events",
+                headers=auth_headers,
+                json={
+                    "calendar_id": busy,
+                    "title": f"Event {days}",
+                    "start_at": (now + timedelta(days=days)).isoformat(),
+                    "end_at": (now + timedelta(days=days, hours=1)).isoformat(),
+                },
+            )
+        for task_status in ("PENDING", "IN_PROGRESS", "COMPLETED"):
+            client.post(
+                "/api/v1/tasks",
+                headers=auth_headers,
+                json={"calendar_id": busy, "title": task_status, "status": task_status},
+            )
+        return busy
+
+    def test_include_all(self, client, auth_headers):
+        """요청한 집계만 캘린더별로 포함"""
+        busy = self._seed(client, auth_headers)
+        response = client.get("/api/v1/calendars?include=counts,next_event,open_tasks", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        content = {item["title"]: item for item in response.json()["content"]}
+
+        assert content["Busy"]["id"] == busy
+        assert content["Busy"]["counts"] == {"events": 3, "tasks": 3}
+        assert content["Busy"]["open_tasks"] == 2
+        assert content["Busy"]["next_event"]["title"] == "Event 2"
+        assert content["Empty"]["counts"] == {"events": 0, "tasks": 0}
+        assert content["Empty"]["next_event"] is None
+
+    def test_include_with_fields(self, client, auth_headers):
+        """fields와 함께 사용"""
+        self._seed(client, auth_headers)
+        response = client.get("/api/v1/calendars?fields=title&include=open_tasks", headers=auth_headers)
+        item = response.json()["content"][0]
+        assert set(item) == {"id", "title", "open_tasks"}
+
+    def test_counts_one_query_per_aggregate_and_cached(self, client, auth_headers, count_statements):
+        """페이지 전체에 집계당 쿼리 한 번, 두 번째 요청은 캐시"""
+        busy = self._seed(client, auth_headers)
+
+        with count_statements("GROUP BY") as statements:
+            client.get("/api/v1/calendars?include=counts", headers=auth_headers)
+            assert len(statements) == 2
+            statements.clear()
+            client.get("/api/v1/calendars?include=counts", headers=auth_headers)
+            assert statements == []
+
+            task_id = client.get(f"/api/v1/tasks?calendar_id={busy}", headers=auth_headers).json()["content"][0]["id"]
+            client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+            statements.clear()
+            response = client.get("/api/v1/calendars?include=counts", headers=auth_headers)
+        content = {item["title"]: item for item in response.json()["content"]}
+        assert content["Busy"]["counts"] == {"events": 3, "tasks": 2}
+        assert len(statements) == 2
+
+    def test_unknown_include_rejected(self, client, auth_headers):
+        """알 수 없는 include는 400"""
+        response = client.get("/api/v1/calendars?include=members", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestCalendarViews:
+    """월/주/일 뷰 테스트"""
+
+    def _event(self, client, headers, calendar_id, title, start_at, end_at, **extra):
+        response = client.post(
+            "/api/v1/events",
+            headers=headers,
+            json={"calendar_id": calendar_id, "title": title, "start_at": start_at, "end_at": end_at, **extra},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def _calendar(self, client, headers, title="Views"):
+        return client.post("/api/v1/calendars", headers=headers, json={"title": title}).json()["id"]
+
+    def test_month_view_splits_multi_day_events(self, client, auth_headers):
+        """여러 날 이벤트는 걸친 날마다, 종일 이벤트가 먼저, 빈 날짜도 포함"""
+        work = self._calendar(client, auth_headers, "Work")
+        home = self._calendar(client, auth_headers, "Home")
+        trip = self._event(client, auth_headers, work, "출장", "2026-05-30T08:00:00", "2026-06-02T12:00:00")
+        holiday = self._event(
+            client, auth_headers, home, "휴일", "2026-05-31T00:00:00", "2026-06-01T00:00:00", is_all_day=True,
+        )
+        self._event(client, auth_headers, home, "다음 달", "2026-06-03T09:00:00", "2026-06-03T10:00:00")
+
+        response = client.get("/api/v1/calendars/views/month?month=2026-05", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert (data["view"], data["start"], data["end"]) == ("month", "2026-05-01", "2026-05-31")
+        assert len(data["days"]) == 31
+        assert data["days"]["2026-05-01"] == []
+        assert [(item["id"], item["is_start"], item["is_end"]) for item in data["days"]["2026-05-30"]] == [
+            (trip["id"], True, False),
+        ]
+        assert [item["id"] for item in data["days"]["2026-05-31"]] == [holiday["id"], trip["id"]]
+
+        june = client.get("/api/v1/calendars/views/month?month=2026-06", headers=auth_headers).json()["days"]
+        assert [(item["title"], item["is_end"]) for item in june["2026-06-02"]] == [("출장", True)]
+        assert [item["title"] for item in june["2026-06-03"]] == ["다음 달"]
+
+    def test_timezone_shifts_timed_events_only(self, client, auth_headers):
+        """시각 이벤트는 요청 시간대 날짜로, 종일 이벤트는 저장된 날짜 그대로"""
+        calendar_id = self._calendar(client, auth_headers)
+        self._event(client, auth_headers, calendar_id, "밤 회의", "2026-05-01T15:30:00", "2026-05-01T16:00:00")
+        self._event(
+            client, auth_headers, calendar_id, "기념일", "2026-05-01T00:00:00", "2026-05-02T00:00:00", is_all_day=True,
+        )
+
+        data = client.get("/api/v1/calendars/views/day?date=2026-05-02&tz=Asia/Seoul", headers=auth_headers).json()
+        assert data["timezone"] == "Asia/Seoul"
+        assert [(item["title"], item["start_at"]) for item in data["days"]["2026-05-02"]] == [
+            ("밤 회의", "2026-05-02T00:30:00"),
+        ]
+        data = client.get("/api/v1/calendars/views/day?date=2026-05-01&tz=Asia/Seoul", headers=auth_headers).json()
+        assert [item["title"] for item in data["days"]["2026-05-01"]] == ["기념일"]
+
+        response = client.get("/api/v1/calendars/views/day?tz=Mars/Olympus", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_week_view_spans_months_with_occurrences(self, client, auth_headers):
+        """월을 걸친 주, 반복 회차 포함, week_start 지원"""
+        calendar_id = self._calendar(client, auth_headers)
+        self._event(
+            client, auth_headers, calendar_id, "스탠드업", "2026-04-01T09:00:00", "2026-04-01T09:15:00",
+            rrule="FREQ=WEEKLY;BYDAY=MO,FR",
+        )
+
+        data = client.get("/api/v1/calendars/views/week?date=2026-04-29", headers=auth_headers).json()
+        assert (data["start"], data["end"]) == ("2026-04-27", "2026-05-03")
+        occurrences = {day: [item["recurrence_id"] for item in items] for day, items in data["days"].items() if items}
+        assert occurrences == {"2026-04-27": ["2026-04-27T09:00:00"], "2026-05-01": ["2026-05-01T09:00:00"]}
+
+        data = client.get("/api/v1/calendars/views/week?date=2026-04-29&week_start=sunday", headers=auth_headers).json()
+        assert (data["start"], data["end"]) == ("2026-04-26", "2026-05-02")
+
+    def test_cache_invalidated_on_write(self, client, auth_headers, admin_headers):
+        """캐시된 월 뷰는 이벤트 쓰기 후 다시 계산, 다른 사용자 이벤트는 제외"""
+        calendar_id = self._calendar(client, auth_headers)
+        other_calendar = self._calendar(client, admin_headers, "Other")
+        self._event(client, admin_headers, other_calendar, "남의 일정", "2026-05-04T09:00:00", "2026-05-04T10:00:00")
+        url = "/api/v1/calendars/views/month?month=2026-05"
+
+        first = client.get(url, headers=auth_headers)
+        assert first.json()["days"]["2026-05-04"] == []
+        cached = client.get(url, headers={**auth_headers, "If-None-Match": first.headers["etag"]})
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+
+        event = self._event(client, auth_headers, calendar_id, "새 일정", "2026-05-04T09:00:00", "2026-05-04T10:00:00")
+        assert [item["id"] for item in client.get(url, headers=auth_headers).json()["days"]["2026-05-04"]] == [event["id"]]
+
+        client.delete(f"/api/v1/events/{event['id']}", headers=auth_headers)
+        assert client.get(url, headers=auth_headers).json()["days"]["2026-05-04"] == []
+
+
+class TestCalendarICS:
+    """iCalendar 내보내기/가져오기 테스트"""
+
+    def _calendar(self, client, headers, title="ICS"):
+        return client.post("/api/v1/calendars", headers=headers, json={"title": title}).json()["id"]
+
+    def _seed(self, client, headers, calendar_id):
+        client.post("/api/v1/events", headers=headers, json={
+            "calendar_id": calendar_id, "title": "회의, 주간; 정리", "description": "안건\n" + "가" * 60,
+            "start_at": "2026-03-02T09:00:00", "end_at": "2026-03-02T10:00:00",
+        })
+        client.post("/api/v1/events", headers=headers, json={
+            "calendar_id": calendar_id, "title": "휴가", "is_all_day": True,
+            "start_at": "2026-03-05T00:00:00", "end_at": "2026-03-07T00:00:00",
+        })
+        master_id = client.post("/api/v1/events", headers=headers, json={
+            "calendar_id": calendar_id, "title": "스탠드업", "rrule": "FREQ=DAILY;UNTIL=20260305",
+            "start_at": "2026-03-02T08:00:00", "end_at": "2026-03-02T08:15:00",
+        }).json()["id"]
+        client.put(
+            f"/api/v1/events/{master_id}/occurrences/2026-03-03T08:00:00",
+            headers=headers, json={"title": "스탠드업 (연기)", "start_at": "2026-03-03T11:00:00"},
+        )
+        client.delete(f"/api/v1/events/{master_id}/occurrences/2026-03-04T08:00:00", headers=headers)
+        client.post("/api/v1/tasks", headers=headers, json={
+            "calendar_id": calendar_id, "title": "보고서", "due_at": "2026-03-06T18:00:00", "priority": "HIGH",
+        })
+
+    def _expanded(self, client, headers, calendar_id):
+        content = client.get(
+            f"/api/v1/events?expand=true&calendar_id={calendar_id}"
+            "&start_from=2026-03-01T00:00:00&start_to=2026-03-31T00:00:00",
+            headers=headers,
+        ).json()["content"]
+        return [(item["title"], item["start_at"], item["end_at"], item["is_all_day"]) for item in content]
+
+    def test_export_feed(self, client, auth_headers):
+        """RFC 5545 형식: CRLF, 줄 접기, 이스케이프, 종일/반복/회차 수정/작업"""
+        calendar_id = self._calendar(client, auth_headers)
+        self._seed(client, auth_headers, calendar_id)
+
+        response = client.get(f"/api/v1/calendars/{calendar_id}/ics", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/calendar")
+        body = response.content.decode("utf-8")
+        lines = body.split("\r\n")
+        assert lines[0] == "BEGIN:VCALENDAR" and lines[-2:] == ["END:VCALENDAR", ""]
+        assert all(len(line.encode("utf-8")) <= 75 for line in lines)
+        unfolded = body.replace("\r\n ", "")
+        assert "SUMMARY:회의\\, 주간\\; 정리" in unfolded
+        assert "DESCRIPTION:안건\\n" + "가" * 60 in unfolded
+        assert "DTSTART;VALUE=DATE:20260305\r\nDTEND;VALUE=DATE:20260307" in unfolded
+        assert "RRULE:FREQ=DAILY;UNTIL=20260305T235959Z" in unfolded
+        assert "RECURRENCE-ID:20260304T080000Z" in unfolded and "STATUS:CANCELLED" in unfolded
+        assert "BEGIN:VTODO" in unfolded and "PRIORITY:1" in unfolded
+
+    def test_round_trip(self, client, auth_headers):
+        """내보낸 ICS를 다른 캘린더로 가져오면 같은 일정"""
+        source = self._calendar(client, auth_headers, "Source")
+        self._seed(client, auth_headers, source)
+        feed = client.get(f"/api/v1/calendars/{source}/ics", headers=auth_headers).content
+
+        target = self._calendar(client, auth_headers, "Target")
+        response = client.post(
+            f"/api/v1/calendars/{target}/import",
+            headers={**auth_headers, "Content-Type": "text/calendar"},
+            content=feed,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        result = response.json()
+        assert (result["events"], result["tasks"], result["exceptions"], result["rejected_count"]) == (3, 1, 2, 0)
+        assert self._expanded(client, auth_headers, target) == self._expanded(client, auth_headers, source)
+        tasks = client.get(f"/api/v1/tasks?calendar_id={target}", headers=auth_headers).json()["content"]
+        assert [(task["title"], task["priority"]) for task in tasks] == [("보고서", "HIGH")]
+
+    def test_import_reports_rejected_entries(self, client, auth_headers, monkeypatch):
+        """변환할 수 없는 항목은 줄 번호/사유와 함께 건너뛰고 나머지는 청크마다 저장"""
+        import app.core.ics as ics
+
+        monkeypatch.setattr(ics, "IMPORT_CHUNK_SIZE", 2)
+        calendar_id = self._calendar(client, auth_headers)
+        feed = "\n".join([
+            "BEGIN:VCALENDAR",
+            "BEGIN:VTIMEZONE", "TZID:Asia/Seoul", "END:VTIMEZONE",
+            "BEGIN:VEVENT", "UID:a", "SUMMARY:서울 ", " 회의", "DTSTART;TZID=Asia/Seoul:20260402T090000", "DURATION:PT90M",
+            "BEGIN:VALARM", "TRIGGER:-PT10M", "SUMMARY:알림", "END:VALARM", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:b", "SUMMARY:시작 없음", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:c", "SUMMARY:매년", "DTSTART:20260402T000000Z", "RRULE:FREQ=YEARLY", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:d", "SUMMARY:이상한 시간대", "DTSTART;TZID=Mars/Base:20260402T090000", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:e", "RECURRENCE-ID:20260402T000000Z", "SUMMARY:고아", "DTSTART:20260402T000000Z", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:f", "SUMMARY:종일", "DTSTART;VALUE=DATE:20260403", "END:VEVENT",
+            "BEGIN:VTODO", "UID:g", "SUMMARY:끝낸 일", "STATUS:COMPLETED", "COMPLETED:20260401T100000Z", "END:VTODO",
+            "END:VCALENDAR",
+        ]).encode("utf-8")
+
+        result = client.post(f"/api/v1/calendars/{calendar_id}/import", headers=auth_headers, content=feed).json()
+        assert (result["events"], result["tasks"], result["chunks"]) == (2, 1, 4)
+        assert [(entry["uid"], entry["line"], entry["reason"]) for entry in result["rejected"]] == [
+            ("b", 16, "Missing DTSTART"),
+            ("c", 20, "Unsupported RRULE: FREQ must be one of DAILY, WEEKLY, MONTHLY"),
+            ("d", 26, "Unknown TZID: Mars/Base"),
+            ("e", 31, "RECURRENCE-ID without a recurring event earlier in the file"),
+        ]
+        events = client.get(f"/api/v1/events?calendar_id={calendar_id}", headers=auth_headers).json()["content"]
+        assert [(item["title"], item["start_at"], item["end_at"], item["is_all_day"]) for item in events] == [
+            ("서울 회의", "2026-04-02T00:00:00", "2026-04-02T01:30:00", False),
+            ("종일", "2026-04-03T00:00:00", "2026-04-04T00:00:00", True),
+        ]
+        task = client.get(f"/api/v1/tasks?calendar_id={calendar_id}", headers=auth_headers).json()["content"][0]
+        assert (task["status"], task["completed_at"]) == ("COMPLETED", "2026-04-01T10:00:00")
+
+    def test_import_rejected_exception_does_not_block_later_one(self, client, auth_headers, db):
+        """거부된 RECURRENCE-ID 항목 뒤의 같은 회차 항목은 저장, 취소 회차는 설명/장소 없이 저장"""
+        from app.models.event import EventException
+
+        calendar_id = self._calendar(client, auth_headers)
+        feed = "\n".join([
+            "BEGIN:VCALENDAR",
+            "BEGIN:VEVENT", "UID:m", "SUMMARY:스탠드업", "DTSTART:20260406T090000Z", "DURATION:PT15M",
+            "RRULE:FREQ=DAILY;COUNT=3", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:m", "RECURRENCE-ID:20260407T090000Z", "SUMMARY:" + "긴" * 300,
+            "DTSTART:20260407T100000Z", "DURATION:PT15M", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:m", "RECURRENCE-ID:20260407T090000Z", "SUMMARY:스탠드업 (연기)",
+            "DTSTART:20260407T100000Z", "DURATION:PT15M", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:m", "RECURRENCE-ID:20260408T090000Z", "STATUS:CANCELLED", "SUMMARY:스탠드업",
+            "DESCRIPTION:취소", "LOCATION:회의실", "DTSTART:20260408T090000Z", "DURATION:PT15M", "END:VEVENT",
+            "END:VCALENDAR",
+        ]).encode("utf-8")
+
+        result = client.post(f"/api/v1/calendars/{calendar_id}/import", headers=auth_headers, content=feed).json()
+        assert (result["events"], result["exceptions"]) == (1, 2)
+        assert [(entry["line"], entry["reason"]) for entry in result["rejected"]] == [
+            (9, "SUMMARY longer than 255 characters"),
+        ]
+        content = client.get(
+            f"/api/v1/events?expand=true&calendar_id={calendar_id}"
+            "&start_from=2026-04-01T00:00:00&start_to=2026-04-30T00:00:00",
+            headers=auth_headers,
+        ).json()["content"]
+        assert [(item["title"], item["start_at"]) for item in content] == [
+            ("스탠드업", "2026-04-06T09:00:00"), ("스탠드업 (연기)", "2026-04-07T10:00:00"),
+        ]
+        cancelled = db.query(EventException).filter_by(is_cancelled=True).one()
+        assert (cancelled.title, cancelled.description, cancelled.location) == (None, None, None)
+
+    def test_failed_import_still_refreshes_committed_chunks(self, client, auth_headers, monkeypatch):
+        """커밋한 청크가 있으면 요청이 오류로 끝나도 카운터/캘린더 버전 갱신"""
+        import app.core.ics as ics
+
+        monkeypatch.setattr(ics, "IMPORT_CHUNK_SIZE", 1)
+        close = ics.ICSReader.close
+
+        def close_without_calendar(reader):
+            done = close(reader)
+            reader.saw_calendar = False
+            return done
+
+        monkeypatch.setattr(ics.ICSReader, "close", close_without_calendar)
+        calendar_id = self._calendar(client, auth_headers)
+        url = "/api/v1/events?count=cached"
+        assert client.get(url, headers=auth_headers).json()["totalElements"] == 0
+        feed = "\n".join([
+            "BEGIN:VCALENDAR",
+            "BEGIN:VEVENT", "UID:a", "SUMMARY:하나", "DTSTART:20260402T000000Z", "END:VEVENT",
+            "BEGIN:VEVENT", "UID:b", "SUMMARY:둘", "DTSTART:20260403T000000Z", "END:VEVENT",
+        ]).encode("utf-8")
+
+        response = client.post(f"/api/v1/calendars/{calendar_id}/import", headers=auth_headers, content=feed)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert client.get(url, headers=auth_headers).json()["totalElements"] == 1
+
+    def test_import_requires_calendar_and_owner(self, client, auth_headers, admin_headers):
+        """VCALENDAR가 없으면 400, 남의 캘린더는 403"""
+        calendar_id = self._calendar(client, auth_headers)
+        response = client.post(f"/api/v1/calendars/{calendar_id}/import", headers=auth_headers, content=b"hello")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        other = self._calendar(client, admin_headers, "Admin")
+        response = client.post(
+            f"/api/v1/calendars/{other}/import", headers=auth_headers, content=b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n",
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        response = client.get(f"/api/v1/calendars/{other}/ics", headers=auth_headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
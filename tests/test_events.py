@@ -97,6 +97,15 @@ class TestGetEvents:
         data = response.json()
         assert "content" in data
     
+    def test_get_events_unsupported_sort(self, client, auth_headers):
+        """인덱스가 없는 필드/잘못된 방향 정렬은 400"""
+        for sort in ("description,ASC", "start_at,SIDEWAYS", "start_at,ASC,id"):
+            response = client.get("/api/v1/events", headers=auth_headers, params={"sort": sort})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.get("/api/v1/events", headers=auth_headers, params={"sort": "end_at"})
+        assert response.status_code == status.HTTP_200_OK
+
     def test_get_events_unauthorized(self, client):
         """인증 없이 조회 실패 (403)"""
         response = client.get("/api/v1/events")
@@ -240,3 +249,747 @@ class TestDeleteEvent:
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+
+
+class TestEventCursorPagination:
+    """이벤트 목록 커서 페이징 테스트"""
+
+    def _create_events(self, client, auth_headers, create_event, count):
+        calendar_id = client.post(
+            "/api/v1/calendars",
+            headers=auth_headers,
+            json={"title": "Cursor Calendar"},
+        ).json()["id"]
+        # 같은 시작 시간을 섞어 id 보조 정렬까지 확인
+        base = datetime(2026, 1, 1, 9, 0)
+        for i in range(count):
+            create_event(calendar_id, f"Event {i}", base + timedelta(hours=i // 2))
+
+    def test_cursor_walks_all_pages(self, client, auth_headers, create_event):
+        """next_cursor로 끝까지 조회하면 OFFSET 결과와 동일"""
+        self._create_events(client, auth_headers, create_event, 7)
+
+        offset_ids = [
+            event["id"]
+            for event in client.get("/api/v1/events?size=100", headers=auth_headers).json()["content"]
+        ]
+
+        cursor_ids = []
+        data = client.get("/api/v1/events?size=3", headers=auth_headers).json()
+        cursor_ids += [event["id"] for event in data["content"]]
+        while data["nextCursor"]:
+            data = client.get(
+                "/api/v1/events",
+                headers=auth_headers,
+                params={"size": 3, "cursor": data["nextCursor"]},
+            ).json()
+            cursor_ids += [event["id"] for event in data["content"]]
+
+        assert cursor_ids == offset_ids
+        assert len(cursor_ids) == 7
+
+    def test_cursor_desc_sort(self, client, auth_headers, create_event):
+        """내림차순 정렬에서도 커서가 이어짐"""
+        self._create_events(client, auth_headers, create_event, 5)
+        first = client.get("/api/v1/events?size=2&sort=start_at,DESC", headers=auth_headers).json()
+        second = client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"size": 2, "sort": "start_at,DESC", "cursor": first["nextCursor"]},
+        ).json()
+        third = client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"size": 2, "sort": "start_at,DESC", "cursor": second["nextCursor"]},
+        ).json()
+        starts = [event["start_at"] for event in first["content"] + second["content"] + third["content"]]
+        assert len(starts) == 5
+        assert starts == sorted(starts, reverse=True)
+        assert third["nextCursor"] is None
+
+    def test_tampered_cursor_rejected(self, client, auth_headers, create_event):
+        """변조되었거나 정렬이 다른 커서는 400"""
+        self._create_events(client, auth_headers, create_event, 3)
+        cursor = client.get("/api/v1/events?size=1", headers=auth_headers).json()["nextCursor"]
+
+        body, signature = cursor.split(".")
+        response = client.get(
+            "/api/v1/events", headers=auth_headers, params={"cursor": body[:-2] + "AA." + signature}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = client.get(
+            "/api/v1/events", headers=auth_headers, params={"size": 1, "sort": "end_at,ASC", "cursor": cursor}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        # 비ASCII 서명/본문도 500이 아닌 400
+        for garbage in (body + ".é", "é." + signature):
+            response = client.get("/api/v1/events", headers=auth_headers, params={"cursor": garbage})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestEventCountModes:
+    """이벤트 목록 전체 개수 조회 방식 테스트"""
+
+    def _calendar(self, client, auth_headers):
+        return client.post("/api/v1/calendars", headers=auth_headers, json={"title": "Count"}).json()["id"]
+
+    def test_count_none(self, client, auth_headers, create_event):
+        """count=none이면 전체 개수 생략"""
+        create_event(self._calendar(client, auth_headers), "Count Event")
+        data = client.get("/api/v1/events?count=none", headers=auth_headers).json()
+        assert data["countMode"] == "none"
+        assert data["totalElements"] is None
+        assert data["totalPages"] is None
+        assert len(data["content"]) == 1
+
+    def test_count_cached_bumped_on_write(self, client, auth_headers, create_event):
+        """count=cached: 첫 조회는 exact로 저장, 이후 생성/삭제 시 증감"""
+        calendar_id = self._calendar(client, auth_headers)
+        event_id = create_event(calendar_id, "Count Event")["id"]
+
+        first = client.get("/api/v1/events?count=cached", headers=auth_headers).json()
+        assert (first["countMode"], first["totalElements"]) == ("exact", 1)
+        second = client.get("/api/v1/events?count=cached", headers=auth_headers).json()
+        assert (second["countMode"], second["totalElements"]) == ("cached", 1)
+
+        create_event(calendar_id, "Count Event")
+        assert client.get("/api/v1/events?count=cached", headers=auth_headers).json()["totalElements"] == 2
+
+        client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+        assert client.get("/api/v1/events?count=cached", headers=auth_headers).json()["totalElements"] == 1
+
+    def test_count_cached_ignored_with_filters(self, client, auth_headers, create_event):
+        """필터가 있으면 카운터 대신 exact"""
+        create_event(self._calendar(client, auth_headers), "Count Event")
+        for _ in range(2):
+            data = client.get("/api/v1/events?count=cached&keyword=Count", headers=auth_headers).json()
+            assert data["countMode"] == "exact"
+
+    def test_count_estimate_falls_back_to_exact(self, client, auth_headers, create_event):
+        """통계가 없는 DB(SQLite)에서 estimate는 exact로 대체"""
+        create_event(self._calendar(client, auth_headers), "Count Event")
+        data = client.get("/api/v1/events?count=estimate", headers=auth_headers).json()
+        assert (data["countMode"], data["totalElements"]) == ("exact", 1)
+
+    def test_estimate_from_plan(self):
+        """EXPLAIN rows * filtered% 곱으로 추정"""
+        from app.core.counts import estimate_from_plan
+
+        plan = [{"rows": 10, "filtered": 100.0}, {"rows": 200, "filtered": 10.0}]
+        assert estimate_from_plan(plan) == 200
+
+
+class TestEventWindowCount:
+    """페이지 + 전체 개수 단일 조회 테스트"""
+
+    def _statements(self, count_statements, client, auth_headers, url):
+        with count_statements("FROM events") as statements:
+            data = client.get(url, headers=auth_headers).json()
+        return data, statements
+
+    def test_page_and_total_in_one_query(self, count_statements, client, auth_headers, create_event):
+        """exact 개수를 COUNT(*) OVER()로 페이지와 함께 조회"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "W"}).json()["id"]
+        start_at = datetime(2026, 1, 1, 9, 0)
+        for i in range(5):
+            create_event(calendar_id, f"Window {i}", start_at + timedelta(hours=i))
+
+        data, statements = self._statements(count_statements, client, auth_headers, "/api/v1/events?size=2&page=1&keyword=Window")
+        assert (data["totalElements"], data["totalPages"], len(data["content"])) == (5, 3, 2)
+        assert len(statements) == 1
+        assert "OVER ()" in statements[0]
+
+        # 범위를 벗어난 페이지는 개수만 따로 조회
+        data, statements = self._statements(count_statements, client, auth_headers, "/api/v1/events?size=2&page=9")
+        assert (data["totalElements"], data["content"]) == (5, [])
+
+
+class TestEventFields:
+    """fields= sparse fieldset 테스트"""
+
+    def _calendar(self, client, auth_headers):
+        return client.post("/api/v1/calendars", headers=auth_headers, json={"title": "F"}).json()["id"]
+
+    def test_list_fields_trims_response_and_select(self, count_statements, client, auth_headers, create_event):
+        """선택한 필드만 응답하고 description 컬럼을 읽지 않음"""
+        create_event(self._calendar(client, auth_headers), "Fields Event", description="long text " * 100)
+        with count_statements("FROM events") as statements:
+            response = client.get("/api/v1/events?fields=title,start_at,end_at", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["totalElements"] == 1
+        assert set(data["content"][0]) == {"id", "title", "start_at", "end_at"}
+        assert statements and all("events.description" not in s for s in statements)
+
+    def test_detail_fields(self, client, auth_headers, create_event):
+        """상세 조회 fields"""
+        event_id = create_event(self._calendar(client, auth_headers), "Fields Event")["id"]
+        response = client.get(f"/api/v1/events/{event_id}?fields=title", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"id": event_id, "title": "Fields Event"}
+
+    def test_unknown_field_rejected(self, client, auth_headers):
+        """응답에 없는 필드는 400"""
+        response = client.get("/api/v1/events?fields=title,password", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestEventListETag:
+    """캘린더별 이벤트 목록 조건부 GET 테스트"""
+
+    def test_calendar_events_not_modified_until_write(self, count_statements, client, auth_headers, create_event):
+        """If-None-Match 일치 시 페이지 쿼리 없이 304, 이벤트 생성 후 200"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "E"}).json()["id"]
+        url = f"/api/v1/events?calendar_id={calendar_id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        with count_statements("FROM events") as statements:
+            cached = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+        assert statements == []
+
+        create_event(calendar_id, "New")
+        changed = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert changed.status_code == status.HTTP_200_OK
+        assert len(changed.json()["content"]) == 1
+
+
+class TestEventExport:
+    """이벤트 전체 내보내기 테스트"""
+
+    def _setup(self, client, headers, create_event, count=7):
+        calendar_id = client.post("/api/v1/calendars", headers=headers, json={"title": "X"}).json()["id"]
+        start_at = datetime(2026, 1, 1, 9, 0)
+        for i in range(count):
+            create_event(calendar_id, f"Export {i}", start_at + timedelta(days=i), is_all_day=i % 2 == 0, headers=headers)
+        return calendar_id
+
+    def test_export_ndjson_streams_all_rows(self, client, auth_headers, monkeypatch, create_event):
+        """배치 크기와 무관하게 정렬된 전체 행을 NDJSON으로 반환"""
+        import json
+        import app.core.export as export_module
+
+        monkeypatch.setattr(export_module, "EXPORT_BATCH_SIZE", 3)
+        self._setup(client, auth_headers, create_event)
+        response = client.get("/api/v1/events/export", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["title"] for row in rows] == [f"Export {i}" for i in range(7)]
+
+    def test_export_csv_with_filters_and_fields(self, client, auth_headers, create_event):
+        """목록과 같은 필터 + fields 적용 CSV"""
+        import csv
+        import io
+
+        self._setup(client, auth_headers, create_event)
+        response = client.get(
+            "/api/v1/events/export?format=csv&is_all_day=true&fields=title,start_at&sort=start_at,DESC",
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert list(rows[0]) == ["title", "start_at", "id"]
+        assert [row["title"] for row in rows] == ["Export 6", "Export 4", "Export 2", "Export 0"]
+
+    def test_export_only_own_events(self, client, auth_headers, admin_headers, create_event):
+        """다른 사용자의 이벤트는 내보내지 않음"""
+        self._setup(client, admin_headers, create_event, count=2)
+        response = client.get("/api/v1/events/export", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.text == ""
+
+
+class TestEventKeywordSearch:
+    """keyword 전문 검색 테스트 (SQLite FTS5 trigram)"""
+
+    def test_keyword_uses_fts_and_follows_updates(self, count_statements, client, auth_headers, create_event):
+        """3자 이상 키워드는 events_fts로 검색하고 수정 내용이 바로 반영됨"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "주간 회의록 정리")["id"]
+        create_event(calendar_id, "점심 약속")
+
+        with count_statements() as statements:
+            response = client.get("/api/v1/events?keyword=회의록", headers=auth_headers)
+        assert [item["id"] for item in response.json()["content"]] == [event_id]
+        assert any("events_fts MATCH" in s for s in statements)
+
+        client.put(f"/api/v1/events/{event_id}", headers=auth_headers, json={"title": "분기 보고"})
+        assert client.get("/api/v1/events?keyword=회의록", headers=auth_headers).json()["content"] == []
+        assert client.get("/api/v1/events?keyword=보고", headers=auth_headers).json()["totalElements"] == 1
+
+    def test_latin_keyword_matches_substring_only(self, client, auth_headers, create_event):
+        """라틴 문자 키워드도 부분 문자열이 일치하는 행만 반환"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "L"}).json()["id"]
+        event_id = create_event(calendar_id, "Quarterly data review")["id"]
+        create_event(calendar_id, "Team lunch", description="bring the dat-a sheet")
+
+        response = client.get("/api/v1/events?keyword=data", headers=auth_headers)
+        assert [item["id"] for item in response.json()["content"]] == [event_id]
+
+    def test_relevance_sort(self, client, auth_headers, create_event):
+        """sort=relevance는 일치 횟수가 많은 이벤트를 먼저 반환"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        weak = create_event(calendar_id, "디자인 리뷰", description="참고 자료 없음")["id"]
+        strong = create_event(
+            calendar_id, "디자인 리뷰 2차", datetime(2026, 1, 2, 9, 0), description="디자인 리뷰 후속 디자인 리뷰",
+        )["id"]
+
+        response = client.get("/api/v1/events?keyword=디자인 리뷰&sort=relevance", headers=auth_headers)
+        data = response.json()
+        assert [item["id"] for item in data["content"]] == [strong, weak]
+        assert data["nextCursor"] is None
+
+    def test_relevance_requires_keyword(self, client, auth_headers):
+        """keyword 없는 sort=relevance는 400"""
+        response = client.get("/api/v1/events?sort=relevance", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_mysql_compiles_to_match_against(self, db):
+        """MySQL에서는 events_fts 보조 테이블 MATCH ... AGAINST (ngram)"""
+        from sqlalchemy.dialects import mysql
+        from app.db.fulltext import keyword_criterion
+        from app.models.calendar import Calendar
+        from app.models.event import Event
+
+        events_sql = str(keyword_criterion(Event, "회의록", "mysql").compile(dialect=mysql.dialect()))
+        assert "events_fts" in events_sql and "MATCH" in events_sql and "IN BOOLEAN MODE" in events_sql
+        calendar_sql = str(keyword_criterion(Calendar, "회의록", "mysql").compile(dialect=mysql.dialect()))
+        assert "MATCH (calendars.title, calendars.description)" in calendar_sql
+        # n-gram 구문 일치 후 부분 문자열 재확인
+        assert "LIKE" in events_sql and "LIKE" in calendar_sql
+        assert "LIKE" in str(keyword_criterion(Event, "회", "mysql").compile(dialect=mysql.dialect()))
+
+
+class TestEventSearchIndex:
+    """사용자별 역색인 검색 테스트 (SEARCH_BACKEND=index, 프로세스 내 저장소)"""
+
+    @pytest.fixture(autouse=True)
+    def index_backend(self, monkeypatch):
+        from app.core.config import settings
+        from app.db.search_index import local_store
+
+        from app.db import generations
+
+        monkeypatch.setattr(settings, "SEARCH_BACKEND", "index")
+        monkeypatch.setattr(settings, "SEARCH_INDEX_STORE", "local")
+        # 백그라운드 생성을 바로 실행 (인메모리 SQLite 연결을 스레드 간에 공유하지 않도록)
+        monkeypatch.setattr(generations, "run_in_background", lambda job: job())
+        local_store.clear()
+        yield local_store
+        local_store.clear()
+
+    def test_tokenize_bigrams(self):
+        """단어 안의 bigram, 한 글자 단어는 토큰 없음"""
+        from app.db.search_index import tokenize
+
+        assert tokenize("회의록 A", None) == {"회의", "의록"}
+
+    def test_one_letter_word_matches_inside_longer_word(self, client, auth_headers, index_backend, create_event):
+        """키워드의 한 글자 단어가 문서에서 긴 단어의 일부여도 LIKE와 같은 결과"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "우리팀 회의")["id"]
+        create_event(calendar_id, "팀장 면담")
+
+        client.get("/api/v1/events?keyword=회의", headers=auth_headers)
+        assert any(key.endswith(f":events:d:{event_id}") for key in index_backend.scan_iter("sidx:*"))
+        response = client.get("/api/v1/events", headers=auth_headers, params={"keyword": "팀 회의"})
+        assert [item["id"] for item in response.json()["content"]] == [event_id]
+        response = client.get("/api/v1/events", headers=auth_headers, params={"keyword": "a 팀"})
+        assert response.json()["content"] == []
+
+    def test_keyword_uses_index_and_follows_writes(self, client, auth_headers, index_backend, create_event):
+        """생성/수정/삭제가 색인에 증분 반영되고 후보는 LIKE로 다시 확인"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "주간 회의록 정리")["id"]
+        create_event(calendar_id, "록의회 순서 뒤섞임")
+
+        response = client.get("/api/v1/events?keyword=회의록", headers=auth_headers)
+        assert [item["id"] for item in response.json()["content"]] == [event_id]
+        assert any(key.endswith(f":events:d:{event_id}") for key in index_backend.scan_iter("sidx:*"))
+
+        client.put(f"/api/v1/events/{event_id}", headers=auth_headers, json={"title": "분기 보고"})
+        assert client.get("/api/v1/events?keyword=회의록", headers=auth_headers).json()["content"] == []
+        assert client.get("/api/v1/events?keyword=보고", headers=auth_headers).json()["totalElements"] == 1
+
+        client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+        assert not any(f":d:{event_id}" in key for key in index_backend.scan_iter("sidx:*"))
+
+    def test_missing_index_is_rebuilt(self, client, auth_headers, index_backend, create_event):
+        """색인이 없으면(저장소 초기화, 캘린더 삭제) 첫 조회 시 DB에서 다시 생성"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "프로젝트 킥오프")["id"]
+        index_backend.clear()
+
+        response = client.get("/api/v1/events?keyword=킥오프", headers=auth_headers)
+        assert [item["id"] for item in response.json()["content"]] == [event_id]
+
+        client.delete(f"/api/v1/calendars/{calendar_id}", headers=auth_headers)
+        assert client.get("/api/v1/events?keyword=킥오프", headers=auth_headers).json()["content"] == []
+        assert not any(":events:d:" in key for key in index_backend.scan_iter("sidx:*"))
+
+    def test_rebuild(self, db, client, auth_headers, test_user, index_backend, create_event):
+        """rebuild는 사용자 문서를 배치로 다시 색인"""
+        from app.db.search_index import rebuild
+
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        for title in ("첫 일정", "둘째 일정", "셋째 일정"):
+            create_event(calendar_id, title)
+        index_backend.clear()
+
+        assert rebuild(db, index_backend, batch_size=2) == 4
+        assert index_backend.get(f"sidx:{test_user.id}:gen") is not None
+
+    def test_writes_during_build_reach_new_generation(self, client, auth_headers, test_user, index_backend, monkeypatch, create_event):
+        """생성이 읽은 뒤에 커밋된 쓰기도 새 세대에 남고, 생성 중 두 번째 생성은 예약되지 않음"""
+        from app.db import generations, search_index
+
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        jobs = []
+        monkeypatch.setattr(generations, "run_in_background", jobs.append)
+
+        # 첫 조회는 생성을 예약하고 DB 검색으로 응답
+        assert client.get("/api/v1/events?keyword=킥오프", headers=auth_headers).json()["content"] == []
+        client.get("/api/v1/events?keyword=킥오프", headers=auth_headers)
+        assert len(jobs) == 1
+
+        # 생성이 DB를 읽기 전 스냅샷처럼 이벤트를 보지 못해도 증분 쓰기가 새 세대에 반영
+        event_id = create_event(calendar_id, "프로젝트 킥오프")["id"]
+        removed_id = create_event(calendar_id, "킥오프 취소")["id"]
+        client.delete(f"/api/v1/events/{removed_id}", headers=auth_headers)
+        owner_rows = search_index._owner_rows
+        monkeypatch.setattr(
+            search_index, "_owner_rows",
+            lambda db, model, owner_id, batch_size: iter([[(removed_id, "킥오프 취소", None, None)]])
+            if model.__tablename__ == "events" else owner_rows(db, model, owner_id, batch_size),
+        )
+        jobs[0]()
+
+        assert search_index.candidate_ids(None, None, "events", test_user.id, "킥오프") == [event_id]
+
+    def test_lookup_uses_injected_client(self, test_user, monkeypatch):
+        """조회는 쓰기와 같은 (주입된) 클라이언트를 사용"""
+        from app.core.config import settings
+        from app.db import search_index
+        from app.db.search_index import LocalIndexStore
+
+        monkeypatch.setattr(settings, "SEARCH_INDEX_STORE", "redis")
+        monkeypatch.setattr("app.db.redis.get_redis", lambda: (_ for _ in ()).throw(AssertionError("global client")))
+        store = LocalIndexStore()
+        store.set(f"sidx:{test_user.id}:gen", "g1")
+        store.sadd(f"sidx:{test_user.id}:g1:events:t:킥오", "e1")
+        store.sadd(f"sidx:{test_user.id}:g1:events:t:오프", "e1")
+
+        assert search_index.candidate_ids(None, store, "events", test_user.id, "킥오프") == ["e1"]
+
+
+class TestRecurringEvents:
+    """반복 이벤트 (RRULE) 전개 테스트"""
+
+    def _expand(self, client, auth_headers, start_from, start_to, **params):
+        query = "&".join(f"{key}={value}" for key, value in params.items())
+        return client.get(
+            f"/api/v1/events?expand=true&start_from={start_from.isoformat()}&start_to={start_to.isoformat()}&{query}",
+            headers=auth_headers,
+        )
+
+    def test_expand_window_merges_single_events(self, client, auth_headers, create_event):
+        """구간 안의 회차만 전개하고 단일 이벤트와 시작 시각 순으로 병합"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        master = create_event(calendar_id, "주간 회의", datetime(2026, 1, 5, 9, 0), rrule="freq=weekly;byday=we,mo;count=4")
+        assert master["rrule"] == "FREQ=WEEKLY;BYDAY=MO,WE;COUNT=4"
+        single_id = create_event(calendar_id, "점심", datetime(2026, 1, 8, 12, 0))["id"]
+
+        data = self._expand(client, auth_headers, datetime(2026, 1, 1), datetime(2026, 1, 31)).json()
+        assert [(item["id"], item["start_at"]) for item in data["content"]] == [
+            (master["id"], "2026-01-05T09:00:00"),
+            (master["id"], "2026-01-07T09:00:00"),
+            (single_id, "2026-01-08T12:00:00"),
+            (master["id"], "2026-01-12T09:00:00"),
+            (master["id"], "2026-01-14T09:00:00"),
+        ]
+        assert data["content"][1]["recurrence_id"] == "2026-01-07T09:00:00"
+        assert data["content"][1]["end_at"] == "2026-01-07T10:00:00"
+        assert data["totalElements"] == 5
+
+        page = self._expand(client, auth_headers, datetime(2026, 1, 1), datetime(2026, 1, 31), page=1, size=2).json()
+        assert [item["start_at"] for item in page["content"]] == ["2026-01-08T12:00:00", "2026-01-12T09:00:00"]
+
+        # expand 없이 조회하면 마스터 한 행
+        plain = client.get(f"/api/v1/events?calendar_id={calendar_id}", headers=auth_headers).json()
+        assert plain["totalElements"] == 2
+
+    def test_occurrence_exceptions(self, client, auth_headers, create_event):
+        """회차 하나의 수정/취소는 예외로 저장되어 전개 결과에 반영"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        event_id = create_event(calendar_id, "스탠드업", datetime(2026, 3, 2, 9, 0), rrule="FREQ=DAILY;COUNT=3")["id"]
+
+        response = client.put(
+            f"/api/v1/events/{event_id}/occurrences/2026-03-03T09:00:00",
+            headers=auth_headers,
+            json={"title": "스탠드업 (연기)", "start_at": "2026-03-03T11:00:00"},
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = client.delete(f"/api/v1/events/{event_id}/occurrences/2026-03-04T09:00:00", headers=auth_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = client.delete(f"/api/v1/events/{event_id}/occurrences/2026-03-04T10:00:00", headers=auth_headers)
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        content = self._expand(client, auth_headers, datetime(2026, 3, 1), datetime(2026, 3, 31)).json()["content"]
+        assert [(item["title"], item["start_at"], item["end_at"], item["recurrence_id"]) for item in content] == [
+            ("스탠드업", "2026-03-02T09:00:00", "2026-03-02T10:00:00", "2026-03-02T09:00:00"),
+            ("스탠드업 (연기)", "2026-03-03T11:00:00", "2026-03-03T12:00:00", "2026-03-03T09:00:00"),
+        ]
+
+        # 규칙이 바뀌면 기존 예외는 삭제
+        client.put(f"/api/v1/events/{event_id}", headers=auth_headers, json={"rrule": "FREQ=DAILY;COUNT=4"})
+        content = self._expand(client, auth_headers, datetime(2026, 3, 1), datetime(2026, 3, 31)).json()["content"]
+        assert [item["title"] for item in content] == ["스탠드업"] * 4
+
+    def test_unbounded_rule_expands_far_window(self, client, auth_headers, create_event):
+        """끝이 없는 규칙도 먼 구간의 회차만 계산"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        create_event(calendar_id, "매일", datetime(2026, 1, 1, 8, 0), rrule="FREQ=DAILY;INTERVAL=2")
+
+        data = self._expand(client, auth_headers, datetime(2036, 1, 1), datetime(2036, 1, 6, 23, 59)).json()
+        assert [item["start_at"] for item in data["content"]] == [
+            "2036-01-01T08:00:00", "2036-01-03T08:00:00", "2036-01-05T08:00:00",
+        ]
+
+    def test_timezone_aware_window(self, client, auth_headers, create_event):
+        """시간대가 있는 구간(...Z, +09:00)과 recurrence_id는 UTC로 변환해 전개"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        event_id = create_event(calendar_id, "스탠드업", datetime(2026, 1, 5, 9, 0), rrule="FREQ=DAILY;COUNT=3")["id"]
+
+        response = client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"expand": "true", "start_from": "2026-01-05T00:00:00Z", "start_to": "2026-01-08T00:00:00Z"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["start_at"] for item in response.json()["content"]] == [
+            "2026-01-05T09:00:00", "2026-01-06T09:00:00", "2026-01-07T09:00:00",
+        ]
+
+        # 2026-01-06T18:00+09:00 = 2026-01-06T09:00Z
+        response = client.delete(f"/api/v1/events/{event_id}/occurrences/2026-01-06T18:00:00+09:00", headers=auth_headers)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = client.get(
+            "/api/v1/events",
+            headers=auth_headers,
+            params={"expand": "true", "start_from": "2026-01-06T09:00:00+09:00", "start_to": "2026-01-08T00:00:00Z"},
+        )
+        assert [item["start_at"] for item in response.json()["content"]] == ["2026-01-07T09:00:00"]
+
+    def test_monthly_skips_missing_days(self):
+        """MONTHLY는 해당 날짜가 없는 달을 건너뜀, UNTIL은 그날 포함"""
+        from app.core.recurrence import expand, parse_rrule
+
+        rule = parse_rrule("FREQ=MONTHLY;UNTIL=20260531")
+        starts = expand(rule, datetime(2026, 1, 31, 9, 0), datetime(2026, 1, 1), datetime(2026, 12, 31))
+        assert starts == [datetime(2026, 1, 31, 9, 0), datetime(2026, 3, 31, 9, 0), datetime(2026, 5, 31, 9, 0)]
+
+    def test_invalid_requests(self, client, auth_headers, create_event):
+        """잘못된 규칙, 구간 없는 expand는 400"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "R"}).json()["id"]
+        for rrule in ("FREQ=YEARLY", "FREQ=DAILY;COUNT=5000"):
+            create_event(calendar_id, "X", datetime(2026, 1, 1), rrule=rrule, expect=status.HTTP_400_BAD_REQUEST)
+
+        response = client.get("/api/v1/events?expand=true", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestEventConflicts:
+    """겹침 확인 (check_conflicts) 테스트"""
+
+    def _calendar(self, client, auth_headers, title="C"):
+        return client.post("/api/v1/calendars", headers=auth_headers, json={"title": title}).json()["id"]
+
+    def test_conflict_returns_409_without_writing(self, client, auth_headers, create_event):
+        """겹치면 409와 겹치는 이벤트 목록, 이벤트는 저장되지 않음"""
+        calendar_id = self._calendar(client, auth_headers)
+        existing = create_event(calendar_id, "회의", datetime(2026, 5, 1, 9, 0), datetime(2026, 5, 1, 10, 0))
+
+        body = create_event(
+            calendar_id, "새 회의", datetime(2026, 5, 1, 9, 30), datetime(2026, 5, 1, 11, 0),
+            params="?check_conflicts=true", expect=status.HTTP_409_CONFLICT,
+        )
+        assert [item["id"] for item in body["details"]["conflicts"]] == [existing["id"]]
+        assert client.get(f"/api/v1/events?calendar_id={calendar_id}", headers=auth_headers).json()["totalElements"] == 1
+
+        # 맞닿은 구간은 겹치지 않음, 옵션이 없으면 확인하지 않음
+        create_event(
+            calendar_id, "다음 회의", datetime(2026, 5, 1, 10, 0), datetime(2026, 5, 1, 11, 0),
+            params="?check_conflicts=true",
+        )
+        create_event(calendar_id, "겹치는 회의", datetime(2026, 5, 1, 9, 30), datetime(2026, 5, 1, 10, 30))
+
+    def test_multi_day_event_buckets(self, client, auth_headers, db, create_event):
+        """여러 날에 걸친 이벤트는 날짜마다 버킷을 두어 중간 날짜에서도 찾음, 삭제 시 버킷도 삭제"""
+        from app.models.event import EventDayBucket
+
+        calendar_id = self._calendar(client, auth_headers)
+        trip = create_event(calendar_id, "출장", datetime(2026, 6, 1, 8, 0), datetime(2026, 6, 4, 0, 0))
+        days = [row.day.isoformat() for row in db.query(EventDayBucket).filter_by(event_id=trip["id"]).order_by(EventDayBucket.day)]
+        assert days == ["2026-06-01", "2026-06-02", "2026-06-03"]
+
+        create_event(
+            calendar_id, "미팅", datetime(2026, 6, 2, 14, 0), datetime(2026, 6, 2, 15, 0),
+            params="?check_conflicts=true", expect=status.HTTP_409_CONFLICT,
+        )
+        create_event(
+            calendar_id, "미팅", datetime(2026, 6, 4, 9, 0), datetime(2026, 6, 4, 10, 0),
+            params="?check_conflicts=true",
+        )
+
+        client.delete(f"/api/v1/events/{trip['id']}", headers=auth_headers)
+        assert db.query(EventDayBucket).filter_by(event_id=trip["id"]).count() == 0
+
+    def test_update_excludes_itself_and_moves_buckets(self, client, auth_headers, create_event):
+        """수정 시 자기 자신은 겹침에서 제외, 옮긴 시각으로 다시 확인"""
+        calendar_id = self._calendar(client, auth_headers)
+        first = create_event(calendar_id, "A", datetime(2026, 7, 1, 9, 0), datetime(2026, 7, 1, 10, 0))
+        second = create_event(calendar_id, "B", datetime(2026, 7, 2, 9, 0), datetime(2026, 7, 2, 10, 0))
+
+        response = client.put(
+            f"/api/v1/events/{first['id']}?check_conflicts=true",
+            headers=auth_headers,
+            json={"end_at": datetime(2026, 7, 1, 11, 0).isoformat()},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.put(
+            f"/api/v1/events/{second['id']}?check_conflicts=true",
+            headers=auth_headers,
+            json={"start_at": datetime(2026, 7, 1, 10, 30).isoformat(), "end_at": datetime(2026, 7, 1, 12, 0).isoformat()},
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert [item["id"] for item in response.json()["details"]["conflicts"]] == [first["id"]]
+
+        # 첫 이벤트를 옮기면 이전 날짜 버킷이 사라져 더 이상 겹치지 않음
+        client.put(
+            f"/api/v1/events/{first['id']}",
+            headers=auth_headers,
+            json={"start_at": datetime(2026, 7, 3, 9, 0).isoformat(), "end_at": datetime(2026, 7, 3, 10, 0).isoformat()},
+        )
+        create_event(
+            calendar_id, "C", datetime(2026, 7, 1, 9, 0), datetime(2026, 7, 1, 10, 0), params="?check_conflicts=true",
+        )
+
+    def test_user_scope_checks_all_calendars(self, client, auth_headers, create_event):
+        """conflict_scope=user는 소유자의 모든 캘린더에서 확인"""
+        work = self._calendar(client, auth_headers, "Work")
+        home = self._calendar(client, auth_headers, "Home")
+        create_event(work, "회의", datetime(2026, 8, 3, 9, 0), datetime(2026, 8, 3, 10, 0))
+
+        create_event(
+            home, "병원", datetime(2026, 8, 3, 9, 0), datetime(2026, 8, 3, 9, 30), params="?check_conflicts=true",
+        )
+        body = create_event(
+            home, "약속", datetime(2026, 8, 3, 9, 0), datetime(2026, 8, 3, 9, 30),
+            params="?check_conflicts=true&conflict_scope=user", expect=status.HTTP_409_CONFLICT,
+        )
+        assert len(body["details"]["conflicts"]) == 2
+
+    def test_recurring_occurrence_conflict(self, client, auth_headers, create_event):
+        """반복 이벤트는 구간과 겹치는 회차를 전개해 확인"""
+        calendar_id = self._calendar(client, auth_headers)
+        master = create_event(
+            calendar_id, "스탠드업", datetime(2026, 9, 1, 9, 0), datetime(2026, 9, 1, 9, 15), rrule="FREQ=DAILY",
+        )
+
+        body = create_event(
+            calendar_id, "면접", datetime(2026, 9, 20, 9, 10), datetime(2026, 9, 20, 10, 0),
+            params="?check_conflicts=true", expect=status.HTTP_409_CONFLICT,
+        )
+        conflict = body["details"]["conflicts"][0]
+        assert (conflict["id"], conflict["recurrence_id"]) == (master["id"], "2026-09-20T09:00:00")
+
+        create_event(
+            calendar_id, "면접", datetime(2026, 9, 20, 9, 15), datetime(2026, 9, 20, 10, 0),
+            params="?check_conflicts=true",
+        )
+
+    def test_new_series_checks_every_occurrence(self, client, auth_headers, create_event):
+        """새 반복 이벤트는 첫 회차뿐 아니라 이후 회차도 확인"""
+        calendar_id = self._calendar(client, auth_headers)
+        blocker = create_event(calendar_id, "세미나", datetime(2026, 10, 12, 9, 30), datetime(2026, 10, 12, 10, 30))
+
+        # 2주차(10/12)부터 겹치는 주간 반복
+        body = create_event(
+            calendar_id, "주간 회의", datetime(2026, 10, 5, 9, 0), datetime(2026, 10, 5, 10, 0),
+            rrule="FREQ=WEEKLY;COUNT=4", params="?check_conflicts=true", expect=status.HTTP_409_CONFLICT,
+        )
+        assert [item["id"] for item in body["details"]["conflicts"]] == [blocker["id"]]
+        assert client.get(f"/api/v1/events?calendar_id={calendar_id}", headers=auth_headers).json()["totalElements"] == 1
+
+        # 회차 사이에 있는 이벤트는 겹치지 않음
+        create_event(
+            calendar_id, "격주 회의", datetime(2026, 10, 5, 9, 0), datetime(2026, 10, 5, 10, 0),
+            rrule="FREQ=WEEKLY;INTERVAL=2;COUNT=4", params="?check_conflicts=true",
+        )
+
+        # 단일 이벤트를 반복으로 바꿀 때도 회차마다 확인
+        single = create_event(calendar_id, "점검", datetime(2026, 10, 6, 9, 0), datetime(2026, 10, 6, 10, 0))
+        response = client.put(
+            f"/api/v1/events/{single['id']}?check_conflicts=true",
+            headers=auth_headers,
+            json={"rrule": "FREQ=DAILY;COUNT=10"},
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert client.get(f"/api/v1/events/{single['id']}", headers=auth_headers).json()["rrule"] is None
+
+    def test_occurrence_edit_conflict(self, client, auth_headers, create_event):
+        """회차 하나를 옮길 때 check_conflicts로 옮긴 시각 확인 (같은 반복의 다른 회차는 제외)"""
+        calendar_id = self._calendar(client, auth_headers)
+        master = create_event(
+            calendar_id, "스탠드업", datetime(2026, 11, 2, 9, 0), datetime(2026, 11, 2, 9, 15),
+            rrule="FREQ=DAILY;COUNT=5",
+        )
+        lunch = create_event(calendar_id, "점심", datetime(2026, 11, 3, 12, 0), datetime(2026, 11, 3, 13, 0))
+
+        url = f"/api/v1/events/{master['id']}/occurrences/2026-11-03T09:00:00?check_conflicts=true"
+        response = client.put(url, headers=auth_headers, json={"start_at": "2026-11-03T12:30:00"})
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert [item["id"] for item in response.json()["details"]["conflicts"]] == [lunch["id"]]
+
+        response = client.put(url, headers=auth_headers, json={"start_at": "2026-11-04T09:05:00"})
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_timezone_aware_times(self, client, auth_headers, create_event):
+        """시간대가 있는 시각(...Z, +09:00)은 UTC로 변환해 반복 회차와 비교"""
+        calendar_id = self._calendar(client, auth_headers)
+        master = create_event(
+            calendar_id, "스탠드업", datetime(2026, 1, 5, 9, 0), datetime(2026, 1, 5, 9, 30), rrule="FREQ=DAILY;COUNT=5",
+        )
+
+        def post(start_at, end_at):
+            return client.post(
+                "/api/v1/events?check_conflicts=true",
+                headers=auth_headers,
+                json={"calendar_id": calendar_id, "title": "면담", "start_at": start_at, "end_at": end_at},
+            )
+
+        response = post("2026-01-06T12:00:00Z", "2026-01-06T13:00:00Z")
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["start_at"] == "2026-01-06T12:00:00"
+
+        # 2026-01-07T18:15+09:00 = 2026-01-07T09:15Z
+        response = post("2026-01-07T18:15:00+09:00", "2026-01-07T19:00:00+09:00")
+        assert response.status_code == status.HTTP_409_CONFLICT
+        conflict = response.json()["details"]["conflicts"][0]
+        assert (conflict["id"], conflict["recurrence_id"]) == (master["id"], "2026-01-07T09:00:00")
+
+        other = create_event(calendar_id, "점심", datetime(2026, 1, 8, 12, 0))
+        response = client.put(
+            f"/api/v1/events/{other['id']}?check_conflicts=true",
+            headers=auth_headers,
+            json={"start_at": "2026-01-08T09:00:00Z", "end_at": "2026-01-08T10:00:00Z"},
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
@@ -0,0 +1,113 @@
+"""
+Free/busy 관련 테스트
+"""
+import pytest
+from fastapi import status
+from datetime import datetime, timedelta
+
+
+class TestFreeBusy:
+    """Free/busy 조회 테스트"""
+
+    def test_merges_across_calendars(self, client, auth_headers, test_user, create_event):
+        """여러 캘린더의 겹치거나 맞닿은 구간을 병합하고 구간 경계로 자름"""
+        first = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "A"}).json()["id"]
+        second = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "B"}).json()["id"]
+        day = datetime(2026, 2, 2)
+        create_event(first, "busy", day + timedelta(hours=9), hours=2)     # 09-11
+        create_event(second, "busy", day + timedelta(hours=10), hours=2)   # 10-12
+        create_event(first, "busy", day + timedelta(hours=12))             # 12-13 (맞닿음)
+        create_event(second, "busy", day + timedelta(hours=15))            # 15-16
+        create_event(first, "busy", day - timedelta(hours=2), hours=3)     # 전날 22 - 01
+
+        response = client.post(
+            "/api/v1/freebusy",
+            headers=auth_headers,
+            json={"time_min": day.isoformat(), "time_max": (day + timedelta(days=1)).isoformat(), "user_ids": [test_user.id]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["calendars"] == 2
+        assert data["busy"] == [
+            {"start": "2026-02-02T00:00:00", "end": "2026-02-02T01:00:00"},
+            {"start": "2026-02-02T09:00:00", "end": "2026-02-02T13:00:00"},
+            {"start": "2026-02-02T15:00:00", "end": "2026-02-02T16:00:00"},
+        ]
+
+    def test_includes_recurring_occurrences(self, client, auth_headers, create_event):
+        """반복 이벤트는 구간 안의 회차로 계산"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "A"}).json()["id"]
+        create_event(calendar_id, "busy", datetime(2026, 1, 1, 9, 0), rrule="FREQ=DAILY")
+
+        response = client.post(
+            "/api/v1/freebusy",
+            headers=auth_headers,
+            json={"time_min": "2026-03-10T00:00:00", "time_max": "2026-03-12T00:00:00", "calendar_ids": [calendar_id]},
+        )
+        assert response.json()["busy"] == [
+            {"start": "2026-03-10T09:00:00", "end": "2026-03-10T10:00:00"},
+            {"start": "2026-03-11T09:00:00", "end": "2026-03-11T10:00:00"},
+        ]
+
+    def test_timezone_aware_window(self, client, auth_headers, create_event):
+        """시간대가 있는 구간(...Z, +09:00)은 UTC로 변환해 계산"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "A"}).json()["id"]
+        create_event(calendar_id, "busy", datetime(2026, 1, 5, 9, 0), rrule="FREQ=DAILY;COUNT=3")
+        create_event(calendar_id, "busy", datetime(2026, 1, 6, 12, 0))
+
+        response = client.post(
+            "/api/v1/freebusy",
+            headers=auth_headers,
+            json={"time_min": "2026-01-05T00:00:00Z", "time_max": "2026-01-08T00:00:00Z", "calendar_ids": [calendar_id]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["busy"] == [
+            {"start": "2026-01-05T09:00:00", "end": "2026-01-05T10:00:00"},
+            {"start": "2026-01-06T09:00:00", "end": "2026-01-06T10:00:00"},
+            {"start": "2026-01-06T12:00:00", "end": "2026-01-06T13:00:00"},
+            {"start": "2026-01-07T09:00:00", "end": "2026-01-07T10:00:00"},
+        ]
+
+        # 2026-01-06T18:30+09:00 = 2026-01-06T09:30Z
+        response = client.post(
+            "/api/v1/freebusy",
+            headers=auth_headers,
+            json={"time_min": "2026-01-06T18:30:00+09:00", "time_max": "2026-01-07T00:00:00Z", "calendar_ids": [calendar_id]},
+        )
+        assert response.json()["time_min"] == "2026-01-06T09:30:00"
+        assert response.json()["busy"] == [
+            {"start": "2026-01-06T09:30:00", "end": "2026-01-06T10:00:00"},
+            {"start": "2026-01-06T12:00:00", "end": "2026-01-06T13:00:00"},
+        ]
+
+    def test_access_and_validation(self, client, auth_headers, admin_headers, test_admin):
+        """다른 사용자의 캘린더/사용자는 403, 잘못된 구간은 400"""
+        other = client.post("/api/v1/calendars", headers=admin_headers, json={"title": "Admin"}).json()["id"]
+        window = {"time_min": "2026-01-01T00:00:00", "time_max": "2026-01-02T00:00:00"}
+
+        response = client.post("/api/v1/freebusy", headers=auth_headers, json={**window, "calendar_ids": [other]})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        response = client.post("/api/v1/freebusy", headers=auth_headers, json={**window, "user_ids": [test_admin.id]})
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        response = client.post("/api/v1/freebusy", headers=admin_headers, json={**window, "calendar_ids": [other]})
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.post(
+            "/api/v1/freebusy",
+            headers=auth_headers,
+            json={"time_min": "2026-01-02T00:00:00", "time_max": "2026-01-01T00:00:00", "calendar_ids": [other]},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestMergeIntervals:
+    """구간 병합 테스트"""
+
+    def test_sweep_merge(self):
+        """정렬 후 스윕 병합 (포함 구간, 맞닿은 구간)"""
+        from app.core.freebusy import merge_intervals
+
+        t = lambda hour: datetime(2026, 1, 1, hour)
+        assert merge_intervals([(t(5), t(6)), (t(1), t(4)), (t(2), t(3)), (t(4), t(5)), (t(8), t(9))]) == [
+            (t(1), t(6)), (t(8), t(9)),
+        ]
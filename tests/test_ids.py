@@ -0,0 +1,54 @@
+"""
+ID 생성 및 BinaryUUID 타입 테스트
+"""
+import uuid
+
+from sqlalchemy import Column, MetaData, Table, create_engine, select
+
+from app.core.ids import uuid7, new_id
+from app.db.types import BinaryUUID
+
+
+class TestUUID7:
+    """UUIDv7 생성 테스트"""
+
+    def test_uuid7_version_and_variant(self):
+        """버전 7 / RFC 4122 variant"""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_monotonic(self):
+        """연속 생성 시 정렬 순서 유지"""
+        values = [uuid7() for _ in range(5000)]
+        assert values == sorted(values)
+        assert [str(v) for v in values] == sorted(str(v) for v in values)
+        assert len(set(values)) == len(values)
+
+    def test_new_id_default_scheme(self):
+        """기본 설정(uuid4)에서는 36자 문자열"""
+        value = new_id()
+        assert len(value) == 36
+        assert uuid.UUID(value).version == 4
+
+
+class TestBinaryUUID:
+    """BINARY(16) 컬럼 타입 테스트"""
+
+    def test_roundtrip(self):
+        """문자열 ID가 16바이트로 저장되고 문자열로 복원됨"""
+        engine = create_engine("sqlite:///:memory:")
+        metadata = MetaData()
+        table = Table("items", metadata, Column("id", BinaryUUID(), primary_key=True))
+        metadata.create_all(engine)
+
+        value = str(uuid7())
+        with engine.begin() as conn:
+            conn.execute(table.insert(), {"id": value})
+            raw = conn.exec_driver_sql("SELECT id FROM items").scalar()
+            loaded = conn.execute(select(table.c.id).where(table.c.id == value)).scalar()
+            missing = conn.execute(select(table.c.id).where(table.c.id == "nonexistent-id")).scalar()
+
+        assert isinstance(raw, bytes) and len(raw) == 16
+        assert loaded == value
+        assert missing is None
@@ -0,0 +1,54 @@
+"""
+목록 쿼리 인덱스 점검 테스트
+"""
+from app.db.index_audit import audit, explain, list_query_shapes
+from app.models import Calendar, Event, Task, User
+
+
+class TestIndexAudit:
+    """엔드포인트 ↔ 인덱스 매핑 테스트"""
+
+    def test_every_list_query_uses_index(self, db):
+        """모든 목록 쿼리의 각 테이블 접근에 인덱스가 매핑됨"""
+        for endpoint, choices in audit(db).items():
+            for choice in choices:
+                assert choice.index is not None, f"{endpoint}: {choice.table} full scan"
+
+    def test_composite_index_covers_order(self, db):
+        """캘린더/작업 목록은 복합 인덱스로 정렬까지 처리"""
+        result = audit(db)
+        calendars = result["GET /calendars"][0]
+        assert calendars.index == "idx_calendar_user_created"
+        assert calendars.sorted_by_index
+
+        tasks = {c.table: c for c in result["GET /tasks?calendar_id&status"]}
+        assert tasks["tasks"].index == "idx_task_calendar_status"
+        assert tasks["tasks"].used_columns == ["calendar_id", "status", "due_at"]
+
+    def test_explain_has_no_full_table_scan(self, db):
+        """SQLite 실행 계획에서 events/tasks/calendars 전체 스캔이 없음"""
+        engine = db.get_bind()
+        for endpoint, query in list_query_shapes(db).items():
+            plan = " ".join(str(row[-1]) for row in explain(engine, query))
+            for table in ("events", "tasks", "calendars"):
+                assert f"SCAN {table} " not in f"{plan} ", f"{endpoint}: {plan}"
+
+    def test_sortable_fields_backed_by_index(self):
+        """정렬 가능 필드는 선언한 인덱스에 포함된 컬럼"""
+        for model in (Event, Task, Calendar, User):
+            indexes = {index.name: [c.name for c in index.columns] for index in model.__table__.indexes}
+            for field, index_name in model.SORTABLE_FIELDS.items():
+                assert field in indexes.get(index_name, []), f"{model.__name__}.{field} -> {index_name}"
+
+    def test_window_query_covered_by_recurring_index(self, db):
+        """구간 조회(free/busy, 뷰)는 is_recurring과 두 시각 조건을 모두 인덱스에서 처리"""
+        from datetime import datetime
+
+        query = db.query(Event.start_at, Event.end_at).filter(
+            Event.calendar_id.in_(["a", "b"]),
+            Event.start_at < datetime(2026, 1, 2),
+            Event.end_at > datetime(2026, 1, 1),
+            Event.is_recurring.is_(False),
+        )
+        plan = " ".join(str(row[-1]) for row in explain(db.get_bind(), query))
+        assert "COVERING INDEX idx_event_calendar_recurring" in plan, plan
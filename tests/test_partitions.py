@@ -0,0 +1,86 @@
+"""
+events 월별 파티션 관리 테스트
+"""
+from datetime import date, datetime
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import mysql
+
+from app.db.partitions import (
+    add_partitions_sql,
+    create_partitioning_sql,
+    partition_range,
+    plan_expired_partitions,
+    plan_future_partitions,
+    purge_children_sql,
+)
+from app.db.queries import event_list_query
+from app.models.user import UserRole
+from app.schemas.event import EventListRequest
+
+
+class TestPartitionPlanning:
+    """파티션 생성/삭제 계획 테스트"""
+
+    def test_create_partitioning_sql(self):
+        """최초 파티셔닝 DDL: 월별 경계 + pmax"""
+        sql = create_partitioning_sql(date(2025, 11, 15), date(2026, 1, 1))
+        assert "PARTITION BY RANGE COLUMNS(start_at)" in sql
+        assert "PARTITION p202511 VALUES LESS THAN ('2025-12-01 00:00:00')" in sql
+        assert "PARTITION p202601 VALUES LESS THAN ('2026-02-01 00:00:00')" in sql
+        assert sql.rstrip(")\n").endswith("PARTITION pmax VALUES LESS THAN (MAXVALUE")
+
+    def test_plan_future_partitions(self):
+        """부족한 미래 월만 계획 (연도 경계 포함)"""
+        existing = ["p202510", "p202511", "pmax"]
+        months = plan_future_partitions(existing, date(2025, 11, 20), 2)
+        assert months == [date(2025, 12, 1), date(2026, 1, 1)]
+        assert plan_future_partitions(existing, date(2025, 9, 1), 2) == []
+
+        sql = add_partitions_sql(months)
+        assert sql.startswith("ALTER TABLE events REORGANIZE PARTITION pmax INTO")
+        assert "p202512" in sql and "p202601" in sql
+
+    def test_plan_expired_partitions(self):
+        """기준 월 이전 파티션만 삭제 대상 (pmax 제외)"""
+        existing = ["p202401", "p202402", "p202403", "pmax"]
+        assert plan_expired_partitions(existing, date(2024, 3, 1)) == ["p202401", "p202402"]
+
+
+    def test_purge_children_sql(self):
+        """DROP/EXCHANGE 전 해당 기간 이벤트의 하위 행 삭제 (트리거/FK CASCADE 미동작)"""
+        existing = ["p202401", "p202402", "p202403", "pmax"]
+        assert partition_range(existing, "p202401") == (None, date(2024, 2, 1))
+        assert partition_range(existing, "p202403") == (date(2024, 3, 1), date(2024, 4, 1))
+
+        statements = purge_children_sql(*partition_range(existing, "p202402"))
+        assert statements == [
+            f"DELETE FROM {table} WHERE {column} IN (SELECT id FROM events "
+            "WHERE start_at >= '2024-02-01 00:00:00' AND start_at < '2024-03-01 00:00:00')"
+            for table, column in (("event_day_buckets", "event_id"), ("event_exceptions", "event_id"), ("events_fts", "id"))
+        ]
+        assert purge_children_sql(None, date(2024, 3, 1))[0].endswith("WHERE start_at < '2024-03-01 00:00:00')")
+
+
+class TestPartitionPruning:
+    """이벤트 목록 쿼리의 파티션 프루닝 조건 테스트"""
+
+    def _user(self):
+        return SimpleNamespace(id="user-id", role=UserRole.USER)
+
+    def test_end_to_adds_start_at_bound(self, db):
+        """end_to만 있어도 start_at 상한 조건을 생성"""
+        query = event_list_query(db, self._user(), EventListRequest(end_to=datetime(2026, 1, 31)))
+        sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+        assert "events.start_at <=" in sql
+
+    def test_period_query_bounds_partition_key(self, db):
+        """기간 조회 시 MySQL 쿼리에 파티션 키(start_at) 범위 조건 포함"""
+        query = event_list_query(
+            db,
+            self._user(),
+            EventListRequest(calendar_id="calendar-id", start_from=datetime(2026, 1, 1), end_to=datetime(2026, 1, 31)),
+        )
+        sql = str(query.statement.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+        assert "events.start_at >= '2026-01-01 00:00:00'" in sql
+        assert "events.start_at <= '2026-01-31 00:00:00'" in sql
@@ -0,0 +1,243 @@
+"""
+검색 관련 테스트
+"""
+import pytest
+from fastapi import status
+
+
+@pytest.fixture
+def local_index(monkeypatch):
+    """검색 색인/자동완성을 프로세스 내 저장소로"""
+    from app.core.config import settings
+    from app.db import generations
+    from app.db.search_index import local_store
+
+    monkeypatch.setattr(settings, "SEARCH_INDEX_STORE", "local")
+    # 백그라운드 생성을 바로 실행 (인메모리 SQLite 연결을 스레드 간에 공유하지 않도록)
+    monkeypatch.setattr(generations, "run_in_background", lambda job: job())
+    local_store.clear()
+    yield local_store
+    local_store.clear()
+
+
+class TestSuggest:
+    """제목 자동완성 테스트"""
+
+    def test_prefix_across_types(self, client, auth_headers, local_index, create_event):
+        """제목/단어 시작 접두사로 여러 타입을 함께 반환"""
+        # 첫 조회가 (빈) 저장소 생성을 예약하고 이후 쓰기는 증분 반영
+        assert client.get("/api/v1/search/suggest?q=회", headers=auth_headers).json()["items"] == []
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "회사 일정"}).json()["id"]
+        event_id = create_event(calendar_id, "주간 회의록 정리")["id"]
+        task_id = client.post(
+            "/api/v1/tasks", headers=auth_headers, json={"calendar_id": calendar_id, "title": "회의실 예약"},
+        ).json()["id"]
+        create_event(calendar_id, "점심 약속")
+
+        response = client.get("/api/v1/search/suggest?q=회", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        items = response.json()["items"]
+        assert {(item["type"], item["id"]) for item in items} == {
+            ("calendars", calendar_id), ("events", event_id), ("tasks", task_id),
+        }
+
+        response = client.get("/api/v1/search/suggest?q=회의&types=tasks", headers=auth_headers)
+        assert [item["title"] for item in response.json()["items"]] == ["회의실 예약"]
+
+    def test_follows_writes(self, client, auth_headers, local_index, create_event):
+        """수정/삭제가 바로 반영됨"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "Design Review")["id"]
+
+        client.put(f"/api/v1/events/{event_id}", headers=auth_headers, json={"title": "분기 보고"})
+        assert client.get("/api/v1/search/suggest?q=design", headers=auth_headers).json()["items"] == []
+        assert [item["id"] for item in client.get("/api/v1/search/suggest?q=분기", headers=auth_headers).json()["items"]] == [event_id]
+
+        client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+        assert client.get("/api/v1/search/suggest?q=분기", headers=auth_headers).json()["items"] == []
+
+    def test_rebuilt_on_miss(self, client, auth_headers, local_index, create_event):
+        """저장소가 비어 있으면 첫 조회는 DB 제목 접두사로 응답하고 백그라운드에서 다시 생성"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        event_id = create_event(calendar_id, "프로젝트 킥오프")["id"]
+        local_index.clear()
+
+        items = client.get("/api/v1/search/suggest?q=프로", headers=auth_headers).json()["items"]
+        assert [item["id"] for item in items] == [event_id]
+        assert any(key.endswith(f":d:events:{event_id}") for key in local_index.scan_iter("sug:*"))
+
+        items = client.get("/api/v1/search/suggest?q=킥", headers=auth_headers).json()["items"]
+        assert [item["id"] for item in items] == [event_id]
+
+        client.delete(f"/api/v1/calendars/{calendar_id}", headers=auth_headers)
+        assert client.get("/api/v1/search/suggest?q=킥", headers=auth_headers).json()["items"] == []
+
+    def test_build_in_progress(self, client, auth_headers, test_user, local_index, monkeypatch, create_event):
+        """생성 중에는 두 번째 생성을 예약하지 않고, 생성 중 삭제된 문서는 새 세대에 들어가지 않음"""
+        from app.db import generations
+
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        kept = create_event(calendar_id, "회의 준비")["id"]
+        removed = create_event(calendar_id, "회의 취소")["id"]
+        local_index.clear()
+        jobs = []
+        monkeypatch.setattr(generations, "run_in_background", jobs.append)
+
+        client.get("/api/v1/search/suggest?q=회의", headers=auth_headers)
+        client.get("/api/v1/search/suggest?q=회의", headers=auth_headers)
+        assert len(jobs) == 1
+
+        client.delete(f"/api/v1/events/{removed}", headers=auth_headers)
+        jobs[0]()
+        items = client.get("/api/v1/search/suggest?q=회의", headers=auth_headers).json()["items"]
+        assert [item["id"] for item in items] == [kept]
+
+    def test_limit_and_unknown_type(self, client, auth_headers, local_index, create_event):
+        """limit개까지 사전순, 알 수 없는 types는 400"""
+        calendar_id = client.post("/api/v1/calendars", headers=auth_headers, json={"title": "S"}).json()["id"]
+        for title in ("ab 3", "ab 1", "ab 2"):
+            create_event(calendar_id, title)
+
+        items = client.get("/api/v1/search/suggest?q=ab&limit=2", headers=auth_headers).json()["items"]
+        assert [item["title"] for item in items] == ["ab 1", "ab 2"]
+        response = client.get("/api/v1/search/suggest?q=ab&types=users", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestUnifiedSearch:
+    """통합 검색 테스트"""
+
+    def _seed(self, client, headers, create_event, prefix=""):
+        calendar_id = client.post(
+            "/api/v1/calendars", headers=headers, json={"title": f"{prefix}워크숍 준비", "description": "팀"},
+        ).json()["id"]
+        event_id = create_event(calendar_id, f"{prefix}워크숍", headers=headers)["id"]
+        task_id = client.post(
+            "/api/v1/tasks",
+            headers=headers,
+            json={"calendar_id": calendar_id, "title": f"{prefix}장소 예약", "description": "워크숍 장소"},
+        ).json()["id"]
+        return calendar_id, event_id, task_id
+
+    def test_merged_typed_results_in_user_scope(self, client, auth_headers, admin_headers, create_event):
+        """세 리소스를 한 목록으로 병합 (제목 일치 우선), 다른 사용자 데이터 제외"""
+        calendar_id, event_id, task_id = self._seed(client, auth_headers, create_event)
+        self._seed(client, admin_headers, create_event, prefix="관리자 ")
+
+        response = client.get("/api/v1/search?q=워크숍", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["partial"] is False
+        assert [(item["type"], item["id"]) for item in data["items"]] == [
+            ("calendars", calendar_id), ("events", event_id), ("tasks", task_id),
+        ]
+        assert data["items"][1]["start_at"] is not None
+        assert data["items"][2]["calendar_id"] == calendar_id
+
+        response = client.get("/api/v1/search?q=워크숍&types=tasks&limit=1", headers=auth_headers)
+        assert [item["id"] for item in response.json()["items"]] == [task_id]
+
+    def test_time_budget_returns_partial(self, client, auth_headers, monkeypatch, create_event):
+        """예산 안에 끝나지 않은 리소스는 incomplete로 표시하고 나머지만 반환"""
+        import time
+        from app.core import search as search_module
+
+        calendar_id, event_id, _ = self._seed(client, auth_headers, create_event)
+        run_type = search_module._run_type
+
+        def slow_tasks(bind, resource, *args):
+            if resource == "tasks":
+                time.sleep(0.5)
+            return run_type(bind, resource, *args)
+
+        monkeypatch.setattr(search_module, "_run_type", slow_tasks)
+        monkeypatch.setattr(search_module, "SEARCH_TIME_BUDGET_SECONDS", 0.2)
+
+        data = client.get("/api/v1/search?q=워크숍", headers=auth_headers).json()
+        assert data["partial"] is True
+        assert data["incomplete"] == ["tasks"]
+        assert {item["type"] for item in data["items"]} == {"calendars", "events"}
+
+    def test_slow_sub_query_is_interrupted(self, client, auth_headers, monkeypatch, create_event):
+        """예산을 넘긴 느린 하위 쿼리는 DB에서 중단되어 스레드를 오래 붙잡지 않음"""
+        import time
+        from sqlalchemy import text
+        from app.core import search as search_module
+
+        self._seed(client, auth_headers, create_event)
+        query_for = search_module.search_query
+        run_type = search_module._run_type
+        finished = {}
+
+        def slow_tasks(session, resource, current_user, calendar_ids, keyword, limit, redis_client=None):
+            query = query_for(session, resource, current_user, calendar_ids, keyword, limit, redis_client)
+            if resource == "tasks":
+                # 테스트 DB는 연결 하나를 공유하므로 (StaticPool) 다른 하위 쿼리가 끝난 뒤 실행
+                started = time.monotonic()
+                while not {"calendars", "events"} <= finished.keys() and time.monotonic() - started < 0.2:
+                    time.sleep(0.01)
+                # 천만 행을 세는 재귀 CTE (중단하지 않으면 수 초)
+                query = query.limit(None).filter(text(
+                    "(WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 10000000)"
+                    " SELECT count(*) FROM c) > 0"
+                )).limit(limit)
+            return query
+
+        def timed(bind, resource, *args):
+            started = time.monotonic()
+            try:
+                return run_type(bind, resource, *args)
+            finally:
+                finished[resource] = time.monotonic() - started
+
+        monkeypatch.setattr(search_module, "search_query", slow_tasks)
+        monkeypatch.setattr(search_module, "_run_type", timed)
+        monkeypatch.setattr(search_module, "SEARCH_TIME_BUDGET_SECONDS", 0.3)
+
+        data = client.get("/api/v1/search?q=워크숍", headers=auth_headers).json()
+        assert data["incomplete"] == ["tasks"]
+        assert {item["type"] for item in data["items"]} == {"calendars", "events"}
+
+        waited = 0.0
+        while "tasks" not in finished and waited < 3:
+            time.sleep(0.05)
+            waited += 0.05
+        assert finished["tasks"] < 1.5
+
+    def test_timeout_keeps_other_statements_on_shared_connection(self, db):
+        """공유 연결(StaticPool)에서 기한 이후 다른 스레드가 시작한 문장은 중단하지 않음"""
+        import threading
+        import time
+        from sqlalchemy import text
+        from sqlalchemy.orm import Session
+        from app.core.search import _statement_timeout
+
+        count = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2000000) SELECT count(*) FROM c"
+        results = {}
+
+        def timed():
+            session = Session(db.get_bind())
+            try:
+                with _statement_timeout(session, 100):
+                    results["timed"] = session.execute(text(count)).scalar()
+            except Exception as exc:
+                results["timed"] = exc
+            finally:
+                session.close()
+
+        thread = threading.Thread(target=timed)
+        thread.start()
+        time.sleep(0.02)
+        other = Session(db.get_bind())
+        try:
+            # 타이머 기한(100ms)에 마지막으로 시작한 문장은 이 문장이므로 interrupt하지 않음
+            assert other.execute(text(count)).scalar() == 2000000
+        finally:
+            other.close()
+            thread.join()
+        assert results["timed"] == 2000000
+
+    def test_unknown_type(self, client, auth_headers):
+        """알 수 없는 types는 400"""
+        response = client.get("/api/v1/search?q=a&types=users", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,149 @@
+"""
+증분 동기화 관련 테스트
+"""
+import pytest
+from fastapi import status
+from datetime import datetime, timedelta
+
+
+def _create_calendar(client, headers, title="Sync"):
+    response = client.post("/api/v1/calendars", headers=headers, json={"title": title})
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+def _create_task(client, headers, calendar_id, title):
+    response = client.post("/api/v1/tasks", headers=headers, json={"calendar_id": calendar_id, "title": title})
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()["id"]
+
+
+def _sync(client, headers, token=None, limit=None):
+    params = {}
+    if token is not None:
+        params["token"] = token
+    if limit is not None:
+        params["limit"] = limit
+    return client.get("/api/v1/sync", headers=headers, params=params)
+
+
+class TestSync:
+    """증분 동기화 테스트"""
+
+    def test_initial_sync_returns_everything_as_created(self, client, auth_headers, create_event):
+        """토큰 없이 요청하면 모든 캘린더/이벤트/작업을 created로 반환"""
+        calendar_id = _create_calendar(client, auth_headers)
+        event_id = create_event(calendar_id, "Meeting")["id"]
+        task_id = _create_task(client, auth_headers, calendar_id, "Todo")
+
+        response = _sync(client, auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["has_more"] is False
+        assert [item["id"] for item in data["calendars"]["created"]] == [calendar_id]
+        assert [item["id"] for item in data["events"]["created"]] == [event_id]
+        assert [item["id"] for item in data["tasks"]["created"]] == [task_id]
+        for resource in ("calendars", "events", "tasks"):
+            assert data[resource]["updated"] == []
+            assert data[resource]["deleted"] == []
+
+        # 변경이 없으면 빈 응답과 같은 토큰 번호
+        again = _sync(client, auth_headers, data["token"]).json()
+        assert all(again[resource] == {"created": [], "updated": [], "deleted": []} for resource in ("calendars", "events", "tasks"))
+        assert _sync(client, auth_headers, again["token"]).status_code == status.HTTP_200_OK
+
+    def test_incremental_sync_returns_changes_and_deletions(self, client, auth_headers, create_event):
+        """토큰 이후의 생성/수정/삭제만 반환"""
+        calendar_id = _create_calendar(client, auth_headers)
+        kept = create_event(calendar_id, "Kept")["id"]
+        removed = create_event(calendar_id, "Removed")["id"]
+        task_id = _create_task(client, auth_headers, calendar_id, "Todo")
+        other_calendar = _create_calendar(client, auth_headers, "Other")
+        token = _sync(client, auth_headers).json()["token"]
+
+        client.put(f"/api/v1/events/{kept}", headers=auth_headers, json={"title": "Renamed"})
+        assert client.delete(f"/api/v1/events/{removed}", headers=auth_headers).status_code == status.HTTP_204_NO_CONTENT
+        assert client.delete(f"/api/v1/tasks/{task_id}", headers=auth_headers).status_code == status.HTTP_204_NO_CONTENT
+        assert client.delete(f"/api/v1/calendars/{other_calendar}", headers=auth_headers).status_code == status.HTTP_204_NO_CONTENT
+        added = create_event(calendar_id, "Added")["id"]
+
+        data = _sync(client, auth_headers, token).json()
+        assert [item["title"] for item in data["events"]["updated"]] == ["Renamed"]
+        assert [item["id"] for item in data["events"]["created"]] == [added]
+        assert data["events"]["deleted"] == [removed]
+        assert data["tasks"] == {"created": [], "updated": [], "deleted": [task_id]}
+        assert data["calendars"] == {"created": [], "updated": [], "deleted": [other_calendar]}
+
+    def test_occurrence_edit_marks_master_updated(self, client, auth_headers, create_event):
+        """반복 이벤트 회차 취소는 마스터 이벤트의 수정으로 전달"""
+        calendar_id = _create_calendar(client, auth_headers)
+        master = create_event(calendar_id, "Daily", datetime(2026, 3, 2, 9, 0), rrule="FREQ=DAILY;COUNT=5")["id"]
+        token = _sync(client, auth_headers).json()["token"]
+
+        response = client.delete(
+            f"/api/v1/events/{master}/occurrences/2026-03-03T09:00:00", headers=auth_headers,
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        data = _sync(client, auth_headers, token).json()
+        assert [item["id"] for item in data["events"]["updated"]] == [master]
+
+    def test_has_more_pages_in_change_order(self, client, auth_headers, create_event):
+        """limit을 넘으면 has_more와 이어서 받을 토큰 반환"""
+        calendar_id = _create_calendar(client, auth_headers)
+        event_ids = [create_event(calendar_id, f"E{index}")["id"] for index in range(4)]
+
+        seen = []
+        token = None
+        pages = 0
+        while True:
+            data = _sync(client, auth_headers, token, limit=2).json()
+            seen.extend(item["id"] for item in data["calendars"]["created"] + data["events"]["created"])
+            token = data["token"]
+            pages += 1
+            if not data["has_more"]:
+                break
+        assert pages == 3
+        assert seen == [calendar_id] + event_ids
+
+    def test_invalid_token(self, client, auth_headers, db):
+        """위변조되었거나 다른 사용자의 토큰은 400"""
+        from app.core.pagination import encode_signed
+
+        assert _sync(client, auth_headers, "garbage").status_code == status.HTTP_400_BAD_REQUEST
+        assert _sync(client, auth_headers, "abc.é").status_code == status.HTTP_400_BAD_REQUEST
+        foreign = encode_signed({"u": "someone-else", "s": 0})
+        assert _sync(client, auth_headers, foreign).status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_compacted_token_is_gone(self, client, auth_headers, db, create_event):
+        """보존 기간이 지나 삭제 기록이 정리되면 이전 토큰은 410"""
+        from app.db.sync import compact
+
+        calendar_id = _create_calendar(client, auth_headers)
+        event_id = create_event(calendar_id, "Old")["id"]
+        token = _sync(client, auth_headers).json()["token"]
+        client.delete(f"/api/v1/events/{event_id}", headers=auth_headers)
+        latest = _sync(client, auth_headers, token).json()["token"]
+
+        assert compact(db, retention_days=30) == 0
+        assert compact(db, retention_days=30, now=datetime.utcnow() + timedelta(days=31)) == 1
+
+        response = _sync(client, auth_headers, token)
+        assert response.status_code == status.HTTP_410_GONE
+        assert _sync(client, auth_headers, latest).status_code == status.HTTP_200_OK
+
+    def test_archived_task_is_not_deleted(self, client, auth_headers, db):
+        """보관으로 옮겨진 작업은 삭제로 보고하지 않고 처음 동기화에 포함"""
+        from app.db.archive import archive_tasks
+
+        calendar_id = _create_calendar(client, auth_headers)
+        task_id = _create_task(client, auth_headers, calendar_id, "Done")
+        client.put(f"/api/v1/tasks/{task_id}", headers=auth_headers, json={"status": "COMPLETED"})
+        token = _sync(client, auth_headers).json()["token"]
+
+        assert archive_tasks(db, older_than_days=0, now=datetime.utcnow() + timedelta(days=1)) == 1
+
+        data = _sync(client, auth_headers, token).json()
+        assert data["tasks"] == {"created": [], "updated": [], "deleted": []}
+        initial = _sync(client, auth_headers).json()
+        assert [item["id"] for item in initial["tasks"]["created"]] == [task_id]
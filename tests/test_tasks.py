@@ -198,3 +198,118 @@ class TestDeleteTask:
         )
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+
+
+class TestArchiveTasks:
+    """완료 작업 아카이빙 테스트"""
+    
+    def _create_completed_task(self, client, auth_headers, title):
+        calendar_response = client.post(
+            "/api/v1/calendars",
+            headers=auth_headers,
+            json={"title": "Test Calendar"},
+        )
+        calendar_id = calendar_response.json()["id"]
+        task_response = client.post(
+            "/api/v1/tasks",
+            headers=auth_headers,
+            json={"calendar_id": calendar_id, "title": title},
+        )
+        task_id = task_response.json()["id"]
+        client.put(
+            f"/api/v1/tasks/{task_id}",
+            headers=auth_headers,
+            json={"status": TaskStatus.COMPLETED.value},
+        )
+        return task_id
+    
+    def test_archive_moves_old_completed_tasks(self, client, auth_headers, db):
+        """기준일이 지난 완료 작업만 아카이브로 이동"""
+        from app.db.archive import archive_tasks
+        from app.models.task import Task, TaskArchive
+        
+        task_id = self._create_completed_task(client, auth_headers, "Done Task")
+        
+        # 기준일 이전: 이동 없음
+        assert archive_tasks(db, older_than_days=30) == 0
+        
+        # 40일 뒤 기준으로 실행 (배치 크기 1로 재개 동작 확인)
+        moved = archive_tasks(db, older_than_days=30, batch_size=1, now=datetime.utcnow() + timedelta(days=40))
+        assert moved == 1
+        db.expire_all()
+        assert db.query(Task).filter(Task.id == task_id).first() is None
+        assert db.query(TaskArchive).filter(TaskArchive.id == task_id).first() is not None
+    
+    def test_get_tasks_includes_archive(self, client, auth_headers, db):
+        """status=COMPLETED 또는 include_archived=true일 때만 아카이브 포함"""
+        from app.db.archive import archive_tasks
+        
+        task_id = self._create_completed_task(client, auth_headers, "Archived Task")
+        archive_tasks(db, older_than_days=0, now=datetime.utcnow() + timedelta(days=1))
+        
+        default = client.get("/api/v1/tasks", headers=auth_headers).json()
+        assert task_id not in [t["id"] for t in default["content"]]
+        
+        completed = client.get(
+            "/api/v1/tasks?status=COMPLETED",
+            headers=auth_headers,
+        ).json()
+        assert [t["id"] for t in completed["content"]] == [task_id]
+        
+        included = client.get(
+            "/api/v1/tasks?include_archived=true&sort=due_at,DESC",
+            headers=auth_headers,
+        ).json()
+        assert task_id in [t["id"] for t in included["content"]]
+        
+        trimmed = client.get(
+            "/api/v1/tasks?include_archived=true&fields=title,status",
+            headers=auth_headers,
+        ).json()
+        assert {"id": task_id, "title": "Archived Task", "status": "COMPLETED"} in trimmed["content"]
+    
+    def test_archived_task_detail_update_delete(self, client, auth_headers, db):
+        """보관된 작업도 id로 조회/수정/삭제 (수정하면 tasks로 되돌림)"""
+        from app.db.archive import archive_tasks
+        from app.models.task import Task, TaskArchive
+        
+        task_id = self._create_completed_task(client, auth_headers, "Archived Task")
+        other_id = self._create_completed_task(client, auth_headers, "Other Task")
+        archive_tasks(db, older_than_days=0, now=datetime.utcnow() + timedelta(days=1))
+        
+        response = client.get(f"/api/v1/tasks/{task_id}", headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["title"] == "Archived Task"
+        trimmed = client.get(f"/api/v1/tasks/{task_id}?fields=title", headers=auth_headers).json()
+        assert trimmed == {"id": task_id, "title": "Archived Task"}
+        
+        response = client.put(
+            f"/api/v1/tasks/{task_id}",
+            headers=auth_headers,
+            json={"status": TaskStatus.PENDING.value},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["status"] == TaskStatus.PENDING.value
+        assert response.json()["completed_at"] is None
+        db.expire_all()
+        assert db.query(TaskArchive).filter(TaskArchive.id == task_id).first() is None
+        default = client.get("/api/v1/tasks", headers=auth_headers).json()
+        assert [t["id"] for t in default["content"]] == [task_id]
+        
+        assert client.delete(f"/api/v1/tasks/{other_id}", headers=auth_headers).status_code == status.HTTP_204_NO_CONTENT
+        assert client.get(f"/api/v1/tasks/{other_id}", headers=auth_headers).status_code == status.HTTP_404_NOT_FOUND
+        assert db.query(Task).count() == 1
+    
+    def test_archive_invalidates_task_counter(self, client, auth_headers, db, mock_redis, test_user):
+        """배치마다 소유자 작업 카운터를 삭제해 count=cached가 보관된 작업을 세지 않음"""
+        from app.core.counts import counter_key
+        from app.db.archive import archive_tasks
+        
+        self._create_completed_task(client, auth_headers, "Archived Task")
+        cached = client.get("/api/v1/tasks?count=cached", headers=auth_headers).json()
+        assert cached["totalElements"] == 1
+        assert mock_redis.get(counter_key("tasks", test_user.id)) is not None
+        
+        archive_tasks(db, older_than_days=0, now=datetime.utcnow() + timedelta(days=1), redis_client=mock_redis)
+        assert mock_redis.get(counter_key("tasks", test_user.id)) is None
+        assert client.get("/api/v1/tasks?count=cached", headers=auth_headers).json()["totalElements"] == 0